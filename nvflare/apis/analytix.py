@@ -53,6 +53,13 @@ class TrackConst(object):
     SITE_KEY = "site"
     JOB_ID_KEY = "job_id"
 
+    # columns of a batch of records, see AnalyticsDataType.BATCH
+    BATCH_TRACK_KEYS = "batch_track_keys"
+    BATCH_TRACK_VALUES = "batch_track_values"
+    BATCH_GLOBAL_STEPS = "batch_global_steps"
+    BATCH_DATA_TYPES = "batch_data_types"
+    BATCH_KWARGS = "batch_kwargs"
+
 
 class AnalyticsDataType(Enum):
     SCALARS = "SCALARS"
@@ -72,6 +79,18 @@ class AnalyticsDataType(Enum):
     TAGS = "TAGS"
     INIT_DATA = "INIT_DATA"
 
+    # a batch of records of one writer, stored column by column
+    BATCH = "BATCH"
+
+
+# data types of the records that can be sent in a batch
+BATCHABLE_DATA_TYPES = (
+    AnalyticsDataType.SCALAR,
+    AnalyticsDataType.SCALARS,
+    AnalyticsDataType.METRIC,
+    AnalyticsDataType.METRICS,
+)
+
 
 class AnalyticsData:
     def __init__(
@@ -26,6 +26,10 @@ from .shareable import Shareable
 
 
 class FLComponent(StatePersistable):
+
+    # changed whenever any component registers an event handler, so that event subscription indexes are rebuilt
+    event_handlers_version = 0
+
     def __init__(self):
         """Init FLComponent.
 
@@ -285,6 +289,7 @@ class FLComponent(StatePersistable):
 
             if not already_registered:
                 entries.append((handler, kwargs))
+                FLComponent.event_handlers_version += 1
 
     def get_event_handlers(self):
         self._self_check()
@@ -201,6 +201,13 @@ class FLContextKey(object):
     # Tensor streaming: minimum get_task_timeout required by server (stored in FLContext)
     MIN_GET_TASK_TIMEOUT = "__min_get_task_timeout__"
 
+    # Task-ready notification: the client accepts notifications / the server will notify the client
+    ACCEPT_TASK_READY_NOTIFY = "__accept_task_ready_notify__"
+    TASK_READY_NOTIFY = "__task_ready_notify__"
+
+    # ID of the task whose result the client is still sending while asking for the next task
+    SUBMITTING_TASK_ID = "__submitting_task_id__"
+
 
 class ProcessType:
     SERVER_PARENT = "SP"
@@ -221,6 +228,7 @@ class ReservedTopic(object):
     APP_METRICS = "__app_metrics__"
     MSG_ROOT_DELETED = "__msg_root_deleted__"
     STOP_CELLNET = "__stop_cellnet__"
+    TASK_READY = "__task_ready__"
 
 
 class AdminCommandNames(object):
@@ -302,6 +310,9 @@ class ServerCommandKey(object):
     TURN_TO_COLD = "__turn_to_cold__"
     REASON = "reason"
     MIN_GET_TASK_TIMEOUT = "min_get_task_timeout"
+    ACCEPT_TASK_READY_NOTIFY = "accept_task_ready_notify"
+    TASK_READY_NOTIFY = "task_ready_notify"
+    SUBMITTING_TASK_ID = "submitting_task_id"
 
 
 class FedEventHeader(object):
@@ -523,6 +534,13 @@ class ConfigVarName:
     # client: timeout for getTask requests
     GET_TASK_TIMEOUT = "get_task_timeout"
 
+    # client: max time to wait for a task-ready notification before asking for a task again (0 to disable);
+    # the wait never exceeds the task fetch interval suggested by the server
+    TASK_READY_WAIT_TIME = "task_ready_wait_time"
+
+    # client: send task results in the background while the next task is fetched and executed
+    PIPELINE_TASK_RESULT = "pipeline_task_result"
+
     # client: timeout for submitTaskResult requests
     SUBMIT_TASK_RESULT_TIMEOUT = "submit_task_result_timeout"
 
@@ -532,6 +550,11 @@ class ConfigVarName:
     # client and server: query interval for reliable message
     RM_QUERY_INTERVAL = "rm_query_interval"
 
+    # client and server: whether reliable message stages the request and result in the download service, so that
+    # only small control messages are resent and an interrupted transfer resumes from the last byte received.
+    # Disabled by default: enable it only when all sites support it.
+    RM_STAGE_PAYLOAD = "rm_stage_payload"
+
     # server: wait this long since client death report before treating the client as dead/disconnected
     DEAD_CLIENT_GRACE_PERIOD = "dead_client_grace_period"
 
@@ -565,6 +588,11 @@ class ConfigVarName:
     # SJ and CJ: chunk size for downloading
     DOWNLOAD_CHUNK_SIZE = "download_chunk_size"
 
+    # SJ and CJ: send arrays and tensors in the raw-buffer wire format, and split large ones into byte ranges.
+    # Off by default: earlier versions cannot decode this format, so only enable it when all sites support it.
+    # Example: recipe.add_client_config({"np_raw_buffer_encoding": True})
+    RAW_BUFFER_ENCODING = "raw_buffer_encoding"
+
     # SJ and CJ: minimum transaction lifetime for large-tensor downloads.
     # Raise via job config when model size or network latency exceeds the default 60s.
     # Example: recipe.add_client_config({"np_min_download_timeout": 600.0})
@@ -573,6 +601,9 @@ class ConfigVarName:
     # SJ and CJ: min file size for streaming. If file size is less than this, it will be attached to msg directly.
     MIN_FILE_SIZE_FOR_STREAMING = "min_file_size_for_streaming"
 
+    # SJ and CJ: record the time spent by each event handler, and log the slowest handlers at the end of the run
+    EVENT_HANDLER_TIMING = "event_handler_timing"
+
 
 class SystemVarName:
     """
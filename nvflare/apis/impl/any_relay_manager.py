@@ -37,9 +37,12 @@ class AnyRelayTaskManager(TaskManager):
             dynamic_targets (bool): allow clients to join after this task starts
         """
         TaskManager.__init__(self)
+        self.fixed_targets = not dynamic_targets
+        self.notify_on_result = True
 
         if task_result_timeout is None:
             task_result_timeout = 0
+        self.handover_interval = task_result_timeout
 
         task.props[_KEY_DYNAMIC_TARGETS] = dynamic_targets
         task.props[_KEY_TASK_RESULT_TIMEOUT] = task_result_timeout
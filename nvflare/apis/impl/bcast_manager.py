@@ -35,6 +35,7 @@ class BcastTaskManager(TaskManager):
             wait_time_after_min_received (int, optional): additional wait time for late clients to contribute their results. Defaults to 0.
         """
         TaskManager.__init__(self)
+        self.fixed_targets = True
         task.props[_KEY_MIN_RESPS] = min_responses
         task.props[_KEY_WAIT_TIME_AFTER_MIN_RESPS] = wait_time_after_min_received
         task.props[_KEY_MIN_RESPS_RCV_TIME] = None
@@ -93,6 +94,7 @@ class BcastForeverTaskManager(TaskManager):
     def __init__(self):
         """Task manager for broadcast controller with forever waiting time."""
         TaskManager.__init__(self)
+        self.fixed_targets = True
 
     def check_task_send(self, client_task: ClientTask, fl_ctx: FLContext) -> TaskCheckStatus:
         """Determine whether the task should be sent to the client.
@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import datetime
 import os
 import pathlib
 import shutil
 import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
@@ -101,8 +103,75 @@ class _ScheduleJobFilter(_JobFilter):
         return True
 
 
+def _status_value(status) -> str:
+    return status.value if isinstance(status, RunStatus) else status
+
+
+class _JobCatalog:
+    """In-memory index of the meta of all jobs in the job store, by job ID and by status."""
+
+    def __init__(self):
+        self.metas = {}
+        self.jobs_by_status = {}
+
+    def _index(self, jid: str, status):
+        self.jobs_by_status.setdefault(status, set()).add(jid)
+
+    def _unindex(self, jid: str, status):
+        jids = self.jobs_by_status.get(status)
+        if jids is not None:
+            jids.discard(jid)
+            if not jids:
+                self.jobs_by_status.pop(status)
+
+    def add(self, jid: str, meta: dict):
+        self.remove(jid)
+        meta = copy.deepcopy(meta)
+        self.metas[jid] = meta
+        self._index(jid, meta.get(JobMetaKey.STATUS.value))
+
+    def update(self, jid: str, meta: dict):
+        current = self.metas.get(jid)
+        if current is None:
+            return
+        old_status = current.get(JobMetaKey.STATUS.value)
+        current.update(copy.deepcopy(meta))
+        new_status = current.get(JobMetaKey.STATUS.value)
+        if new_status != old_status:
+            self._unindex(jid, old_status)
+            self._index(jid, new_status)
+
+    def remove(self, jid: str):
+        meta = self.metas.pop(jid, None)
+        if meta is not None:
+            self._unindex(jid, meta.get(JobMetaKey.STATUS.value))
+
+    def get_infos(self, statuses: Optional[list] = None) -> List[tuple]:
+        """Get (jid, meta) of the jobs in the specified statuses, or of all jobs if statuses is None.
+
+        The metas returned are copies, which can be changed by the caller.
+        """
+        if statuses is None:
+            jids = list(self.metas.keys())
+        else:
+            jids = []
+            for status in statuses:
+                jids.extend(self.jobs_by_status.get(_status_value(status), ()))
+        return [(jid, copy.deepcopy(self.metas[jid])) for jid in jids]
+
+
 class SimpleJobDefManager(JobDefManagerSpec):
-    def __init__(self, uri_root: str = "jobs", job_store_id: str = "job_store"):
+    def __init__(self, uri_root: str = "jobs", job_store_id: str = "job_store", use_catalog: bool = True):
+        """Job definition manager that keeps jobs in the job store component.
+
+        Args:
+            uri_root: root URI of the jobs in the job store
+            job_store_id: component ID of the job store
+            use_catalog: whether to keep an in-memory catalog of the job metas. The catalog is built with one scan
+                of the job store when it is first needed, and is then kept up to date by this manager, so that job
+                queries don't read the meta of every job from the store. Disable it if other processes change the
+                job store.
+        """
         super().__init__()
         self.uri_root = uri_root
 
@@ -113,6 +182,9 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
         os.makedirs(uri_root, exist_ok=True)
         self.job_store_id = job_store_id
+        self.use_catalog = use_catalog
+        self._catalog = None
+        self._catalog_lock = threading.RLock()
 
     def _get_job_store(self, fl_ctx):
         engine = fl_ctx.get_engine()
@@ -127,6 +199,43 @@ class SimpleJobDefManager(JobDefManagerSpec):
     def job_uri(self, jid: str):
         return os.path.join(self.uri_root, jid)
 
+    def _get_catalog(self, fl_ctx: FLContext) -> Optional[_JobCatalog]:
+        # must be called with self._catalog_lock held
+        if not self.use_catalog:
+            return None
+
+        if self._catalog is None:
+            catalog = _JobCatalog()
+            store = self._get_job_store(fl_ctx)
+            obj_uris = store.list_objects(self.uri_root)
+            self.log_debug(fl_ctx, f"building job catalog from {len(obj_uris)} objects")
+            for uri in obj_uris:
+                jid = pathlib.PurePath(uri).name
+                try:
+                    meta = store.get_meta(self.job_uri(jid))
+                except StorageException as e:
+                    self.log_warning(fl_ctx, f"cannot read meta of job {jid}: {e}")
+                    continue
+                if meta:
+                    catalog.add(jid, meta)
+            self._catalog = catalog
+        return self._catalog
+
+    def _add_to_catalog(self, jid: str, meta: dict):
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.add(jid, meta)
+
+    def _update_catalog(self, jid: str, meta: dict):
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.update(jid, meta)
+
+    def _remove_from_catalog(self, jid: str):
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.remove(jid)
+
     def create(self, meta: dict, uploaded_content: Union[str, bytes], fl_ctx: FLContext) -> Dict[str, Any]:
         # validate meta to make sure it has:
         jid = meta.get(JobMetaKey.JOB_ID.value, None)
@@ -145,6 +254,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
         # write it to the store
         store = self._get_job_store(fl_ctx)
         store.create_object(self.job_uri(jid), uploaded_content, meta, overwrite_existing=True)
+        self._add_to_catalog(jid, meta)
         return meta
 
     def clone(self, from_jid: str, meta: dict, fl_ctx: FLContext) -> Dict[str, Any]:
@@ -165,11 +275,13 @@ class SimpleJobDefManager(JobDefManagerSpec):
         store.clone_object(
             from_uri=self.job_uri(from_jid), to_uri=self.job_uri(jid), meta=meta, overwrite_existing=True
         )
+        self._add_to_catalog(jid, meta)
         return meta
 
     def delete(self, jid: str, fl_ctx: FLContext):
         store = self._get_job_store(fl_ctx)
         store.delete_object(self.job_uri(jid))
+        self._remove_from_catalog(jid)
 
     def _validate_meta(self, meta):
         """Validate meta
@@ -204,6 +316,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
         store = self._get_job_store(fl_ctx)
         updated_meta = {JobMetaKey.RESULT_LOCATION.value: result_uri}
         store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+        self._update_catalog(jid, updated_meta)
         return self.get_job(jid, fl_ctx)
 
     def get_app(self, job: Job, app_name: str, fl_ctx: FLContext) -> bytes:
@@ -281,10 +394,12 @@ class SimpleJobDefManager(JobDefManagerSpec):
                 )
                 meta[JobMetaKey.DURATION.value] = str(datetime.datetime.now() - start_time)
         store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._update_catalog(jid, meta)
 
     def update_meta(self, jid: str, meta, fl_ctx: FLContext):
         store = self._get_job_store(fl_ctx)
         store.update_meta(uri=self.job_uri(jid), meta=meta, replace=False)
+        self._update_catalog(jid, meta)
 
     def refresh_meta(self, job: Job, meta_keys: list, fl_ctx: FLContext):
         """Refresh meta of the job as specified in the meta keys
@@ -313,10 +428,29 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
     def get_jobs_to_schedule(self, fl_ctx: FLContext) -> List[Job]:
         job_filter = _ScheduleJobFilter(self._get_job_store(fl_ctx))
-        self._scan(job_filter, fl_ctx, skip_tag=_OBJ_TAG_SCHEDULED)
+        self._scan(job_filter, fl_ctx, skip_tag=_OBJ_TAG_SCHEDULED, statuses=[RunStatus.SUBMITTED])
         return job_filter.result
 
-    def _scan(self, job_filter: _JobFilter, fl_ctx: FLContext, skip_tag=None):
+    def _scan(self, job_filter: _JobFilter, fl_ctx: FLContext, skip_tag=None, statuses: Optional[list] = None):
+        """Apply the job filter to the jobs.
+
+        Args:
+            job_filter: the filter to apply
+            fl_ctx: FLContext
+            skip_tag: when scanning the job store, skip the jobs with this tag
+            statuses: when the catalog is used, only apply the filter to the jobs in these statuses.
+                The filter must still check the status since it's not applied when the store is scanned.
+        """
+        with self._catalog_lock:
+            catalog = self._get_catalog(fl_ctx)
+            if catalog is not None:
+                infos = catalog.get_infos(statuses)
+        if catalog is not None:
+            for jid, meta in infos:
+                if not job_filter.filter_job(JobInfo(meta, jid, self.job_uri(jid))):
+                    break
+            return
+
         store = self._get_job_store(fl_ctx)
         obj_uris = store.list_objects(self.uri_root, without_tag=skip_tag)
         self.log_debug(fl_ctx, f"objects to scan: {len(obj_uris)}")
@@ -343,7 +477,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
 
         """
         job_filter = _StatusFilter(status)
-        self._scan(job_filter, fl_ctx)
+        self._scan(job_filter, fl_ctx, statuses=job_filter.status_to_check)
         return job_filter.result
 
     def get_jobs_waiting_for_review(self, reviewer_name: str, fl_ctx: FLContext) -> List[Job]:
@@ -364,6 +498,7 @@ class SimpleJobDefManager(JobDefManagerSpec):
             updated_meta = {JobMetaKey.APPROVALS.value: approvals}
             store = self._get_job_store(fl_ctx)
             store.update_meta(self.job_uri(jid), updated_meta, replace=False)
+            self._update_catalog(jid, updated_meta)
         return meta
 
     def save_workspace(self, jid: str, data: Union[bytes, str, List[str]], fl_ctx: FLContext):
@@ -34,8 +34,10 @@ class SendTaskManager(TaskManager):
             task_assignment_timeout (int): timeout value on a client requesting its task
         """
         TaskManager.__init__(self)
+        self.fixed_targets = True
         if task_assignment_timeout is None or task_assignment_timeout <= 0:
             task_assignment_timeout = 0
+        self.handover_interval = task_assignment_timeout
         task.props[_KEY_ORDER] = send_order
         task.props[_KEY_TASK_ASSIGN_TIMEOUT] = task_assignment_timeout
 
@@ -39,12 +39,16 @@ class SequentialRelayTaskManager(TaskManager):
             dynamic_targets (bool): allow clients to join after this task starts
         """
         TaskManager.__init__(self)
+        self.fixed_targets = not dynamic_targets
+        self.notify_on_result = True
         if task_assignment_timeout is None:
             task_assignment_timeout = 0
 
         if task_result_timeout is None:
             task_result_timeout = 0
 
+        self.handover_interval = min([t for t in (task_assignment_timeout, task_result_timeout) if t > 0], default=0)
+
         task.props[_KEY_DYNAMIC_TARGETS] = dynamic_targets
         task.props[_KEY_TASK_ASSIGN_TIMEOUT] = task_assignment_timeout
         task.props[_KEY_TASK_RESULT_TIMEOUT] = task_result_timeout
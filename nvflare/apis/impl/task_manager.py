@@ -37,9 +37,23 @@ class TaskManager(object):
         All task processing state info should be stored in the Task's props dict.
         Name the keys in the props dict with prefix "__" to avoid potential conflict with
         app-defined props.
+
+        A manager that never sends the task to clients outside the task's targets (as set when the task is
+        scheduled) should set fixed_targets to True. This allows the controller to only check the task
+        for task requests from its targets.
+
+        A manager that may send the task to another client once a result is received (e.g. relay) should set
+        notify_on_result to True. This allows the controller to notify the clients that are waiting for tasks.
+
+        A manager that may send the task to more clients as time passes (e.g. when the current target does not
+        ask for the task or return its result in time) should set handover_interval to that period (in seconds).
+        This allows the controller to notify the waiting clients each time the period is over.
         """
         self._name = self.__class__.__name__
         self.logger = get_obj_logger(self)
+        self.fixed_targets = False
+        self.notify_on_result = False
+        self.handover_interval = 0
 
     def check_task_send(self, client_task: ClientTask, fl_ctx: FLContext) -> TaskCheckStatus:
         """Determine whether the task should be sent to the client.
@@ -11,16 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import heapq
+import itertools
 import threading
 import time
 from threading import Lock
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 from nvflare.apis.client import Client
 from nvflare.apis.controller_spec import ClientTask, SendOrder, Task, TaskCompletionStatus
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_component import FLComponent
-from nvflare.apis.fl_constant import ConfigVarName, FLContextKey, SystemConfigs
+from nvflare.apis.fl_constant import ConfigVarName, FLContextKey, ReservedTopic, SystemConfigs
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.job_def import job_from_meta
 from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_copy
@@ -40,6 +42,9 @@ from .task_manager import TaskCheckStatus, TaskManager
 _TASK_KEY_ENGINE = "___engine"
 _TASK_KEY_MANAGER = "___mgr"
 _TASK_KEY_DONE = "___done"
+_TASK_KEY_SEQ = "___seq"
+_TASK_KEY_HANDOVER = "___handover"
+_TASK_KEY_DONE_EVENT = "___done_event"
 
 
 def _check_positive_int(name, value):
@@ -90,12 +95,23 @@ class WFCommServer(FLComponent, WFCommSpec):
         super().__init__()
         self.controller = None
         self._engine = None
-        self._tasks = []  # list of standing tasks
+        self._tasks = {}  # task seq => standing task, in the order of scheduling
+        self._task_seq = itertools.count()
+        # client name => {task seq => task} of standing tasks that can only be sent to their targets
+        self._target_task_index = {}
+        self._open_tasks = {}  # task seq => standing task that may be sent to any client
+        self._task_deadlines = []  # heap of (deadline, task seq) of standing tasks with timeout
+        # heap of (handover time, task seq) of standing tasks that may become ready for more clients as time passes
+        self._task_handovers = []
         self._client_task_map = {}  # client_task_id => client_task
+        # names of clients that asked for tasks and will be notified when a task may be ready for them
+        self._waiting_clients = set()
         self._all_done = False
         self._task_lock = Lock()
         self._task_monitor = threading.Thread(target=self._monitor_tasks, args=(), name="wf_task", daemon=True)
         self._task_check_period = task_check_period
+        # set to wake up the task monitor before the task check period is over
+        self._task_check_needed = threading.Event()
         self._dead_client_grace = 60.0
         self._dead_clients = {}  # clients reported dead: name => _DeadClientStatus
         self._dead_clients_lock = Lock()  # need lock since dead_clients can be modified from different threads
@@ -142,7 +158,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             collector.add_info(
                 group_name=self.controller.name,
                 info={
-                    "tasks": {t.name: [ct.client.name for ct in t.client_tasks] for t in self._tasks},
+                    "tasks": {t.name: [ct.client.name for ct in t.client_tasks] for t in self._tasks.values()},
                 },
             )
 
@@ -195,9 +211,15 @@ class WFCommServer(FLComponent, WFCommSpec):
             raise TypeError("fl_ctx must be an instance of FLContext, but got {}".format(type(fl_ctx)))
 
         client_task_to_send = None
+        submitting_task_id = fl_ctx.get_prop(FLContextKey.SUBMITTING_TASK_ID)
         with self._task_lock:
+            if fl_ctx.get_prop(FLContextKey.ACCEPT_TASK_READY_NOTIFY):
+                # register before checking the tasks, so that the client is notified of any task scheduled later
+                self._waiting_clients.add(client.name)
+                fl_ctx.set_prop(FLContextKey.TASK_READY_NOTIFY, True, private=True, sticky=False)
+
             self.logger.debug("self._tasks: {}".format(self._tasks))
-            for task in self._tasks:
+            for task in self._get_candidate_tasks(client.name):
                 if task.completion_status is not None:
                     # this task is finished (and waiting for the monitor to exit it)
                     continue
@@ -212,6 +234,10 @@ class WFCommServer(FLComponent, WFCommSpec):
                 if client_task_to_check is not None:
                     # this client has been sent the task already
                     if client_task_to_check.result_received_time is None:
+                        if client_task_to_check.id == submitting_task_id:
+                            # the client is still sending the result of this task - check the next task
+                            continue
+
                         # controller has not received result from client
                         # something wrong happens when client working on this task, so resend the task
                         resend_task = True
@@ -326,6 +352,7 @@ class WFCommServer(FLComponent, WFCommSpec):
 
         with self._task_lock:
             # sent the ClientTask and remember it
+            self._waiting_clients.discard(client.name)
             now = time.time()
             client_task_to_send.task_sent_time = now
             client_task_to_send.task_send_count += 1
@@ -347,6 +374,82 @@ class WFCommServer(FLComponent, WFCommSpec):
             client_data.set_header(ReservedHeaderKey.MSG_ROOT_TTL, task.timeout)
             return task_name, client_task_to_send.id, client_data
 
+    def _get_candidate_tasks(self, client_name: str) -> Iterable[Task]:
+        """Get the standing tasks that could be sent to the client, in the order of scheduling.
+
+        Must be called with self._task_lock held.
+        """
+        target_tasks = self._target_task_index.get(client_name)
+        if not target_tasks:
+            return self._open_tasks.values()
+        if not self._open_tasks:
+            return target_tasks.values()
+        return (t for _, t in heapq.merge(target_tasks.items(), self._open_tasks.items(), key=lambda x: x[0]))
+
+    def _add_standing_task(self, task: Task, manager: TaskManager):
+        # must be called with self._task_lock held
+        seq = next(self._task_seq)
+        task.props[_TASK_KEY_SEQ] = seq
+        self._tasks[seq] = task
+        if getattr(manager, "fixed_targets", False):
+            for name in task.targets:
+                self._target_task_index.setdefault(name, {})[seq] = task
+        else:
+            self._open_tasks[seq] = task
+
+        if task.timeout:
+            heapq.heappush(self._task_deadlines, (task.schedule_time + task.timeout, seq))
+
+        self._schedule_handover(task, manager, task.schedule_time)
+
+    def _schedule_handover(self, task: Task, manager: TaskManager, start_time: float):
+        # must be called with self._task_lock held
+        # only the latest handover time of the task is valid - older entries in the heap are skipped
+        interval = getattr(manager, "handover_interval", 0)
+        if interval:
+            handover_time = start_time + interval
+            task.props[_TASK_KEY_HANDOVER] = handover_time
+            heapq.heappush(self._task_handovers, (handover_time, task.props[_TASK_KEY_SEQ]))
+
+    def _remove_standing_task(self, task: Task):
+        # must be called with self._task_lock held
+        seq = task.props[_TASK_KEY_SEQ]
+        self._tasks.pop(seq, None)
+        self._open_tasks.pop(seq, None)
+        for name in task.targets or []:
+            target_tasks = self._target_task_index.get(name)
+            if target_tasks is not None:
+                target_tasks.pop(seq, None)
+                if not target_tasks:
+                    self._target_task_index.pop(name)
+
+    def _notify_waiting_clients(self, fl_ctx: FLContext, task: Optional[Task] = None):
+        """Notify the waiting clients that a task may be ready for them, so that they ask for it right away.
+
+        Args:
+            fl_ctx: FLContext
+            task: the task that may be ready. If None or the task may be sent to any client, all waiting clients
+                are notified; otherwise only the waiting targets of the task are notified.
+        """
+        with self._task_lock:
+            if task is None or not getattr(task.props.get(_TASK_KEY_MANAGER), "fixed_targets", False):
+                names = self._waiting_clients
+                self._waiting_clients = set()
+            else:
+                names = self._waiting_clients.intersection(task.targets)
+                self._waiting_clients.difference_update(names)
+
+        if names and self._engine:
+            self.logger.debug(f"notifying {len(names)} waiting clients of task ready")
+            self._engine.send_aux_request(
+                targets=list(names),
+                topic=ReservedTopic.TASK_READY,
+                request=Shareable(),
+                timeout=0.0,
+                fl_ctx=fl_ctx,
+                optional=True,
+            )
+
     def handle_exception(self, task_id: str, fl_ctx: FLContext) -> None:
         """Called to cancel one task as its client_task is causing exception at upper level.
 
@@ -460,6 +563,16 @@ class WFCommServer(FLComponent, WFCommSpec):
 
             client_task.result_received_time = time.time()
 
+        # the task may be able to exit now - no need to wait for the next check period
+        self._task_check_needed.set()
+
+        if getattr(manager, "notify_on_result", False):
+            # the task may be sent to another client now, and the next handover is counted from now
+            with self._task_lock:
+                if task.is_standing:
+                    self._schedule_handover(task, manager, client_task.result_received_time)
+            self._notify_waiting_clients(fl_ctx, task)
+
     def _schedule_task(
         self,
         task: Task,
@@ -511,9 +624,11 @@ class WFCommServer(FLComponent, WFCommSpec):
         task.schedule_time = time.time()
 
         with self._task_lock:
-            self._tasks.append(task)
+            self._add_standing_task(task, manager)
             self.log_info(fl_ctx, "scheduled task {}".format(task.name))
 
+        self._notify_waiting_clients(fl_ctx, task)
+
     def broadcast(
         self,
         task: Task,
@@ -750,6 +865,8 @@ class WFCommServer(FLComponent, WFCommSpec):
             fl_ctx (Optional[FLContext], optional): FLContext associated with this cancellation. Defaults to None.
         """
         task.completion_status = completion_status
+        self._notify_task_waiter(task)
+        self._task_check_needed.set()
 
     def cancel_all_tasks(self, completion_status=TaskCompletionStatus.CANCELLED, fl_ctx: Optional[FLContext] = None):
         """Cancel all standing tasks in this controller.
@@ -760,8 +877,10 @@ class WFCommServer(FLComponent, WFCommSpec):
             fl_ctx (Optional[FLContext], optional): FLContext associated with this cancellation. Defaults to None.
         """
         with self._task_lock:
-            for t in self._tasks:
+            for t in self._tasks.values():
                 t.completion_status = completion_status
+                self._notify_task_waiter(t)
+        self._task_check_needed.set()
 
     def finalize_run(self, fl_ctx: FLContext):
         """Do cleanup of the coordinator implementation.
@@ -775,6 +894,10 @@ class WFCommServer(FLComponent, WFCommSpec):
         """
         self.cancel_all_tasks()  # unconditionally cancel all tasks
         self._all_done = True
+        self._task_check_needed.set()
+
+        # waiting clients will be told to end the run
+        self._notify_waiting_clients(fl_ctx)
 
     def relay(
         self,
@@ -937,7 +1060,8 @@ class WFCommServer(FLComponent, WFCommSpec):
                 with self._engine.new_context() as fl_ctx:
                     self.system_panic("Aborting job due to deployment policy violation", fl_ctx)
                 return
-            time.sleep(self._task_check_period)
+            self._task_check_needed.wait(self._task_check_period)
+            self._task_check_needed.clear()
 
     def check_tasks(self):
         with self._controller_lock:
@@ -946,7 +1070,25 @@ class WFCommServer(FLComponent, WFCommSpec):
     def _do_check_tasks(self):
         exit_tasks = []
         with self._task_lock:
-            for task in self._tasks:
+            # tasks are only checked for timeout when they reach their deadline
+            now = time.time()
+            timed_out = set()
+            while self._task_deadlines and self._task_deadlines[0][0] <= now:
+                _, seq = heapq.heappop(self._task_deadlines)
+                timed_out.add(seq)
+
+            # tasks that may be ready for more clients now (e.g. task assignment timeout of the current target)
+            handover_tasks = []
+            while self._task_handovers and self._task_handovers[0][0] <= now:
+                handover_time, seq = heapq.heappop(self._task_handovers)
+                task = self._tasks.get(seq)
+                if task is None or task.props.get(_TASK_KEY_HANDOVER) != handover_time:
+                    # the task is gone or its handover was rescheduled
+                    continue
+                handover_tasks.append(task)
+                self._schedule_handover(task, task.props[_TASK_KEY_MANAGER], handover_time)
+
+            for seq, task in self._tasks.items():
                 if task.completion_status is not None:
                     exit_tasks.append(task)
                     continue
@@ -966,7 +1108,7 @@ class WFCommServer(FLComponent, WFCommSpec):
                         continue
 
                 # check if task timeout
-                if task.timeout and time.time() - task.schedule_time >= task.timeout:
+                if seq in timed_out:
                     task.completion_status = TaskCompletionStatus.TIMEOUT
                     exit_tasks.append(task)
                     continue
@@ -984,11 +1126,17 @@ class WFCommServer(FLComponent, WFCommSpec):
                 self.logger.debug(
                     "Removing task={}, completion_status={}".format(exit_task, exit_task.completion_status)
                 )
-                self._tasks.remove(exit_task)
+                self._remove_standing_task(exit_task)
                 for client_task in exit_task.client_tasks:
                     self.logger.debug("Removing client_task with id={}".format(client_task.id))
                     self._client_task_map.pop(client_task.id)
 
+        if handover_tasks:
+            with self._engine.new_context() as fl_ctx:
+                for task in handover_tasks:
+                    if task.is_standing:
+                        self._notify_waiting_clients(fl_ctx, task)
+
         # do the task exit processing outside the lock to minimize the locking time
         # and to avoid potential deadlock since the CB could schedule another task
         if len(exit_tasks) <= 0:
@@ -1035,6 +1183,9 @@ class WFCommServer(FLComponent, WFCommSpec):
                     if hasattr(exit_task, "_broadcast_data"):
                         delattr(exit_task, "_broadcast_data")
 
+                # the targets of the task may have been blocked by it
+                self._notify_waiting_clients(fl_ctx, exit_task)
+
     def _get_task_dead_clients(self, task: Task):
         """
         See whether the task is only waiting for response from a dead client
@@ -1067,17 +1218,36 @@ class WFCommServer(FLComponent, WFCommSpec):
 
         return dead_clients
 
+    @staticmethod
+    def _notify_task_waiter(task: Task):
+        done_event = task.props.get(_TASK_KEY_DONE_EVENT)
+        if done_event is not None:
+            done_event.set()
+
     @staticmethod
     def _process_finished_task(task, func):
         def wrap(*args, **kwargs):
-            if func:
-                func(*args, **kwargs)
-            task.props[_TASK_KEY_DONE] = True
+            try:
+                if func:
+                    func(*args, **kwargs)
+            finally:
+                task.props[_TASK_KEY_DONE] = True
+                WFCommServer._notify_task_waiter(task)
 
         return wrap
 
     def wait_for_task(self, task: Task, abort_signal: Signal):
+        """Wait for the task to be done.
+
+        The waiter is woken up as soon as the task is done or cancelled. It also checks the abort signal
+        every task check period.
+
+        Args:
+            task: the task to wait for
+            abort_signal: signal to abort the wait and the task
+        """
         task.props[_TASK_KEY_DONE] = False
+        task.props[_TASK_KEY_DONE_EVENT] = threading.Event()
         task.task_done_cb = self._process_finished_task(task=task, func=task.task_done_cb)
         while True:
             if task.completion_status is not None:
@@ -1090,7 +1260,7 @@ class WFCommServer(FLComponent, WFCommSpec):
             task_done = task.props[_TASK_KEY_DONE]
             if task_done:
                 break
-            time.sleep(self._task_check_period)
+            task.props[_TASK_KEY_DONE_EVENT].wait(self._task_check_period)
 
     def _job_policy_violated(self):
         if not self._engine:
@@ -12,11 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsData, AnalyticsDataType, LogWriterName
-from nvflare.apis.dxo import DXO
+import threading
+from typing import Callable, List
+
+from nvflare.apis.analytix import (
+    ANALYTIC_EVENT_TYPE,
+    BATCHABLE_DATA_TYPES,
+    AnalyticsData,
+    AnalyticsDataType,
+    LogWriterName,
+    TrackConst,
+)
+from nvflare.apis.dxo import DXO, DataKind
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import FLContextKey
 from nvflare.apis.fl_context import FLContext
+from nvflare.fuel.utils.log_utils import get_obj_logger
 
 
 def send_analytic_dxo(
@@ -70,3 +81,168 @@ def create_analytic_dxo(
     data = AnalyticsData(key=tag, value=value, data_type=data_type, sender=writer, **kwargs)
     dxo = data.to_dxo()
     return dxo
+
+
+def is_analytic_batch_dxo(dxo: DXO) -> bool:
+    """Checks whether the dxo is a batch of analytic records created by create_analytic_batch_dxo."""
+    return dxo.data_kind == DataKind.ANALYTIC and dxo.get_meta_prop(TrackConst.DATA_TYPE_KEY) == AnalyticsDataType.BATCH
+
+
+def create_analytic_batch_dxo(dxos: List[DXO]) -> DXO:
+    """Creates one DXO that holds the records of the analytic DXOs column by column.
+
+    Args:
+        dxos (List[DXO]): analytic DXOs of the same writer, each holding one record.
+
+    Returns:
+        A DXO of data type AnalyticsDataType.BATCH. split_analytic_batch_dxo restores the original DXOs.
+    """
+    if not dxos:
+        raise ValueError("cannot create analytic batch without records")
+
+    writer = dxos[0].get_meta_prop(TrackConst.TRACKER_KEY)
+    tags, values, steps, data_types, kwargs_list = [], [], [], [], []
+    for dxo in dxos:
+        if dxo.get_meta_prop(TrackConst.TRACKER_KEY) != writer:
+            raise ValueError(f"all records of a batch must have writer {writer}")
+        data = dxo.data
+        tags.append(data[TrackConst.TRACK_KEY])
+        values.append(data[TrackConst.TRACK_VALUE])
+        steps.append(data.get(TrackConst.GLOBAL_STEP_KEY))
+        data_types.append(dxo.get_meta_prop(TrackConst.DATA_TYPE_KEY).value)
+        # the step is in its own column
+        kwargs = {k: v for k, v in data.get(TrackConst.KWARGS_KEY, {}).items() if k != TrackConst.GLOBAL_STEP_KEY}
+        kwargs_list.append(kwargs if kwargs else None)
+
+    batch = DXO(
+        data_kind=DataKind.ANALYTIC,
+        data={
+            TrackConst.BATCH_TRACK_KEYS: tags,
+            TrackConst.BATCH_TRACK_VALUES: values,
+            TrackConst.BATCH_GLOBAL_STEPS: steps,
+            TrackConst.BATCH_DATA_TYPES: data_types,
+            TrackConst.BATCH_KWARGS: kwargs_list,
+        },
+    )
+    batch.set_meta_prop(TrackConst.DATA_TYPE_KEY, AnalyticsDataType.BATCH)
+    batch.set_meta_prop(TrackConst.TRACKER_KEY, writer)
+    return batch
+
+
+def split_analytic_batch_dxo(dxo: DXO) -> List[DXO]:
+    """Splits a batch DXO created by create_analytic_batch_dxo into analytic DXOs of one record each.
+
+    Args:
+        dxo (DXO): the batch DXO.
+
+    Returns:
+        A list of DXOs, in the order the records were added to the batch.
+    """
+    if not is_analytic_batch_dxo(dxo):
+        raise ValueError("dxo is not a batch of analytic records")
+
+    writer = dxo.get_meta_prop(TrackConst.TRACKER_KEY)
+    data = dxo.data
+    columns = zip(
+        data[TrackConst.BATCH_TRACK_KEYS],
+        data[TrackConst.BATCH_TRACK_VALUES],
+        data[TrackConst.BATCH_GLOBAL_STEPS],
+        data[TrackConst.BATCH_DATA_TYPES],
+        data[TrackConst.BATCH_KWARGS],
+    )
+    result = []
+    for tag, value, step, data_type, kwargs in columns:
+        record = {TrackConst.TRACK_KEY: tag, TrackConst.TRACK_VALUE: value}
+        kwargs = dict(kwargs) if kwargs else {}
+        if step is not None:
+            record[TrackConst.GLOBAL_STEP_KEY] = step
+            kwargs[TrackConst.GLOBAL_STEP_KEY] = step
+        if kwargs.get(TrackConst.PATH_KEY):
+            record[TrackConst.PATH_KEY] = kwargs[TrackConst.PATH_KEY]
+        if kwargs:
+            record[TrackConst.KWARGS_KEY] = kwargs
+        record_dxo = DXO(data_kind=DataKind.ANALYTIC, data=record)
+        record_dxo.set_meta_prop(TrackConst.DATA_TYPE_KEY, AnalyticsDataType(data_type))
+        record_dxo.set_meta_prop(TrackConst.TRACKER_KEY, writer)
+        result.append(record_dxo)
+    return result
+
+
+class AnalyticsBatcher:
+    def __init__(self, send_func: Callable[[DXO], None], batch_size: int = 100, flush_interval: float = 1.0):
+        """Buffers scalar and metric records and sends them in batches.
+
+        Records are buffered per writer. A buffer is sent as one batch DXO when it has batch_size records,
+        when flush_interval seconds have passed since the last flush, or when flush is called (e.g. at the end of
+        a task). Records of other data types flush the buffers and are sent as they are, so the records of a
+        writer are always sent in the order they were added.
+
+        Args:
+            send_func: the function to send a DXO.
+            batch_size (int): max number of records in a batch.
+            flush_interval (float): max time in seconds that a record is buffered.
+        """
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive int but got {batch_size}")
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive but got {flush_interval}")
+        self.send_func = send_func
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.logger = get_obj_logger(self)
+        self._buffers = {}  # writer => list of DXOs
+        # held while sending, so that batches of a writer are not reordered by the flush thread
+        self._lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._flush_thread = None
+
+    def add(self, dxo: DXO):
+        """Adds an analytic DXO of one record.
+
+        Args:
+            dxo (DXO): the analytic DXO.
+        """
+        data_type = dxo.get_meta_prop(TrackConst.DATA_TYPE_KEY)
+        with self._lock:
+            if data_type not in BATCHABLE_DATA_TYPES or self._stopped.is_set():
+                self._flush()
+                self.send_func(dxo)
+                return
+
+            writer = dxo.get_meta_prop(TrackConst.TRACKER_KEY)
+            buffer = self._buffers.setdefault(writer, [])
+            buffer.append(dxo)
+            if len(buffer) >= self.batch_size:
+                self._send(self._buffers.pop(writer))
+            elif self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._flush_periodically, daemon=True)
+                self._flush_thread.start()
+
+    def flush(self):
+        """Sends all buffered records."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Sends all buffered records and stops the flush thread. Records added later are sent right away."""
+        self._stopped.set()
+        self.flush()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+
+    def _flush(self):
+        buffers = self._buffers
+        self._buffers = {}
+        for records in buffers.values():
+            self._send(records)
+
+    def _send(self, records: List[DXO]):
+        self.send_func(records[0] if len(records) == 1 else create_analytic_batch_dxo(records))
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"failed to flush analytic records: {e}")
@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+import time
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import EventScope, FLContextKey
@@ -23,14 +25,113 @@ from nvflare.security.logging import secure_format_exception
 _KEY_EVENT_DEPTH = "###event_depth"
 _MAX_EVENT_DEPTH = 20
 
+_EVENT_PROP_KEYS = (FLContextKey.EVENT_ID, FLContextKey.EVENT_DATA, FLContextKey.EVENT_ORIGIN, FLContextKey.EVENT_SCOPE)
 
-def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLContext):
+
+def _overrides_handle_event(component: FLComponent) -> bool:
+    return type(component).handle_event is not FLComponent.handle_event or "handle_event" in getattr(
+        component, "__dict__", {}
+    )
+
+
+def find_subscribers(event: str, components: List[FLComponent]) -> List[Tuple[FLComponent, Optional[list]]]:
+    """Find the components that handle the event, in the order of the components.
+
+    A component handles the event if it has registered handlers for it, or if it overrides handle_event, which is
+    called for events without registered handlers. Components that do neither would ignore the event.
+
+    Args:
+        event: the event type
+        components: the components
+
+    Returns: list of (component, registered handlers of the event). The handlers are None if handle_event is to be
+        called instead.
+
+    """
+    subscribers = []
+    for h in components:
+        if not isinstance(h, FLComponent):
+            raise TypeError(f"handler must be FLComponent but got {type(h)}")
+        entries = h.get_event_handlers().get(event)
+        if entries:
+            subscribers.append((h, list(entries)))
+        elif _overrides_handle_event(h):
+            subscribers.append((h, None))
+    return subscribers
+
+
+class EventSubscriptionIndex:
+    def __init__(self, timing: bool = False):
+        """Index of the components that handle each event type, for firing events to a list of components.
+
+        The subscribers of an event type are found when the event is first fired. The index is rebuilt when the list
+        of components changes, or when any component registers an event handler.
+
+        Args:
+            timing: whether to record the number of calls and the time spent by each handler of each event type
+        """
+        self.timing = timing
+        self._state = ((), None, {})  # (components, handlers version, event type => subscribers)
+        self._stats = {}  # (component name, event type) => [number of calls, total time]
+        self._stats_lock = threading.Lock()
+
+    def get_subscribers(self, event: str, components: List[FLComponent]) -> List[Tuple[FLComponent, Optional[list]]]:
+        """Get the components that handle the event. See find_subscribers."""
+        components = tuple(components) if components else ()
+        version = FLComponent.event_handlers_version
+        state = self._state
+        if state[1] != version or state[0] != components:
+            state = (components, version, {})
+            self._state = state
+
+        subscribers = state[2].get(event)
+        if subscribers is None:
+            subscribers = find_subscribers(event, components)
+            state[2][event] = subscribers
+        return subscribers
+
+    def add_handler_time(self, component: FLComponent, event: str, duration: float):
+        key = (component.name, event)
+        with self._stats_lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = [1, duration]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+
+    def get_handler_stats(self) -> List[Tuple[str, str, int, float]]:
+        """Get the recorded handler times, slowest first.
+
+        Returns: list of (component name, event type, number of calls, total time in seconds)
+
+        """
+        with self._stats_lock:
+            stats = [(name, event, count, total) for (name, event), (count, total) in self._stats.items()]
+        return sorted(stats, key=lambda x: x[3], reverse=True)
+
+    def format_handler_stats(self, max_rows: int = 20) -> str:
+        lines = [f"{'component':<40} {'event':<40} {'calls':>8} {'total(s)':>10} {'avg(ms)':>10}"]
+        for name, event, count, total in self.get_handler_stats()[:max_rows]:
+            lines.append(f"{name:<40} {event:<40} {count:>8} {total:>10.3f} {total * 1000.0 / count:>10.3f}")
+        return "\n".join(lines)
+
+
+def fire_event_to_components(
+    event: str,
+    components: List[FLComponent],
+    ctx: FLContext,
+    subscription_index: Optional[EventSubscriptionIndex] = None,
+):
     """Fires the specified event and invokes the list of handlers.
 
+    Only the components that handle the event are invoked, see find_subscribers.
+
     Args:
         event: the event to be fired
         components: components to be invoked
         ctx: context for cross-component data sharing
+        subscription_index: optional index to find the components that handle the event, which is kept across events
 
     Returns: N/A
 
@@ -48,29 +149,33 @@ def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLC
     ctx.set_prop(key=_KEY_EVENT_DEPTH, value=depth + 1, private=True, sticky=False)
 
     if components:
-        for h in components:
-            if not isinstance(h, FLComponent):
-                raise TypeError(f"handler must be FLComponent but got {type(h)}")
+        if subscription_index:
+            subscribers = subscription_index.get_subscribers(event, components)
+            timing = subscription_index.timing
+        else:
+            subscribers = find_subscribers(event, components)
+            timing = False
+
+        event_props = (event_id, event_data, event_origin, event_scope)
+        if subscribers:
+            _set_event_props(ctx, event_props)
+
+        for h, entries in subscribers:
             try:
-                # since events could be recursive (a handler fires another event) on the same fl_ctx,
-                # we need to reset these key values into the fl_ctx
-                ctx.set_prop(key=FLContextKey.EVENT_ID, value=event_id, private=True, sticky=False)
-                ctx.set_prop(key=FLContextKey.EVENT_DATA, value=event_data, private=True, sticky=False)
-                ctx.set_prop(key=FLContextKey.EVENT_ORIGIN, value=event_origin, private=True, sticky=False)
-                ctx.set_prop(key=FLContextKey.EVENT_SCOPE, value=event_scope, private=True, sticky=False)
-
-                event_table = h.get_event_handlers()
-                if event_table:
-                    entries = event_table.get(event)
-                    if entries:
-                        for cb, kwargs in entries:
-                            cb(event, ctx, **kwargs)
-                    else:
-                        # no CB explicitly for this event - call the default handler.
-                        h.handle_event(event, ctx)
+                # since events could be recursive (a handler fires another event) on the same fl_ctx, a handler may
+                # have changed these key values in the fl_ctx: set them again for the next handler
+                if not _has_event_props(ctx, event_props):
+                    _set_event_props(ctx, event_props)
+
+                start = time.perf_counter() if timing else None
+                if entries:
+                    for cb, kwargs in entries:
+                        cb(event, ctx, **kwargs)
                 else:
-                    # no explicitly defined CBs - call the default handler.
+                    # no CB explicitly for this event - call the default handler.
                     h.handle_event(event, ctx)
+                if timing:
+                    subscription_index.add_handler_time(h, event, time.perf_counter() - start)
             except Exception as e:
                 h.log_exception(
                     ctx, f'Exception when handling event "{event}": {secure_format_exception(e)}', fire_event=False
@@ -82,3 +187,12 @@ def fire_event_to_components(event: str, components: List[FLComponent], ctx: FLC
                 exceptions[h.name] = e
 
     ctx.set_prop(key=_KEY_EVENT_DEPTH, value=depth, private=True, sticky=False)
+
+
+def _set_event_props(ctx: FLContext, values):
+    for key, value in zip(_EVENT_PROP_KEYS, values):
+        ctx.set_prop(key=key, value=value, private=True, sticky=False)
+
+
+def _has_event_props(ctx: FLContext, values) -> bool:
+    return all(ctx.get_prop(key) is value for key, value in zip(_EVENT_PROP_KEYS, values))
@@ -16,11 +16,17 @@ import threading
 import time
 import uuid
 
-from nvflare.apis.fl_constant import ConfigVarName, SystemConfigs
+from nvflare.apis.fl_constant import ConfigVarName, FLContextKey, ProcessType, SiteType, SystemConfigs
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import ReservedHeaderKey, ReturnCode, Shareable, make_reply
 from nvflare.apis.signal import Signal
 from nvflare.apis.utils.fl_context_utils import generate_log_message
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.cellnet.fqcn import FQCN
+from nvflare.fuel.f3.streaming.bytes_downloader import add_bytes, download_bytes
+from nvflare.fuel.f3.streaming.download_service import DownloadService
+from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+from nvflare.fuel.utils import fobs
 from nvflare.fuel.utils.config_service import ConfigService
 from nvflare.fuel.utils.log_utils import get_module_logger
 from nvflare.fuel.utils.msg_root_utils import delete_msg_root
@@ -39,6 +45,14 @@ HEADER_TX_ID = "rm.tx_id"
 HEADER_PER_MSG_TIMEOUT = "rm.per_msg_timeout"
 HEADER_TX_TIMEOUT = "rm.tx_timeout"
 HEADER_STATUS = "rm.status"
+HEADER_PAYLOAD_REF = "rm.payload_ref"
+HEADER_PAYLOAD_SIZE = "rm.payload_size"
+
+# RM headers copied to the control message of a staged payload
+_CONTROL_HEADERS = [HEADER_TX_ID, HEADER_OP, HEADER_TOPIC, HEADER_PER_MSG_TIMEOUT, HEADER_TX_TIMEOUT]
+
+# when the result is pushed, the requester only queries the peer occasionally to detect lost requests
+_PUSH_QUERY_INTERVAL_FACTOR = 5
 
 # Status
 STATUS_IN_PROCESS = "in_process"
@@ -76,6 +90,108 @@ def _error_reply(rc: str, error: str):
     return make_reply(rc, headers={ReservedHeaderKey.ERROR: error})
 
 
+def _get_cell(fl_ctx: FLContext):
+    engine = fl_ctx.get_engine()
+    get_cell = getattr(engine, "get_cell", None)
+    return get_cell() if callable(get_cell) else None
+
+
+def _get_msg_origin(fl_ctx: FLContext):
+    """Get the FQCN of the cell that sent the message being processed, as authenticated by the cellnet."""
+    cell_msg = fl_ctx.get_prop(FLContextKey.CELL_MESSAGE)
+    return cell_msg.get_header(MessageHeaderKey.ORIGIN) if cell_msg else None
+
+
+def _get_peer_fqcn(fl_ctx: FLContext, peer_name: str):
+    """Get the FQCN of the cell that aux messages to the peer are sent to."""
+    if peer_name.lower() == SiteType.SERVER:
+        fqcn = FQCN.ROOT_SERVER
+    else:
+        get_client = getattr(fl_ctx.get_engine(), "get_client_from_name", None)
+        client = get_client(peer_name) if callable(get_client) else None
+        if not client:
+            return None
+        fqcn = client.get_fqcn()
+
+    if fl_ctx.get_process_type() in [ProcessType.CLIENT_JOB, ProcessType.SERVER_JOB]:
+        fqcn = FQCN.join([fqcn, fl_ctx.get_job_id()])
+    return fqcn
+
+
+def _is_staged(msg: Shareable) -> bool:
+    return isinstance(msg, Shareable) and msg.get_header(HEADER_PAYLOAD_REF) is not None
+
+
+def _stage_payload(cell, msg: Shareable, download_tx_id: str, timeout: float) -> Shareable:
+    """Serialize the message once and add it to the download service.
+
+    Args:
+        cell: the cell that serves the download
+        msg: the message to be staged
+        download_tx_id: ID of the download transaction
+        timeout: the download transaction is removed after being idle for this long
+
+    Returns: the control message that references the staged payload, with the RM headers of the message.
+
+    """
+    data = fobs.dumps(msg)
+    downloader = ObjectDownloader(cell=cell, timeout=timeout, num_receivers=1, tx_id=download_tx_id)
+    ref_id = add_bytes(downloader, data)
+    control = Shareable()
+    for k in _CONTROL_HEADERS:
+        v = msg.get_header(k)
+        if v is not None:
+            control.set_header(k, v)
+    control.set_header(HEADER_PAYLOAD_REF, ref_id)
+    control.set_header(HEADER_PAYLOAD_SIZE, len(data))
+    return control
+
+
+def _fetch_payload(
+    cell, owner: str, control: Shareable, per_msg_timeout: float, deadline: float, retry_interval: float, abort_signal
+):
+    """Download the payload referenced by the control message from the owner.
+
+    The owner is the peer cell that the control message is exchanged with, never a cell named by the message.
+    A failed download is resumed from the last byte received, until the deadline.
+
+    Returns: tuple of (error message if any, the payload).
+
+    """
+    ref_id = control.get_header(HEADER_PAYLOAD_REF)
+    size = control.get_header(HEADER_PAYLOAD_SIZE)
+    if not cell:
+        return "no cell to download the payload", None
+    if not owner:
+        return "unknown owner of the payload", None
+
+    consumer = None
+    while True:
+        err, consumer = download_bytes(
+            from_fqcn=owner,
+            ref_id=ref_id,
+            per_request_timeout=per_msg_timeout,
+            cell=cell,
+            consumer=consumer,
+            optional=True,
+            abort_signal=abort_signal,
+        )
+        if not err:
+            break
+        if abort_signal and abort_signal.triggered:
+            return "aborted", None
+        if time.time() + retry_interval >= deadline:
+            return f"failed to download payload from {owner} ({len(consumer.buffer)} of {size} bytes): {err}", None
+        time.sleep(retry_interval)
+
+    if len(consumer.buffer) != size:
+        return f"payload size mismatch: expect {size} bytes but got {len(consumer.buffer)}", None
+    payload = fobs.loads(memoryview(consumer.buffer))
+    if not isinstance(payload, Shareable):
+        return f"payload must be Shareable but got {type(payload)}", None
+    return None, payload
+
+
 class _RequestReceiver:
     """This class handles reliable message request on the receiving end"""
 
@@ -96,9 +212,11 @@ class _RequestReceiver:
         self.rcv_time = None
         self.result = None
         self.source = None
+        self.source_fqcn = None
         self.tx_id = None
         self.reply_time = None
         self.replying = False
+        self.staged = False
         self.lock = threading.Lock()
 
     def process(self, request: Shareable, fl_ctx: FLContext) -> Shareable:
@@ -117,6 +235,8 @@ class _RequestReceiver:
                     self.rcv_time = time.time()
                     self.per_msg_timeout = request.get_header(HEADER_PER_MSG_TIMEOUT)
                     self.tx_timeout = request.get_header(HEADER_TX_TIMEOUT)
+                    self.staged = _is_staged(request)
+                    self.source_fqcn = _get_msg_origin(fl_ctx)
 
                     # start processing
                     ReliableMessage.info(fl_ctx, f"started processing request of topic {self.topic}")
@@ -163,19 +283,34 @@ class _RequestReceiver:
 
     def _try_reply(self, fl_ctx: FLContext):
         engine = fl_ctx.get_engine()
-        self.replying = True
         start_time = time.time()
-        ReliableMessage.debug(fl_ctx, f"try to send reply back to {self.source}: {self.per_msg_timeout=}")
-        ack = engine.send_aux_request(
-            targets=[self.source],
-            topic=TOPIC_RELIABLE_REPLY,
-            request=self.result,
-            timeout=self.per_msg_timeout,
-            fl_ctx=fl_ctx,
-        )
+        num_tries = 0
+        while True:
+            self.replying = True
+            ReliableMessage.debug(fl_ctx, f"try to send reply back to {self.source}: {self.per_msg_timeout=}")
+            ack = engine.send_aux_request(
+                targets=[self.source],
+                topic=TOPIC_RELIABLE_REPLY,
+                request=self.result,
+                timeout=self.per_msg_timeout,
+                fl_ctx=fl_ctx,
+            )
+            self.replying = False
+            _, rc = _extract_result(ack, self.source)
+            if rc == ReturnCode.OK or not _is_staged(self.result):
+                break
+
+            # the result notice is small: keep pushing it, so the requester doesn't need to poll for the result
+            num_tries += 1
+            if (
+                not ReliableMessage.is_available()
+                or time.time() + ReliableMessage._query_interval - self.rcv_time >= self.tx_timeout
+            ):
+                break
+            ReliableMessage.debug(fl_ctx, f"failed to push result notice ({rc=}): retry #{num_tries}")
+            time.sleep(ReliableMessage._query_interval)
+
         time_spent = time.time() - start_time
-        self.replying = False
-        _, rc = _extract_result(ack, self.source)
         if rc == ReturnCode.OK:
             # reply sent successfully!
             self.reply_time = time.time()
@@ -192,17 +327,45 @@ class _RequestReceiver:
 
     def _do_request(self, request: Shareable, fl_ctx: FLContext):
         start_time = time.time()
-        ReliableMessage.debug(fl_ctx, "invoking request handler")
-        try:
-            result = self.request_handler_f(self.topic, request, fl_ctx)
-        except Exception as e:
-            ReliableMessage.error(fl_ctx, f"exception processing request: {secure_format_traceback()}")
-            result = _error_reply(ReturnCode.EXECUTION_EXCEPTION, secure_format_exception(e))
+        cell = _get_cell(fl_ctx) if self.staged else None
+        result = None
+        if self.staged:
+            # only the control message was sent: download the request from the requester
+            err, payload = _fetch_payload(
+                cell,
+                self.source_fqcn,
+                request,
+                per_msg_timeout=self.per_msg_timeout,
+                deadline=self.rcv_time + self.tx_timeout,
+                retry_interval=ReliableMessage._query_interval,
+                abort_signal=None,
+            )
+            if err:
+                ReliableMessage.error(fl_ctx, f"failed to get staged request: {err}")
+                result = _error_reply(ReturnCode.COMMUNICATION_ERROR, err)
+            else:
+                ReliableMessage.debug(fl_ctx, f"downloaded staged request in {time.time() - start_time} secs")
+                payload.set_peer_props(request.get_peer_props())
+                request = payload
+
+        if result is None:
+            ReliableMessage.debug(fl_ctx, "invoking request handler")
+            try:
+                result = self.request_handler_f(self.topic, request, fl_ctx)
+            except Exception as e:
+                ReliableMessage.error(fl_ctx, f"exception processing request: {secure_format_traceback()}")
+                result = _error_reply(ReturnCode.EXECUTION_EXCEPTION, secure_format_exception(e))
 
         # send back
         result.set_header(HEADER_TX_ID, self.tx_id)
         result.set_header(HEADER_OP, OP_REPLY)
         result.set_header(HEADER_TOPIC, self.topic)
+        if cell:
+            # stage the result, and push a small notice to the requester instead of the result itself
+            try:
+                result = _stage_payload(cell, result, f"{self.tx_id}.reply", self.tx_timeout)
+            except Exception as e:
+                ReliableMessage.warning(fl_ctx, f"failed to stage result, sending it directly: {e}")
         self.result = result
         ReliableMessage.debug(fl_ctx, f"finished request handler in {time.time() - start_time} secs")
         self._try_reply(fl_ctx)
@@ -211,8 +374,10 @@ class _RequestReceiver:
 class _ReplyReceiver:
     """This class handles reliable message replies on the sending end"""
 
-    def __init__(self, tx_id: str, per_msg_timeout: float, tx_timeout: float):
+    def __init__(self, tx_id: str, per_msg_timeout: float, tx_timeout: float, peer_fqcn: str = None):
         self.tx_id = tx_id
+        self.peer_fqcn = peer_fqcn
+        self.staged = bool(peer_fqcn)
         self.tx_start_time = time.time()
         self.tx_timeout = tx_timeout
         self.per_msg_timeout = per_msg_timeout
@@ -233,6 +398,7 @@ class ReliableMessage:
     _enabled = False
     _executor = None
     _query_interval = 1.0
+    _stage_payload = False
     _max_retries = 5
     _reply_receivers = {}  # tx id => receiver
     _tx_lock = threading.Lock()
@@ -387,7 +553,12 @@ class ReliableMessage:
             name=ConfigVarName.RM_QUERY_INTERVAL, conf=SystemConfigs.APPLICATION_CONF, default=2.0
         )
 
+        stage_payload = ConfigService.get_bool_var(
+            name=ConfigVarName.RM_STAGE_PAYLOAD, conf=SystemConfigs.APPLICATION_CONF, default=False
+        )
+
         cls._query_interval = query_interval
+        cls._stage_payload = stage_payload
         cls._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_request_workers, thread_name_prefix="rm")
         engine = fl_ctx.get_engine()
         engine.register_aux_message_handler(
@@ -400,7 +571,7 @@ class ReliableMessage:
         )
         t = threading.Thread(target=cls._monitor_req_receivers, name="rm_monitor", daemon=True)
         t.start()
-        cls._logger.info(f"enabled reliable message: {max_request_workers=} {query_interval=}")
+        cls._logger.info(f"enabled reliable message: {max_request_workers=} {query_interval=} {stage_payload=}")
 
     @classmethod
     def _monitor_req_receivers(cls):
@@ -522,6 +693,12 @@ class ReliableMessage:
             If `tx_timeout` is not specified or is less than or equal to `per_msg_timeout`,
             the request will be sent only once without retrying.
 
+            Otherwise, if payload staging is enabled (the "rm_stage_payload" config var) and the engine has a cell,
+            the request is serialized once and staged in the download service.
+            Only a small control message is resent until the peer acks it, and the peer downloads the request,
+            resuming from the last byte received if the download is interrupted. The result is returned the same
+            way: the peer stages it and pushes a notice, and the result is downloaded from the peer.
+
         """
         check_positive_number("per_msg_timeout", per_msg_timeout)
         if tx_timeout:
@@ -549,23 +726,65 @@ class ReliableMessage:
         tx_id = str(uuid.uuid4())
         fl_ctx.set_prop(key=PROP_KEY_TX_ID, value=tx_id, private=True, sticky=False)
         cls.debug(fl_ctx, f"send request with Reliable Msg {per_msg_timeout=} {tx_timeout=}")
-        receiver = _ReplyReceiver(tx_id, per_msg_timeout, tx_timeout)
-        cls._reply_receivers[tx_id] = receiver
         request.set_header(HEADER_TX_ID, tx_id)
         request.set_header(HEADER_OP, OP_REQUEST)
         request.set_header(HEADER_TOPIC, topic)
         request.set_header(HEADER_PER_MSG_TIMEOUT, per_msg_timeout)
         request.set_header(HEADER_TX_TIMEOUT, tx_timeout)
+
+        cell = _get_cell(fl_ctx) if cls._stage_payload else None
+        peer_fqcn = _get_peer_fqcn(fl_ctx, target) if cell else None
+        download_tx_id = None
+        if peer_fqcn:
+            try:
+                request = _stage_payload(cell, request, f"{tx_id}.req", tx_timeout)
+                download_tx_id = f"{tx_id}.req"
+            except Exception as e:
+                cls.warning(fl_ctx, f"failed to stage request, sending it directly: {secure_format_exception(e)}")
+                peer_fqcn = None
+
+        receiver = _ReplyReceiver(tx_id, per_msg_timeout, tx_timeout, peer_fqcn=peer_fqcn)
+        cls._reply_receivers[tx_id] = receiver
         try:
             result = cls._send_request(target, request, abort_signal, fl_ctx, receiver)
+            if _is_staged(result):
+                result = cls._fetch_result(result, abort_signal, fl_ctx, receiver)
         except Exception as e:
             cls.error(fl_ctx, f"exception sending reliable message: {secure_format_traceback()}")
             result = _error_reply(ReturnCode.ERROR, secure_format_exception(e))
 
         delete_msg_root(msg_root_id)
+        if download_tx_id:
+            DownloadService.delete_transaction(download_tx_id)
         cls._reply_receivers.pop(tx_id)
         return result
 
+    @classmethod
+    def _fetch_result(
+        cls,
+        notice: Shareable,
+        abort_signal: Signal,
+        fl_ctx: FLContext,
+        receiver: _ReplyReceiver,
+    ) -> Shareable:
+        start_time = time.time()
+        err, result = _fetch_payload(
+            _get_cell(fl_ctx),
+            receiver.peer_fqcn,
+            notice,
+            per_msg_timeout=receiver.per_msg_timeout,
+            deadline=receiver.tx_start_time + receiver.tx_timeout,
+            retry_interval=cls._query_interval,
+            abort_signal=abort_signal,
+        )
+        if abort_signal and abort_signal.triggered:
+            return make_reply(ReturnCode.TASK_ABORTED)
+        if err:
+            cls.error(fl_ctx, f"failed to get staged result: {err}")
+            return _error_reply(ReturnCode.COMMUNICATION_ERROR, err)
+        cls.debug(fl_ctx, f"downloaded staged result in {time.time() - start_time} secs")
+        return result
+
     @classmethod
     def _send_request(
         cls,
@@ -657,6 +876,10 @@ class ReliableMessage:
     ) -> Shareable:
         tx_timeout = receiver.tx_timeout
         per_msg_timeout = receiver.per_msg_timeout
+        query_interval = cls._query_interval
+        if receiver.staged:
+            # the peer keeps pushing the result notice until acked: only query to detect a lost request
+            query_interval *= _PUSH_QUERY_INTERVAL_FACTOR
 
         # Querying phase - try to get result
         engine = fl_ctx.get_engine()
@@ -665,7 +888,8 @@ class ReliableMessage:
         query.set_header(HEADER_OP, OP_QUERY)
 
         num_tries = 0
-        last_query_time = 0
+        # the peer just acked the request: with pushed results, there is no need to query right away
+        last_query_time = time.time() if receiver.staged else 0
         short_wait = 0.1
         while True:
             if time.time() - receiver.tx_start_time > tx_timeout:
@@ -683,7 +907,7 @@ class ReliableMessage:
                 cls.debug(fl_ctx, "aborted query triggered by abort signal")
                 return make_reply(ReturnCode.TASK_ABORTED)
 
-            if time.time() - last_query_time < cls._query_interval:
+            if time.time() - last_query_time < query_interval:
                 # don't query too quickly
                 continue
 
@@ -721,9 +945,9 @@ class ReliableMessage:
                     cls.error(fl_ctx, f"peer {target} aborted processing!")
                     return _error_reply(ReturnCode.EXECUTION_EXCEPTION, "Aborted")
 
-                cls.debug(fl_ctx, f"will retry query in {cls._query_interval} secs: {rc=} {status=} {op=}")
+                cls.debug(fl_ctx, f"will retry query in {query_interval} secs: {rc=} {status=} {op=}")
             else:
-                cls.debug(fl_ctx, f"will retry query in {cls._query_interval} secs: {rc=}")
+                cls.debug(fl_ctx, f"will retry query in {query_interval} secs: {rc=}")
 
     @classmethod
     def _register_completed_req(cls, tx_id, tx_timeout):
@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 from nvflare.apis.dxo import DXO, DataKind, MetaKey
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.aggregators.sharded_aggregation_helper import ShardedWeightedAggregationHelper
 from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.fuel.utils.log_utils import get_module_logger
@@ -30,6 +31,9 @@ class DXOAggregator(FLComponent):
         expected_data_kind: DataKind = DataKind.WEIGHT_DIFF,
         name_postfix: str = "",
         weigh_by_local_iter: bool = True,
+        accumulator_dtype: Optional[str] = None,
+        flat_buffer: bool = False,
+        num_shards: int = 1,
     ):
         """Perform accumulated weighted aggregation for one kind of corresponding DXO from contributors.
 
@@ -45,15 +49,34 @@ class DXOAggregator(FLComponent):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            accumulator_dtype (str, optional): NumPy dtype of the accumulators for NumPy arrays.
+                See WeightedAggregationHelper. Defaults to None.
+            flat_buffer (bool, optional): Whether to accumulate all NumPy arrays of a contribution in one flat buffer.
+                See WeightedAggregationHelper. Defaults to `False`.
+            num_shards (int, optional): Number of shards to split the parameters into. With more than one shard,
+                the shards are updated in parallel by a thread pool. See ShardedWeightedAggregationHelper.
+                Defaults to 1.
         """
         super().__init__()
         self.expected_data_kind = expected_data_kind
         self.aggregation_weights = aggregation_weights or {}
         self.logger.debug(f"aggregation weights control: {aggregation_weights}")
 
-        self.aggregation_helper = WeightedAggregationHelper(
-            exclude_vars=exclude_vars, weigh_by_local_iter=weigh_by_local_iter
-        )
+        if num_shards > 1:
+            self.aggregation_helper = ShardedWeightedAggregationHelper(
+                num_shards=num_shards,
+                exclude_vars=exclude_vars,
+                weigh_by_local_iter=weigh_by_local_iter,
+                accumulator_dtype=accumulator_dtype,
+                flat_buffer=flat_buffer,
+            )
+        else:
+            self.aggregation_helper = WeightedAggregationHelper(
+                exclude_vars=exclude_vars,
+                weigh_by_local_iter=weigh_by_local_iter,
+                accumulator_dtype=accumulator_dtype,
+                flat_buffer=flat_buffer,
+            )
 
         self.warning_count = {}
         self.warning_limit = 10
@@ -67,6 +90,10 @@ class DXOAggregator(FLComponent):
         if self.aggregation_helper:
             self.aggregation_helper.reset_stats()
 
+    def shutdown(self):
+        if isinstance(self.aggregation_helper, ShardedWeightedAggregationHelper):
+            self.aggregation_helper.shutdown()
+
     def accept(self, dxo: DXO, contributor_name, contribution_round, fl_ctx: FLContext) -> bool:
         """Store DXO and update aggregator's internal state
         Args:
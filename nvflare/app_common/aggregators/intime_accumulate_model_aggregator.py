@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from nvflare.apis.dxo import DXO, DataKind, from_shareable
 from nvflare.apis.event_type import EventType
@@ -50,6 +50,9 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
         aggregation_weights: Union[Dict[str, Any], Dict[str, Dict[str, Any]], None] = None,
         expected_data_kind: Union[DataKind, Dict[str, DataKind]] = DataKind.WEIGHT_DIFF,
         weigh_by_local_iter: bool = True,
+        accumulator_dtype: Optional[str] = None,
+        flat_buffer: bool = False,
+        num_shards: int = 1,
     ):
         """Perform accumulated weighted aggregation.
 
@@ -75,6 +78,13 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            accumulator_dtype (str, optional): NumPy dtype (e.g. "float64") of the accumulators for NumPy arrays.
+                Defaults to None, which accumulates floating point arrays in their own dtype.
+            flat_buffer (bool, optional): Whether to pack all NumPy arrays of a contribution into one contiguous
+                buffer and accumulate it with a single operation. Defaults to `False`.
+            num_shards (int, optional): Number of shards to split the parameters into. With more than one shard,
+                each shard has its own lock and accumulators, and the shards are updated in parallel by a thread
+                pool, so aggregation uses several cores. Defaults to 1.
         """
         super().__init__()
         self.logger.debug(f"exclude vars: {exclude_vars}")
@@ -83,6 +93,9 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
 
         self._single_dxo_key = ""
         self._weigh_by_local_iter = weigh_by_local_iter
+        self._accumulator_dtype = accumulator_dtype
+        self._flat_buffer = flat_buffer
+        self._num_shards = num_shards
 
         self.aggregation_weights = aggregation_weights
         self.exclude_vars = exclude_vars
@@ -94,6 +107,9 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
         # parameters when re-construct the object creation configuration.
         if event_type == EventType.START_RUN:
             self._initialize(self.aggregation_weights, self.exclude_vars, self.expected_data_kind)
+        elif event_type == EventType.END_RUN:
+            for dxo_aggregator in getattr(self, "dxo_aggregators", {}).values():
+                dxo_aggregator.shutdown()
 
     def _initialize(self, aggregation_weights, exclude_vars, expected_data_kind):
         # Check expected data kind
@@ -166,6 +182,9 @@ class InTimeAccumulateWeightedAggregator(Aggregator):
                         expected_data_kind=self.expected_data_kind[k],
                         name_postfix=k,
                         weigh_by_local_iter=self._weigh_by_local_iter,
+                        accumulator_dtype=self._accumulator_dtype,
+                        flat_buffer=self._flat_buffer,
+                        num_shards=self._num_shards,
                     )
                 }
             )
@@ -0,0 +1,196 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+DEFAULT_SPLIT_THRESHOLD = 64 * 1024 * 1024
+
+
+class _Part(NamedTuple):
+    """Key of one byte range of an array that is split across shards."""
+
+    key: str
+    index: int
+
+
+class ShardedWeightedAggregationHelper(object):
+    def __init__(
+        self,
+        num_shards: int,
+        exclude_vars: Optional[str] = None,
+        weigh_by_local_iter: bool = True,
+        accumulator_dtype: Optional[str] = None,
+        flat_buffer: bool = False,
+        split_threshold: int = DEFAULT_SPLIT_THRESHOLD,
+    ):
+        """Perform weighted aggregation with the parameters sharded across a thread pool.
+
+        Each shard is a WeightedAggregationHelper with its own lock and accumulators. The parameters of a
+        contribution are assigned to shards by key, balanced by size, and all shards are updated in parallel.
+        Since different contributions only contend on the same shard, several contributions can be folded in
+        at the same time. NumPy arrays larger than split_threshold are further split into byte ranges across all
+        shards, so that a model dominated by a few huge layers is still spread over all workers.
+
+        Threads are used rather than processes: NumPy and PyTorch release the GIL in the accumulation math, and
+        worker processes would need a copy of every contribution.
+
+        Args:
+            num_shards: number of shards, which is also the number of worker threads.
+            exclude_vars (str, optional): regex string to match excluded vars during aggregation. Defaults to None.
+            weigh_by_local_iter (bool, optional): Whether to weight the contributions by the number of iterations
+                performed in local training in the current round. See WeightedAggregationHelper.
+            accumulator_dtype (str, optional): NumPy dtype of the accumulators for NumPy arrays.
+                See WeightedAggregationHelper.
+            flat_buffer (bool, optional): Whether each shard packs its arrays into one flat buffer.
+                See WeightedAggregationHelper.
+            split_threshold: NumPy arrays with more bytes than this are split across shards.
+        """
+        super().__init__()
+        check_positive_int("num_shards", num_shards)
+        check_positive_int("split_threshold", split_threshold)
+        self.num_shards = num_shards
+        self.split_threshold = split_threshold
+        self.exclude_vars = re.compile(exclude_vars) if exclude_vars else None
+        self.shards = [
+            WeightedAggregationHelper(
+                weigh_by_local_iter=weigh_by_local_iter,
+                accumulator_dtype=accumulator_dtype,
+                flat_buffer=flat_buffer,
+            )
+            for _ in range(num_shards)
+        ]
+        self.executor = ThreadPoolExecutor(max_workers=num_shards, thread_name_prefix="aggr_shard")
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.history = list()
+            # key (or _Part) -> shard index
+            self.assignments = dict()
+            self.shard_loads = [0] * self.num_shards
+            # key -> (shape, number of parts) of split arrays
+            self.split_layout = dict()
+        for shard in self.shards:
+            shard.reset_stats()
+
+    def _should_split(self, v) -> bool:
+        return (
+            self.num_shards > 1
+            and isinstance(v, np.ndarray)
+            and v.dtype.kind in "biuf"
+            and v.nbytes > self.split_threshold
+        )
+
+    def _assign(self, key, size: int) -> int:
+        # must be called with self.lock held
+        shard_idx = self.assignments.get(key)
+        if shard_idx is None:
+            shard_idx = min(range(self.num_shards), key=lambda i: self.shard_loads[i])
+            self.assignments[key] = shard_idx
+            self.shard_loads[shard_idx] += size
+        return shard_idx
+
+    def _split(self, k, v: np.ndarray) -> list:
+        # must be called with self.lock held
+        layout = self.split_layout.get(k)
+        if layout is None:
+            layout = (v.shape, self.num_shards)
+            self.split_layout[k] = layout
+        elif layout[0] != v.shape:
+            raise ValueError(f"shape of {k} changed from {layout[0]} to {v.shape}")
+
+        flat = v.reshape(-1)
+        bounds = np.linspace(0, flat.size, layout[1] + 1, dtype=np.int64)
+        return [(_Part(k, i), flat[bounds[i] : bounds[i + 1]]) for i in range(layout[1])]
+
+    def _partition(self, data: dict) -> list:
+        shard_data = [dict() for _ in range(self.num_shards)]
+        with self.lock:
+            for k, v in data.items():
+                if self.exclude_vars is not None and self.exclude_vars.search(k):
+                    continue
+
+                materialize_fn = getattr(v, "materialize", None)
+                if callable(materialize_fn):
+                    v = materialize_fn()
+
+                if k in self.split_layout or self._should_split(v):
+                    for part_key, part in self._split(k, v):
+                        shard_data[self._assign(part_key, part.nbytes)][part_key] = part
+                else:
+                    size = getattr(v, "nbytes", 1)
+                    shard_data[self._assign(k, size)][k] = v
+        return shard_data
+
+    def add(self, data, weight, contributor_name, contribution_round):
+        """Compute weighted sum and sum of weights, with all shards updated in parallel."""
+        shard_data = self._partition(data)
+        futures = [
+            self.executor.submit(shard.add, d, weight, contributor_name, contribution_round)
+            for shard, d in zip(self.shards, shard_data)
+            if d
+        ]
+        for f in futures:
+            f.result()
+
+        with self.lock:
+            self.history.append(
+                {
+                    "contributor_name": contributor_name,
+                    "round": contribution_round,
+                    "weight": weight,
+                }
+            )
+
+    def get_result(self):
+        """Divide weighted sum by sum of weights in every shard and combine the shards."""
+        futures = [self.executor.submit(shard.get_result) for shard in self.shards]
+        results = [f.result() for f in futures]
+
+        with self.lock:
+            split_layout = self.split_layout
+
+        aggregated_dict = {}
+        parts = {}
+        for result in results:
+            for k, v in result.items():
+                if isinstance(k, _Part):
+                    parts[k] = v
+                else:
+                    aggregated_dict[k] = v
+
+        for k, (shape, num_parts) in split_layout.items():
+            if _Part(k, 0) not in parts:
+                continue
+            aggregated_dict[k] = np.concatenate([parts[_Part(k, i)] for i in range(num_parts)]).reshape(shape)
+
+        self.reset_stats()
+        return aggregated_dict
+
+    def get_history(self):
+        return self.history
+
+    def get_len(self):
+        return len(self.get_history())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
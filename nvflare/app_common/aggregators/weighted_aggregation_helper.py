@@ -16,6 +16,8 @@ import re
 import threading
 from typing import Any, Callable, Dict, Optional, Set
 
+import numpy as np
+
 
 def _is_aggregatable_metric_value(v: Any) -> bool:
     """Return True if the metric value supports weighted aggregation (v * weight and addition).
@@ -72,7 +74,13 @@ def filter_aggregatable_metrics(
 
 
 class WeightedAggregationHelper(object):
-    def __init__(self, exclude_vars: Optional[str] = None, weigh_by_local_iter: bool = True):
+    def __init__(
+        self,
+        exclude_vars: Optional[str] = None,
+        weigh_by_local_iter: bool = True,
+        accumulator_dtype: Optional[str] = None,
+        flat_buffer: bool = False,
+    ):
         """Perform weighted aggregation.
 
         Args:
@@ -83,11 +91,19 @@ class WeightedAggregationHelper(object):
                 the number of computations on encrypted ciphertext.
                 The aggregated sum will still be divided by the provided weights and `aggregation_weights` for the
                 resulting weighted sum to be valid.
+            accumulator_dtype (str, optional): NumPy dtype (e.g. "float64") of the accumulators for NumPy arrays.
+                Defaults to None, which accumulates floating point arrays in their own dtype and other
+                numeric arrays in float64. Floating point results are cast back to the dtype of the contribution.
+            flat_buffer (bool, optional): Whether to pack all NumPy arrays of a contribution into one contiguous
+                buffer, so that each contribution is accumulated with a single operation instead of one per
+                array. This helps models with many layers. Defaults to `False`.
         """
         super().__init__()
         self.lock = threading.Lock()
         self.exclude_vars = re.compile(exclude_vars) if exclude_vars else None
         self.weigh_by_local_iter = weigh_by_local_iter
+        self.accumulator_dtype = np.dtype(accumulator_dtype) if accumulator_dtype else None
+        self.flat_buffer = flat_buffer
         self.reset_stats()
         self.total = dict()
         self.counts = dict()
@@ -97,15 +113,50 @@ class WeightedAggregationHelper(object):
         self.total = dict()
         self.counts = dict()
         self.history = list()
+        # dtype of the first contribution of each NumPy array, used for the result
+        self.result_dtypes = dict()
+        # flat buffer mode: key -> (offset, shape) of each array in the flat accumulator
+        self.flat_layout = None
+        self.flat_total = None
+        self.scratch = None
 
     @staticmethod
     def _is_pytorch_tensor(tensor):
         """Check if tensor is a PyTorch tensor with in-place operation support."""
         return hasattr(tensor, "add_") and hasattr(tensor, "mul_") and hasattr(tensor, "clone")
 
+    @staticmethod
+    def _is_numeric_ndarray(v):
+        return isinstance(v, np.ndarray) and v.dtype.kind in "biuf"
+
+    def _to_ndarray(self, k, v) -> np.ndarray:
+        """Convert a contribution to a NumPy array, since the accumulator of the var is a NumPy array.
+
+        The accumulator may be a view of the flat buffer, so it must be updated in place and divided with it.
+        """
+        try:
+            a = np.asarray(v)
+        except Exception as e:
+            raise TypeError(f"contribution of {k} must be a numeric array, but got {type(v)}: {e}")
+        if not self._is_numeric_ndarray(a):
+            raise TypeError(f"contribution of {k} must be a numeric array, but got {type(v)}")
+        return a
+
+    def _get_accumulator_dtype(self, dtype: np.dtype) -> np.dtype:
+        if self.accumulator_dtype is not None:
+            return self.accumulator_dtype
+        return dtype if dtype.kind == "f" else np.dtype(np.float64)
+
+    def _get_scratch(self, size: int, dtype: np.dtype) -> np.ndarray:
+        """Get a reusable buffer for the weighted contribution, so it's not allocated for every array."""
+        if self.scratch is None or self.scratch.size < size or self.scratch.dtype != dtype:
+            self.scratch = np.empty(size, dtype=dtype)
+        return self.scratch[:size]
+
     def add(self, data, weight, contributor_name, contribution_round):
         """Compute weighted sum and sum of weights."""
         with self.lock:
+            items = {}
             for k, v in data.items():
                 if self.exclude_vars is not None and self.exclude_vars.search(k):
                     continue
@@ -116,47 +167,13 @@ class WeightedAggregationHelper(object):
                 materialize_fn = getattr(v, "materialize", None)
                 if callable(materialize_fn):
                     v = materialize_fn()
+                if k in self.result_dtypes and not self._is_numeric_ndarray(v):
+                    v = self._to_ndarray(k, v)
+                items[k] = v
 
-                current_total = self.total.get(k, None)
-
-                if current_total is None:
-                    # First contribution: initialize accumulator
-                    # We must create a copy to avoid mutating caller's input tensors
-                    if self._is_pytorch_tensor(v):
-                        if self.weigh_by_local_iter:
-                            # Weigh by local iter: create weighted copy (multiply by weight)
-                            self.total[k] = v.mul(weight)
-                        else:
-                            self.total[k] = v.clone()
-                    else:
-                        # Fallback for non-PyTorch tensors
-                        if self.weigh_by_local_iter:
-                            # Multiply creates a new array/tensor, no aliasing issue
-                            self.total[k] = v * weight
-                        else:
-                            # For HE mode: try to copy to avoid aliasing
-                            # But encrypted tensors can't be copied (requires secret key)
-                            try:
-                                self.total[k] = v.copy() if hasattr(v, "copy") else v
-                            except (ValueError, RuntimeError):
-                                # Encrypted tensor copy failed, use reference (safe, immutable)
-                                self.total[k] = v
-                    self.counts[k] = weight
-                else:
-                    # Subsequent contributions: use in-place operations
-                    if self._is_pytorch_tensor(v) and self._is_pytorch_tensor(current_total):
-                        if self.weigh_by_local_iter:
-                            # Weigh by local iter: weighted accumulation
-                            self.total[k].add_(v, alpha=weight)
-                        else:
-                            self.total[k].add_(v)
-                    else:
-                        # Fallback for non-PyTorch tensors
-                        if self.weigh_by_local_iter:
-                            self.total[k] = current_total + v * weight
-                        else:
-                            self.total[k] = current_total + v
-                    self.counts[k] = self.counts[k] + weight
+            if not (self.flat_buffer and self._add_flat(items, weight)):
+                for k, v in items.items():
+                    self._add_item(k, v, weight)
 
             self.history.append(
                 {
@@ -166,12 +183,144 @@ class WeightedAggregationHelper(object):
                 }
             )
 
+    def _add_item(self, k, v, weight):
+        current_total = self.total.get(k, None)
+
+        if self._is_numeric_ndarray(v) and (current_total is None or k in self.result_dtypes):
+            self._add_ndarray(k, v, weight, current_total)
+            return
+
+        if current_total is None:
+            # First contribution: initialize accumulator
+            # We must create a copy to avoid mutating caller's input tensors
+            if self._is_pytorch_tensor(v):
+                if self.weigh_by_local_iter:
+                    # Weigh by local iter: create weighted copy (multiply by weight)
+                    self.total[k] = v.mul(weight)
+                else:
+                    self.total[k] = v.clone()
+            else:
+                # Fallback for non-PyTorch tensors
+                if self.weigh_by_local_iter:
+                    # Multiply creates a new array/tensor, no aliasing issue
+                    self.total[k] = v * weight
+                else:
+                    # For HE mode: try to copy to avoid aliasing
+                    # But encrypted tensors can't be copied (requires secret key)
+                    try:
+                        self.total[k] = v.copy() if hasattr(v, "copy") else v
+                    except (ValueError, RuntimeError):
+                        # Encrypted tensor copy failed, use reference (safe, immutable)
+                        self.total[k] = v
+            self.counts[k] = weight
+        else:
+            # Subsequent contributions: use in-place operations
+            if self._is_pytorch_tensor(v) and self._is_pytorch_tensor(current_total):
+                if self.weigh_by_local_iter:
+                    # Weigh by local iter: weighted accumulation
+                    self.total[k].add_(v, alpha=weight)
+                else:
+                    self.total[k].add_(v)
+            else:
+                # Fallback for non-PyTorch tensors
+                if self.weigh_by_local_iter:
+                    self.total[k] = current_total + v * weight
+                else:
+                    self.total[k] = current_total + v
+            self.counts[k] = self.counts[k] + weight
+
+    def _add_ndarray(self, k, v: np.ndarray, weight, current_total: Optional[np.ndarray]):
+        """Accumulate a NumPy array in place. The accumulator is owned by the helper, never the caller's array."""
+        if current_total is None:
+            current_total = np.empty(v.shape, dtype=self._get_accumulator_dtype(v.dtype))
+            if self.weigh_by_local_iter:
+                np.multiply(v, weight, out=current_total)
+            else:
+                np.copyto(current_total, v, casting="same_kind")
+            self.total[k] = current_total
+            self.result_dtypes[k] = v.dtype
+            self.counts[k] = weight
+            return
+
+        if self.weigh_by_local_iter and weight != 1:
+            weighted = self._get_scratch(v.size, current_total.dtype).reshape(v.shape)
+            np.multiply(v, weight, out=weighted)
+            np.add(current_total, weighted, out=current_total)
+        else:
+            np.add(current_total, v, out=current_total, casting="same_kind")
+        self.counts[k] = self.counts[k] + weight
+
+    def _add_flat(self, items: dict, weight) -> bool:
+        """Accumulate all arrays of the contribution with one operation on a flat buffer.
+
+        Returns: False if the contribution doesn't match the flat layout and must be added array by array.
+            The accumulated arrays are views of the flat buffer, so both ways update the same accumulators.
+        """
+        if not items or not all(self._is_numeric_ndarray(v) for v in items.values()):
+            return False
+
+        if self.flat_layout is None:
+            if self.total:
+                # arrays have been accumulated one by one already
+                return False
+
+            dtype = self.accumulator_dtype
+            if dtype is None:
+                dtype = np.result_type(*[self._get_accumulator_dtype(v.dtype) for v in items.values()])
+            self.flat_layout = {}
+            offset = 0
+            for k, v in items.items():
+                self.flat_layout[k] = (offset, v.shape)
+                offset += v.size
+            self.flat_total = np.empty(offset, dtype=dtype)
+            for k, v in items.items():
+                start, shape = self.flat_layout[k]
+                self.total[k] = self.flat_total[start : start + v.size].reshape(shape)
+                self.result_dtypes[k] = v.dtype
+                self.counts[k] = 0
+            weighted = self.flat_total
+            first = True
+        else:
+            if items.keys() != self.flat_layout.keys():
+                return False
+            for k, (_, shape) in self.flat_layout.items():
+                if items[k].shape != shape:
+                    return False
+            weighted = self._get_scratch(self.flat_total.size, self.flat_total.dtype)
+            first = False
+
+        np.concatenate([items[k].ravel() for k in self.flat_layout], out=weighted, casting="same_kind")
+        if self.weigh_by_local_iter and weight != 1:
+            np.multiply(weighted, weight, out=weighted)
+        if not first:
+            np.add(self.flat_total, weighted, out=self.flat_total)
+
+        for k in self.flat_layout:
+            self.counts[k] = self.counts[k] + weight
+        return True
+
     def get_result(self):
         """Divide weighted sum by sum of weights."""
         with self.lock:
+            divided = set()
+            if self.flat_total is not None:
+                counts = {self.counts[k] for k in self.flat_layout}
+                if len(counts) == 1:
+                    # all arrays in the flat buffer have the same weights: divide them with one operation
+                    np.multiply(self.flat_total, 1.0 / counts.pop(), out=self.flat_total)
+                    divided = set(self.flat_layout.keys())
+
             aggregated_dict = {}
             for k, v in self.total.items():
-                if self._is_pytorch_tensor(v):
+                if k in self.result_dtypes:
+                    # NumPy accumulators are owned by the helper, so divide in place
+                    if k not in divided:
+                        np.multiply(v, 1.0 / self.counts[k], out=v)
+                    dtype = self.result_dtypes[k]
+                    if dtype.kind == "f" and v.dtype != dtype:
+                        v = v.astype(dtype)
+                    aggregated_dict[k] = v
+                elif self._is_pytorch_tensor(v):
                     # For PyTorch tensors, use in-place division to avoid creating a copy
                     aggregated_dict[k] = v.div_(self.counts[k])
                 else:
@@ -19,7 +19,7 @@ from nvflare.app_common.abstract.metric_comparator import MetricComparator
 from nvflare.app_common.abstract.model_persistor import ModelPersistor
 from nvflare.app_common.abstract.shareable_generator import ShareableGenerator
 from nvflare.app_common.app_constant import AppConstants
-from nvflare.app_common.ccwf.common import Constant, CyclicOrder
+from nvflare.app_common.ccwf.common import AggregationMode, Constant, CyclicOrder
 from nvflare.job_config.api import FedJob, validate_object_for_job
 from nvflare.widgets.widget import Widget
 
@@ -49,6 +49,7 @@ class SwarmServerConfig:
         aggr_clients=None,
         train_clients=None,
         min_clients=None,
+        aggregation_mode: str = AggregationMode.CENTRAL,
     ):
         self.num_rounds = num_rounds
         self.start_round = start_round
@@ -63,6 +64,7 @@ class SwarmServerConfig:
         self.aggr_clients = aggr_clients
         self.train_clients = train_clients
         self.min_clients = min_clients
+        self.aggregation_mode = aggregation_mode
 
 
 class SwarmClientConfig:
@@ -87,6 +89,7 @@ class SwarmClientConfig:
         max_concurrent_submissions: int = 1,
         memory_gc_rounds: int = 1,
         cuda_empty_cache: bool = False,
+        all_gather_timeout: float = Constant.ALL_GATHER_TIMEOUT,
     ):
         # the executor could be a wrapper object that adds real Executor when added to job!
         validate_object_for_job("executor", executor, Executor)
@@ -119,6 +122,7 @@ class SwarmClientConfig:
         self.max_concurrent_submissions = max_concurrent_submissions
         self.memory_gc_rounds = memory_gc_rounds
         self.cuda_empty_cache = cuda_empty_cache
+        self.all_gather_timeout = all_gather_timeout
 
 
 class CyclicServerConfig:
@@ -253,6 +257,7 @@ class CCWFJob(FedJob):
             aggr_clients=server_config.aggr_clients,
             train_clients=server_config.train_clients,
             min_clients=server_config.min_clients,
+            aggregation_mode=server_config.aggregation_mode,
         )
         self.to_server(controller)
 
@@ -282,6 +287,7 @@ class CCWFJob(FedJob):
             max_concurrent_submissions=client_config.max_concurrent_submissions,
             memory_gc_rounds=client_config.memory_gc_rounds,
             cuda_empty_cache=client_config.cuda_empty_cache,
+            all_gather_timeout=client_config.all_gather_timeout,
         )
         self.to_clients(client_controller, tasks=["swarm_*"])
         if not self.executor:
@@ -49,6 +49,8 @@ class Constant:
     AGGR_CLIENTS = "cwf.aggr_clients"
     TRAIN_CLIENTS = "cwf.train_clients"
     AGGREGATOR = "cwf.aggr"
+    AGGREGATION_MODE = "cwf.aggr_mode"
+    SHARD_LAYOUT = "cwf.shard_layout"
     METRIC = "cwf.metric"
     CLIENT = "cwf.client"
     ROUND = "cwf.round"
@@ -72,6 +74,8 @@ class Constant:
     TOPIC_SHARE_RESULT = "cwf.share_result"
     TOPIC_END_WORKFLOW = "cwf.end_wf"
     TOPIC_UPDATE_MEMBERSHIP = "cwf.update_membership"
+    TOPIC_REDUCE_SCATTER = "cwf.reduce_scatter"
+    TOPIC_ALL_GATHER = "cwf.all_gather"
 
     RC_NO_GLOBAL_MODELS = "cwf.no_global_models"
     RC_NO_LOCAL_MODEL = "cwf.no_local_model"
@@ -91,6 +95,7 @@ class Constant:
     FINAL_RESULT_ACK_TIMEOUT = 10
     GET_MODEL_TIMEOUT = 10
     MAX_TASK_TIMEOUT = 3600
+    ALL_GATHER_TIMEOUT = 600.0
 
     PROP_KEY_TRAIN_CLIENTS = "cwf.train_clients"
 
@@ -113,6 +118,12 @@ class CyclicOrder:
     RANDOM = "random"
 
 
+class AggregationMode:
+
+    CENTRAL = "central"
+    REDUCE_SCATTER = "reduce_scatter"
+
+
 class StatusReport:
     def __init__(
         self,
@@ -0,0 +1,132 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Split the parameters of a model into shards of about the same size, and merge them back.
+
+The shards are owned by different clients in the reduce-scatter aggregation mode of Swarm Learning: each client
+aggregates only its own shard of the trainers' results, and the aggregated shards are then gathered by all clients.
+The layout of the shards is computed from the model alone, so every trainer that has the same model structure
+computes the same layout without any coordination.
+"""
+from bisect import bisect_right
+from typing import List, Tuple
+
+import numpy as np
+
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+
+def _is_splittable(v) -> bool:
+    return isinstance(v, np.ndarray) and v.dtype.kind in "biuf" and v.ndim > 0
+
+
+def make_shard_layout(data: dict, num_shards: int) -> List[dict]:
+    """Assign the items of a model to shards of about the same size.
+
+    The items are laid out one after another in the order of their keys, and the resulting byte range is cut into
+    num_shards equal ranges. A numeric NumPy array that crosses a cut is split into contiguous ranges of its
+    flattened elements; any other item is assigned whole to the shard in which it starts.
+
+    Args:
+        data: the model, a dict of key => item
+        num_shards: number of shards
+
+    Returns: a list with one dict per shard, which maps the key of each item of the shard to [start, end, shape]
+        of the elements of a split array, or to None for an item that is assigned whole.
+
+    """
+    check_positive_int("num_shards", num_shards)
+    items = sorted(data.items())
+    sizes = [v.nbytes if _is_splittable(v) else getattr(v, "nbytes", 1) for _, v in items]
+    total = sum(sizes)
+    bounds = [total * i // num_shards for i in range(num_shards + 1)]
+    layout = [dict() for _ in range(num_shards)]
+    offset = 0
+    for (k, v), size in zip(items, sizes):
+        shard_idx = min(bisect_right(bounds, offset) - 1, num_shards - 1)
+        if not _is_splittable(v) or offset + size <= bounds[shard_idx + 1] or shard_idx == num_shards - 1:
+            layout[shard_idx][k] = None
+        else:
+            shape = list(v.shape)
+            start = 0
+            while start < v.size:
+                if shard_idx == num_shards - 1:
+                    end = v.size
+                else:
+                    # the first element that starts at or after the end of the shard
+                    end = min(v.size, -(-(bounds[shard_idx + 1] - offset) // v.itemsize))
+                if end > start:
+                    layout[shard_idx][k] = [start, end, shape]
+                start = end
+                shard_idx += 1
+        offset += size
+    return layout
+
+
+def split_into_shards(data: dict, layout: List[dict]) -> List[dict]:
+    """Split the model into shards.
+
+    Args:
+        data: the model, a dict of key => item
+        layout: the shard layout of the model, see make_shard_layout
+
+    Returns: a list with one dict per shard, which holds the items and the array ranges of the shard.
+        Array ranges are 1-D views of the flattened arrays where possible.
+
+    """
+    shards = []
+    for entries in layout:
+        shard = {}
+        for k, r in entries.items():
+            if k not in data:
+                raise ValueError(f"item {k} of the shard layout is not in the model")
+            v = data[k]
+            shard[k] = v if r is None else v.reshape(-1)[r[0] : r[1]]
+        shards.append(shard)
+    return shards
+
+
+def merge_shards(shards: List[Tuple[dict, dict]]) -> dict:
+    """Merge the shards of a model.
+
+    Args:
+        shards: list of (layout entries, data) of all shards of the model. The layout entries of a shard are the
+            dict of the shard in the layout of the model (see make_shard_layout).
+
+    Returns: the model, a dict of key => item
+
+    """
+    result = {}
+    parts = {}  # key => list of (start, end, shape, range of elements)
+    for entries, data in shards:
+        for k, v in data.items():
+            if k not in entries:
+                raise ValueError(f"item {k} of the shard is not in its layout")
+            r = entries[k]
+            if r is None:
+                result[k] = v
+            else:
+                parts.setdefault(k, []).append((r[0], r[1], r[2], v))
+
+    for k, ranges in parts.items():
+        ranges.sort(key=lambda x: x[0])
+        shape = ranges[0][2]
+        expected_start = 0
+        for start, end, _, _ in ranges:
+            if start != expected_start:
+                raise ValueError(f"missing elements {expected_start}-{start} of {k}")
+            expected_start = end
+        if expected_start != int(np.prod(shape)):
+            raise ValueError(f"missing elements {expected_start}-{int(np.prod(shape))} of {k}")
+        result[k] = np.concatenate([np.asarray(x[3]).reshape(-1) for x in ranges]).reshape(shape)
+    return result
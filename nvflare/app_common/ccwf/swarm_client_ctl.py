@@ -17,10 +17,11 @@ import threading
 import time
 
 from nvflare.apis.controller_spec import Task
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import FLContextKey, ReturnCode
 from nvflare.apis.fl_context import FLContext
-from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_reply
+from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_copy, make_reply
 from nvflare.apis.signal import Signal
 from nvflare.app_common.abstract.aggregator import Aggregator
 from nvflare.app_common.abstract.learnable import Learnable
@@ -28,7 +29,14 @@ from nvflare.app_common.abstract.metric_comparator import MetricComparator
 from nvflare.app_common.app_constant import AppConstants
 from nvflare.app_common.app_event_type import AppEventType
 from nvflare.app_common.ccwf.client_ctl import ClientSideController
-from nvflare.app_common.ccwf.common import Constant, NumberMetricComparator, ResultType, make_task_name
+from nvflare.app_common.ccwf.common import (
+    AggregationMode,
+    Constant,
+    NumberMetricComparator,
+    ResultType,
+    make_task_name,
+)
+from nvflare.app_common.ccwf.model_shards import make_shard_layout, merge_shards, split_into_shards
 from nvflare.fuel.utils.validation_utils import check_non_empty_str, check_positive_int, check_positive_number
 from nvflare.security.logging import secure_format_traceback
 
@@ -69,6 +77,7 @@ class Gatherer(FLComponent):
         self.start_time = time.time()
         self.timeout = timeout
         self.max_concurrent_submissions = max_concurrent_submissions
+        self.shard_layout = None  # layout of the model shard that is gathered in reduce-scatter mode
 
         for t in trainers:
             self.trainer_statuses[t] = _TrainerStatus(t)
@@ -186,6 +195,15 @@ class Gatherer(FLComponent):
             self.log_error(fl_ctx, f"Bad result from {client_name} for round {result_round}: {rc}.")
             return make_reply(ReturnCode.EXECUTION_EXCEPTION)
 
+        shard_layout = result.get_header(Constant.SHARD_LAYOUT)
+        if shard_layout is not None:
+            # all results must be the same shard of the model
+            if self.shard_layout is None:
+                self.shard_layout = shard_layout
+            elif shard_layout != self.shard_layout:
+                self.log_error(fl_ctx, f"shard layout of the result from {client_name} differs from other results")
+                return make_reply(ReturnCode.EXECUTION_EXCEPTION)
+
         fl_ctx.set_prop(AppConstants.CURRENT_ROUND, self.for_round, private=True, sticky=True)
         fl_ctx.set_prop(AppConstants.TRAINING_RESULT, result, private=True, sticky=False)
         self.fire_event(AppEventType.BEFORE_CONTRIBUTION_ACCEPT, fl_ctx)
@@ -267,6 +285,10 @@ class Gatherer(FLComponent):
 
 
 class SwarmClientController(ClientSideController):
+
+    # the mode until process_config is done
+    aggregation_mode = AggregationMode.CENTRAL
+
     def __init__(
         self,
         task_name_prefix=Constant.TN_PREFIX_SWARM,
@@ -288,6 +310,7 @@ class SwarmClientController(ClientSideController):
         max_concurrent_submissions: int = 1,
         memory_gc_rounds: int = 1,
         cuda_empty_cache: bool = False,
+        all_gather_timeout: float = Constant.ALL_GATHER_TIMEOUT,
     ):
         """
         Constructor of a ClientSideController object.
@@ -322,12 +345,22 @@ class SwarmClientController(ClientSideController):
             cuda_empty_cache: also call torch.cuda.empty_cache() during aggregator-side cleanup.
                 In swarm learning the aggregator runs on the same client as the trainer, so GPU
                 memory may be relevant. Defaults to False.
+            all_gather_timeout: in the reduce-scatter mode, max time to wait for the aggregated shards of the
+                other shard owners after the first aggregated shard of the round is received. If not all shards
+                are received in time, the round fails.
 
         Note that if the max_concurrent_submissions is set to 1, it practically means that all training results
         will be submitted to the aggregation client sequentially. This lowers the resource pressure on
         the aggr client, but makes the overall training process longer. The value of request_to_submit_result_max_wait,
         if specified, should be long enough to allow the aggr client sufficient time to process training results.
 
+        The aggregation mode is configured on the server (see SwarmServerController). In the reduce-scatter mode,
+        every aggr client owns one shard of the model: the model is split into shards of about the same size, and
+        each trainer sends each aggr client its shard of the training result. Each aggr client aggregates its shard
+        with the configured aggregator, and sends the aggregated shard to all clients, which merge the shards into
+        the global model and start the next round on their own. The submission permission protocol is not used in
+        this mode, since each aggr client only receives a fraction of every result.
+
         """
         check_non_empty_str("learn_task_name", learn_task_name)
         check_non_empty_str("persistor_id", persistor_id)
@@ -347,6 +380,7 @@ class SwarmClientController(ClientSideController):
 
         check_positive_int("min_responses_required", min_responses_required)
         check_positive_number("wait_time_after_min_resps_received", wait_time_after_min_resps_received)
+        check_positive_number("all_gather_timeout", all_gather_timeout)
 
         super().__init__(
             task_name_prefix=task_name_prefix,
@@ -384,6 +418,13 @@ class SwarmClientController(ClientSideController):
         self.memory_gc_rounds = memory_gc_rounds
         self.cuda_empty_cache = cuda_empty_cache
         self._aggr_round_count = 0
+        self.aggregation_mode = AggregationMode.CENTRAL
+        self.shard_owners = []
+        self.shard_lock = threading.Lock()
+        self.aggregated_shards = {}  # round => {shard owner => aggregated shard}
+        self.all_gather_deadlines = {}  # round => time by which all aggregated shards must be received
+        self.all_gather_timeout = all_gather_timeout
+        self.last_all_gather_round = -1
 
     def process_config(self, fl_ctx: FLContext):
         all_clients = self.get_config_prop(Constant.CLIENTS)
@@ -398,6 +439,19 @@ class SwarmClientController(ClientSideController):
             self.aggrs = all_clients
         self.is_aggr = self.me in self.aggrs
 
+        self.aggregation_mode = self.get_config_prop(Constant.AGGREGATION_MODE, AggregationMode.CENTRAL)
+        if self.aggregation_mode == AggregationMode.REDUCE_SCATTER:
+            # shard i of the model is owned by aggr client i: the config is the same on all clients
+            self.shard_owners = list(self.aggrs)
+            self.engine.register_aux_message_handler(
+                topic=self.topic_for_my_workflow(Constant.TOPIC_REDUCE_SCATTER),
+                message_handle_func=self._process_shard_result,
+            )
+            self.engine.register_aux_message_handler(
+                topic=self.topic_for_my_workflow(Constant.TOPIC_ALL_GATHER),
+                message_handle_func=self._process_aggregated_shard,
+            )
+
         self.engine.register_aux_message_handler(
             topic=self.topic_for_my_workflow(Constant.TOPIC_SHARE_RESULT),
             message_handle_func=self._process_share_result,
@@ -482,12 +536,19 @@ class SwarmClientController(ClientSideController):
         clients = self.get_config_prop(Constant.TRAIN_CLIENTS)
         aggregator_candidates = self.get_config_prop(Constant.AGGR_CLIENTS)
 
-        # determine aggr client
-        aggr = random.choice(aggregator_candidates)
-
         task_data.set_header(AppConstants.CURRENT_ROUND, for_round)
         task_data.add_cookie(AppConstants.CONTRIBUTION_ROUND, for_round)
-        task_data.set_header(Constant.AGGREGATOR, aggr)
+        if self.aggregation_mode == AggregationMode.REDUCE_SCATTER:
+            # every shard owner aggregates its shard
+            aggr = None
+            targets = copy.copy(self.get_config_prop(Constant.CLIENTS))
+        else:
+            # determine aggr client
+            aggr = random.choice(aggregator_candidates)
+            task_data.set_header(Constant.AGGREGATOR, aggr)
+            targets = copy.copy(clients)
+            if aggr not in targets:
+                targets.append(aggr)
 
         # Stamp MSG_ROOT_TTL on the task data so the sender's ArrayDownloadable
         # download transaction stays alive for learn_task_timeout seconds — long
@@ -499,10 +560,6 @@ class SwarmClientController(ClientSideController):
         if self.learn_task_timeout:
             task_data.set_header(ReservedHeaderKey.MSG_ROOT_TTL, float(self.learn_task_timeout))
 
-        targets = copy.copy(clients)
-        if aggr not in targets:
-            targets.append(aggr)
-
         # Handle self locally to avoid synchronous self-message deadlock.
         # When sending to self via broadcast_and_wait, the message is processed synchronously
         # on the same thread (via _send_direct_message in core_cell.py). If TensorStreamer
@@ -527,9 +584,11 @@ class SwarmClientController(ClientSideController):
 
         # Then send to remote targets
         if remote_targets:
+            aggregation_clients = aggr if aggr else self.shard_owners
             self.log_info(
                 fl_ctx,
-                f"broadcasting learn task of round {for_round} to {remote_targets}; aggregation happens on {aggr}",
+                f"broadcasting learn task of round {for_round} to {remote_targets}; "
+                f"aggregation happens on {aggregation_clients}",
             )
             if not self.send_learn_task(targets=remote_targets, request=task_data, fl_ctx=fl_ctx):
                 return False
@@ -553,6 +612,9 @@ class SwarmClientController(ClientSideController):
                     except:
                         self.logger.error(f"exception ending gatherer: {secure_format_traceback()}")
                         self.update_status(action="aggregate", error=ReturnCode.EXECUTION_EXCEPTION)
+
+            if self.aggregation_mode == AggregationMode.REDUCE_SCATTER:
+                self._check_all_gather_timeout()
             time.sleep(0.2)
 
     def _end_gather(self, gatherer: Gatherer):
@@ -573,19 +635,35 @@ class SwarmClientController(ClientSideController):
             )
             return
 
+        if self.aggregation_mode == AggregationMode.REDUCE_SCATTER:
+            self._all_gather(aggr_result, gatherer, fl_ctx)
+        else:
+            self._end_round(aggr_result, gatherer.for_round, fl_ctx)
+
+        if self.memory_gc_rounds > 0:
+            self._aggr_round_count += 1
+            if self._aggr_round_count % self.memory_gc_rounds == 0:
+                from nvflare.fuel.utils.memory_utils import cleanup_memory
+
+                cleanup_memory(cuda_empty_cache=self.cuda_empty_cache)
+                self.log_info(fl_ctx, f"Swarm aggregator memory cleanup at round {self._aggr_round_count}")
+
+    def _end_round(self, aggr_result: Shareable, for_round: int, fl_ctx: FLContext):
         # aggr_result could be just weight diffs, not full weights!
         # need to call shareable_to_learnable to get full weights.
         self.log_debug(fl_ctx, f"aggr result: {aggr_result}")
         global_weights = self.shareable_generator.shareable_to_learnable(aggr_result, fl_ctx)
-        self.record_last_result(fl_ctx, gatherer.for_round, global_weights)
+        self.record_last_result(fl_ctx, for_round, global_weights)
 
         # are we done with training?
-        num_rounds_done = gatherer.for_round - self.get_config_prop(Constant.START_ROUND, 0) + 1
+        num_rounds_done = for_round - self.get_config_prop(Constant.START_ROUND, 0) + 1
         if num_rounds_done >= self.get_config_prop(AppConstants.NUM_ROUNDS):
             self.log_info(fl_ctx, f"Swarm Learning Done: number of rounds completed {num_rounds_done}")
 
-            # determine the best global result
-            self._distribute_final_results(aggr_result, fl_ctx)
+            # in reduce-scatter mode, all clients have the final result: the first shard owner distributes it
+            if self.aggregation_mode != AggregationMode.REDUCE_SCATTER or self.me == self.shard_owners[0]:
+                # determine the best global result
+                self._distribute_final_results(aggr_result, fl_ctx)
 
         else:
             # continue next round
@@ -601,15 +679,139 @@ class SwarmClientController(ClientSideController):
                 next_round_data.set_header(Constant.CLIENT, best_client)
                 next_round_data.set_header(Constant.METRIC, best_metric)
 
-            self._scatter(next_round_data, gatherer.for_round + 1, gatherer.fl_ctx)
+            if self.aggregation_mode == AggregationMode.REDUCE_SCATTER:
+                # all clients have the global model: each starts the next round on its own
+                next_round_data.set_header(AppConstants.CURRENT_ROUND, for_round + 1)
+                next_round_data.add_cookie(AppConstants.CONTRIBUTION_ROUND, for_round + 1)
+                if not self.set_learn_task(task_data=next_round_data, fl_ctx=fl_ctx):
+                    self.log_error(fl_ctx, f"failed to queue learn task locally for round {for_round + 1}")
+                    self.update_status(action="start_next_round", error=ReturnCode.EXECUTION_EXCEPTION)
+            else:
+                self._scatter(next_round_data, for_round + 1, fl_ctx)
 
-        if self.memory_gc_rounds > 0:
-            self._aggr_round_count += 1
-            if self._aggr_round_count % self.memory_gc_rounds == 0:
-                from nvflare.fuel.utils.memory_utils import cleanup_memory
+    def _all_gather(self, aggr_result: Shareable, gatherer: Gatherer, fl_ctx: FLContext):
+        """Send the aggregated shard of the model to all clients."""
+        if gatherer.shard_layout is None:
+            self.log_error(fl_ctx, f"no shard of the model was gathered for round {gatherer.for_round}")
+            self.update_status(action="all_gather", error=ReturnCode.EXECUTION_EXCEPTION)
+            return
 
-                cleanup_memory(cuda_empty_cache=self.cuda_empty_cache)
-                self.log_info(fl_ctx, f"Swarm aggregator memory cleanup at round {self._aggr_round_count}")
+        aggr_result.set_header(AppConstants.CURRENT_ROUND, gatherer.for_round)
+        aggr_result.set_header(Constant.SHARD_LAYOUT, gatherer.shard_layout)
+        remote_targets = [c for c in self.get_config_prop(Constant.CLIENTS) if c != self.me]
+        if remote_targets:
+            self.log_info(fl_ctx, f"sending aggregated shard of round {gatherer.for_round} to {remote_targets}")
+            resp = self.engine.send_aux_request(
+                targets=remote_targets,
+                topic=self.topic_for_my_workflow(Constant.TOPIC_ALL_GATHER),
+                request=aggr_result,
+                timeout=self.learn_task_ack_timeout,
+                fl_ctx=fl_ctx,
+                secure=self.is_task_secure(fl_ctx),
+            )
+            for t in remote_targets:
+                reply = resp.get(t)
+                if not isinstance(reply, Shareable) or reply.get_return_code(ReturnCode.OK) != ReturnCode.OK:
+                    self.log_error(fl_ctx, f"failed to send aggregated shard of round {gatherer.for_round} to {t}")
+                    self.update_status(action="all_gather", error=ReturnCode.EXECUTION_EXCEPTION)
+
+        # the aggregated shard is not sent to myself, to avoid the synchronous self-message path
+        self._add_aggregated_shard(self.me, aggr_result, fl_ctx)
+
+    def _process_aggregated_shard(self, topic: str, request: Shareable, fl_ctx: FLContext) -> Shareable:
+        peer_ctx = fl_ctx.get_peer_context()
+        assert isinstance(peer_ctx, FLContext)
+        owner = peer_ctx.get_identity_name()
+        if owner not in self.shard_owners:
+            self.log_error(fl_ctx, f"got aggregated shard from {owner}, but it is not a shard owner")
+            return make_reply(ReturnCode.BAD_REQUEST_DATA)
+
+        if self._has_lazy_refs(request):
+            request = self._resolve_lazy_refs(request, fl_ctx)
+        self._add_aggregated_shard(owner, request, fl_ctx)
+        return make_reply(ReturnCode.OK)
+
+    def _add_aggregated_shard(self, owner: str, shard: Shareable, fl_ctx: FLContext):
+        for_round = shard.get_header(AppConstants.CURRENT_ROUND)
+        with self.shard_lock:
+            if for_round <= self.last_all_gather_round:
+                self.log_warning(fl_ctx, f"dropped late aggregated shard from {owner} for round {for_round}")
+                return
+
+            shards = self.aggregated_shards.setdefault(for_round, {})
+            if not shards:
+                self.all_gather_deadlines[for_round] = time.time() + self.all_gather_timeout
+            shards[owner] = shard
+            self.log_debug(fl_ctx, f"got aggregated shard from {owner} for round {for_round}")
+            if len(shards) < len(self.shard_owners):
+                return
+
+            self.aggregated_shards.pop(for_round)
+            self.all_gather_deadlines.pop(for_round, None)
+            self.last_all_gather_round = for_round
+
+        # end the round in another thread, so that the shard owner gets the reply without waiting for it
+        t = threading.Thread(target=self._end_all_gather, args=(for_round, shards), daemon=True)
+        t.start()
+
+    def _check_all_gather_timeout(self):
+        now = time.time()
+        with self.shard_lock:
+            expired = [r for r, deadline in self.all_gather_deadlines.items() if now > deadline]
+            if not expired:
+                return
+
+            for_round = max(expired)
+            missing = [o for o in self.shard_owners if o not in self.aggregated_shards.get(for_round, {})]
+
+            # give up on these rounds: shards that arrive later are dropped
+            for r in expired:
+                self.aggregated_shards.pop(r, None)
+                self.all_gather_deadlines.pop(r)
+            self.last_all_gather_round = max(self.last_all_gather_round, for_round)
+
+        with self.engine.new_context() as fl_ctx:
+            self.log_error(
+                fl_ctx,
+                f"aggregated shards of round {for_round} not received from {missing} "
+                f"within {self.all_gather_timeout} secs",
+            )
+            self.update_status(action="all_gather", error=ReturnCode.EXECUTION_EXCEPTION)
+
+    def _end_all_gather(self, for_round: int, shards: dict):
+        with self.engine.new_context() as fl_ctx:
+            try:
+                aggr_result = self._merge_aggregated_shards(shards)
+                self._end_round(aggr_result, for_round, fl_ctx)
+            except:
+                self.log_error(fl_ctx, f"exception ending round {for_round}: {secure_format_traceback()}")
+                self.update_status(action="all_gather", error=ReturnCode.EXECUTION_EXCEPTION)
+
+    def _merge_aggregated_shards(self, shards: dict) -> Shareable:
+        """Merge the aggregated shards of all shard owners into the aggregation result.
+
+        Each shard owner determined the best global metric from its own best metric, so the best of the shards
+        is the global best.
+        """
+        parts = []
+        best = None
+        for owner in self.shard_owners:
+            shard = shards[owner]
+            parts.append((shard.get_header(Constant.SHARD_LAYOUT), from_shareable(shard)))
+            metric = shard.get_header(Constant.METRIC)
+            if metric is not None and (
+                best is None or self.metric_comparator.compare(metric, best.get_header(Constant.METRIC)) > 0
+            ):
+                best = shard
+
+        first_dxo = parts[0][1]
+        data = merge_shards([(layout, dxo.data) for layout, dxo in parts])
+        aggr_result = DXO(data_kind=first_dxo.data_kind, data=data, meta=first_dxo.meta).to_shareable()
+        if best is not None:
+            aggr_result.set_header(Constant.ROUND, best.get_header(Constant.ROUND))
+            aggr_result.set_header(Constant.METRIC, best.get_header(Constant.METRIC))
+            aggr_result.set_header(Constant.CLIENT, best.get_header(Constant.CLIENT))
+        return aggr_result
 
     def _ask_to_share_best_result(self, client: str, metric, fl_ctx: FLContext):
         # other client has best model - ask it to distribute its result
@@ -811,8 +1013,9 @@ class SwarmClientController(ClientSideController):
         current_round = task_data.get_header(AppConstants.CURRENT_ROUND)
         self.update_status(last_round=current_round, action="start_learn_task")
 
+        sharded = self.aggregation_mode == AggregationMode.REDUCE_SCATTER
         aggr = task_data.get_header(Constant.AGGREGATOR)
-        if not aggr:
+        if not aggr and not sharded:
             self.log_error(fl_ctx, f"missing aggregation client for round {current_round}")
             self.update_status(action="do_learn_task", error=ReturnCode.EXECUTION_EXCEPTION)
             return
@@ -844,7 +1047,7 @@ class SwarmClientController(ClientSideController):
         fl_ctx.set_prop(AppConstants.CURRENT_ROUND, current_round, private=True, sticky=True)
         self.fire_event(AppEventType.ROUND_STARTED, fl_ctx)
 
-        if self.me == aggr:
+        if self.me == aggr or (sharded and self.me in self.shard_owners):
             # set up the aggr waiter
             gatherer = self.gatherer
             if gatherer:
@@ -885,6 +1088,12 @@ class SwarmClientController(ClientSideController):
                 self.update_status(action="learner_execution", error=rc)
                 return
 
+            if sharded:
+                if self._reduce_scatter(result, current_round, fl_ctx, abort_signal):
+                    self.log_info(fl_ctx, f"Finished round {current_round}")
+                    self.update_status(last_round=current_round, action="finished_learn_task")
+                return
+
             # ask permission to submit result to the aggr client repeatedly until permitted
             self.log_info(fl_ctx, f"asking permission to submit result to the aggregation client {aggr}")
             submission_req = Shareable()
@@ -1006,6 +1215,55 @@ class SwarmClientController(ClientSideController):
             # update status
             self.update_status(last_round=current_round, action="finished_learn_task")
 
+    def _reduce_scatter(self, result: Shareable, current_round: int, fl_ctx: FLContext, abort_signal: Signal) -> bool:
+        """Send each shard owner its shard of the training result."""
+        # the shards must be made of real tensors, not of references to the subprocess
+        if self._has_lazy_refs(result):
+            result = self._resolve_lazy_refs(result, fl_ctx)
+        dxo = from_shareable(result)
+        layout = make_shard_layout(dxo.data, len(self.shard_owners))
+        shard_data = split_into_shards(dxo.data, layout)
+
+        # each trainer starts with a different owner, so that the owners receive shards in parallel
+        num_owners = len(self.shard_owners)
+        first = self.trainers.index(self.me) % num_owners
+        engine = fl_ctx.get_engine()
+        for i in range(num_owners):
+            idx = (first + i) % num_owners
+            owner = self.shard_owners[idx]
+            if abort_signal.triggered:
+                self.log_info(fl_ctx, f"giving up result submission for round {current_round}: job aborted")
+                return False
+
+            shard = make_copy(result)
+            shard.set_header(Constant.SHARD_LAYOUT, layout[idx])
+            DXO(data_kind=dxo.data_kind, data=shard_data[idx], meta=dxo.meta).update_shareable(shard)
+            if owner == self.me:
+                # Avoid synchronous self-message path through CoreCell._send_direct_message.
+                local_fl_ctx = fl_ctx.clone()
+                local_fl_ctx.set_peer_context(engine.new_context())
+                reply = self._process_learn_result(shard, local_fl_ctx, abort_signal)
+            else:
+                self.log_info(fl_ctx, f"sending shard {idx} of training result to {owner}")
+                resp = engine.send_aux_request(
+                    targets=[owner],
+                    topic=self.topic_for_my_workflow(Constant.TOPIC_REDUCE_SCATTER),
+                    request=shard,
+                    timeout=self.learn_task_ack_timeout,
+                    fl_ctx=fl_ctx,
+                    secure=self.is_task_secure(fl_ctx),
+                )
+                reply = resp.get(owner)
+
+            if not isinstance(reply, Shareable) or reply.get_return_code(ReturnCode.OK) != ReturnCode.OK:
+                self.log_error(fl_ctx, f"failed to submit shard {idx} of training result to {owner}: {reply}")
+                self.update_status(action="receive_learn_result_reply", error=ReturnCode.EXECUTION_EXCEPTION)
+                return False
+        return True
+
+    def _process_shard_result(self, topic: str, request: Shareable, fl_ctx: FLContext) -> Shareable:
+        return self._process_learn_result(request, fl_ctx, Signal())
+
     def _process_share_result(self, topic: str, request: Shareable, fl_ctx: FLContext) -> Shareable:
         peer_ctx = fl_ctx.get_peer_context()
         assert isinstance(peer_ctx, FLContext)
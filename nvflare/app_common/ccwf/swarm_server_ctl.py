@@ -13,9 +13,14 @@
 # limitations under the License.
 
 from nvflare.apis.fl_context import FLContext
-from nvflare.app_common.ccwf.common import Constant
+from nvflare.app_common.ccwf.common import AggregationMode, Constant
 from nvflare.app_common.ccwf.server_ctl import ServerSideController
-from nvflare.fuel.utils.validation_utils import DefaultValuePolicy, normalize_config_arg, validate_candidates
+from nvflare.fuel.utils.validation_utils import (
+    DefaultValuePolicy,
+    check_str,
+    normalize_config_arg,
+    validate_candidates,
+)
 
 
 class SwarmServerController(ServerSideController):
@@ -37,7 +42,25 @@ class SwarmServerController(ServerSideController):
         aggr_clients=None,
         train_clients=None,
         min_clients: int = 0,
+        aggregation_mode: str = AggregationMode.CENTRAL,
     ):
+        """Server side controller of Swarm Learning.
+
+        Args:
+            aggregation_mode: how the results of each round are aggregated. In the "central" mode, one of the
+                aggr_clients is chosen randomly for each round, and all trainers send their results to it.
+                In the "reduce_scatter" mode, the model is split into one shard per aggr_client. Each trainer sends
+                each aggr_client only its shard of the result, and the aggr_clients send the aggregated shards to all
+                clients, which rebuild the global model. This spreads the traffic and the aggregation work over all
+                aggr_clients. See SwarmClientController for details.
+        """
+        check_str("aggregation_mode", aggregation_mode)
+        if aggregation_mode not in [AggregationMode.CENTRAL, AggregationMode.REDUCE_SCATTER]:
+            raise ValueError(
+                f"invalid aggregation_mode {aggregation_mode}: must be in "
+                f"{[AggregationMode.CENTRAL, AggregationMode.REDUCE_SCATTER]}"
+            )
+
         result_clients = normalize_config_arg(result_clients)
         starting_client = normalize_config_arg(starting_client)
         if starting_client is None:
@@ -69,6 +92,7 @@ class SwarmServerController(ServerSideController):
 
         self.aggr_clients = aggr_clients
         self.train_clients = train_clients
+        self.aggregation_mode = aggregation_mode
 
     def start_controller(self, fl_ctx: FLContext):
         super().start_controller(fl_ctx)
@@ -99,4 +123,8 @@ class SwarmServerController(ServerSideController):
         fl_ctx.set_prop(key=Constant.PROP_KEY_TRAIN_CLIENTS, value=self.train_clients, private=True, sticky=True)
 
     def prepare_config(self):
-        return {Constant.AGGR_CLIENTS: self.aggr_clients, Constant.TRAIN_CLIENTS: self.train_clients}
+        return {
+            Constant.AGGR_CLIENTS: self.aggr_clients,
+            Constant.TRAIN_CLIENTS: self.train_clients,
+            Constant.AGGREGATION_MODE: self.aggregation_mode,
+        }
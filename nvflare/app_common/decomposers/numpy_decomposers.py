@@ -19,8 +19,11 @@ from typing import Any, Tuple
 
 import numpy as np
 
+import nvflare.fuel.utils.app_config_utils as acu
 import nvflare.fuel.utils.fobs.dots as dots
+from nvflare.apis.fl_constant import ConfigVarName
 from nvflare.app_common.np.np_downloader import ArrayDownloadable, download_arrays
+from nvflare.app_common.np.raw_array import decode_array, encode_array, is_raw_buffer
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.download_service import Downloadable
 from nvflare.fuel.utils import fobs
@@ -72,7 +75,10 @@ class NumpyArrayDecomposer(ViaDownloaderDecomposer):
         return dots.NUMPY_DOWNLOAD
 
     def to_downloadable(self, items: dict, max_chunk_size: int, fobs_ctx: dict) -> Downloadable:
-        return ArrayDownloadable(items, max_chunk_size)
+        return ArrayDownloadable(items, max_chunk_size, raw_buffer=self._use_raw_buffer())
+
+    def _use_raw_buffer(self) -> bool:
+        return acu.get_bool_var(self._config_var_name(ConfigVarName.RAW_BUFFER_ENCODING), False)
 
     def download(
         self,
@@ -94,12 +100,19 @@ class NumpyArrayDecomposer(ViaDownloaderDecomposer):
             abort_signal,
         )
 
-    def native_decompose(self, target: np.ndarray, manager: DatumManager = None) -> bytes:
+    def native_decompose(self, target: np.ndarray, manager: DatumManager = None):
+        if self._use_raw_buffer():
+            return encode_array(target)
+
         stream = BytesIO()
         np.save(stream, target, allow_pickle=False)
         return stream.getvalue()
 
-    def native_recompose(self, data: bytes, manager: DatumManager = None) -> np.ndarray:
+    def native_recompose(self, data, manager: DatumManager = None) -> np.ndarray:
+        if is_raw_buffer(data):
+            return decode_array(data)
+
+        # np.save data
         stream = BytesIO(data)
         return np.load(stream, allow_pickle=False)
 
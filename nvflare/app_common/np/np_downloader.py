@@ -16,6 +16,18 @@ from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
+from nvflare.app_common.np.raw_array import (
+    RawBufferAssembler,
+    RawBufferKey,
+    decode_array,
+    encode_array,
+    encode_array_part,
+    flatten_array,
+    get_part_ranges,
+    is_raw_buffer,
+    is_raw_buffer_part,
+    raw_buffer_size,
+)
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
 from nvflare.fuel.f3.streaming.download_service import download_object
@@ -26,20 +38,68 @@ _TWO_MB = 2 * 1024 * 1024
 
 class ArrayDownloadable(CacheableObject):
 
-    def __init__(self, arrays: dict[str, np.ndarray], max_chunk_size: int):
-        self.size = len(arrays)
+    def __init__(self, arrays: dict[str, np.ndarray], max_chunk_size: int, raw_buffer: bool = False):
+        """Downloadable of a dict of arrays. Each array is one item.
+
+        Args:
+            arrays: the arrays to be downloaded
+            max_chunk_size: max number of bytes for each chunk
+            raw_buffer: whether to send the arrays in the raw-buffer format instead of npz. In this format, an array
+                larger than max_chunk_size is split into items of byte ranges, so that no chunk exceeds
+                max_chunk_size. Receivers of earlier versions cannot decode it.
+        """
         self.keys = list(arrays.keys())
+        self.raw_buffer = raw_buffer
+
+        # item index => (key, element range of the part, or None if the item is the whole array)
+        self.items = []
+        for key in self.keys:
+            array = arrays[key]
+            if not raw_buffer:
+                self.items.append((key, None))
+                continue
+            ranges = get_part_ranges(array.size, array.itemsize, max_chunk_size)
+            if len(ranges) == 1:
+                self.items.append((key, None))
+            else:
+                self.items.extend((key, r) for r in ranges)
+        self.size = len(self.items)
+        self.flat_arrays = {}  # key => (flattened array, order) of arrays that are split
         super().__init__(arrays, max_chunk_size)
 
     def get_item_count(self) -> int:
         return self.size
 
-    def produce_item(self, index: int) -> bytes:
-        key = self.keys[index]
-        arrays_to_send = {key: self.base_obj[key]}
-        stream = BytesIO()
-        np.savez(allow_pickle=False, file=stream, **arrays_to_send)
-        return stream.getvalue()
+    def produce_item(self, index: int):
+        key, part_range = self.items[index]
+        array = self.base_obj[key]
+        if not self.raw_buffer:
+            stream = BytesIO()
+            np.savez(stream, allow_pickle=False, **{key: array})
+            return stream.getvalue()
+
+        if part_range is None:
+            return encode_array(array, name=key)
+
+        flat = self.flat_arrays.get(key)
+        if flat is None:
+            # a view unless the array is not contiguous
+            flat = flatten_array(array)
+            self.flat_arrays[key] = flat
+        flat_array, order = flat
+        start, end = part_range
+        return encode_array_part(flat_array, start, end, name=key, shape=array.shape, order=order)
+
+    def get_item_size(self, item) -> int:
+        if is_raw_buffer(item):
+            return raw_buffer_size(item)
+        return len(item)
+
+    def transaction_done(self, transaction_id: str, status: str):
+        super().transaction_done(transaction_id, status)
+
+        # flattened copies of non-contiguous items are no longer needed
+        self.flat_arrays = {}
 
 
 class ArrayConsumer(ItemConsumer):
@@ -50,9 +110,19 @@ class ArrayConsumer(ItemConsumer):
         self.cb_kwargs = cb_kwargs
         if arrays_received_cb is not None and not callable(arrays_received_cb):
             raise ValueError("arrays_received_cb must be callable")
+        self.assembler = RawBufferAssembler()
 
-    @staticmethod
-    def _to_dict(item: bytes) -> dict:
+    def _to_dict(self, item) -> dict:
+        if is_raw_buffer_part(item):
+            item = self.assembler.add_part(item)
+            if item is None:
+                # more parts of the array to come
+                return {}
+
+        if is_raw_buffer(item):
+            return {item[RawBufferKey.NAME]: decode_array(item)}
+
+        # npz data
         result = {}
         stream = BytesIO(item)
         with np.load(stream, allow_pickle=False) as npz_obj:
@@ -72,6 +142,9 @@ class ArrayConsumer(ItemConsumer):
                 raise ValueError("cannot load received bytes to arrays")
             arrays.update(td)
 
+        if not arrays:
+            return result
+
         if self.arrays_received_cb is not None:
             cb_result = self.arrays_received_cb(arrays, **self.cb_kwargs)
             if isinstance(cb_result, dict):
@@ -80,11 +153,19 @@ class ArrayConsumer(ItemConsumer):
             result.update(arrays)
         return result
 
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.get_incomplete()
+        if incomplete:
+            self.download_failed(ref_id, f"missing parts of arrays {incomplete}")
+        else:
+            super().download_completed(ref_id)
+
 
 def add_arrays(
     downloader: ObjectDownloader,
     arrays: dict[str, np.ndarray],
     max_chunk_size: int = _TWO_MB,
+    raw_buffer: bool = False,
 ) -> str:
     """Add arrays to be downloaded to the specified downloader.
 
@@ -92,11 +173,12 @@ def add_arrays(
         downloader: the downloader to add arrays to.
         arrays: arrays to be downloaded
         max_chunk_size: max chunk size
+        raw_buffer: whether to send the arrays in the raw-buffer format. See ArrayDownloadable.
 
     Returns: reference id for the arrays.
 
     """
-    obj = ArrayDownloadable(arrays, max_chunk_size)
+    obj = ArrayDownloadable(arrays, max_chunk_size, raw_buffer=raw_buffer)
     return downloader.add_object(obj)
 
 
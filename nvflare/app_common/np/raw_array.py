@@ -0,0 +1,310 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Raw-buffer wire format of arrays.
+
+An array is encoded as a dict that holds its dtype, shape and memory order, and its bytes as a memoryview of the
+array's own memory. Since the dict only contains msgpack types, it can be put into any FOBS-serialized object, and
+the bytes are written to the wire without being copied into an intermediate container (npz, np.save, safetensors).
+
+On receive, the array is rebuilt over the received buffer with np.frombuffer.
+
+An array that is larger than the max chunk size of a download can be sent in parts. Each part is an encoded slice of
+the flattened array, with the shape of the whole array, the byte offset of the slice and the total size. The parts
+are copied into a preallocated buffer on receive by RawBufferAssembler.
+"""
+import bisect
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+
+class RawBufferKey:
+    NAME = "name"
+    DTYPE = "dtype"
+    SHAPE = "shape"
+    ORDER = "order"
+    DATA = "data"
+    OFFSET = "offset"
+    TOTAL_SIZE = "total_size"
+
+
+_ORDER_C = "C"
+_ORDER_F = "F"
+
+
+def is_raw_buffer(item: Any) -> bool:
+    """Check whether the item is an array encoded in the raw-buffer format.
+
+    Items in the formats used before (npz, np.save, safetensors) are bytes.
+    """
+    return isinstance(item, dict) and RawBufferKey.DATA in item
+
+
+def is_raw_buffer_part(item: Any) -> bool:
+    """Check whether the item is a part of an array encoded in the raw-buffer format."""
+    return is_raw_buffer(item) and RawBufferKey.OFFSET in item
+
+
+def raw_buffer_size(item: dict) -> int:
+    """Get the number of bytes of the array data in the encoded item."""
+    data = item[RawBufferKey.DATA]
+    return data.nbytes if isinstance(data, memoryview) else len(data)
+
+
+def get_writable_buffer(data, writable: bool):
+    """Get a buffer of the received data that arrays can be built over.
+
+    Args:
+        data: the received data: bytes, bytearray or memoryview
+        writable: whether the arrays built over the buffer must be writable. If so, read-only data is copied.
+
+    Returns: a buffer of the data.
+
+    """
+    if writable and memoryview(data).readonly:
+        # NumPy allocates large buffers with huge pages where available, which is faster to fill than bytearray
+        return np.frombuffer(data, dtype=np.uint8).copy()
+    return data
+
+
+def encode_array(array: np.ndarray, name: str = None) -> dict:
+    """Encode the array in the raw-buffer format.
+
+    The encoded data references the memory of the array. An array that is neither C- nor Fortran-contiguous is
+    copied into a C-contiguous array first.
+
+    Args:
+        array: the array to be encoded
+        name: optional name of the array, e.g. the key of the array in a model
+
+    Returns: the encoded dict
+
+    """
+    if not isinstance(array, np.ndarray):
+        raise TypeError(f"array must be np.ndarray but got {type(array)}")
+    if array.dtype.hasobject:
+        raise ValueError(f"cannot encode array of dtype {array.dtype}: object arrays are not supported")
+
+    flat, order = flatten_array(array)
+    result = {
+        RawBufferKey.DTYPE: array.dtype.str,
+        RawBufferKey.SHAPE: list(array.shape),
+        RawBufferKey.ORDER: order,
+        RawBufferKey.DATA: memoryview(flat.view(np.uint8)),
+    }
+    if name is not None:
+        result[RawBufferKey.NAME] = name
+    return result
+
+
+def flatten_array(array: np.ndarray) -> Tuple[np.ndarray, str]:
+    """Get the elements of the array as a 1-D array in memory order.
+
+    The result is a view of the array, unless the array is neither C- nor Fortran-contiguous.
+
+    Args:
+        array: the array to be flattened
+
+    Returns: a tuple of (the 1-D array, memory order of the elements)
+
+    """
+    if array.flags.c_contiguous:
+        order = _ORDER_C
+    elif array.flags.f_contiguous:
+        order = _ORDER_F
+    else:
+        array = np.ascontiguousarray(array)
+        order = _ORDER_C
+    return array.reshape(-1, order="A"), order
+
+
+def get_part_ranges(num_elements: int, item_size: int, max_part_size: int) -> List[Tuple[int, int]]:
+    """Split the elements of an array into ranges of at most max_part_size bytes.
+
+    Args:
+        num_elements: number of elements of the array
+        item_size: number of bytes of each element
+        max_part_size: max number of bytes of each part. If not positive, the array is not split.
+
+    Returns: list of (start, end) element ranges. An array that is not split has one range.
+
+    """
+    if max_part_size <= 0 or num_elements * item_size <= max_part_size:
+        return [(0, num_elements)]
+    part_elements = max(1, max_part_size // max(item_size, 1))
+    return [(start, min(start + part_elements, num_elements)) for start in range(0, num_elements, part_elements)]
+
+
+def encode_array_part(flat: np.ndarray, start: int, end: int, name: str, shape, order: str) -> dict:
+    """Encode the elements [start, end) of the flattened array as a part of the array.
+
+    Args:
+        flat: the flattened array, see flatten_array
+        start: index of the first element of the part
+        end: index after the last element of the part
+        name: name of the array
+        shape: shape of the whole array
+        order: memory order of the flattened array
+
+    Returns: the encoded dict of the part
+
+    """
+    result = encode_array(flat[start:end], name=name)
+    result[RawBufferKey.SHAPE] = list(shape)
+    result[RawBufferKey.ORDER] = order
+    result[RawBufferKey.OFFSET] = start * flat.itemsize
+    result[RawBufferKey.TOTAL_SIZE] = flat.nbytes
+    return result
+
+
+def decode_array(item: dict, writable: bool = True) -> np.ndarray:
+    """Decode the array from the raw-buffer format.
+
+    The array is built over the received buffer without copying, unless it must be writable and the buffer is
+    read-only (e.g. bytes).
+
+    Args:
+        item: the encoded dict
+        writable: whether the returned array must be writable
+
+    Returns: the decoded array
+
+    """
+    try:
+        dtype = np.dtype(item[RawBufferKey.DTYPE])
+        shape = tuple(item[RawBufferKey.SHAPE])
+        order = item.get(RawBufferKey.ORDER, _ORDER_C)
+        data = item[RawBufferKey.DATA]
+    except (KeyError, TypeError) as ex:
+        raise ValueError(f"invalid raw array data: {ex}")
+
+    if dtype.hasobject:
+        raise ValueError(f"invalid raw array data: object dtype {dtype} is not supported")
+
+    buffer = get_writable_buffer(data, writable)
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape, order=order)
+
+
+class ReceivedRanges:
+    def __init__(self, name: str, total_size: int):
+        """Byte ranges of an array that have been received in parts.
+
+        Args:
+            name: name of the array
+            total_size: size of the whole array in bytes
+        """
+        self.name = name
+        self.total_size = total_size
+        self.received_size = 0
+        self._starts = []  # sorted start offsets of the received ranges, which never overlap
+        self._ends = []  # end offsets of the received ranges, in the same order
+
+    def add(self, offset: int, size: int, total_size: int) -> bool:
+        """Add the range of a received part.
+
+        Args:
+            offset: offset of the part in bytes
+            size: size of the part in bytes
+            total_size: size of the whole array as sent with the part
+
+        Returns: True if the range is new; False if the same range has been received already.
+
+        Raises ValueError if the range is out of the array, or overlaps a different range received before.
+
+        """
+        if total_size != self.total_size:
+            raise ValueError(
+                f"invalid raw array part of {self.name}: total size {total_size} != {self.total_size} of other parts"
+            )
+        end = offset + size
+        if offset < 0 or end > total_size:
+            raise ValueError(f"invalid raw array part of {self.name}: range {offset}-{end} exceeds {total_size}")
+
+        i = bisect.bisect_left(self._starts, offset)
+        if i < len(self._starts) and self._starts[i] == offset and self._ends[i] == end:
+            return False
+        if (i > 0 and self._ends[i - 1] > offset) or (i < len(self._starts) and self._starts[i] < end):
+            raise ValueError(f"invalid raw array part of {self.name}: range {offset}-{end} overlaps another part")
+        self._starts.insert(i, offset)
+        self._ends.insert(i, end)
+        self.received_size += size
+        return True
+
+    def is_complete(self) -> bool:
+        return self.received_size >= self.total_size
+
+
+class _PartialBuffer:
+    def __init__(self, name: str, total_size: int):
+        self.buffer = np.empty(total_size, dtype=np.uint8)
+        self.ranges = ReceivedRanges(name, total_size)
+
+
+class RawBufferAssembler:
+    def __init__(self):
+        """Reassemble arrays that are sent in parts.
+
+        The buffer of an array is allocated when its first part is received, and each part is copied into it.
+        Parts can be received in any order, and a part that is received again is ignored, even after the array
+        has been completed. A part that overlaps a different part is rejected, so that only parts that cover the
+        whole array complete it.
+        """
+        self.partial_buffers = {}  # name => _PartialBuffer
+        self.completed = set()  # names of completed arrays
+
+    def add_part(self, item: dict) -> Optional[dict]:
+        """Add a received part.
+
+        Args:
+            item: the encoded dict of the part
+
+        Returns: the encoded dict of the whole array if all its parts have been received; None otherwise.
+            Its data is a writable buffer, so the array can be decoded without copying.
+
+        """
+        try:
+            name = item[RawBufferKey.NAME]
+            offset = item[RawBufferKey.OFFSET]
+            total_size = item[RawBufferKey.TOTAL_SIZE]
+            data = item[RawBufferKey.DATA]
+        except KeyError as ex:
+            raise ValueError(f"invalid raw array part: missing {ex}")
+
+        size = memoryview(data).nbytes
+        if offset < 0 or offset + size > total_size:
+            raise ValueError(f"invalid raw array part of {name}: range {offset}-{offset + size} exceeds {total_size}")
+
+        if name in self.completed:
+            return None
+
+        pb = self.partial_buffers.get(name)
+        if pb is None:
+            pb = _PartialBuffer(name, total_size)
+            self.partial_buffers[name] = pb
+
+        if not pb.ranges.add(offset, size, total_size):
+            return None
+        pb.buffer[offset : offset + size] = np.frombuffer(data, dtype=np.uint8)
+        if not pb.ranges.is_complete():
+            return None
+
+        self.partial_buffers.pop(name)
+        self.completed.add(name)
+        result = {k: v for k, v in item.items() if k not in (RawBufferKey.OFFSET, RawBufferKey.TOTAL_SIZE)}
+        result[RawBufferKey.DATA] = pb.buffer
+        return result
+
+    def get_incomplete(self) -> List[str]:
+        """Get names of arrays that have not been completely received."""
+        return list(self.partial_buffers.keys())
@@ -23,10 +23,18 @@ from nvflare.app_common.widgets.streaming import AnalyticsSender
 
 
 class LogWriter(FLComponent, ABC):
-    def __init__(self, event_type: str = ANALYTIC_EVENT_TYPE, metrics_sender_id: str = None):
+    def __init__(
+        self,
+        event_type: str = ANALYTIC_EVENT_TYPE,
+        metrics_sender_id: str = None,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
+    ):
         super().__init__()
         self.event_type = event_type
         self.metrics_sender_id = metrics_sender_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self.sender = None
         self.engine = None
 
@@ -39,8 +47,13 @@ class LogWriter(FLComponent, ABC):
                     self.system_panic("Cannot load MetricsSender!", fl_ctx=fl_ctx)
                 self.sender.writer = self.get_writer_name()
             else:
-                self.sender = AnalyticsSender(self.event_type, self.get_writer_name())
-                self.sender.engine = engine
+                self.sender = AnalyticsSender(
+                    self.event_type, self.get_writer_name(), self.batch_size, self.flush_interval
+                )
+                self.sender.handle_event(event_type, fl_ctx)
+        elif self.sender and not self.metrics_sender_id:
+            # the sender is not a component of the job, so it does not get the events otherwise
+            self.sender.handle_event(event_type, fl_ctx)
 
     def write(self, tag: str, value, data_type: AnalyticsDataType, global_step: Optional[int] = None, **kwargs):
         """Writes a record.
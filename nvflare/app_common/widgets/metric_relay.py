@@ -18,7 +18,7 @@ from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE
 from nvflare.apis.dxo import DXO
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_context import FLContext
-from nvflare.apis.utils.analytix_utils import send_analytic_dxo
+from nvflare.apis.utils.analytix_utils import AnalyticsBatcher, send_analytic_dxo
 from nvflare.client.config import ConfigKey
 from nvflare.fuel.utils.attributes_exportable import AttributesExportable
 from nvflare.fuel.utils.constants import PipeChannelName
@@ -37,8 +37,27 @@ class MetricRelay(Widget, AttributesExportable):
         pipe_channel_name=PipeChannelName.METRIC,
         event_type: str = ANALYTIC_EVENT_TYPE,
         fed_event: bool = True,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
     ):
+        """Relays the metrics received from the pipe as analytic events.
+
+        Args:
+            pipe_id: id of the pipe component to receive metrics from.
+            read_interval: how often to read from the pipe.
+            heartbeat_interval: how often to send heartbeats to the peer.
+            heartbeat_timeout: how long to wait for a heartbeat from the peer before treating it as gone.
+            pipe_channel_name: the channel name of the pipe.
+            event_type: event type to fire.
+            fed_event: whether to fire the events as federated events.
+            batch_size: max number of scalar and metric records to relay in one event. Records are buffered and
+                relayed in batches if greater than 1. The buffer is also relayed after each task and at the end of
+                the run. Defaults to 1: each record is relayed right away.
+            flush_interval: max time in seconds that a record is buffered when batch_size is greater than 1.
+        """
         super().__init__()
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive int but got {batch_size}")
         self.pipe_id = pipe_id
         self._read_interval = read_interval
         self._heartbeat_interval = heartbeat_interval
@@ -49,6 +68,9 @@ class MetricRelay(Widget, AttributesExportable):
         self._fl_ctx = None
         self._event_type = event_type
         self._fed_event = fed_event
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._batcher = None
 
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.ABOUT_TO_START_RUN:
@@ -61,6 +83,11 @@ class MetricRelay(Widget, AttributesExportable):
             self._fl_ctx = fl_ctx
             self.pipe = pipe
             self.pipe.open(self.pipe_channel_name)
+            if self._batch_size > 1:
+                self._batcher = AnalyticsBatcher(self._send_dxo, self._batch_size, self._flush_interval)
+        elif event_type == EventType.AFTER_TASK_EXECUTION:
+            if self._batcher:
+                self._batcher.flush()
         elif event_type == EventType.BEFORE_TASK_EXECUTION:
             if self.pipe_handler:
                 self.pipe_handler.stop(close_pipe=False)
@@ -71,6 +98,8 @@ class MetricRelay(Widget, AttributesExportable):
             if self.pipe_handler:
                 self.pipe_handler.notify_end("end_of_job")
                 self.pipe_handler.stop(close_pipe=False)
+            if self._batcher:
+                self._batcher.close()
 
     def _create_pipe_handler(self):
         handler = PipeHandler(
@@ -95,7 +124,13 @@ class MetricRelay(Widget, AttributesExportable):
         if not isinstance(msg.data, DXO):
             self.logger.error(f"bad metric data: expect DXO but got {type(msg.data)}")
             return
-        send_analytic_dxo(self, msg.data, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
+        if self._batcher:
+            self._batcher.add(msg.data)
+        else:
+            self._send_dxo(msg.data)
+
+    def _send_dxo(self, dxo: DXO):
+        send_analytic_dxo(self, dxo, self._fl_ctx, self._event_type, fire_fed_event=self._fed_event)
 
     def export(self, export_mode: str) -> Tuple[str, dict]:
         pipe_export_class, pipe_export_args = self.pipe.export(export_mode)
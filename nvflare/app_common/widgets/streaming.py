@@ -17,16 +17,29 @@ from threading import Lock
 from typing import List, Optional
 
 from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_constant import EventScope, FLContextKey, ReservedKey
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
-from nvflare.apis.utils.analytix_utils import create_analytic_dxo, send_analytic_dxo
+from nvflare.apis.utils.analytix_utils import (
+    AnalyticsBatcher,
+    create_analytic_dxo,
+    is_analytic_batch_dxo,
+    send_analytic_dxo,
+    split_analytic_batch_dxo,
+)
 from nvflare.widgets.widget import Widget
 
 
 class AnalyticsSender(Widget):
-    def __init__(self, event_type=ANALYTIC_EVENT_TYPE, writer_name=LogWriterName.TORCH_TB):
+    def __init__(
+        self,
+        event_type=ANALYTIC_EVENT_TYPE,
+        writer_name=LogWriterName.TORCH_TB,
+        batch_size: int = 1,
+        flush_interval: float = 1.0,
+    ):
         """Sender for analytics data.
 
         This class has some legacy methods that implement some common methods following signatures from
@@ -36,11 +49,20 @@ class AnalyticsSender(Widget):
         Args:
             event_type (str): event type to fire (defaults to "analytix_log_stats").
             writer_name: the log writer for syntax information (defaults to LogWriterName.TORCH_TB)
+            batch_size (int): max number of scalar and metric records to send in one event. Records are buffered
+                and sent in batches if greater than 1. The buffer is also sent after each task and at the end of
+                the run. Defaults to 1: each record is sent right away.
+            flush_interval (float): max time in seconds that a record is buffered when batch_size is greater than 1.
         """
         super().__init__()
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive int but got {batch_size}")
         self.engine = None
         self.event_type = event_type
         self.writer = writer_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batcher = None
 
     def get_writer_name(self) -> LogWriterName:
         return self.writer
@@ -48,6 +70,13 @@ class AnalyticsSender(Widget):
     def handle_event(self, event_type: str, fl_ctx: FLContext):
         if event_type == EventType.ABOUT_TO_START_RUN:
             self.engine = fl_ctx.get_engine()
+            if self.batch_size > 1:
+                self._batcher = AnalyticsBatcher(self._send_dxo, self.batch_size, self.flush_interval)
+        elif event_type == EventType.AFTER_TASK_EXECUTION:
+            self.flush()
+        elif event_type == EventType.ABOUT_TO_END_RUN:
+            if self._batcher:
+                self._batcher.close()
 
     def add(self, tag: str, value, data_type: AnalyticsDataType, global_step: Optional[int] = None, **kwargs):
         """Create and send a DXO by firing an event.
@@ -67,11 +96,25 @@ class AnalyticsSender(Widget):
                 raise TypeError(f"Expect global step to be an instance of int, but got {type(global_step)}")
             kwargs[TrackConst.GLOBAL_STEP_KEY] = global_step
         dxo = create_analytic_dxo(tag=tag, value=value, data_type=data_type, writer=self.get_writer_name(), **kwargs)
+        if self._batcher:
+            self._batcher.add(dxo)
+        else:
+            self._send_dxo(dxo)
+
+    def flush(self):
+        """Send the buffered records."""
+        if self._batcher:
+            self._batcher.flush()
+
+    def _send_dxo(self, dxo: DXO):
         with self.engine.new_context() as fl_ctx:
             send_analytic_dxo(self, dxo=dxo, fl_ctx=fl_ctx, event_type=self.event_type)
 
     def close(self):
         """Close resources."""
+        if self._batcher:
+            self._batcher.close()
+            self._batcher = None
         if self.engine:
             self.engine = None
 
@@ -115,6 +158,23 @@ class AnalyticsReceiver(Widget, ABC):
         """
         pass
 
+    def save_batch(self, fl_ctx: FLContext, records: List[DXO], record_origin: str):
+        """Saves a batch of records received in one message.
+
+        The records are saved one by one with save by default. Receivers that can write records in bulk
+        should override this method.
+
+        Args:
+            fl_ctx (FLContext): fl context.
+            records (List[DXO]): the received records, one analytic DXO per record.
+            record_origin (str): the sender of these records.
+        """
+        for dxo in records:
+            try:
+                self.save(fl_ctx=fl_ctx, shareable=dxo.to_shareable(), record_origin=record_origin)
+            except Exception as e:
+                self.log_error(fl_ctx, f"Receiver save method failed with {e}.", fire_event=False)
+
     @abstractmethod
     def finalize(self, fl_ctx: FLContext):
         """Finalizes the receiver.
@@ -164,8 +224,12 @@ class AnalyticsReceiver(Widget, ABC):
                 return
 
             try:
+                batch = self._get_batch(data)
                 with self._save_lock:
-                    self.save(shareable=data, fl_ctx=fl_ctx, record_origin=record_origin)
+                    if batch is None:
+                        self.save(shareable=data, fl_ctx=fl_ctx, record_origin=record_origin)
+                    else:
+                        self.save_batch(fl_ctx=fl_ctx, records=batch, record_origin=record_origin)
             except Exception as e:
                 self.log_error(fl_ctx, f"Receiver save method failed with {e}.", fire_event=False)
 
@@ -179,6 +243,15 @@ class AnalyticsReceiver(Widget, ABC):
                 # catch the exception so the job can continue
                 self.log_error(fl_ctx, f"Receiver finalize failed with {e}.", fire_event=False)
 
+    @staticmethod
+    def _get_batch(data: Shareable) -> Optional[List[DXO]]:
+        try:
+            dxo = from_shareable(data)
+        except Exception:
+            # not a DXO, leave it to save
+            return None
+        return split_analytic_batch_dxo(dxo) if is_analytic_batch_dxo(dxo) else None
+
     def _get_record_origin(self, fl_ctx: FLContext, data: Shareable) -> Optional[str]:
         if fl_ctx.get_prop(FLContextKey.EVENT_SCOPE) == EventScope.FEDERATION:
             return data.get_peer_prop(ReservedKey.IDENTITY_NAME, None)
@@ -17,13 +17,17 @@ from typing import Tuple, Union
 import torch
 from safetensors.torch import load, save
 
+import nvflare.fuel.utils.app_config_utils as acu
 import nvflare.fuel.utils.fobs.dots as dots
+from nvflare.apis.fl_constant import ConfigVarName
+from nvflare.app_common.np.raw_array import is_raw_buffer
 from nvflare.fuel.f3.streaming.download_service import Downloadable
 from nvflare.fuel.utils.fobs.datum import DatumManager
 from nvflare.fuel.utils.fobs.decomposers.via_downloader import ViaDownloaderDecomposer
 
 from ...fuel.f3.cellnet.cell import Cell
 from .lazy_tensor_dict import LazyTensorDict
+from .raw_tensor import decode_tensor, encode_tensor
 from .tensor_downloader import TensorDownloadable, download_tensors, download_tensors_to_disk
 
 
@@ -45,7 +49,10 @@ class TensorDecomposer(ViaDownloaderDecomposer):
         return dots.TENSOR_DOWNLOAD
 
     def to_downloadable(self, items: dict, max_chunk_size: int, fobs_ctx: dict) -> Downloadable:
-        return TensorDownloadable(items, max_chunk_size)
+        return TensorDownloadable(items, max_chunk_size, raw_buffer=self._use_raw_buffer())
+
+    def _use_raw_buffer(self) -> bool:
+        return acu.get_bool_var(self._config_var_name(ConfigVarName.RAW_BUFFER_ENCODING), False)
 
     def download(
         self,
@@ -78,12 +85,15 @@ class TensorDecomposer(ViaDownloaderDecomposer):
             abort_signal,
         )
 
-    def native_decompose(self, target: torch.Tensor, manager: DatumManager = None) -> bytes:
-        # save the tensor to bytes using safetensors
-        dummy = {"t": target}
-        return save(dummy)
+    def native_decompose(self, target: torch.Tensor, manager: DatumManager = None):
+        if self._use_raw_buffer():
+            return encode_tensor(target)
+        return save({"t": target})
+
+    def native_recompose(self, data, manager: DatumManager = None) -> torch.Tensor:
+        if is_raw_buffer(data):
+            return decode_tensor(data)
 
-    def native_recompose(self, data: bytes, manager: DatumManager = None) -> torch.Tensor:
         # load safetensors generated bytes
         dummy = load(data)
         if not isinstance(dummy, dict):
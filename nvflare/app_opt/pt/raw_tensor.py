@@ -0,0 +1,187 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Raw-buffer wire format of tensors. See nvflare.app_common.np.raw_array for the format, including how large
+tensors are sent in parts.
+
+The dtype is the name of the torch dtype (e.g. "bfloat16"), so that dtypes without a NumPy equivalent are supported.
+"""
+import json
+import os
+import struct
+
+import torch
+
+from nvflare.app_common.np.raw_array import RawBufferKey, get_writable_buffer
+
+# torch dtype name => safetensors dtype name
+_SAFETENSORS_DTYPES = {
+    "float64": "F64",
+    "float32": "F32",
+    "float16": "F16",
+    "bfloat16": "BF16",
+    "int64": "I64",
+    "int32": "I32",
+    "int16": "I16",
+    "int8": "I8",
+    "uint64": "U64",
+    "uint32": "U32",
+    "uint16": "U16",
+    "uint8": "U8",
+    "bool": "BOOL",
+    "float8_e4m3fn": "F8_E4M3",
+    "float8_e5m2": "F8_E5M2",
+}
+
+
+def _dtype_name(dtype: torch.dtype) -> str:
+    return str(dtype).split(".")[-1]
+
+
+def _get_dtype(name) -> torch.dtype:
+    dtype = getattr(torch, name, None) if isinstance(name, str) else None
+    if not isinstance(dtype, torch.dtype):
+        raise ValueError(f"invalid raw tensor data: unknown dtype {name}")
+    return dtype
+
+
+def encode_tensor(tensor: torch.Tensor, name: str = None) -> dict:
+    """Encode the tensor in the raw-buffer format.
+
+    The encoded data references the memory of the tensor. A tensor that is not on CPU or not contiguous is
+    copied first.
+
+    Args:
+        tensor: the tensor to be encoded
+        name: optional name of the tensor, e.g. the key of the tensor in a state dict
+
+    Returns: the encoded dict
+
+    """
+    if not isinstance(tensor, torch.Tensor):
+        raise TypeError(f"tensor must be torch.Tensor but got {type(tensor)}")
+
+    t = tensor.detach()
+    if t.device.type != "cpu":
+        t = t.cpu()
+    t = t.contiguous()
+
+    result = {
+        RawBufferKey.DTYPE: _dtype_name(t.dtype),
+        RawBufferKey.SHAPE: list(t.shape),
+        RawBufferKey.DATA: memoryview(t.reshape(-1).view(torch.uint8).numpy()),
+    }
+    if name is not None:
+        result[RawBufferKey.NAME] = name
+    return result
+
+
+def flatten_tensor(tensor: torch.Tensor) -> torch.Tensor:
+    """Get the elements of the tensor as a 1-D tensor on the same device.
+
+    The result is a view of the tensor, unless the tensor is not contiguous.
+    """
+    return tensor.detach().reshape(-1)
+
+
+def encode_tensor_part(flat: torch.Tensor, start: int, end: int, name: str, shape) -> dict:
+    """Encode the elements [start, end) of the flattened tensor as a part of the tensor.
+
+    Only the part is copied if the tensor is not on CPU.
+
+    Args:
+        flat: the flattened tensor, see flatten_tensor
+        start: index of the first element of the part
+        end: index after the last element of the part
+        name: name of the tensor
+        shape: shape of the whole tensor
+
+    Returns: the encoded dict of the part
+
+    """
+    result = encode_tensor(flat[start:end], name=name)
+    result[RawBufferKey.SHAPE] = list(shape)
+    result[RawBufferKey.OFFSET] = start * flat.element_size()
+    result[RawBufferKey.TOTAL_SIZE] = flat.numel() * flat.element_size()
+    return result
+
+
+def decode_tensor(item: dict, writable: bool = True) -> torch.Tensor:
+    """Decode the tensor from the raw-buffer format.
+
+    The tensor is built over the received buffer without copying, unless it must be writable and the buffer is
+    read-only (e.g. bytes).
+
+    Args:
+        item: the encoded dict
+        writable: whether the returned tensor must be writable. Writing to a tensor over a read-only buffer is
+            undefined behavior.
+
+    Returns: the decoded tensor
+
+    """
+    try:
+        dtype = _get_dtype(item[RawBufferKey.DTYPE])
+        shape = tuple(item[RawBufferKey.SHAPE])
+        data = item[RawBufferKey.DATA]
+    except (KeyError, TypeError) as ex:
+        raise ValueError(f"invalid raw tensor data: {ex}")
+
+    if len(data) == 0:
+        # torch.frombuffer does not accept empty buffers
+        return torch.empty(shape, dtype=dtype)
+
+    buffer = get_writable_buffer(data, writable)
+    return torch.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+def write_safetensors_file(file_path: str, item: dict):
+    """Write the tensor encoded in the raw-buffer format to a safetensors file, without decoding it.
+
+    If the item is a part of a tensor, the part is written at its offset in the file, and the file is created
+    when it does not exist yet. All parts of the tensor must be written to the same file.
+
+    Args:
+        file_path: path of the file to be written
+        item: the encoded dict. It must have the name of the tensor, which is used as the key in the file.
+
+    """
+    name = item.get(RawBufferKey.NAME)
+    if name is None:
+        raise ValueError("invalid raw tensor data: missing tensor name")
+    dtype_name = item.get(RawBufferKey.DTYPE)
+    st_dtype = _SAFETENSORS_DTYPES.get(dtype_name)
+    if not st_dtype:
+        raise ValueError(f"dtype {dtype_name} is not supported by safetensors")
+
+    data = item[RawBufferKey.DATA]
+    offset = item.get(RawBufferKey.OFFSET, 0)
+    total_size = item.get(RawBufferKey.TOTAL_SIZE, len(data))
+    header = {
+        name: {
+            "dtype": st_dtype,
+            "shape": list(item[RawBufferKey.SHAPE]),
+            "data_offsets": [0, total_size],
+        }
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+    # the data must start at an 8-byte aligned offset
+    header_bytes += b" " * (-len(header_bytes) % 8)
+    exists = os.path.exists(file_path)
+    with open(file_path, "r+b" if exists else "wb") as f:
+        if not exists:
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+        f.seek(8 + len(header_bytes) + offset)
+        f.write(data)
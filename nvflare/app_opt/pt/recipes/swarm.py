@@ -22,6 +22,7 @@ from nvflare.apis.dxo import DataKind
 from nvflare.apis.fl_constant import SystemVarName
 from nvflare.app_common.aggregators.intime_accumulate_model_aggregator import InTimeAccumulateWeightedAggregator
 from nvflare.app_common.ccwf.ccwf_job import CCWFJob, CrossSiteEvalConfig, SwarmClientConfig, SwarmServerConfig
+from nvflare.app_common.ccwf.common import AggregationMode
 from nvflare.app_common.ccwf.comps.simple_model_shareable_generator import SimpleModelShareableGenerator
 from nvflare.app_opt.pt.file_model_persistor import PTFileModelPersistor
 from nvflare.fuel.utils.constants import Mode
@@ -154,6 +155,10 @@ class SwarmLearningRecipe(BaseSwarmLearningRecipe):
             the directory is treated as a runtime path and does not need to exist on the
             machine that builds or exports the job. ``{JOB_ID}/{SITE_NAME}`` is always
             appended so concurrent jobs and sites remain isolated. Ignored for ``"cell_pipe"``.
+        aggregation_mode: ``"central"`` (default) aggregates each round on one randomly chosen client.
+            ``"reduce_scatter"`` splits the model into one shard per client: each client aggregates its shard
+            and sends it to all other clients, which spreads the traffic and the aggregation work of large
+            models over all clients. See ``SwarmServerController``.
 
     Example:
         Using nn.Module instance:
@@ -204,6 +209,7 @@ class SwarmLearningRecipe(BaseSwarmLearningRecipe):
         round_timeout: float = 3600,
         pipe_type: str = "cell_pipe",
         pipe_root_path: Optional[str] = None,
+        aggregation_mode: str = AggregationMode.CENTRAL,
     ):
         _SwarmValidator(initial_ckpt=initial_ckpt)
 
@@ -280,6 +286,7 @@ class SwarmLearningRecipe(BaseSwarmLearningRecipe):
             progress_timeout=progress_timeout,
             max_status_report_interval=max_status_report_interval,
             min_clients=min_clients,
+            aggregation_mode=aggregation_mode,
         )
         client_config = SwarmClientConfig(
             executor=ScriptRunner(
@@ -21,30 +21,87 @@ import torch
 from safetensors.torch import load as load_tensors
 from safetensors.torch import save as save_tensors
 
+from nvflare.app_common.np.raw_array import (
+    RawBufferAssembler,
+    RawBufferKey,
+    ReceivedRanges,
+    get_part_ranges,
+    is_raw_buffer,
+    is_raw_buffer_part,
+    raw_buffer_size,
+)
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
 from nvflare.fuel.f3.streaming.download_service import download_object
 from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
 
 from .lazy_tensor_dict import LazyTensorDict, _cleanup_temp_dir
+from .raw_tensor import decode_tensor, encode_tensor, encode_tensor_part, flatten_tensor, write_safetensors_file
 
 _TWO_MB = 2 * 1024 * 1024
 
 
 class TensorDownloadable(CacheableObject):
 
-    def __init__(self, tensors: dict[str, torch.Tensor], max_chunk_size: int):
-        self.size = len(tensors)
+    def __init__(self, tensors: dict[str, torch.Tensor], max_chunk_size: int, raw_buffer: bool = False):
+        """Downloadable of a state dict. Each tensor is one item.
+
+        Args:
+            tensors: the tensors to be downloaded
+            max_chunk_size: max number of bytes for each chunk
+            raw_buffer: whether to send the tensors in the raw-buffer format instead of safetensors. In this format,
+                a tensor larger than max_chunk_size is split into items of byte ranges, so that no chunk exceeds
+                max_chunk_size. Receivers of earlier versions cannot decode it.
+        """
         self.keys = list(tensors.keys())
+        self.raw_buffer = raw_buffer
+
+        # item index => (key, element range of the part, or None if the item is the whole tensor)
+        self.items = []
+        for key in self.keys:
+            tensor = tensors[key]
+            if not raw_buffer:
+                self.items.append((key, None))
+                continue
+            ranges = get_part_ranges(tensor.numel(), tensor.element_size(), max_chunk_size)
+            if len(ranges) == 1:
+                self.items.append((key, None))
+            else:
+                self.items.extend((key, r) for r in ranges)
+        self.size = len(self.items)
+        self.flat_tensors = {}  # key => flattened tensor of tensors that are split
         super().__init__(tensors, max_chunk_size)
 
     def get_item_count(self) -> int:
         return self.size
 
-    def produce_item(self, index: int) -> bytes:
-        key = self.keys[index]
-        tensor_to_send = {key: self.base_obj[key]}
-        return save_tensors(tensor_to_send)
+    def produce_item(self, index: int):
+        key, part_range = self.items[index]
+        tensor = self.base_obj[key]
+        if not self.raw_buffer:
+            return save_tensors({key: tensor})
+
+        if part_range is None:
+            return encode_tensor(tensor, name=key)
+
+        flat = self.flat_tensors.get(key)
+        if flat is None:
+            # a view unless the tensor is not contiguous
+            flat = flatten_tensor(tensor)
+            self.flat_tensors[key] = flat
+        start, end = part_range
+        return encode_tensor_part(flat, start, end, name=key, shape=tensor.shape)
+
+    def get_item_size(self, item) -> int:
+        if is_raw_buffer(item):
+            return raw_buffer_size(item)
+        return len(item)
+
+    def transaction_done(self, transaction_id: str, status: str):
+        super().transaction_done(transaction_id, status)
+
+        # flattened copies of non-contiguous items are no longer needed
+        self.flat_tensors = {}
 
 
 class TensorConsumer(ItemConsumer):
@@ -55,6 +112,7 @@ class TensorConsumer(ItemConsumer):
         self.cb_kwargs = cb_kwargs
         if tensors_received_cb is not None and not callable(tensors_received_cb):
             raise ValueError("tensors_received_cb must be callable")
+        self.assembler = RawBufferAssembler()
 
     def consume_items(self, items: List[Any], result: Any) -> Any:
         if not isinstance(items, list):
@@ -64,11 +122,25 @@ class TensorConsumer(ItemConsumer):
 
         tensors = {}
         for item in items:
+            if is_raw_buffer_part(item):
+                item = self.assembler.add_part(item)
+                if item is None:
+                    # more parts of the tensor to come
+                    continue
+
+            if is_raw_buffer(item):
+                tensors[item[RawBufferKey.NAME]] = decode_tensor(item)
+                continue
+
+            # safetensors data
             td = load_tensors(item)
             if not isinstance(td, dict):
                 raise ValueError("cannot load received bytes to tensors")
             tensors.update(td)
 
+        if not tensors:
+            return result
+
         if self.tensors_received_cb:
             cb_result = self.tensors_received_cb(tensors, **self.cb_kwargs)
             if isinstance(cb_result, dict):
@@ -77,11 +149,19 @@ class TensorConsumer(ItemConsumer):
             result.update(tensors)
         return result
 
+    def download_completed(self, ref_id: str):
+        incomplete = self.assembler.get_incomplete()
+        if incomplete:
+            self.download_failed(ref_id, f"missing parts of tensors {incomplete}")
+        else:
+            super().download_completed(ref_id)
+
 
 def add_tensors(
     downloader: ObjectDownloader,
     tensors: dict[str, torch.Tensor],
     max_chunk_size: int = _TWO_MB,
+    raw_buffer: bool = False,
 ) -> str:
     """Add tensors to be downloaded to the specified downloader.
 
@@ -89,11 +169,12 @@ def add_tensors(
         downloader: the downloader to add tensors to.
         tensors: state dict to be downloaded
         max_chunk_size: max chunk size
+        raw_buffer: whether to send the tensors in the raw-buffer format. See TensorDownloadable.
 
     Returns: reference id for the state dict.
 
     """
-    obj = TensorDownloadable(tensors, max_chunk_size)
+    obj = TensorDownloadable(tensors, max_chunk_size, raw_buffer=raw_buffer)
     return downloader.add_object(obj)
 
 
@@ -162,12 +243,44 @@ def _extract_safetensors_keys(data: bytes) -> list[str]:
 
 
 class DiskTensorConsumer(ItemConsumer):
-    """Writes raw safetensors bytes to disk without deserializing to tensors."""
+    """Writes received tensors to safetensors files on disk without deserializing them."""
 
     def __init__(self, temp_dir: str):
         ItemConsumer.__init__(self)
         self._temp_dir = temp_dir
         self._file_counter = 0
+        self._partial_files = {}  # tensor name => (file path, ReceivedRanges)
+        self._completed_parts = set()  # names of tensors whose parts have all been written
+
+    def _new_file_path(self) -> str:
+        file_path = os.path.join(self._temp_dir, f"chunk_{self._file_counter}.safetensors")
+        self._file_counter += 1
+        return file_path
+
+    def _write_part(self, item: dict):
+        """Write the part of a tensor into the file of the tensor.
+
+        Returns: path of the file if all parts of the tensor have been written; None otherwise.
+        """
+        name = item.get(RawBufferKey.NAME)
+        if name in self._completed_parts:
+            return None
+
+        total_size = item[RawBufferKey.TOTAL_SIZE]
+        pf = self._partial_files.get(name)
+        if pf is None:
+            pf = (self._new_file_path(), ReceivedRanges(name, total_size))
+            self._partial_files[name] = pf
+
+        file_path, ranges = pf
+        if not ranges.add(item[RawBufferKey.OFFSET], raw_buffer_size(item), total_size):
+            return None
+        write_safetensors_file(file_path, item)
+        if not ranges.is_complete():
+            return None
+        self._partial_files.pop(name)
+        self._completed_parts.add(name)
+        return file_path
 
     def consume_items(self, items: List[Any], result: Any) -> Any:
         if not isinstance(items, list):
@@ -176,11 +289,22 @@ class DiskTensorConsumer(ItemConsumer):
             result = {}
 
         for item in items:
-            keys = _extract_safetensors_keys(item)
-            file_path = os.path.join(self._temp_dir, f"chunk_{self._file_counter}.safetensors")
-            self._file_counter += 1
-            with open(file_path, "wb") as f:
-                f.write(item)
+            if is_raw_buffer_part(item):
+                file_path = self._write_part(item)
+                if not file_path:
+                    # more parts of the tensor to come
+                    continue
+                keys = [item.get(RawBufferKey.NAME)]
+            elif is_raw_buffer(item):
+                file_path = self._new_file_path()
+                keys = [item.get(RawBufferKey.NAME)]
+                write_safetensors_file(file_path, item)
+            else:
+                # safetensors data
+                file_path = self._new_file_path()
+                keys = _extract_safetensors_keys(item)
+                with open(file_path, "wb") as f:
+                    f.write(item)
             for key in keys:
                 if key in result:
                     raise ValueError(
@@ -191,6 +315,12 @@ class DiskTensorConsumer(ItemConsumer):
 
         return result
 
+    def download_completed(self, ref_id: str):
+        if self._partial_files:
+            self.download_failed(ref_id, f"missing parts of tensors {list(self._partial_files.keys())}")
+        else:
+            super().download_completed(ref_id)
+
     def download_failed(self, ref_id, reason: str):
         super().download_failed(ref_id, reason)
         # Eager cleanup on download callback error; the outer caller may also
@@ -21,8 +21,15 @@ import mlflow
 from mlflow.entities import Metric, Param, RunTag
 from mlflow.tracking.client import MlflowClient
 
-from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsData, AnalyticsDataType, LogWriterName, TrackConst
-from nvflare.apis.dxo import from_shareable
+from nvflare.apis.analytix import (
+    ANALYTIC_EVENT_TYPE,
+    BATCHABLE_DATA_TYPES,
+    AnalyticsData,
+    AnalyticsDataType,
+    LogWriterName,
+    TrackConst,
+)
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.fl_constant import ProcessType, ReservedKey
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.job_def import JobMetaKey
@@ -289,6 +296,24 @@ class MLflowReceiver(AnalyticsReceiver):
             if self.time_since_flush >= self.buff_flush_time:
                 self.flush_buffers(record_origin)
 
+    def save_batch(self, fl_ctx: FLContext, records: List[DXO], record_origin: str):
+        if self.time_start == 0:
+            self.time_start = timeit.default_timer()
+
+        for dxo in records:
+            data = AnalyticsData.from_dxo(dxo, receiver=LogWriterName.MLFLOW)
+            if not data:
+                continue
+            if data.data_type in BATCHABLE_DATA_TYPES:
+                self.buffer_data(data, record_origin)
+            else:
+                self.save(fl_ctx, dxo.to_shareable(), record_origin)
+
+        # the whole batch is sent to the tracking server with the next log_batch
+        self.time_since_flush += timeit.default_timer() - self.time_start
+        if self.time_since_flush >= self.buff_flush_time:
+            self.flush_buffers(record_origin)
+
     def buffer_data(self, data: AnalyticsData, record_origin: str) -> None:
         """Buffer the data to send later.
 
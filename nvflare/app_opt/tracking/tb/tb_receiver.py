@@ -16,7 +16,7 @@ import os
 from typing import List, Optional
 
 from nvflare.apis.analytix import AnalyticsData, AnalyticsDataType
-from nvflare.apis.dxo import from_shareable
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
 from nvflare.app_common.widgets.streaming import AnalyticsReceiver
@@ -103,17 +103,21 @@ class TBAnalyticsReceiver(AnalyticsReceiver):
 
         return records
 
+    def _get_writer(self, record_origin: str) -> TensorBoardEventWriter:
+        writer = self.writers_table.get(record_origin)
+        if writer is None:
+            peer_log_dir = os.path.join(self.root_log_dir, record_origin)
+            writer = TensorBoardEventWriter(log_dir=peer_log_dir)
+            self.writers_table[record_origin] = writer
+        return writer
+
     def save(self, fl_ctx: FLContext, shareable: Shareable, record_origin):
         dxo = from_shareable(shareable)
         analytic_data = AnalyticsData.from_dxo(dxo)
         if not analytic_data:
             return
 
-        writer = self.writers_table.get(record_origin)
-        if writer is None:
-            peer_log_dir = os.path.join(self.root_log_dir, record_origin)
-            writer = TensorBoardEventWriter(log_dir=peer_log_dir)
-            self.writers_table[record_origin] = writer
+        writer = self._get_writer(record_origin)
 
         # do different things depending on the type in dxo
         self.log_debug(
@@ -121,6 +125,17 @@ class TBAnalyticsReceiver(AnalyticsReceiver):
             f"try to save data {analytic_data} from {record_origin}",
             fire_event=False,
         )
+        self._write(writer, analytic_data, fl_ctx)
+
+    def save_batch(self, fl_ctx: FLContext, records: List[DXO], record_origin: str):
+        writer = self._get_writer(record_origin)
+        self.log_debug(fl_ctx, f"try to save {len(records)} records from {record_origin}", fire_event=False)
+        for dxo in records:
+            analytic_data = AnalyticsData.from_dxo(dxo)
+            if analytic_data:
+                self._write(writer, analytic_data, fl_ctx)
+
+    def _write(self, writer: TensorBoardEventWriter, analytic_data: AnalyticsData, fl_ctx: FLContext):
         data_records = self._convert_to_records(analytic_data, fl_ctx)
 
         for data_record in data_records:
@@ -19,13 +19,15 @@ from nvflare.app_common.tracking.log_writer import LogWriter
 
 
 class TBWriter(LogWriter):
-    def __init__(self, event_type=ANALYTIC_EVENT_TYPE):
+    def __init__(self, event_type=ANALYTIC_EVENT_TYPE, batch_size: int = 1, flush_interval: float = 1.0):
         """Sends experiment tracking data.
 
         Args:
             event_type (str): event type to fire.
+            batch_size (int): max number of scalar records to send in one event. Defaults to 1: no batching.
+            flush_interval (float): max time in seconds that a record is buffered when batching.
         """
-        super().__init__(event_type)
+        super().__init__(event_type, batch_size=batch_size, flush_interval=flush_interval)
 
     def get_writer_name(self) -> LogWriterName:
         return LogWriterName.TORCH_TB
@@ -58,6 +60,8 @@ class TBWriter(LogWriter):
     def flush(self):
         """Flushes out the message.
 
-        This does nothing, it is defined to mimic the PyTorch SummaryWriter behavior.
+        Sends the buffered records when batching is enabled; otherwise it does nothing. It is defined to mimic
+        the PyTorch SummaryWriter behavior.
         """
-        pass
+        if self.sender:
+            self.sender.flush()
@@ -20,7 +20,7 @@ from typing import List, NamedTuple, Optional
 import wandb
 
 from nvflare.apis.analytix import AnalyticsData, AnalyticsDataType, LogWriterName
-from nvflare.apis.dxo import from_shareable
+from nvflare.apis.dxo import DXO, from_shareable
 from nvflare.apis.fl_constant import ProcessType
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import Shareable
@@ -45,6 +45,14 @@ def _check_wandb_args(wandb_args):
         raise ValueError("must provide 'job_type' value")
 
 
+def _get_log_data(data: AnalyticsData) -> Optional[dict]:
+    if data.data_type == AnalyticsDataType.PARAMETER or data.data_type == AnalyticsDataType.METRIC:
+        return {data.tag: data.value}
+    elif data.data_type == AnalyticsDataType.PARAMETERS or data.data_type == AnalyticsDataType.METRICS:
+        return data.value
+    return None
+
+
 def _get_job_id_tag(fl_ctx: FLContext) -> str:
     """Gets a unique job id tag."""
     job_id = fl_ctx.get_job_id()
@@ -176,11 +184,31 @@ class WandBReceiver(AnalyticsReceiver):
 
         q: Optional[Queue] = self.get_task_queue(record_origin)
         if q:
-            if data.data_type == AnalyticsDataType.PARAMETER or data.data_type == AnalyticsDataType.METRIC:
-                log_data = {data.tag: data.value}
+            log_data = _get_log_data(data)
+            if log_data is not None:
                 q.put(WandBTask(task_owner=record_origin, task_type="log", task_data=log_data, step=data.step))
-            elif data.data_type == AnalyticsDataType.PARAMETERS or data.data_type == AnalyticsDataType.METRICS:
-                q.put(WandBTask(task_owner=record_origin, task_type="log", task_data=data.value, step=data.step))
+
+    def save_batch(self, fl_ctx: FLContext, records: List[DXO], record_origin: str):
+        q: Optional[Queue] = self.get_task_queue(record_origin)
+        if not q:
+            return
+
+        # records of the same step are put into the queue as one task
+        batch_data, batch_step = None, None
+        for dxo in records:
+            data = AnalyticsData.from_dxo(dxo, receiver=LogWriterName.WANDB)
+            log_data = _get_log_data(data) if data else None
+            if log_data is None:
+                continue
+            if batch_data is not None and data.step != batch_step:
+                q.put(WandBTask(task_owner=record_origin, task_type="log", task_data=batch_data, step=batch_step))
+                batch_data = None
+            if batch_data is None:
+                batch_data, batch_step = {}, data.step
+            batch_data.update(log_data)
+
+        if batch_data is not None:
+            q.put(WandBTask(task_owner=record_origin, task_type="log", task_data=batch_data, step=batch_step))
 
     def finalize(self, fl_ctx: FLContext):
         """Called at EventType.END_RUN.
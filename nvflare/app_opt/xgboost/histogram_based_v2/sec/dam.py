@@ -13,7 +13,9 @@
 # limitations under the License.
 import struct
 from io import BytesIO
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 SIGNATURE = "NVDADAM1"  # DAM (Direct Accessible Marshalling) V1
 PREFIX_LEN = 24
@@ -25,17 +27,22 @@ DATA_TYPE_INT_ARRAY = 257
 DATA_TYPE_FLOAT_ARRAY = 258
 
 
+# Array values are 8-byte numbers in native byte order, same as struct formats "q" and "d"
+_INT_DTYPE = np.dtype(np.int64)
+_FLOAT_DTYPE = np.dtype(np.float64)
+
+
 class DamEncoder:
     def __init__(self, data_set_id: int):
         self.data_set_id = data_set_id
         self.entries = []
         self.buffer = BytesIO()
 
-    def add_int_array(self, value: List[int]):
-        self.entries.append((DATA_TYPE_INT_ARRAY, value))
+    def add_int_array(self, value: Union[List[int], np.ndarray]):
+        self.entries.append((DATA_TYPE_INT_ARRAY, np.asarray(value, dtype=_INT_DTYPE)))
 
-    def add_float_array(self, value: List[float]):
-        self.entries.append((DATA_TYPE_FLOAT_ARRAY, value))
+    def add_float_array(self, value: Union[List[float], np.ndarray]):
+        self.entries.append((DATA_TYPE_FLOAT_ARRAY, np.asarray(value, dtype=_FLOAT_DTYPE)))
 
     def finish(self) -> bytes:
         size = PREFIX_LEN
@@ -51,12 +58,7 @@ class DamEncoder:
             data_type, value = entry
             self.write_int64(data_type)
             self.write_int64(len(value))
-
-            for x in value:
-                if data_type == DATA_TYPE_INT_ARRAY:
-                    self.write_int64(x)
-                else:
-                    self.write_float(x)
+            self.buffer.write(value.tobytes())
 
         return self.buffer.getvalue()
 
@@ -90,27 +92,27 @@ class DamDecoder:
         return self.data_set_id
 
     def decode_int_array(self) -> List[int]:
-        data_type = self.read_int64()
-        if data_type != DATA_TYPE_INT_ARRAY:
-            raise RuntimeError("Invalid data type for int array")
+        return self.decode_int_ndarray().tolist()
 
-        num = self.read_int64()
-        result = [0] * num
-        for i in range(num):
-            result[i] = self.read_int64()
+    def decode_float_array(self) -> List[float]:
+        return self.decode_float_ndarray().tolist()
 
-        return result
+    def decode_int_ndarray(self) -> np.ndarray:
+        """Decode the next int array as a view of the buffer, without copying."""
+        return self._read_array(DATA_TYPE_INT_ARRAY, _INT_DTYPE, "int array")
 
-    def decode_float_array(self):
+    def decode_float_ndarray(self) -> np.ndarray:
+        """Decode the next float array as a view of the buffer, without copying."""
+        return self._read_array(DATA_TYPE_FLOAT_ARRAY, _FLOAT_DTYPE, "float array")
+
+    def _read_array(self, expected_type: int, dtype: np.dtype, type_name: str) -> np.ndarray:
         data_type = self.read_int64()
-        if data_type != DATA_TYPE_FLOAT_ARRAY:
-            raise RuntimeError("Invalid data type for float array")
+        if data_type != expected_type:
+            raise RuntimeError(f"Invalid data type for {type_name}")
 
         num = self.read_int64()
-        result = [0.0] * num
-        for i in range(num):
-            result[i] = self.read_float()
-
+        result = np.frombuffer(self.buffer, dtype=dtype, count=num, offset=self.pos)
+        self.pos += num * dtype.itemsize
         return result
 
     def read_string(self, length: int) -> str:
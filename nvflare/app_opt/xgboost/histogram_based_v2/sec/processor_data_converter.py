@@ -13,6 +13,8 @@
 # limitations under the License.
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 from nvflare.apis.fl_context import FLContext
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.data_converter import (
@@ -47,35 +49,31 @@ class ProcessorDataConverter(DataConverter):
         if decoder.get_data_set_id() != DATA_SET_GH_PAIRS:
             raise RuntimeError(f"Data is not for GH Pairs: {decoder.get_data_set_id()}")
 
-        float_array = decoder.decode_float_array()
-        result = []
-        self.num_samples = int(len(float_array) / 2)
-
-        for i in range(self.num_samples):
-            result.append((self.float_to_int(float_array[2 * i]), self.float_to_int(float_array[2 * i + 1])))
+        gh = self.floats_to_ints(decoder.decode_float_ndarray())
+        self.num_samples = int(len(gh) / 2)
 
-        return result
+        # the values are returned as Python ints since they are combined into numbers larger than 64 bits
+        end = 2 * self.num_samples
+        return list(zip(gh[0:end:2].tolist(), gh[1:end:2].tolist()))
 
     def decode_aggregation_context(self, buffer: bytes, fl_ctx: FLContext) -> AggregationContext:
         decoder = DamDecoder(buffer)
         if not decoder.is_valid():
             return None
         data_set_id = decoder.get_data_set_id()
-        cuts = decoder.decode_int_array()
+        cuts = decoder.decode_int_ndarray()
 
         if data_set_id == DATA_SET_AGGREGATION_WITH_FEATURES:
             self.feature_list = decoder.decode_int_array()
             num = len(self.feature_list)
-            slots = decoder.decode_int_array()
+            slots = decoder.decode_int_ndarray()
             num_samples = int(len(slots) / num)
-            for i in range(num):
-                bin_assignment = []
-                for row_id in range(num_samples):
-                    _, bin_num = self.slot_to_bin(cuts, slots[row_id * num + i])
-                    bin_assignment.append(bin_num)
 
-                bin_size = self.get_bin_size(cuts, self.feature_list[i])
-                feature_ctx = FeatureContext(self.feature_list[i], bin_assignment, bin_size)
+            # slots are stored row by row: one slot for each feature of each sample
+            bins = self.slots_to_bins(cuts, slots[: num_samples * num].reshape(num_samples, num))
+            for i in range(num):
+                bin_size = int(self.get_bin_size(cuts, self.feature_list[i]))
+                feature_ctx = FeatureContext(self.feature_list[i], bins[:, i].tolist(), bin_size)
                 self.features.append(feature_ctx)
         elif data_set_id != DATA_SET_AGGREGATION:
             raise RuntimeError(f"Invalid DataSet: {data_set_id}")
@@ -138,6 +136,32 @@ class ProcessorDataConverter(DataConverter):
 
         raise RuntimeError(f"Logic error. Slot {slot}, out of range [0-{cuts[-1] - 1}]")
 
+    @staticmethod
+    def slots_to_bins(cuts: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """Get the bin numbers of the slots, like slot_to_bin but for an array of slots.
+
+        Args:
+            cuts: the cut points of all features
+            slots: array of slots. A negative slot means a missing value.
+
+        Returns: array of bin numbers of the same shape as slots, with -1 for missing values
+
+        """
+        valid = slots >= 0
+        if valid.any():
+            max_slot = slots.max()
+            if max_slot >= cuts[-1]:
+                raise RuntimeError(f"Invalid slot {max_slot}, out of range [0-{cuts[-1] - 1}]")
+
+        # index of the feature of each slot: the last cut point that is not greater than the slot
+        feature_idx = np.searchsorted(cuts, slots, side="right") - 1
+        out_of_range = valid & (feature_idx < 0)
+        if out_of_range.any():
+            slot = slots[out_of_range].min()
+            raise RuntimeError(f"Logic error. Slot {slot}, out of range [0-{cuts[-1] - 1}]")
+
+        return np.where(valid, slots - cuts[np.maximum(feature_idx, 0)], -1)
+
     @staticmethod
     def float_to_int(value: float) -> int:
         return int(value * SCALE_FACTOR)
@@ -147,10 +171,11 @@ class ProcessorDataConverter(DataConverter):
         return value / SCALE_FACTOR
 
     @staticmethod
-    def to_float_array(result: FeatureAggregationResult) -> List[float]:
-        float_array = []
-        for g, h in result.aggregated_hist:
-            float_array.append(ProcessorDataConverter.int_to_float(g))
-            float_array.append(ProcessorDataConverter.int_to_float(h))
+    def floats_to_ints(values: np.ndarray) -> np.ndarray:
+        # same as float_to_int on each value: the fraction is truncated towards zero
+        return (values * SCALE_FACTOR).astype(np.int64)
 
-        return float_array
+    @staticmethod
+    def to_float_array(result: FeatureAggregationResult) -> np.ndarray:
+        # the (G, H) values of the bins, flattened to [G0, H0, G1, H1, ...]
+        return np.asarray(result.aggregated_hist, dtype=np.float64).reshape(-1) / SCALE_FACTOR
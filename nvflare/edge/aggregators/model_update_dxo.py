@@ -30,11 +30,24 @@ class ModelUpdateDXOAggregator(Aggregator):
         # aggregates the dict on corresponding keys
         for key, sub_object in weight_base.items():
             if isinstance(sub_object, dict):
-                sub_to_add = weight_to_add.get(key)
-                self._aggregate(sub_object, sub_to_add)
-            weight_base[key] = np.add(weight_base[key], weight_to_add[key])
+                self._aggregate(sub_object, weight_to_add.get(key))
+                continue
+            value = np.asarray(weight_to_add[key])
+            if (
+                isinstance(sub_object, np.ndarray)
+                and value.shape == sub_object.shape
+                and np.can_cast(value.dtype, sub_object.dtype, "same_kind")
+            ):
+                # the base is owned by the aggregator, so the update is added in place
+                np.add(sub_object, value, out=sub_object)
+            else:
+                weight_base[key] = np.add(sub_object, value)
         return weight_base
 
+    def _copy(self, weights):
+        # the first update is copied, so that the following ones can be added to it in place
+        return {k: self._copy(v) if isinstance(v, dict) else np.array(v) for k, v in weights.items()}
+
     def reset(self, fl_ctx: FLContext):
         self.dict = None
         self.count = 0
@@ -47,15 +60,11 @@ class ModelUpdateDXOAggregator(Aggregator):
 
         # get weights and add to base
         weight_to_add = dxo.data.get("dict")
-        # convert to numpy arrays if they are lists
-        if weight_to_add is not None:
-            for key, value in weight_to_add.items():
-                if isinstance(value, list):
-                    weight_to_add[key] = np.array(value)
         if weight_to_add is None:
             raise ValueError("Model dict is empty, please check the message")
         if self.dict is None:
-            self.dict = weight_to_add
+            # lists sent by devices are converted to numpy arrays
+            self.dict = self._copy(weight_to_add)
         else:
             self.dict = self._aggregate(self.dict, weight_to_add)
 
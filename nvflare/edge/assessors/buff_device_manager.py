@@ -13,14 +13,81 @@
 # limitations under the License.
 
 import random
-from collections import Counter, defaultdict
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 
 from nvflare.edge.assessors.device_manager import DeviceManager
-from nvflare.edge.mud import PropKey
 from nvflare.fuel.utils.validation_utils import check_positive_int
 
 
+class _IndexedSet:
+    """A set of device IDs that supports adding, removing and sampling a random item in O(1).
+
+    Items are kept in a list, with a dict of item => position in the list. An item is removed by moving the
+    last item into its position.
+    """
+
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def add(self, item):
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def remove(self, item) -> bool:
+        pos = self.positions.pop(item, None)
+        if pos is None:
+            return False
+        last = self.items.pop()
+        if pos < len(self.items):
+            self.items[pos] = last
+            self.positions[last] = pos
+        return True
+
+    def random_item(self):
+        return self.items[random.randrange(len(self.items))]
+
+
+class _DevicePool:
+    """Usable devices (available and not used), indexed by client.
+
+    Devices without a client name are kept in the pool but not in any client group.
+    """
+
+    def __init__(self):
+        self.devices = _IndexedSet()
+        self.client_devices: Dict[str, _IndexedSet] = {}  # client name => devices of the client
+
+    def __len__(self):
+        return len(self.devices)
+
+    def add(self, device_id: str, client_name: Optional[str]):
+        self.devices.add(device_id)
+        if client_name:
+            group = self.client_devices.get(client_name)
+            if group is None:
+                group = _IndexedSet()
+                self.client_devices[client_name] = group
+            group.add(device_id)
+
+    def remove(self, device_id: str, client_name: Optional[str]) -> bool:
+        if not self.devices.remove(device_id):
+            return False
+        group = self.client_devices.get(client_name) if client_name else None
+        if group is not None:
+            group.remove(device_id)
+            if not group:
+                self.client_devices.pop(client_name)
+        return True
+
+
 class BuffDeviceManager(DeviceManager):
     def __init__(
         self,
@@ -65,37 +132,50 @@ class BuffDeviceManager(DeviceManager):
         self.used_devices = {}
         # keep a map of device_id -> client_name
         self.device_client_map = {}
+        # names of all clients that have reported devices
+        self.clients = set()
+        # usable devices, maintained as devices become available, used and reusable
+        self._pool = _DevicePool()
 
-    def _balanced_device_sampling(self, usable_devices: Set[str], num_holes: int) -> Set[str]:
-        """Sample devices while balancing across clients.
+    def _take_device(self, device_id: str) -> str:
+        self._pool.remove(device_id, self.device_client_map.get(device_id))
+        return device_id
+
+    def _random_device_sampling(self, num_holes: int) -> Set[str]:
+        """Sample devices randomly from the usable devices.
 
         Args:
-            usable_devices: Set of device IDs that can be selected
             num_holes: Number of devices to sample
 
         Returns:
-            Set of selected device IDs
+            Set of selected device IDs, which are removed from the usable devices
         """
-        if not usable_devices or num_holes <= 0:
-            return set()
+        selected_devices = set()
+        while len(selected_devices) < num_holes and self._pool:
+            selected_devices.add(self._take_device(self._pool.devices.random_item()))
+        return selected_devices
 
-        # Count devices per client efficiently using Counter
-        client_device_counts = Counter(
-            self.device_client_map[device_id] for device_id in usable_devices if device_id in self.device_client_map
-        )
+    def _balanced_device_sampling(self, num_holes: int) -> Set[str]:
+        """Sample devices while balancing across clients.
+
+        The time taken is proportional to the number of clients and selected devices, not to the number of
+        usable devices.
+
+        Args:
+            num_holes: Number of devices to sample
 
-        # Group devices by client using defaultdict for efficiency
-        client_devices = defaultdict(list)
-        for device_id in usable_devices:
-            if device_id in self.device_client_map:
-                client_devices[self.device_client_map[device_id]].append(device_id)
+        Returns:
+            Set of selected device IDs, which are removed from the usable devices
+        """
+        if not self._pool or num_holes <= 0:
+            return set()
 
-        if not client_device_counts:
+        if not self._pool.client_devices:
             # Fallback to random sampling if no client mapping
-            return set(random.sample(list(usable_devices), min(num_holes, len(usable_devices))))
+            return self._random_device_sampling(num_holes)
 
         # Randomize client order for more balanced distribution
-        clients_list = list(client_device_counts.items())
+        clients_list = list(self._pool.client_devices.values())
         random.shuffle(clients_list)
 
         selected_devices = set()
@@ -105,7 +185,7 @@ class BuffDeviceManager(DeviceManager):
         min_per_client = remaining_holes // len(clients_list)
         extra_holes = remaining_holes % len(clients_list)
 
-        for i, (client_name, device_count) in enumerate(clients_list):
+        for i, devices in enumerate(clients_list):
             # Calculate how many devices this client should get
             if i < extra_holes:
                 target_count = min_per_client + 1
@@ -113,98 +193,85 @@ class BuffDeviceManager(DeviceManager):
                 target_count = min_per_client
 
             # Don't exceed what the client has available
-            actual_count = min(target_count, device_count)
-
-            if actual_count > 0:
-                # Randomly sample from this client's devices
-                sampled = random.sample(client_devices[client_name], actual_count)
-                selected_devices.update(sampled)
-                remaining_holes -= actual_count
+            actual_count = min(target_count, len(devices))
 
-                # Remove selected devices from available pool
-                client_devices[client_name] = [d for d in client_devices[client_name] if d not in sampled]
+            # Randomly sample from this client's devices, which also removes them from the pool
+            for _ in range(actual_count):
+                selected_devices.add(self._take_device(devices.random_item()))
+            remaining_holes -= actual_count
 
         # Second pass: if we still have holes and some clients have remaining devices,
         # distribute remaining holes as evenly as possible with random starting point
         if remaining_holes > 0:
-            clients_with_devices = [(name, devices) for name, devices in client_devices.items() if devices]
-
-            if clients_with_devices:
-                # Shuffle clients to randomize the round-robin starting point
-                random.shuffle(clients_with_devices)
-
-                # Round-robin distribution of remaining holes
-                client_idx = 0
-                while remaining_holes > 0 and clients_with_devices:
-                    client_name, devices = clients_with_devices[client_idx]
-
-                    if devices:
-                        # Take one device from this client
-                        device_id = random.choice(devices)
-                        selected_devices.add(device_id)
-                        devices.remove(device_id)
-                        remaining_holes -= 1
-
-                        # Remove client if no more devices
-                        if not devices:
-                            clients_with_devices.pop(client_idx)
-                            if clients_with_devices:
-                                client_idx = client_idx % len(clients_with_devices)
-                        else:
-                            client_idx = (client_idx + 1) % len(clients_with_devices)
-                    else:
-                        clients_with_devices.pop(client_idx)
-                        if clients_with_devices:
-                            client_idx = client_idx % len(clients_with_devices)
+            clients_with_devices = list(self._pool.client_devices.values())
+
+            # Shuffle clients to randomize the round-robin starting point
+            random.shuffle(clients_with_devices)
+
+            # Round-robin distribution of remaining holes
+            client_idx = 0
+            while remaining_holes > 0 and clients_with_devices:
+                devices = clients_with_devices[client_idx]
+
+                # Take one device from this client
+                selected_devices.add(self._take_device(devices.random_item()))
+                remaining_holes -= 1
+
+                # Remove client if no more devices
+                if not devices:
+                    clients_with_devices.pop(client_idx)
+                    if clients_with_devices:
+                        client_idx = client_idx % len(clients_with_devices)
+                else:
+                    client_idx = (client_idx + 1) % len(clients_with_devices)
 
         return selected_devices
 
     def update_available_devices(self, devices: Dict, fl_ctx) -> None:
+        for device_id, device in devices.items():
+            # add new devices to device_client_map
+            old_client_name = self.device_client_map.get(device_id)
+            client_name = device.client_name
+            if client_name and client_name != old_client_name:
+                self.device_client_map[device_id] = client_name
+                self.clients.add(client_name)
+            elif device_id in self.available_devices:
+                # known device: nothing changed for the pool
+                continue
+
+            # add the new device to the pool, or move it to its new client
+            if device_id not in self.used_devices:
+                self._pool.remove(device_id, old_client_name)
+                self._pool.add(device_id, self.device_client_map.get(device_id))
+
         self.available_devices.update(devices)
         self.log_debug(
             fl_ctx,
             f"assessor got reported {len(devices)} available devices from child. "
             f"total num available devices: {len(self.available_devices)}",
         )
-        # add new devices to device_client_map
-        for device_id, device in devices.items():
-            client_name = device.to_dict().get(PropKey.CLIENT_NAME)
-            if client_name:
-                self.device_client_map[device_id] = client_name
 
     def fill_selection(self, current_model_version: int, fl_ctx) -> None:
         num_holes = self.device_selection_size - len(self.current_selection)
         self.log_info(fl_ctx, f"filling {num_holes} holes in selection list")
         if num_holes > 0:
             self.current_selection_version += 1
-            # remove all used devices from available devices
-            usable_devices = set(self.available_devices.keys()) - set(self.used_devices.keys())
-
-            if usable_devices:
-                if self.device_sampling_strategy == "balanced":
-                    # try to balance the usage of devices across clients
-                    selected_devices = self._balanced_device_sampling(usable_devices, num_holes)
-                    for device_id in selected_devices:
-                        # current_selection keeps track of devices selected for a particular model version
-                        self.current_selection[device_id] = current_model_version
-                        self.used_devices[device_id] = {
-                            "model_version": current_model_version,
-                            "selection_version": self.current_selection_version,
-                        }
-                elif self.device_sampling_strategy == "random":
-                    for _ in range(num_holes):
-                        device_id = random.choice(list(usable_devices))
-                        usable_devices.remove(device_id)
-                        # current_selection keeps track of devices selected for a particular model version
-                        self.current_selection[device_id] = current_model_version
-                        self.used_devices[device_id] = {
-                            "model_version": current_model_version,
-                            "selection_version": self.current_selection_version,
-                        }
-                        if not usable_devices:
-                            break
-                else:
-                    raise ValueError(f"Invalid device sampling strategy: {self.device_sampling_strategy}")
+            # sampled devices are removed from the usable devices
+            if self.device_sampling_strategy == "balanced":
+                # try to balance the usage of devices across clients
+                selected_devices = self._balanced_device_sampling(num_holes)
+            elif self.device_sampling_strategy == "random":
+                selected_devices = self._random_device_sampling(num_holes)
+            else:
+                raise ValueError(f"Invalid device sampling strategy: {self.device_sampling_strategy}")
+
+            for device_id in selected_devices:
+                # current_selection keeps track of devices selected for a particular model version
+                self.current_selection[device_id] = current_model_version
+                self.used_devices[device_id] = {
+                    "model_version": current_model_version,
+                    "selection_version": self.current_selection_version,
+                }
         self.log_info(
             fl_ctx,
             f"current selection with {len(self.current_selection)} items: V{self.current_selection_version}; {dict(sorted(self.current_selection.items()))}",
@@ -221,18 +288,20 @@ class BuffDeviceManager(DeviceManager):
 
     def remove_devices_from_used(self, devices: Set[str], fl_ctx) -> None:
         for device_id in devices:
-            self.used_devices.pop(device_id, None)
+            if self.used_devices.pop(device_id, None) is not None and device_id in self.available_devices:
+                # the device can be selected again
+                self._pool.add(device_id, self.device_client_map.get(device_id))
+
+    def get_num_usable_devices(self, fl_ctx) -> int:
+        return len(self._pool)
 
     def has_enough_devices_and_clients(self, fl_ctx) -> bool:
         num_holes = self.device_selection_size - len(self.current_selection)
-        usable_devices = set(self.available_devices.keys()) - set(self.used_devices.keys())
-        num_usable_devices = len(usable_devices)
-        if num_usable_devices < num_holes:
+        if len(self._pool) < num_holes:
             return False
 
         # Further check if we have enough clients
-        unique_clients = set(self.device_client_map.values())
-        return len(unique_clients) >= self.initial_min_client_num
+        return len(self.clients) >= self.initial_min_client_num
 
     def should_fill_selection(self, fl_ctx) -> bool:
         num_holes = self.device_selection_size - len(self.current_selection)
@@ -71,6 +71,8 @@ class BuffModelManager(ModelManager):
         self.staleness_weight = staleness_weight
 
     def initialize_model(self, model: DXO, fl_ctx: FLContext):
+        # keep the weights as ndarrays: they are encoded for devices only when sent to them
+        model.data = {k: np.asarray(v) if isinstance(v, list) else v for k, v in model.data.items()}
         self.current_model = model
         # updates is a dict of model version to _ModelState
         self.updates[self.current_model_version] = _ModelState(ModelUpdateDXOAggregator())
@@ -126,7 +128,8 @@ class BuffModelManager(ModelManager):
                         if key not in new_model:
                             new_model[key] = value
                         else:
-                            new_model[key] = new_model[key] + value
+                            # the sum is a new array owned by new_model, so it is updated in place
+                            new_model[key] += value
 
                 # Reset aggr after counting its contribution
                 ms.aggregator.reset(fl_ctx)
@@ -138,15 +141,20 @@ class BuffModelManager(ModelManager):
                 if key not in global_weights:
                     self.log_error(fl_ctx, f"key {key} not in new model")
                     continue
-                new_model[key] = np.array(global_weights[key]) + value * self.global_lr
+                base = np.asarray(global_weights[key])
+                value = base + value * self.global_lr
+                if np.issubdtype(base.dtype, np.floating):
+                    # keep the dtype of the model, e.g. float32, rather than the float64 of the updates
+                    value = value.astype(base.dtype, copy=False)
+                new_model[key] = value
 
         # create the ModelState for the new model version
         self.updates[self.current_model_version] = _ModelState(ModelUpdateDXOAggregator())
         self.log_info(fl_ctx, f"generated new model version {self.current_model_version} with {num_updates} updates")
 
         # update the current model
-        # convert new_model items from numpy arrays to lists for serialization
-        new_model = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in new_model.items()}
+        # the weights stay ndarrays, which FOBS serializes as binary. They are only converted to lists for
+        # devices that need them, see EdgeModelExecutor.
         self.current_model = DXO(data_kind=DataKind.WEIGHTS, data=new_model)
 
         # reset the num_updates_counter
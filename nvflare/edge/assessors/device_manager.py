@@ -158,3 +158,14 @@ class DeviceManager(FLComponent, ABC):
             Set of used devices
         """
         return self.used_devices
+
+    def get_num_usable_devices(self, fl_ctx: FLContext) -> int:
+        """Get the number of devices that are available and not used.
+
+        Args:
+            fl_ctx: FLContext object
+
+        Returns:
+            Number of usable devices
+        """
+        return len(self.available_devices.keys() - self.used_devices.keys())
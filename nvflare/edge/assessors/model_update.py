@@ -79,15 +79,12 @@ class ModelUpdateAssessor(Assessor):
         try:
             elapsed = time.time() - self.device_wait_start_time
             if elapsed > self.device_wait_timeout:
-                usable_devices = set(self.device_manager.get_available_devices(fl_ctx).keys()) - set(
-                    self.device_manager.get_used_devices(fl_ctx).keys()
-                )
                 self.log_error(
                     fl_ctx,
                     f"Device wait timeout ({self.device_wait_timeout}s) exceeded. "
                     f"Elapsed time: {elapsed:.1f}s. "
                     f"Total devices: {len(self.device_manager.get_available_devices(fl_ctx))}, "
-                    f"usable: {len(usable_devices)}, "
+                    f"usable: {self.device_manager.get_num_usable_devices(fl_ctx)}, "
                     f"expected: {self.device_manager.device_selection_size}. "
                     f"Device_reuse flag: {self.device_manager.device_reuse}. "
                     "Stopping the job.",
@@ -108,9 +105,6 @@ class ModelUpdateAssessor(Assessor):
         elapsed = current_time - self._last_device_status_log_time
 
         if elapsed >= self.device_status_log_interval:
-            usable_devices = set(self.device_manager.get_available_devices(fl_ctx).keys()) - set(
-                self.device_manager.get_used_devices(fl_ctx).keys()
-            )
 
             # Add timeout info if we're actually waiting with a timeout
             timeout_msg = ""
@@ -124,7 +118,7 @@ class ModelUpdateAssessor(Assessor):
                 fl_ctx,
                 f"Device Status: "
                 f"Total: {len(self.device_manager.available_devices)}, "
-                f"usable: {len(usable_devices)}, "
+                f"usable: {self.device_manager.get_num_usable_devices(fl_ctx)}, "
                 f"expected: {self.device_manager.device_selection_size}.{timeout_msg}",
             )
 
@@ -196,12 +190,9 @@ class ModelUpdateAssessor(Assessor):
         # Check for device wait timeout if we are waiting for devices
         if self.device_wait_start_time is not None and self._is_device_wait_timeout_exceeded(fl_ctx):
             # Timeout exceeded, prepare an empty reply and stop the job
-            usable_devices = set(self.device_manager.get_available_devices(fl_ctx).keys()) - set(
-                self.device_manager.get_used_devices(fl_ctx).keys()
-            )
             self.log_error(
                 fl_ctx,
-                f"Total devices: {len(self.device_manager.available_devices)}, usable: {len(usable_devices)}, expected: {self.device_manager.device_selection_size}. "
+                f"Total devices: {len(self.device_manager.available_devices)}, usable: {self.device_manager.get_num_usable_devices(fl_ctx)}, expected: {self.device_manager.device_selection_size}. "
                 f"Device_reuse flag is set to: {self.device_manager.device_reuse}. "
                 "Not enough devices joining, please adjust the server params. Stopping the job.",
             )
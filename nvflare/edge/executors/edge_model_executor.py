@@ -15,14 +15,16 @@ import threading
 import time
 from typing import Optional
 
-from nvflare.apis.dxo import DXO, from_dict
+from nvflare.apis.dxo import DXO, DataKind, from_dict
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.shareable import ReservedHeaderKey
 from nvflare.edge.constants import CookieKey, EdgeApiStatus, MsgKey, SpecialDeviceId
 from nvflare.edge.executors.ete import EdgeTaskExecutor
 from nvflare.edge.executors.hug import TaskInfo
+from nvflare.edge.model_protocol import ArrayEncoding, decode_arrays, encode_arrays
 from nvflare.edge.mud import BaseState, Device, ModelUpdate, StateUpdateReport
 from nvflare.edge.updaters.emd import AggregatorFactory, EdgeModelUpdater
+from nvflare.edge.web.models.base_model import EdgeProtoKey
 from nvflare.edge.web.models.result_report import ResultReport
 from nvflare.edge.web.models.result_response import ResultResponse
 from nvflare.edge.web.models.selection_request import SelectionRequest
@@ -58,14 +60,16 @@ class EdgeModelExecutor(EdgeTaskExecutor):
 
         return EdgeModelUpdater(aggr_factory, self.max_model_versions)
 
-    def _convert_task(self, task_state: BaseState, current_task: TaskInfo, fl_ctx: FLContext) -> dict:
-        """Convert task_data to a plain dict"""
-        self.log_debug(fl_ctx, f"Converting task for task: {current_task.id}")
+    def _convert_task(
+        self, task_state: BaseState, current_task: TaskInfo, fl_ctx: FLContext, encoding: str = ArrayEncoding.LIST
+    ) -> dict:
+        """Convert task_data to a plain dict, with the arrays of the model encoded for devices"""
+        self.log_debug(fl_ctx, f"Converting task for task: {current_task.id} with {encoding} arrays")
 
         # Add model version to the payload - WHY?
         model_dxo = task_state.model
         model_dxo.set_meta_prop(MsgKey.MODEL_VERSION, task_state.model_version)
-        return model_dxo.to_dict()
+        return DXO(model_dxo.data_kind, encode_arrays(model_dxo.data, encoding), model_dxo.meta).to_dict()
 
     def _convert_device_result_to_model_update(
         self, result_report: ResultReport, current_task: TaskInfo, fl_ctx: FLContext
@@ -75,6 +79,9 @@ class EdgeModelExecutor(EdgeTaskExecutor):
         assert isinstance(result_report.result, dict)
         dxo = from_dict(result_report.result)
         assert isinstance(dxo, DXO)
+        if dxo.data_kind in (DataKind.WEIGHTS, DataKind.WEIGHT_DIFF):
+            # keep the arrays of the update as ndarrays, which are much smaller than lists once serialized
+            dxo.data = decode_arrays(dxo.data)
         dxo.set_meta_prop(ReservedHeaderKey.TASK_ID, current_task.id)
 
         device_id = result_report.get_device_id()
@@ -202,12 +209,18 @@ class EdgeModelExecutor(EdgeTaskExecutor):
             fl_ctx, f"task for model V{task_state.model_version} sent to device {device_id}: {new_selection_id=}"
         )
 
-        # all platforms use the same converted model for now!
+        # devices that cannot read raw arrays get them as lists
+        encoding = request.get(EdgeProtoKey.ARRAY_ENCODING, ArrayEncoding.LIST)
+        if encoding not in (ArrayEncoding.LIST, ArrayEncoding.RAW):
+            self.log_warning(fl_ctx, f"unsupported array encoding {encoding} from device {device_id}: use list")
+            encoding = ArrayEncoding.LIST
+
+        # all platforms use the same converted model for now, one per array encoding!
         with self.cvt_lock:
-            platform = "*"
+            platform = f"*:{encoding}"
             converted_model = task_state.get_converted_model(platform)
             if not converted_model:
-                converted_model = self._convert_task(task_state, current_task, fl_ctx)
+                converted_model = self._convert_task(task_state, current_task, fl_ctx, encoding)
                 task_state.set_converted_model(converted_model, platform)
 
         return TaskResponse(
@@ -24,7 +24,13 @@ from nvflare.apis.shareable import ReservedHeaderKey
 from nvflare.edge.constants import CookieKey, MsgKey
 from nvflare.edge.executors.edge_model_executor import EdgeModelExecutor, ModelUpdate
 from nvflare.edge.executors.hug import TaskInfo
-from nvflare.edge.model_protocol import ModelBufferType, ModelEncoding, ModelExchangeFormat, ModelNativeFormat
+from nvflare.edge.model_protocol import (
+    ArrayEncoding,
+    ModelBufferType,
+    ModelEncoding,
+    ModelExchangeFormat,
+    ModelNativeFormat,
+)
 from nvflare.edge.models.model import DeviceModel, export_model_to_bytes
 from nvflare.edge.mud import BaseState
 from nvflare.edge.web.models.result_report import ResultReport
@@ -68,8 +74,10 @@ class ETEdgeModelExecutor(EdgeModelExecutor):
         model_str = base64.b64encode(model_buffer).decode("utf-8")
         return model_str
 
-    def _convert_task(self, task_state: BaseState, current_task: TaskInfo, fl_ctx: FLContext) -> dict:
-        """Convert task_data to a plain dict"""
+    def _convert_task(
+        self, task_state: BaseState, current_task: TaskInfo, fl_ctx: FLContext, encoding: str = ArrayEncoding.LIST
+    ) -> dict:
+        """Convert task_data to a plain dict. The model is sent as an ExecuTorch program whatever the encoding."""
         self.log_info(fl_ctx, f"ETEdgeModelExecutor Converting task for task: {current_task.id}")
 
         # Add model version to the payload to track the version of the model being processed.
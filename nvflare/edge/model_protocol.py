@@ -33,10 +33,14 @@ Example:
     ... )
 """
 
+import base64
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from nvflare.apis.dxo import DXO
+from nvflare.app_common.np.raw_array import RawBufferKey, decode_array, encode_array, is_raw_buffer
 
 log = logging.getLogger(__name__)
 
@@ -123,6 +127,71 @@ class ModelExchangeFormat:
     MODEL_VERSION = "model_version"
 
 
+class ArrayEncoding:
+    """Encodings of the arrays of a model in messages exchanged with devices.
+
+    LIST: nested lists of numbers. This is plain JSON that any device SDK can read, but every number is
+        written as text.
+    RAW: the raw-buffer format of nvflare.app_common.np.raw_array, with the bytes of the array encoded in base64.
+        The array is rebuilt with its dtype and shape without parsing each number.
+    """
+
+    LIST = "list"
+    RAW = "raw"
+
+
+def encode_arrays(data: Any, encoding: str = ArrayEncoding.LIST) -> Any:
+    """Encode the arrays in the data for sending to devices.
+
+    Dicts are encoded recursively. Values that are not arrays are returned unchanged, except NumPy scalars that
+    are converted to Python numbers.
+
+    Args:
+        data: the data to be encoded, e.g. the weights of a model
+        encoding: the encoding of the arrays, see ArrayEncoding
+
+    Returns: the encoded data, which can be serialized to JSON.
+
+    """
+    if isinstance(data, dict):
+        return {k: encode_arrays(v, encoding) for k, v in data.items()}
+    if isinstance(data, np.generic):
+        return data.item()
+    if not isinstance(data, np.ndarray):
+        return data
+    if encoding == ArrayEncoding.LIST:
+        return data.tolist()
+    if encoding == ArrayEncoding.RAW:
+        item = encode_array(data)
+        item[RawBufferKey.DATA] = base64.b64encode(item[RawBufferKey.DATA]).decode("ascii")
+        return item
+    raise ValueError(f"unsupported array encoding {encoding}")
+
+
+def decode_arrays(data: Any) -> Any:
+    """Decode the arrays in the data received from devices.
+
+    Dicts are decoded recursively. Arrays in either encoding of ArrayEncoding are decoded to np.ndarray.
+    Other values are returned unchanged.
+
+    Args:
+        data: the received data, e.g. the weight diff of a model
+
+    Returns: the decoded data. Arrays decoded from RAW are read-only.
+
+    """
+    if isinstance(data, list):
+        return np.asarray(data)
+    if not isinstance(data, dict):
+        return data
+    if is_raw_buffer(data):
+        item = dict(data)
+        if isinstance(item[RawBufferKey.DATA], str):
+            item[RawBufferKey.DATA] = base64.b64decode(item[RawBufferKey.DATA])
+        return decode_array(item, writable=False)
+    return {k: decode_arrays(v) for k, v in data.items()}
+
+
 def verify_payload(
     task_dxo: DXO,
     expected_type: Optional[str] = None,
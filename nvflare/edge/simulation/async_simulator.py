@@ -0,0 +1,426 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import functools
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from nvflare.edge.constants import CookieKey, EdgeApiStatus, SpecialDeviceId
+from nvflare.edge.simulation.simulated_device import DeviceFactory, DeviceState, SimulatedDevice
+from nvflare.edge.simulation.simulator import Simulator
+from nvflare.edge.web.models.job_response import JobResponse
+from nvflare.edge.web.models.result_response import ResultResponse
+from nvflare.edge.web.models.selection_request import SelectionRequest
+from nvflare.edge.web.models.selection_response import SelectionResponse
+from nvflare.edge.web.models.task_response import TaskResponse
+from nvflare.fuel.f3.stats_pool import QuantileSketch
+from nvflare.security.logging import secure_format_exception
+
+
+class RequestKind:
+    JOB = "job"
+    SELECTION = "selection"
+    TASK = "task"
+    RESULT = "result"
+
+
+class RequestStats:
+    def __init__(self):
+        """Latencies and errors of the requests sent by a simulator.
+
+        Latencies are kept in a QuantileSketch for each request kind, so the memory used and the size of the stats
+        sent to the launcher do not grow with the number of requests.
+        """
+        self.sketches = {}  # request kind => QuantileSketch of latencies in seconds
+        self.max_latencies = {}  # request kind => max latency in seconds
+        self.errors = Counter()  # request kind => number of failed requests
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        self.start_time = time.time()
+        self.end_time = None
+
+    def stop(self):
+        self.end_time = time.time()
+
+    def add(self, kind: str, latency: float, ok: bool):
+        sketch = self.sketches.get(kind)
+        if sketch is None:
+            sketch = self.sketches[kind] = QuantileSketch()
+        sketch.add(latency)
+        if latency > self.max_latencies.get(kind, 0.0):
+            self.max_latencies[kind] = latency
+        if not ok:
+            self.errors[kind] += 1
+
+    def get_elapsed(self) -> float:
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+    def to_dict(self) -> dict:
+        """Convert to a dict of plain types, e.g. to send the stats of a simulator process to the launcher."""
+        return {
+            "elapsed": self.get_elapsed(),
+            "sketches": {k: v.to_dict() for k, v in self.sketches.items()},
+            "max_latencies": dict(self.max_latencies),
+            "errors": dict(self.errors),
+        }
+
+    @staticmethod
+    def merge(stats: List[dict]) -> "RequestStats":
+        """Merge the stats of simulators that ran at the same time.
+
+        Args:
+            stats: list of dicts created by to_dict
+
+        Returns: the merged stats. Its elapsed time is the longest of the simulators.
+
+        """
+        result = RequestStats()
+        elapsed = 0.0
+        for s in stats:
+            elapsed = max(elapsed, s["elapsed"])
+            for k, v in s["sketches"].items():
+                sketch = QuantileSketch.from_dict(v)
+                if k in result.sketches:
+                    result.sketches[k].merge(sketch)
+                else:
+                    result.sketches[k] = sketch
+            for k, v in s["max_latencies"].items():
+                result.max_latencies[k] = max(result.max_latencies.get(k, 0.0), v)
+            result.errors.update(s["errors"])
+        result.start_time = 0.0
+        result.end_time = elapsed
+        return result
+
+    def summary(self) -> Dict[str, dict]:
+        """Get the number of requests, errors, throughput and latency percentiles (in ms) of each request kind."""
+        elapsed = self.get_elapsed()
+        result = {}
+        for kind, sketch in sorted(self.sketches.items()):
+            p50, p90, p99 = (sketch.get_quantile(q) or 0.0 for q in (0.5, 0.9, 0.99))
+            result[kind] = {
+                "count": sketch.count,
+                "errors": self.errors.get(kind, 0),
+                "throughput": sketch.count / elapsed if elapsed > 0 else 0.0,
+                "p50": p50 * 1000.0,
+                "p90": p90 * 1000.0,
+                "p99": p99 * 1000.0,
+                "max": self.max_latencies.get(kind, 0.0) * 1000.0,
+            }
+        return result
+
+    def format(self) -> str:
+        lines = [f"requests in {self.get_elapsed():.1f}s:"]
+        for kind, s in self.summary().items():
+            lines.append(
+                f"  {kind:>9}: {s['count']:>8} reqs {s['errors']:>6} errors {s['throughput']:9.1f} req/s  "
+                f"latency ms p50={s['p50']:.1f} p90={s['p90']:.1f} p99={s['p99']:.1f} max={s['max']:.1f}"
+            )
+        return "\n".join(lines)
+
+
+class AsyncRequestSender(ABC):
+    """Sends the requests of AsyncSimulator to Flare from its event loop."""
+
+    async def open(self):
+        """Allocate the resources of the sender. Called in the event loop before any request is sent."""
+        pass
+
+    async def close(self):
+        """Release the resources of the sender. Called in the event loop after all requests are sent."""
+        pass
+
+    @abstractmethod
+    async def send(self, request, device: SimulatedDevice):
+        """Send the request of the device and return the response.
+
+        Args:
+            request: TaskRequest, JobRequest, SelectionRequest or ResultReport
+            device: the device that the request is for
+
+        Returns: the response
+
+        """
+        pass
+
+
+class _ThreadSender(AsyncRequestSender):
+    """Sends requests with a blocking send function in a pool of threads."""
+
+    def __init__(self, send_f, kwargs: dict, max_workers: int):
+        self.send_f = send_f
+        self.kwargs = kwargs
+        self.max_workers = max_workers
+        self.executor = None
+
+    async def open(self):
+        self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="sim_sender")
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def send(self, request, device: SimulatedDevice):
+        f = functools.partial(self.send_f, request, device, **self.kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, f)
+
+
+class AsyncSimulator(Simulator):
+
+    def __init__(
+        self,
+        job_name: str,
+        device_factory: DeviceFactory,
+        num_devices: int = 10000,
+        num_workers: int = 10,
+        get_job_timeout: float = 60.0,
+        max_concurrent_requests: int = 100,
+        query_interval: float = 1.0,
+        stats_report_interval: float = 30.0,
+    ):
+        """Constructor of AsyncSimulator.
+
+        AsyncSimulator runs all its devices in one asyncio event loop instead of one thread per busy device.
+        The task requests of all devices selected in a query cycle are sent at once, with at most
+        max_concurrent_requests requests in flight. To use more than one CPU, run one AsyncSimulator per process,
+        see run_device_simulator.
+
+        Devices whose do_task is a coroutine function run in the event loop. Other devices run do_task in a pool
+        of num_workers threads.
+
+        Args:
+            device_factory: object for creating new devices
+            num_devices: max number of devices to be created
+            num_workers: number of threads for doing tasks of devices that are not async
+            get_job_timeout: how long to try getting the job, in seconds
+            max_concurrent_requests: max number of requests in flight
+            query_interval: time between two selection queries, in seconds
+            stats_report_interval: how often to log the request stats, in seconds. 0 to disable.
+        """
+        Simulator.__init__(self, job_name, device_factory, num_devices, num_workers, get_job_timeout)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.query_interval = query_interval
+        self.stats_report_interval = stats_report_interval
+        self.sender: Optional[AsyncRequestSender] = None
+        self.stats = RequestStats()
+        self._request_slots = None
+        self._device_tasks = set()
+
+    def set_send_func(self, send_f, **kwargs):
+        """Set a blocking function for sending request to Flare. It is called in a pool of
+        max_concurrent_requests threads.
+
+        Args:
+            send_f: the function to be set
+            **kwargs: args to be passed to the function when invoked
+
+        Returns: None
+
+        """
+        Simulator.set_send_func(self, send_f, **kwargs)
+        self.sender = _ThreadSender(send_f, kwargs, self.max_concurrent_requests)
+
+    def set_sender(self, sender: AsyncRequestSender):
+        """Set the sender for sending requests to Flare from the event loop.
+
+        Args:
+            sender: the sender to be set
+
+        Returns: None
+
+        """
+        if not isinstance(sender, AsyncRequestSender):
+            raise ValueError(f"sender must be AsyncRequestSender but got {type(sender)}")
+        self.sender = sender
+
+    def start(self):
+        if self.sender is None:
+            raise ValueError("sender has not been set - please call set_sender or set_send_func before start")
+
+        asyncio.run(self._run())
+        self._shutdown()
+        self.logger.info(f"device simulator ended: {self.stats.format()}")
+
+    async def _run(self):
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        await self.sender.open()
+        self.stats.start()
+        reporter = asyncio.create_task(self._report_stats()) if self.stats_report_interval > 0 else None
+        try:
+            await self._control_flow()
+        finally:
+            if reporter:
+                reporter.cancel()
+            for t in self._device_tasks:
+                t.cancel()
+            await asyncio.gather(*self._device_tasks, return_exceptions=True)
+            self.stats.stop()
+            await self.sender.close()
+
+    async def _report_stats(self):
+        while True:
+            await asyncio.sleep(self.stats_report_interval)
+            self.logger.info(f"{len(self.busy_devices)} busy devices; {self.stats.format()}")
+
+    async def _send(self, kind: str, req, device: SimulatedDevice, default_resp):
+        async with self._request_slots:
+            start = time.perf_counter()
+            try:
+                resp = await self.sender.send(req, device)
+                ok = resp is not None
+                if not ok:
+                    resp = default_resp
+            except Exception as ex:
+                self.logger.warning(f"exception sending {kind} request: {secure_format_exception(ex)}")
+                resp = default_resp
+                ok = False
+            self.stats.add(kind, time.perf_counter() - start, ok)
+        return resp
+
+    async def _get_job(self) -> Optional[JobResponse]:
+        # get job using a dummy device
+        device = self.device_factory.make_device(SpecialDeviceId.DUMMY)
+        start_time = time.time()
+        while not self.done:
+            resp = await self._send(
+                RequestKind.JOB, self._make_job_request(device), device, JobResponse(EdgeApiStatus.RETRY)
+            )
+            if resp:
+                assert isinstance(resp, JobResponse)
+                if resp.status == EdgeApiStatus.OK:
+                    self.logger.debug(f"Got job {resp.job_id}")
+                    return resp
+                elif resp.status not in [EdgeApiStatus.RETRY, EdgeApiStatus.NO_JOB]:
+                    self.logger.info(f"stop running due to bad JobResponse status: {resp.status}")
+                    return None
+
+            if time.time() - start_time > self.get_job_timeout:
+                self.logger.info(f"cannot get a job for {self.get_job_timeout} seconds - exiting")
+                return None
+
+            self.logger.debug("failed to get job: will retry")
+            await asyncio.sleep(1.0)
+        return None
+
+    async def _control_flow(self):
+        self.logger.info(f"starting async device simulator: {self.num_devices=} {self.max_concurrent_requests=}")
+        job_response = await self._get_job()
+        if not job_response:
+            return
+
+        device_id_for_selection = f"{self.device_id_prefix}{SpecialDeviceId.MAX_INDICATOR}{self.num_devices}"
+        selection_device = self.device_factory.make_device(device_id_for_selection)
+        cycle_num = 0
+        while not self.done:
+            req = SelectionRequest(selection_device.get_device_info(), job_response.job_id)
+            resp = await self._send(
+                RequestKind.SELECTION, req, selection_device, SelectionResponse(EdgeApiStatus.RETRY)
+            )
+            if resp:
+                assert isinstance(resp, SelectionResponse)
+                if resp.status == EdgeApiStatus.NO_JOB:
+                    # all done
+                    self.logger.info(f"no selection: job {job_response.job_id} is gone - exiting")
+                    return
+
+                if resp.status == EdgeApiStatus.OK and device_id_for_selection != SpecialDeviceId.DUMMY:
+                    # no longer need to send device range
+                    device_id_for_selection = SpecialDeviceId.DUMMY
+                    selection_device = self.device_factory.make_device(device_id_for_selection)
+
+                my_devices = self._determine_my_devices(resp.selection) if resp.selection else None
+                if my_devices:
+                    cycle_num += 1
+                    self.logger.info(f"query cycle {cycle_num}: {len(my_devices)} devices selected")
+                    for did, sid in my_devices.items():
+                        # the device is busy until its task is done, so it is not started again by the next cycle
+                        self.busy_devices[did] = sid
+                        task = asyncio.create_task(self._run_device(did, sid, job_response))
+                        self._device_tasks.add(task)
+                        task.add_done_callback(self._device_tasks.discard)
+
+            await asyncio.sleep(self.query_interval)
+
+    async def _run_device(self, did: str, sid, job_response: JobResponse):
+        try:
+            device = self.all_devices.get(did)
+            if not device:
+                device = self._make_new_device(did)
+            assert isinstance(device, SimulatedDevice)
+
+            device.set_job(
+                job_id=job_response.job_id,
+                job_name=job_response.job_name,
+                job_data=job_response.job_data,
+                method=job_response.method,
+            )
+
+            # ask for task
+            resp = await self._send(
+                RequestKind.TASK, self._make_task_request(device), device, TaskResponse(EdgeApiStatus.RETRY)
+            )
+            self.logger.debug(f"tried to get task for device {did}: {resp}")
+
+            if resp.status == EdgeApiStatus.OK:
+                device.state = DeviceState.LEARNING
+                device.cookie = resp.cookie
+                selection_id = sid
+                if isinstance(resp.cookie, dict):
+                    selection_id = resp.cookie.get(CookieKey.DEVICE_SELECTION_ID, sid)
+                self.busy_devices[did] = selection_id
+                await self._do_learn_async(resp, device, selection_id)
+            elif resp.status == EdgeApiStatus.RETRY:
+                self.logger.debug(f"Task request for device {did} returned RETRY status, will retry.")
+            elif resp.status == EdgeApiStatus.NO_JOB:
+                # the job is gone
+                self.logger.info("job is gone when getting task - exiting")
+                self.done = True
+            elif resp.status == EdgeApiStatus.DONE:
+                # this device is done - job is done
+                device.job_id = None
+            else:
+                # ERROR
+                self.logger.info(f"stop running due to bad TaskResponse status: {resp.status}")
+                self.done = True
+        except Exception as ex:
+            self.logger.error(f"exception running device {did}: {secure_format_exception(ex)}")
+        finally:
+            self.busy_devices.pop(did, None)
+
+    async def _do_learn_async(self, task_data: TaskResponse, device: SimulatedDevice, selection_id):
+        self.logger.debug(f"Device {device.device_id} is selected ({selection_id}): started training ")
+        try:
+            if asyncio.iscoroutinefunction(device.do_task):
+                result = await device.do_task(task_data)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(self.worker_pool, device.do_task, task_data)
+            status = EdgeApiStatus.OK
+        except Exception as ex:
+            self.logger.error(f"exception processing task: {secure_format_exception(ex)}")
+            result = {}
+            status = EdgeApiStatus.ERROR
+
+        report = self._make_result_report(task_data, device, result, status)
+        resp = await self._send(RequestKind.RESULT, report, device, ResultResponse(EdgeApiStatus.RETRY))
+        self.logger.debug(f"Device {device.device_id} finished training: {resp}")
+        if resp and not isinstance(resp, ResultResponse):
+            self.logger.error(f"received response must be ResultResponse but got {type(resp)}")
+
+        device.state = DeviceState.IDLE
+        self.used_devices[device.device_id] = selection_id
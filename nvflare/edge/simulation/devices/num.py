@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import random
 import time
 
@@ -29,6 +30,11 @@ class NumDevice(SimulatedDevice):
         self.max_train_time = max_train_time
 
     def do_task(self, task: TaskResponse) -> dict:
+        result = self._compute(task)
+        time.sleep(random.uniform(self.min_train_time, self.max_train_time))
+        return result
+
+    def _compute(self, task: TaskResponse) -> dict:
         task_data = task.task_data
         assert isinstance(task_data, dict)
         model = from_dict(task_data)
@@ -43,20 +49,29 @@ class NumDevice(SimulatedDevice):
         value = model.data.get("value", 0)
         result = value + 1
         result_dxo = DXO(data_kind="number", data={"value": result})
-        delay = random.uniform(self.min_train_time, self.max_train_time)
-        time.sleep(delay)
         return result_dxo.to_dict()
 
 
+class AsyncNumDevice(NumDevice):
+    """NumDevice that waits for its training time in the event loop of AsyncSimulator, without a thread."""
+
+    async def do_task(self, task: TaskResponse) -> dict:
+        result = self._compute(task)
+        await asyncio.sleep(random.uniform(self.min_train_time, self.max_train_time))
+        return result
+
+
 class NumDeviceFactory(DeviceFactory):
 
-    def __init__(self, min_train_time=1.0, max_train_time=5.0):
+    def __init__(self, min_train_time=1.0, max_train_time=5.0, use_async=False):
         DeviceFactory.__init__(self)
         self.min_train_time = min_train_time
         self.max_train_time = max_train_time
+        self.use_async = use_async
 
     def make_device(self, device_id: str) -> SimulatedDevice:
-        return NumDevice(device_id, self.min_train_time, self.max_train_time)
+        device_class = AsyncNumDevice if self.use_async else NumDevice
+        return device_class(device_id, self.min_train_time, self.max_train_time)
 
 
 class NumProcessor(DeviceTaskProcessor):
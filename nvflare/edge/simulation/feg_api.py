@@ -13,9 +13,12 @@
 # limitations under the License.
 from urllib.parse import urlencode, urljoin
 
+import aiohttp
 import requests
 
 from nvflare.edge.constants import HttpHeaderKey
+from nvflare.edge.simulation.async_simulator import AsyncRequestSender
+from nvflare.edge.simulation.simulated_device import SimulatedDevice
 from nvflare.edge.web.models.api_error import ApiError
 from nvflare.edge.web.models.base_model import EdgeProtoKey
 from nvflare.edge.web.models.device_info import DeviceInfo
@@ -48,22 +51,45 @@ class FegApi:
         }
 
     def get_job(self, request: JobRequest) -> JobResponse:
-        return self._do_post(
-            clazz=JobResponse,
-            url=urljoin(self.endpoint, "job"),
-            params={},
-            body={EdgeProtoKey.JOB_NAME: request.job_name, EdgeProtoKey.CAPABILITIES: request.capabilities},
-        )
+        return self._do_post(*self._job_post(request))
 
     def get_task(self, request: TaskRequest) -> TaskResponse:
-        return self._do_post(
-            clazz=TaskResponse,
-            url=urljoin(self.endpoint, "task"),
-            params={EdgeProtoKey.JOB_ID: request.job_id},
-            body={EdgeProtoKey.COOKIE: request.cookie} if request.cookie else {},
-        )
+        return self._do_post(*self._task_post(request))
 
     def report_result(self, report: ResultReport) -> ResultResponse:
+        return self._do_post(*self._result_post(report))
+
+    def get_selection(self, request: SelectionRequest) -> SelectionResponse:
+        return self._do_post(*self._selection_post(request))
+
+    def make_post(self, request):
+        """Get the response class, URL, query params and JSON body of the POST for the request."""
+        if isinstance(request, TaskRequest):
+            return self._task_post(request)
+        if isinstance(request, JobRequest):
+            return self._job_post(request)
+        if isinstance(request, ResultReport):
+            return self._result_post(request)
+        if isinstance(request, SelectionRequest):
+            return self._selection_post(request)
+        raise ValueError(f"unknown type of request {type(request)}")
+
+    def _job_post(self, request: JobRequest):
+        return (
+            JobResponse,
+            urljoin(self.endpoint, "job"),
+            {},
+            {EdgeProtoKey.JOB_NAME: request.job_name, EdgeProtoKey.CAPABILITIES: request.capabilities},
+        )
+
+    def _task_post(self, request: TaskRequest):
+        body = {EdgeProtoKey.COOKIE: request.cookie} if request.cookie else {}
+        array_encoding = request.get(EdgeProtoKey.ARRAY_ENCODING)
+        if array_encoding:
+            body[EdgeProtoKey.ARRAY_ENCODING] = array_encoding
+        return TaskResponse, urljoin(self.endpoint, "task"), {EdgeProtoKey.JOB_ID: request.job_id}, body
+
+    def _result_post(self, report: ResultReport):
         body = {
             EdgeProtoKey.STATUS: report.status,
             EdgeProtoKey.TASK_NAME: report.task_name,
@@ -72,23 +98,14 @@ class FegApi:
         if report.cookie:
             body[EdgeProtoKey.COOKIE] = report.cookie
 
-        return self._do_post(
-            clazz=ResultResponse,
-            url=urljoin(self.endpoint, "result"),
-            params={
-                EdgeProtoKey.JOB_ID: report.job_id,
-                EdgeProtoKey.TASK_ID: report.task_id,
-            },
-            body=body,
-        )
+        params = {
+            EdgeProtoKey.JOB_ID: report.job_id,
+            EdgeProtoKey.TASK_ID: report.task_id,
+        }
+        return ResultResponse, urljoin(self.endpoint, "result"), params, body
 
-    def get_selection(self, request: SelectionRequest) -> SelectionResponse:
-        return self._do_post(
-            clazz=SelectionResponse,
-            url=urljoin(self.endpoint, "selection"),
-            params={EdgeProtoKey.JOB_ID: request.job_id},
-            body={},
-        )
+    def _selection_post(self, request: SelectionRequest):
+        return SelectionResponse, urljoin(self.endpoint, "selection"), {EdgeProtoKey.JOB_ID: request.job_id}, {}
 
     def _do_post(self, clazz, url, params, body):
         response = requests.post(url, params=params, json=body, headers=self.common_headers)
@@ -96,3 +113,32 @@ class FegApi:
         if code == 200:
             return clazz(**response.json())
         raise ApiError(code, "ERROR", f"API Call failed with status code {code}", response.json())
+
+
+class AsyncFegSender(AsyncRequestSender):
+    def __init__(self, endpoint: str, max_connections: int = 100):
+        """Sends the requests of AsyncSimulator to the web proxy with aiohttp. All devices share one session,
+        which keeps at most max_connections connections to the proxy.
+
+        Args:
+            endpoint: URL of the web proxy
+            max_connections: max number of connections to the proxy
+        """
+        self.endpoint = endpoint
+        self.max_connections = max_connections
+        self.session = None
+
+    async def open(self):
+        self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_connections))
+
+    async def close(self):
+        await self.session.close()
+
+    async def send(self, request, device: SimulatedDevice):
+        api = FegApi(self.endpoint, device.get_device_info(), device.get_user_info())
+        clazz, url, params, body = api.make_post(request)
+        async with self.session.post(url, params=params, json=body, headers=api.common_headers) as response:
+            code = response.status
+            if code == 200:
+                return clazz(**await response.json())
+            raise ApiError(code, "ERROR", f"API Call failed with status code {code}", await response.text())
@@ -13,10 +13,12 @@
 # limitations under the License.
 import argparse
 import logging
+import multiprocessing
 
+from nvflare.edge.simulation.async_simulator import AsyncSimulator, RequestStats
 from nvflare.edge.simulation.config import ConfigParser
 from nvflare.edge.simulation.devices.tp import TPDeviceFactory
-from nvflare.edge.simulation.feg_api import FegApi
+from nvflare.edge.simulation.feg_api import AsyncFegSender, FegApi
 from nvflare.edge.simulation.simulated_device import SimulatedDevice
 from nvflare.edge.simulation.simulator import Simulator
 from nvflare.edge.web.models.job_request import JobRequest
@@ -54,6 +56,63 @@ def run_simulator(config_file: str, lcp_mapping_file: str = None, ca_cert_file:
     log.info("DeviceSimulator run ended")
 
 
+def run_async_simulator(
+    config_file: str,
+    num_processes: int = 1,
+    max_concurrent_requests: int = 100,
+    lcp_mapping_file: str = None,
+    ca_cert_file: str = None,
+) -> RequestStats:
+    """Run the devices of the config file with AsyncSimulator, in one or more processes.
+
+    The devices are split evenly among the processes. Each process runs one event loop, and the request stats of
+    all processes are merged when they are done.
+
+    Returns: the merged request stats
+
+    """
+    parser = ConfigParser(config_file)
+    num = parser.get_num_devices()
+    sizes = [num // num_processes + (1 if i < num % num_processes else 0) for i in range(num_processes)]
+    log.info(f"Running {num} devices in {num_processes} processes. Endpoint URL: {parser.get_endpoint()}")
+
+    args = [(config_file, n, max_concurrent_requests, lcp_mapping_file, ca_cert_file) for n in sizes if n > 0]
+    if len(args) == 1:
+        stats = [_run_async_process(*args[0])]
+    else:
+        with multiprocessing.get_context("spawn").Pool(len(args)) as pool:
+            stats = pool.starmap(_run_async_process, args)
+
+    result = RequestStats.merge(stats)
+    log.info(f"DeviceSimulator run ended: {result.format()}")
+    return result
+
+
+def _run_async_process(
+    config_file: str, num_devices: int, max_concurrent_requests: int, lcp_mapping_file: str, ca_cert_file: str
+) -> dict:
+    _setup_logging()
+    parser = ConfigParser(config_file)
+    simulator = AsyncSimulator(
+        job_name=parser.get_job_name(),
+        get_job_timeout=parser.get_job_timeout,
+        device_factory=TPDeviceFactory(parser),
+        num_devices=num_devices,
+        num_workers=parser.get_num_workers(),
+        max_concurrent_requests=max_concurrent_requests,
+    )
+
+    if lcp_mapping_file:
+        # use gRPC Query, which is blocking
+        query = Query(lcp_mapping_file, ca_cert_file)
+        simulator.set_send_func(_send_request_to_lcp, query=query)
+    else:
+        simulator.set_sender(AsyncFegSender(parser.get_endpoint(), max_concurrent_requests))
+
+    simulator.start()
+    return simulator.stats.to_dict()
+
+
 def _send_request_to_lcp(request, device: SimulatedDevice, query: Query):
     return query(request)
 
@@ -79,14 +138,18 @@ def _send_request_to_proxy(request, device: SimulatedDevice, parser: ConfigParse
     raise ValueError(f"unknown type of request {type(request)}")
 
 
-def main():
-    # Set up logging
+def _setup_logging():
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[logging.StreamHandler()],
     )
 
+
+def main():
+    # Set up logging
+    _setup_logging()
+
     # Set up argument parser
     parser = argparse.ArgumentParser(description="Run NVFlare edge DeviceSimulator")
 
@@ -112,11 +175,39 @@ def main():
         help="Location of CA Cert file",
     )
 
+    parser.add_argument(
+        "--async_mode",
+        "-a",
+        action="store_true",
+        help="Run the devices in asyncio event loops instead of threads",
+    )
+
+    parser.add_argument(
+        "--num_processes",
+        "-p",
+        type=int,
+        default=1,
+        help="Number of simulator processes in async mode",
+    )
+
+    parser.add_argument(
+        "--max_concurrent_requests",
+        "-r",
+        type=int,
+        default=100,
+        help="Max number of requests in flight per simulator process in async mode",
+    )
+
     # Parse arguments
     args = parser.parse_args()
 
     # Run Device Simulator
-    run_simulator(args.config_file, args.lcp_mapping_file, args.ca_cert_file)
+    if args.async_mode:
+        run_async_simulator(
+            args.config_file, args.num_processes, args.max_concurrent_requests, args.lcp_mapping_file, args.ca_cert_file
+        )
+    else:
+        run_simulator(args.config_file, args.lcp_mapping_file, args.ca_cert_file)
 
 
 if __name__ == "__main__":
@@ -250,7 +250,9 @@ class Simulator:
             raise ValueError("send_f has not been set - please call set_send_func before start")
 
         self._control_flow()
+        self._shutdown()
 
+    def _shutdown(self):
         # Stop all tasks if any
         self.worker_pool.shutdown()
 
@@ -286,15 +288,19 @@ class Simulator:
         Returns: TaskResponse
 
         """
-        req = TaskRequest(
+        req = self._make_task_request(device)
+        resp = self._send_request(req, device, TaskResponse(EdgeApiStatus.RETRY), **self.send_kwargs)
+        self.logger.debug(f"got task response: {resp}")
+        return resp
+
+    @staticmethod
+    def _make_task_request(device: SimulatedDevice) -> TaskRequest:
+        return TaskRequest(
             device_info=device.get_device_info(),
             user_info=device.get_user_info(),
             job_id=device.get_job_id(),
             cookie=device.cookie,
         )
-        resp = self._send_request(req, device, TaskResponse(EdgeApiStatus.RETRY), **self.send_kwargs)
-        self.logger.debug(f"got task response: {resp}")
-        return resp
 
     def _ask_for_selection(self, job_id: str, device_id) -> SelectionResponse:
         """Send a request to Flare for ask for the current device selection.
@@ -318,15 +324,18 @@ class Simulator:
         Returns:
 
         """
-        req = JobRequest(
+        req = self._make_job_request(device)
+        resp = self._send_request(req, device, JobResponse(EdgeApiStatus.RETRY), **self.send_kwargs)
+        self.logger.debug(f"got job response: {resp}")
+        return resp
+
+    def _make_job_request(self, device: SimulatedDevice) -> JobRequest:
+        return JobRequest(
             job_name=self.job_name,
             device_info=device.get_device_info(),
             user_info=device.get_user_info(),
             capabilities=device.get_capabilities(),
         )
-        resp = self._send_request(req, device, JobResponse(EdgeApiStatus.RETRY), **self.send_kwargs)
-        self.logger.debug(f"got job response: {resp}")
-        return resp
 
     def _make_new_device(self, device_id: str):
         """Create a new device for inclusion to active device list.
@@ -358,21 +367,7 @@ class Simulator:
             result = {}
             status = EdgeApiStatus.ERROR
 
-        if not isinstance(result, dict):
-            self.logger.error(f"bad result from device: expect dict but got {type(result)}")
-            result = {}
-            status = EdgeApiStatus.ERROR
-
-        report = ResultReport(
-            device_info=device.get_device_info(),
-            user_info=device.get_user_info(),
-            job_id=task_data.job_id,
-            task_id=task_data.task_id,
-            task_name=task_data.task_name,
-            result=result,
-            status=status,
-            cookie=device.cookie,
-        )
+        report = self._make_result_report(task_data, device, result, status)
 
         # report the result to Flare
         self.logger.info(f"Device {device.device_id} finished training")
@@ -389,3 +384,20 @@ class Simulator:
         with self.update_lock:
             self.busy_devices.pop(device.device_id, None)
             self.used_devices[device.device_id] = selection_id
+
+    def _make_result_report(self, task_data: TaskResponse, device: SimulatedDevice, result, status) -> ResultReport:
+        if not isinstance(result, dict):
+            self.logger.error(f"bad result from device: expect dict but got {type(result)}")
+            result = {}
+            status = EdgeApiStatus.ERROR
+
+        return ResultReport(
+            device_info=device.get_device_info(),
+            user_info=device.get_user_info(),
+            job_id=task_data.job_id,
+            task_id=task_data.task_id,
+            task_name=task_data.task_name,
+            result=result,
+            status=status,
+            cookie=device.cookie,
+        )
@@ -28,6 +28,7 @@ class EdgeProtoKey:
     DEVICE_ID = "device_id"
     USER_INFO = "user_info"
     METHODS = "methods"
+    ARRAY_ENCODING = "array_encoding"
 
 
 class BaseModel(dict):
@@ -14,14 +14,17 @@
 
 import concurrent.futures
 import copy
+import math
 import threading
 import uuid
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from nvflare.apis.signal import Signal
 from nvflare.fuel.f3.cellnet.core_cell import CoreCell, TargetMessage
 from nvflare.fuel.f3.cellnet.defs import CellChannel, MessageHeaderKey, MessagePropKey, MessageType, ReturnCode
+from nvflare.fuel.f3.cellnet.fqcn import FQCN
 from nvflare.fuel.f3.cellnet.utils import decode_payload, encode_payload, make_reply
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.stream_cell import StreamCell
 from nvflare.fuel.f3.streaming.stream_const import StreamHeaderKey
@@ -42,6 +45,50 @@ CHANNELS_TO_EXCLUDE = (
     CellChannel.RETURN_ONLY,
 )
 
+# channels that relays never forward broadcasts on
+RELAY_EXCLUDED_CHANNELS = CHANNELS_TO_EXCLUDE + (
+    CellChannel.BROADCAST_RELAY,
+    CellChannel.SERVER_COMMAND,
+    CellChannel.HCI,
+)
+
+DEFAULT_BROADCAST_MAX_WORKERS = 64
+RELAY_TOPIC = "relay"
+
+
+class _RelayKey:
+    CHANNEL = "channel"
+    TOPIC = "topic"
+    TARGETS = "targets"
+    TIMEOUT = "timeout"
+    SECURE = "secure"
+    OPTIONAL = "optional"
+    HEADERS = "headers"
+    PAYLOAD = "payload"
+    REPLY_HEADERS = "headers"
+    REPLY_PAYLOAD = "payload"
+
+
+def make_relay_groups(targets: List[str], fanout: int) -> List[Tuple[str, List[str]]]:
+    """Split the targets of a broadcast into at most fanout groups.
+
+    The first target of each group is the relay of the group: it receives the message and forwards it directly
+    to the rest of the group (its subtree).
+
+    Args:
+        targets: the targets of the broadcast
+        fanout: max number of cells that the message is sent to directly. If not positive, or if there are no
+            more targets than this, the message is sent to all targets directly.
+
+    Returns: list of (relay, subtree). The subtree is empty for targets that the message is sent to directly.
+
+    """
+    if fanout <= 0 or len(targets) <= fanout:
+        return [(t, []) for t in targets]
+
+    group_size = math.ceil(len(targets) / fanout)
+    return [(targets[i], targets[i + 1 : i + group_size]) for i in range(0, len(targets), group_size)]
+
 
 def _is_stream_channel(channel: str) -> bool:
     if channel is None or channel == "":
@@ -130,6 +177,19 @@ class Cell(StreamCell):
         self.core_cell.update_fobs_context({FOBSContextKey.CELL: self})
         self.decode_pass_through_channels: set = set()  # per-channel opt-in for receiver-side PASS_THROUGH
 
+        # Requests of broadcasts are sent by persistent pools of threads, which are created on first use:
+        # one for the requests to the targets, and one for the relay requests, which wait for whole subtrees.
+        config = CommConfigurator()
+        self.broadcast_max_workers = config.get_broadcast_max_workers(DEFAULT_BROADCAST_MAX_WORKERS)
+        self._broadcast_executor = None
+        self._relay_executor = None
+        self._broadcast_lock = threading.Lock()
+
+        # Only cells that relay broadcasts themselves accept relay requests
+        self.broadcast_relay_fanout = config.get_broadcast_relay_fanout(0)
+        if self.broadcast_relay_fanout > 0:
+            self._register_request_cb(CellChannel.BROADCAST_RELAY, RELAY_TOPIC, self._relay_broadcast)
+
     def update_fobs_context(self, props: dict):
         self.core_cell.update_fobs_context(props)
 
@@ -144,6 +204,26 @@ class Cell(StreamCell):
             ctx.update(props)
         return ctx
 
+    def stop(self):
+        self.core_cell.stop()
+        with self._broadcast_lock:
+            for executor in (self._broadcast_executor, self._relay_executor):
+                if executor is not None:
+                    executor.shutdown(wait=False)
+            self._broadcast_executor = None
+            self._relay_executor = None
+
+    def _get_broadcast_executors(self) -> Tuple[concurrent.futures.ThreadPoolExecutor, ...]:
+        with self._broadcast_lock:
+            if self._broadcast_executor is None:
+                self._broadcast_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.broadcast_max_workers, thread_name_prefix="cell_broadcast"
+                )
+                self._relay_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.broadcast_max_workers, thread_name_prefix="cell_broadcast_relay"
+                )
+            return self._broadcast_executor, self._relay_executor
+
     def __getattr__(self, func):
         """
         This method is called when Python cannot find an invoked method "x" of this class.
@@ -175,10 +255,20 @@ class Cell(StreamCell):
         secure=False,
         optional=False,
         abort_signal: Signal = None,
+        relay_fanout: int = None,
     ) -> Dict[str, Message]:
         """
         Send a message over a channel to specified destination cell(s), and wait for reply
 
+        The request is encoded once and sent to the targets by the broadcast thread pool of the cell, which runs
+        at most broadcast_max_workers requests at a time. If there are more targets than relay_fanout, the request
+        is only sent to relay_fanout of them, each of which forwards the encoded request to a subtree of the other
+        targets and returns their replies (see make_relay_groups). This only reduces the traffic of this cell if
+        the relays can reach their subtrees without going through it. Targets of forwarded
+        requests see the relay as the origin of the request, and the FQCN of this cell in the BROADCAST_ORIGIN
+        header. Relays only accept requests from their parent or the server cell, and must have relaying enabled
+        with broadcast_relay_fanout. Secure requests are never relayed, since the relay would see them in clear.
+
         Args:
             channel: channel for the message
             topic: topic of the message
@@ -188,6 +278,9 @@ class Cell(StreamCell):
             secure: End-end encryption
             optional: whether the message is optional
             abort_signal: signal to abort the message
+            relay_fanout: max number of targets to send the request to directly. 0 disables relaying.
+                If not specified, the broadcast_relay_fanout of the comm config is used, which defaults to 0.
+                Ignored if secure is True.
 
         Returns: a dict of: cell_id => reply message
 
@@ -196,39 +289,202 @@ class Cell(StreamCell):
 
         if isinstance(targets, str):
             targets = [targets]
-        target_argument = {}
-        fixed_dict = dict(channel=channel, topic=topic, timeout=timeout, secure=secure, optional=optional)
-        results = dict()
-        future_to_target = {}
+        if relay_fanout is None:
+            relay_fanout = self.broadcast_relay_fanout
+        if secure:
+            # end-to-end encryption: each target must get the request from this cell
+            relay_fanout = 0
 
         # encode the request now so each target thread won't need to do it again.
         self._encode_message(request, abort_signal, num_receivers=len(targets))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(targets)) as executor:
-            self.logger.debug(f"broadcast to {targets=}")
-            for t in targets:
-                req = Message(copy.deepcopy(request.headers), request.payload)
-                target_argument["request"] = TargetMessage(t, channel, topic, req).message
-                target_argument["target"] = t
-                target_argument["abort_signal"] = abort_signal
-                target_argument.update(fixed_dict)
-                f = executor.submit(self._send_one_request, **target_argument)
-                future_to_target[f] = t
-                self.logger.debug(f"submitted to {t} with {target_argument.keys()=}")
-            for future in concurrent.futures.as_completed(future_to_target):
-                target = future_to_target[future]
-                self.logger.debug(f"{target} completed")
-                try:
-                    data = future.result()
-                except Exception as exc:
-                    self.logger.warning(f"{target} raises {exc}")
-                    results[target] = make_reply(ReturnCode.TIMEOUT)
-                else:
-                    results[target] = data
-                    self.logger.debug(f"{target=}: {data=}")
+        groups = make_relay_groups(targets, relay_fanout)
+        return self._broadcast_to_groups(groups, channel, topic, request, timeout, secure, optional, abort_signal)
+
+    def _broadcast_to_groups(
+        self,
+        groups: List[Tuple[str, List[str]]],
+        channel: str,
+        topic: str,
+        request: Message,
+        timeout,
+        secure,
+        optional,
+        abort_signal: Signal,
+    ) -> Dict[str, Message]:
+        # Requests to the targets never wait for other tasks of the pools. Relay requests wait for the replies of
+        # whole subtrees, so they run in their own pool and never hold up the requests to the targets.
+        executor, relay_executor = self._get_broadcast_executors()
+        results = dict()
+        future_to_group = {}
+        for target, subtree in groups:
+            if subtree:
+                f = relay_executor.submit(
+                    self._send_relay_request,
+                    target,
+                    subtree,
+                    channel,
+                    topic,
+                    request,
+                    timeout,
+                    secure,
+                    optional,
+                    abort_signal,
+                )
+            else:
+                # headers are flat, so a shallow copy is enough to keep per-target headers apart
+                req = TargetMessage(target, channel, topic, Message(copy.copy(request.headers), request.payload))
+                f = executor.submit(
+                    self._send_one_request,
+                    channel=channel,
+                    target=target,
+                    topic=topic,
+                    request=req.message,
+                    timeout=timeout,
+                    secure=secure,
+                    optional=optional,
+                    abort_signal=abort_signal,
+                )
+            future_to_group[f] = (target, subtree)
+            self.logger.debug(f"submitted to {target} with subtree {subtree}")
+
+        for future in concurrent.futures.as_completed(future_to_group):
+            target, subtree = future_to_group[future]
+            self.logger.debug(f"{target} completed")
+            try:
+                data = future.result()
+            except Exception as exc:
+                self.logger.warning(f"{target} raises {exc}")
+                data = make_reply(ReturnCode.TIMEOUT)
+                if subtree:
+                    data = {t: data for t in [target] + subtree}
+
+            if subtree:
+                results.update(data)
+            else:
+                results[target] = data
+                self.logger.debug(f"{target=}: {data=}")
         self.logger.debug("About to return from broadcast_request")
         return results
 
+    def _send_relay_request(
+        self,
+        relay: str,
+        subtree: List[str],
+        channel: str,
+        topic: str,
+        request: Message,
+        timeout,
+        secure,
+        optional,
+        abort_signal: Signal,
+    ) -> Dict[str, Message]:
+        headers = copy.copy(request.headers)
+        headers.setdefault(MessageHeaderKey.BROADCAST_ORIGIN, self.get_fqcn())
+        spec = {
+            _RelayKey.CHANNEL: channel,
+            _RelayKey.TOPIC: topic,
+            _RelayKey.TARGETS: subtree,
+            _RelayKey.TIMEOUT: timeout,
+            _RelayKey.SECURE: secure,
+            _RelayKey.OPTIONAL: optional,
+            _RelayKey.HEADERS: headers,
+            # already encoded: the relay forwards it without decoding
+            _RelayKey.PAYLOAD: request.payload,
+        }
+
+        # The relay sends the request to itself and its subtree directly, each with the same timeout, in waves of
+        # broadcast_max_workers requests (assuming the relay has the same config), and replies after all of them.
+        waves = math.ceil((len(subtree) + 1) / self.broadcast_max_workers)
+        relay_timeout = timeout * (waves + 1) if timeout else timeout
+        reply = self._send_request(
+            channel=CellChannel.BROADCAST_RELAY,
+            target=relay,
+            topic=RELAY_TOPIC,
+            request=Message(payload=spec),
+            timeout=relay_timeout,
+            secure=secure,
+            optional=optional,
+            abort_signal=abort_signal,
+        )
+
+        targets = [relay] + subtree
+        rc = reply.get_header(MessageHeaderKey.RETURN_CODE, ReturnCode.OK)
+        if rc != ReturnCode.OK or not isinstance(reply.payload, dict):
+            self.logger.warning(f"relay {relay} failed to forward broadcast to {len(subtree)} targets: {rc}")
+            return {t: make_reply(rc if rc != ReturnCode.OK else ReturnCode.PROCESS_EXCEPTION) for t in targets}
+
+        results = {}
+        for t in targets:
+            r = reply.payload.get(t)
+            if isinstance(r, dict):
+                results[t] = Message(r.get(_RelayKey.REPLY_HEADERS), r.get(_RelayKey.REPLY_PAYLOAD))
+            else:
+                results[t] = make_reply(ReturnCode.TIMEOUT)
+        return results
+
+    def _is_relay_requester(self, origin: str) -> bool:
+        """Check whether the cell is allowed to ask this cell to relay a broadcast.
+
+        Relay requests are accepted from the parent of this cell and from the server cell of its level
+        (e.g. "server" for "site-1", "server.job1" for "site-1.job1").
+        """
+        if not origin:
+            return False
+        my_fqcn = self.get_fqcn()
+        server = FQCN.join([FQCN.ROOT_SERVER] + FQCN.split(my_fqcn)[1:])
+        return origin in (FQCN.get_parent(my_fqcn), server) and origin != my_fqcn
+
+    def _relay_broadcast(self, request: Message) -> Message:
+        origin = request.get_header(MessageHeaderKey.ORIGIN)
+        if not self._is_relay_requester(origin):
+            self.logger.warning(f"rejected relay request from {origin}")
+            return make_reply(ReturnCode.UNAUTHENTICATED, error="relay request not allowed")
+
+        spec = request.payload
+        if not isinstance(spec, dict):
+            return make_reply(ReturnCode.INVALID_REQUEST, error="bad relay request")
+
+        try:
+            channel = spec[_RelayKey.CHANNEL]
+            topic = spec[_RelayKey.TOPIC]
+            subtree = spec[_RelayKey.TARGETS]
+            forwarded = Message(spec[_RelayKey.HEADERS], spec[_RelayKey.PAYLOAD])
+        except KeyError as ex:
+            return make_reply(ReturnCode.INVALID_REQUEST, error=f"bad relay request: missing {ex}")
+
+        if not _is_stream_channel(channel) or channel in RELAY_EXCLUDED_CHANNELS or channel.startswith("_"):
+            self.logger.warning(f"rejected relay request from {origin} on channel {channel}")
+            return make_reply(ReturnCode.INVALID_REQUEST, error=f"channel {channel} can't be relayed")
+
+        if spec.get(_RelayKey.SECURE, False):
+            return make_reply(ReturnCode.INVALID_REQUEST, error="secure requests can't be relayed")
+
+        if not isinstance(subtree, list) or not all(isinstance(t, str) for t in subtree):
+            return make_reply(ReturnCode.INVALID_REQUEST, error="bad relay request: invalid targets")
+
+        self.logger.debug(f"relaying broadcast ({topic}@{channel}) from {origin} to {len(subtree)} targets")
+
+        forwarded.set_header(MessageHeaderKey.BROADCAST_ORIGIN, origin)
+
+        # the relay is a target too; the subtree is not split again
+        groups = [(t, []) for t in [self.get_fqcn()] + subtree]
+        replies = self._broadcast_to_groups(
+            groups,
+            channel,
+            topic,
+            forwarded,
+            spec.get(_RelayKey.TIMEOUT),
+            False,
+            spec.get(_RelayKey.OPTIONAL, False),
+            None,
+        )
+        result = {
+            t: {_RelayKey.REPLY_HEADERS: dict(r.headers), _RelayKey.REPLY_PAYLOAD: r.payload}
+            for t, r in replies.items()
+        }
+        return make_reply(ReturnCode.OK, body=result)
+
     def _fire_and_forget(
         self,
         channel: str,
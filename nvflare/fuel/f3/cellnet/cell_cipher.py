@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
 
-from cryptography.exceptions import InvalidKey, InvalidSignature
+from cryptography.exceptions import InvalidKey, InvalidSignature, InvalidTag
 from cryptography.hazmat.primitives import asymmetric, ciphers, hashes, padding
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.x509 import Certificate
 
 HASH_LENGTH = 4  # Adjustable to avoid collision
@@ -27,6 +31,26 @@ KEY_ENC_LENGTH = 256
 SIGNATURE_LENGTH = 256
 SIMPLE_HEADER_LENGTH = NONCE_LENGTH + KEY_ENC_LENGTH + SIGNATURE_LENGTH
 
+# Chunked AES-GCM format: key_enc + signature + key salt, chunk size, clear size + encrypted chunks.
+# Each message is encrypted with its own key, derived from the session key and the random key salt.
+# Each chunk is encrypted with nonce = chunk index and followed by its tag.
+GCM_KEY_SALT_LENGTH = 16
+GCM_NONCE_LENGTH = 12
+GCM_TAG_LENGTH = 16
+GCM_MAX_CHUNKS = 2**32
+GCM_PARAMS_FORMAT = f">{GCM_KEY_SALT_LENGTH}sIQ"
+GCM_PARAMS_LENGTH = struct.calcsize(GCM_PARAMS_FORMAT)
+GCM_HEADER_LENGTH = KEY_ENC_LENGTH + SIGNATURE_LENGTH + GCM_PARAMS_LENGTH
+GCM_KEY_INFO = b"nvflare cell cipher chunked gcm"
+DEFAULT_GCM_CHUNK_SIZE = 1024 * 1024
+
+
+class CipherVersion:
+    """Format of encrypted payloads"""
+
+    CBC = 1  # the whole payload is encrypted with AES-CBC
+    CHUNKED_GCM = 2  # the payload is encrypted in chunks with AES-GCM
+
 
 def get_hash(value):
     hash = hashes.Hash(hashes.SHA256())
@@ -106,6 +130,70 @@ def _sym_dec(k: bytes, n: bytes, m: bytes):
     return unpadder.update(plain_text) + unpadder.finalize()
 
 
+def _to_byte_views(payload: Any) -> List[memoryview]:
+    if payload is None:
+        return []
+    buffers = payload if isinstance(payload, list) else [payload]
+    return [memoryview(b).cast("B") for b in buffers]
+
+
+def _split_chunks(views: List[memoryview], chunk_size: int) -> List[List[memoryview]]:
+    """Split the buffers into chunks of chunk_size bytes. A chunk is a list of slices of the buffers.
+
+    There is at least one chunk, which is empty if the buffers are.
+    """
+    chunks = []
+    chunk = []
+    chunk_len = 0
+    for view in views:
+        pos = 0
+        while pos < len(view):
+            n = min(chunk_size - chunk_len, len(view) - pos)
+            chunk.append(view[pos : pos + n])
+            chunk_len += n
+            pos += n
+            if chunk_len == chunk_size:
+                chunks.append(chunk)
+                chunk = []
+                chunk_len = 0
+    if chunk or not chunks:
+        chunks.append(chunk)
+    return chunks
+
+
+def _gcm_message_key(session_key: bytes, salt: bytes) -> bytes:
+    return HKDF(algorithm=hashes.SHA256(), length=KEY_LENGTH, salt=salt, info=GCM_KEY_INFO).derive(session_key)
+
+
+def _gcm_nonce(index: int) -> bytes:
+    return index.to_bytes(GCM_NONCE_LENGTH, "big")
+
+
+def _check_chunk_count(num_chunks: int):
+    if num_chunks > GCM_MAX_CHUNKS:
+        raise ValueError(f"payload has too many chunks ({num_chunks}), the limit is {GCM_MAX_CHUNKS}")
+
+
+def _gcm_enc_chunk(k: bytes, nonce: bytes, aad: bytes, pieces: List[memoryview], out: memoryview):
+    encryptor = ciphers.Cipher(ciphers.algorithms.AES(k), ciphers.modes.GCM(nonce)).encryptor()
+    encryptor.authenticate_additional_data(aad)
+    pos = 0
+    for piece in pieces:
+        pos += encryptor.update_into(piece, out[pos : pos + len(piece)])
+    encryptor.finalize()
+    out[pos : pos + GCM_TAG_LENGTH] = encryptor.tag
+
+
+def _gcm_dec_chunk(k: bytes, nonce: bytes, aad: bytes, m: memoryview, out: memoryview):
+    data_len = len(m) - GCM_TAG_LENGTH
+    decryptor = ciphers.Cipher(
+        ciphers.algorithms.AES(k), ciphers.modes.GCM(nonce, bytes(m[data_len:]), min_tag_length=GCM_TAG_LENGTH)
+    ).decryptor()
+    decryptor.authenticate_additional_data(aad)
+    decryptor.update_into(m[:data_len], out)
+    decryptor.finalize()
+
+
 class SessionKeyManager:
     def __init__(self, root_ca):
         self.key_hash_dict = dict()
@@ -158,7 +246,25 @@ class SessionKeyManager:
 
 
 class SimpleCellCipher:
-    def __init__(self, root_ca: Certificate, pri_key: asymmetric.rsa.RSAPrivateKey, cert: Certificate):
+    def __init__(
+        self,
+        root_ca: Certificate,
+        pri_key: asymmetric.rsa.RSAPrivateKey,
+        cert: Certificate,
+        chunk_size: int = DEFAULT_GCM_CHUNK_SIZE,
+        max_workers: int = 1,
+    ):
+        """Encrypt and decrypt payloads of secure messages.
+
+        Args:
+            root_ca: the root CA certificate
+            pri_key: private key of the local cell
+            cert: certificate of the local cell
+            chunk_size: number of bytes of each chunk encrypted by encrypt_chunked
+            max_workers: number of threads that encrypt and decrypt the chunks of a payload
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive but got {chunk_size}")
         self._root_ca = root_ca
         self._root_ca_pub_key = root_ca.public_key()
         self._pri_key = pri_key
@@ -167,13 +273,16 @@ class SimpleCellCipher:
         self._validate_cert_chain(self._cert)
         self._cached_enc = dict()
         self._cached_dec = dict()
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self._executor = None
 
     def _validate_cert_chain(self, cert: Certificate):
         self._root_ca_pub_key.verify(
             cert.signature, cert.tbs_certificate_bytes, asymmetric.padding.PKCS1v15(), cert.signature_hash_algorithm
         )
 
-    def encrypt(self, message: bytes, target_cert: Certificate):
+    def _get_enc_secret(self, target_cert: Certificate):
         cert_hash = hash(target_cert)
         secret = self._cached_enc.get(cert_hash)
         if secret is None:
@@ -185,17 +294,9 @@ class SimpleCellCipher:
             self._cached_enc[cert_hash] = (key, key_enc, signature)
         else:
             (key, key_enc, signature) = secret
-        nonce = os.urandom(NONCE_LENGTH)
-        ct = nonce + key_enc + signature + _sym_enc(key, nonce, message)
-        return ct
-
-    def decrypt(self, message: bytes, origin_cert: Certificate):
-        nonce, key_enc, signature = (
-            message[:NONCE_LENGTH],
-            message[NONCE_LENGTH : NONCE_LENGTH + KEY_ENC_LENGTH],
-            message[NONCE_LENGTH + KEY_ENC_LENGTH : SIMPLE_HEADER_LENGTH],
-        )
+        return key, key_enc, signature
 
+    def _get_dec_key(self, key_enc, signature, origin_cert: Certificate):
         if not isinstance(key_enc, bytes):
             key_enc = bytes(key_enc)
 
@@ -209,4 +310,111 @@ class SimpleCellCipher:
             self._cached_dec[key_hash] = key
         else:
             key = dec
+        return key
+
+    def encrypt(self, message: bytes, target_cert: Certificate):
+        key, key_enc, signature = self._get_enc_secret(target_cert)
+        nonce = os.urandom(NONCE_LENGTH)
+        ct = nonce + key_enc + signature + _sym_enc(key, nonce, message)
+        return ct
+
+    def decrypt(self, message: bytes, origin_cert: Certificate):
+        nonce, key_enc, signature = (
+            message[:NONCE_LENGTH],
+            message[NONCE_LENGTH : NONCE_LENGTH + KEY_ENC_LENGTH],
+            message[NONCE_LENGTH + KEY_ENC_LENGTH : SIMPLE_HEADER_LENGTH],
+        )
+        key = self._get_dec_key(key_enc, signature, origin_cert)
         return _sym_dec(key, nonce, message[SIMPLE_HEADER_LENGTH:])
+
+    def _run_chunks(self, fn, args_list: list):
+        if self.max_workers <= 1 or len(args_list) <= 1:
+            for args in args_list:
+                fn(*args)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cell_cipher")
+        futures = [self._executor.submit(fn, *args) for args in args_list]
+        for f in futures:
+            f.result()
+
+    def encrypt_chunked(self, payload: Any, target_cert: Certificate) -> bytearray:
+        """Encrypt the payload in chunks with AES-GCM.
+
+        Each chunk is encrypted directly from the payload into the result, so the payload is not copied.
+        The chunk size and the size of the payload are authenticated with every chunk, so chunks can't be
+        dropped, reordered or truncated. Each payload is encrypted with a key derived from the session key
+        and a random salt, so nonces are never reused under the same key.
+
+        Args:
+            payload: bytes-like object, or list of bytes-like objects as created by FOBS with buffer_list
+            target_cert: certificate of the receiving cell
+
+        Returns: the encrypted payload
+
+        """
+        session_key, key_enc, signature = self._get_enc_secret(target_cert)
+        views = _to_byte_views(payload)
+        _check_chunk_count(-(-sum(len(v) for v in views) // self.chunk_size))
+        chunks = _split_chunks(views, self.chunk_size)
+        clear_len = sum(len(p) for chunk in chunks for p in chunk)
+
+        salt = os.urandom(GCM_KEY_SALT_LENGTH)
+        key = _gcm_message_key(session_key, salt)
+        params = struct.pack(GCM_PARAMS_FORMAT, salt, self.chunk_size, clear_len)
+        result = bytearray(GCM_HEADER_LENGTH + clear_len + len(chunks) * GCM_TAG_LENGTH)
+        result[:GCM_HEADER_LENGTH] = key_enc + signature + params
+
+        out = memoryview(result)
+        pos = GCM_HEADER_LENGTH
+        args_list = []
+        for i, chunk in enumerate(chunks):
+            end = pos + sum(len(p) for p in chunk) + GCM_TAG_LENGTH
+            args_list.append((key, _gcm_nonce(i), params, chunk, out[pos:end]))
+            pos = end
+        self._run_chunks(_gcm_enc_chunk, args_list)
+        return result
+
+    def decrypt_chunked(self, message: Any, origin_cert: Certificate) -> bytearray:
+        """Decrypt the payload encrypted by encrypt_chunked.
+
+        Args:
+            message: the encrypted payload
+            origin_cert: certificate of the sending cell
+
+        Returns: the decrypted payload
+
+        """
+        m = memoryview(message).cast("B")
+        if len(m) < GCM_HEADER_LENGTH:
+            raise ValueError(f"encrypted payload is too short ({len(m)} bytes)")
+        key_enc = m[:KEY_ENC_LENGTH]
+        signature = m[KEY_ENC_LENGTH : KEY_ENC_LENGTH + SIGNATURE_LENGTH]
+        params = bytes(m[KEY_ENC_LENGTH + SIGNATURE_LENGTH : GCM_HEADER_LENGTH])
+        salt, chunk_size, clear_len = struct.unpack(GCM_PARAMS_FORMAT, params)
+        if chunk_size <= 0:
+            raise ValueError(f"invalid chunk size {chunk_size} in encrypted payload")
+
+        num_chunks = max(1, -(-clear_len // chunk_size))
+        _check_chunk_count(num_chunks)
+        expected_len = GCM_HEADER_LENGTH + clear_len + num_chunks * GCM_TAG_LENGTH
+        if len(m) != expected_len:
+            raise ValueError(f"encrypted payload size {len(m)} does not match expected size {expected_len}")
+
+        key = _gcm_message_key(self._get_dec_key(key_enc, signature, origin_cert), salt)
+        result = bytearray(clear_len)
+        out = memoryview(result)
+        args_list = []
+        for i in range(num_chunks):
+            start = i * chunk_size
+            size = min(chunk_size, clear_len - start)
+            pos = GCM_HEADER_LENGTH + start + i * GCM_TAG_LENGTH
+            chunk = m[pos : pos + size + GCM_TAG_LENGTH]
+            args_list.append((key, _gcm_nonce(i), params, chunk, out[start : start + size]))
+
+        try:
+            self._run_chunks(_gcm_dec_chunk, args_list)
+        except InvalidTag:
+            raise ValueError("encrypted payload failed authentication")
+        return result
@@ -23,6 +23,7 @@ from typing import Dict, List, Tuple, Union
 from urllib.parse import urlparse
 
 from nvflare.apis.fl_constant import ConnectionSecurity
+from nvflare.fuel.f3.cellnet.cell_cipher import CipherVersion
 from nvflare.fuel.f3.cellnet.connector_manager import ConnectorManager
 from nvflare.fuel.f3.cellnet.credential_manager import CredentialManager
 from nvflare.fuel.f3.cellnet.defs import (
@@ -40,7 +41,7 @@ from nvflare.fuel.f3.cellnet.defs import (
 )
 from nvflare.fuel.f3.cellnet.fqcn import FQCN, FqcnInfo, same_family
 from nvflare.fuel.f3.cellnet.registry import Callback, Registry
-from nvflare.fuel.f3.cellnet.utils import decode_payload, encode_payload, format_log_message, make_reply
+from nvflare.fuel.f3.cellnet.utils import buffer_len, decode_payload, encode_payload, format_log_message, make_reply
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.communicator import Communicator, MessageReceiver
 from nvflare.fuel.f3.connection import Connection
@@ -50,6 +51,7 @@ from nvflare.fuel.f3.endpoint import Endpoint, EndpointMonitor, EndpointState
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.f3.mpm import MainProcessMonitor
 from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.utils.buffer_list import BufferList
 from nvflare.fuel.utils.fobs import FOBSContextKey
 from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.security.logging import secure_format_exception, secure_format_traceback
@@ -946,6 +948,30 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         self.logger.debug(f"{self.my_info.fqcn}: cell stopped!")
 
+    def unregister(self):
+        """
+        Remove the stopped cell and its stats pools from the process, so that a new cell of the same name can be
+        created in this process.
+
+        Returns:
+
+        """
+        if self.running:
+            raise RuntimeError(f"cannot unregister cell {self.my_info.fqcn} that is still running")
+
+        if self.ALL_CELLS.get(self.my_info.fqcn) is self:
+            self.ALL_CELLS.pop(self.my_info.fqcn)
+        for pool in [
+            self.msg_stats_pool,
+            self.req_cb_stats_pool,
+            self.msg_travel_stats_pool,
+            self.sent_msg_size_pool,
+            self.received_msg_size_pool,
+            self.sent_msg_counter_pool,
+            self.received_msg_counter_pool,
+        ]:
+            StatsPoolManager.delete_pool(pool.name)
+
     def register_request_cb(self, channel: str, topic: str, cb, *args, **kwargs):
         """
         Register a callback for handling request. The CB must follow request_cb_signature.
@@ -979,23 +1005,31 @@ class CoreCell(MessageReceiver, EndpointMonitor):
         if not target:
             raise RuntimeError("Message destination missing")
 
+        cipher_version = self.credential_manager.cipher_version
         if message.payload is None:
             message.payload = bytes(0)
-        elif isinstance(message.payload, memoryview) or isinstance(message.payload, bytearray):
-            message.payload = bytes(message.payload)
-        elif not isinstance(message.payload, bytes):
+        elif not isinstance(message.payload, (bytes, bytearray, memoryview, list)):
             raise RuntimeError(f"Payload type of {type(message.payload)} is not supported.")
-
-        payload_len = len(message.payload)
-        message.add_headers(
-            {
-                MessageHeaderKey.CLEAR_PAYLOAD_LEN: payload_len,
-                MessageHeaderKey.ENCRYPTED: True,
-            }
-        )
+        elif cipher_version == CipherVersion.CBC:
+            # the CBC cipher encrypts the payload as a whole
+            if isinstance(message.payload, list):
+                message.payload = bytes(BufferList(message.payload).flatten() or b"")
+            elif not isinstance(message.payload, bytes):
+                message.payload = bytes(message.payload)
+        # otherwise the payload, including a buffer list from FOBS, is encrypted chunk by chunk without a copy
+
+        payload_len = buffer_len(message.payload)
+        headers = {
+            MessageHeaderKey.CLEAR_PAYLOAD_LEN: payload_len,
+            MessageHeaderKey.ENCRYPTED: True,
+        }
+        if cipher_version != CipherVersion.CBC:
+            # receivers treat messages without the version as CBC, which is what earlier versions send
+            headers[MessageHeaderKey.CIPHER_VERSION] = cipher_version
+        message.add_headers(headers)
 
         target_cert = self.cert_ex.get_certificate(target)
-        message.payload = self.credential_manager.encrypt(target_cert, message.payload)
+        message.payload = self.credential_manager.encrypt(target_cert, message.payload, cipher_version)
         self.logger.debug(f"Payload ({payload_len} bytes) is encrypted ({len(message.payload)} bytes)")
 
     def decrypt_payload(self, message: Message):
@@ -1009,6 +1043,8 @@ class CoreCell(MessageReceiver, EndpointMonitor):
             return
 
         message.remove_header(MessageHeaderKey.ENCRYPTED)
+        cipher_version = message.get_header(MessageHeaderKey.CIPHER_VERSION, CipherVersion.CBC)
+        message.remove_header(MessageHeaderKey.CIPHER_VERSION)
 
         origin = message.get_header(MessageHeaderKey.ORIGIN)
         if not origin:
@@ -1016,7 +1052,7 @@ class CoreCell(MessageReceiver, EndpointMonitor):
 
         payload_len = message.get_header(MessageHeaderKey.CLEAR_PAYLOAD_LEN)
         origin_cert = self.cert_ex.get_certificate(origin)
-        message.payload = self.credential_manager.decrypt(origin_cert, message.payload)
+        message.payload = self.credential_manager.decrypt(origin_cert, message.payload, cipher_version)
         if len(message.payload) != payload_len:
             raise RuntimeError(f"Payload size changed after decryption {len(message.payload)} <> {payload_len}")
 
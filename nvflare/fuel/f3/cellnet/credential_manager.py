@@ -19,8 +19,9 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 from cryptography.x509 import Certificate
 
-from nvflare.fuel.f3.cellnet.cell_cipher import SimpleCellCipher
+from nvflare.fuel.f3.cellnet.cell_cipher import DEFAULT_GCM_CHUNK_SIZE, CipherVersion, SimpleCellCipher
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
 from nvflare.fuel.f3.endpoint import Endpoint
 from nvflare.fuel.f3.message import Message
@@ -44,6 +45,16 @@ class CredentialManager:
         self.cert_cache = {}
         self.lock = threading.Lock()
 
+        # Payloads are sent in the CBC format unless a chunk size is configured. Peers running earlier versions
+        # can't decrypt chunked payloads, so only configure it when all cells support it.
+        config = CommConfigurator()
+        chunk_size = config.get_secure_msg_chunk_size(0)
+        self.cipher_version = CipherVersion.CHUNKED_GCM if chunk_size > 0 else CipherVersion.CBC
+        self.cipher_args = {
+            "chunk_size": chunk_size if chunk_size > 0 else DEFAULT_GCM_CHUNK_SIZE,
+            "max_workers": config.get_secure_msg_cipher_workers(1),
+        }
+
         conn_props = self.local_endpoint.conn_props
         ca_cert_path = conn_props.get(DriverParams.CA_CERT)
         server_cert_path = conn_props.get(DriverParams.SERVER_CERT)
@@ -64,27 +75,39 @@ class CredentialManager:
             self.ca_cert = self.read_file(ca_cert_path)
             self.local_cert = self.read_file(local_cert_path)
             self.local_key = self.read_file(local_key_path)
-            self.cell_cipher = SimpleCellCipher(self.get_ca_cert(), self.get_local_key(), self.get_local_cert())
+            self.cell_cipher = SimpleCellCipher(
+                self.get_ca_cert(), self.get_local_key(), self.get_local_cert(), **self.cipher_args
+            )
 
         if not self.local_cert:
             log.debug("Certificate is not configured, secure message is not supported")
             self.cell_cipher = None
         else:
-            self.cell_cipher = SimpleCellCipher(self.get_ca_cert(), self.get_local_key(), self.get_local_cert())
+            self.cell_cipher = SimpleCellCipher(
+                self.get_ca_cert(), self.get_local_key(), self.get_local_cert(), **self.cipher_args
+            )
 
-    def encrypt(self, target_cert: bytes, payload: bytes) -> bytes:
+    def encrypt(self, target_cert: bytes, payload, cipher_version: int = CipherVersion.CBC):
 
         if not self.cell_cipher:
             raise RuntimeError("Secure message not supported, Cell not running in secure mode")
 
-        return self.cell_cipher.encrypt(payload, x509.load_pem_x509_certificate(target_cert))
+        cert = x509.load_pem_x509_certificate(target_cert)
+        if cipher_version == CipherVersion.CHUNKED_GCM:
+            return self.cell_cipher.encrypt_chunked(payload, cert)
+        return self.cell_cipher.encrypt(payload, cert)
 
-    def decrypt(self, origin_cert: bytes, cipher: bytes) -> bytes:
+    def decrypt(self, origin_cert: bytes, cipher, cipher_version: int = CipherVersion.CBC):
 
         if not self.cell_cipher:
             raise RuntimeError("Secure message not supported, Cell not running in secure mode")
 
-        return self.cell_cipher.decrypt(cipher, x509.load_pem_x509_certificate(origin_cert))
+        cert = x509.load_pem_x509_certificate(origin_cert)
+        if cipher_version == CipherVersion.CHUNKED_GCM:
+            return self.cell_cipher.decrypt_chunked(cipher, cert)
+        if cipher_version != CipherVersion.CBC:
+            raise RuntimeError(f"Unsupported cipher version {cipher_version}")
+        return self.cell_cipher.decrypt(cipher, cert)
 
     def get_certificate(self, fqcn: str) -> bytes:
         if not self.cell_cipher:
@@ -44,6 +44,9 @@ class MessageHeaderKey:
     PAYLOAD_LEN = CELLNET_PREFIX + "payload_len"
     CLEAR_PAYLOAD_LEN = CELLNET_PREFIX + "clear_payload_len"
     ENCRYPTED = CELLNET_PREFIX + "encrypted"
+    CIPHER_VERSION = CELLNET_PREFIX + "cipher_version"
+    # FQCN of the cell that started a broadcast which was forwarded to the receiver by a relay cell
+    BROADCAST_ORIGIN = CELLNET_PREFIX + "broadcast_origin"
     OPTIONAL = CELLNET_PREFIX + "optional"
     MSG_ROOT_ID = CELLNET_PREFIX + "msg_root_id"
     MSG_ROOT_TTL = CELLNET_PREFIX + "msg_root_ttl"
@@ -167,6 +170,7 @@ class CellChannel:
     RETURN_ONLY = "return_only"
     EDGE_REQUEST = "edge_request"
     HCI = "hci_channel"
+    BROADCAST_RELAY = "broadcast_relay"
 
 
 class CellChannelTopic:
@@ -45,6 +45,11 @@ class VarName:
     SFM_SEND_STALL_TIMEOUT = "sfm_send_stall_timeout"
     SFM_CLOSE_STALLED_CONNECTION = "sfm_close_stalled_connection"
     SFM_SEND_STALL_CONSECUTIVE_CHECKS = "sfm_send_stall_consecutive_checks"
+    DOWNLOAD_WINDOW_SIZE = "download_window_size"
+    SECURE_MSG_CHUNK_SIZE = "secure_msg_chunk_size"
+    SECURE_MSG_CIPHER_WORKERS = "secure_msg_cipher_workers"
+    BROADCAST_MAX_WORKERS = "broadcast_max_workers"
+    BROADCAST_RELAY_FANOUT = "broadcast_relay_fanout"
 
 
 class CommConfigurator:
@@ -138,6 +143,21 @@ class CommConfigurator:
     def get_sfm_send_stall_consecutive_checks(self, default=3):
         return ConfigService.get_int_var(VarName.SFM_SEND_STALL_CONSECUTIVE_CHECKS, self.config, default=default)
 
+    def get_download_window_size(self, default=1):
+        return ConfigService.get_int_var(VarName.DOWNLOAD_WINDOW_SIZE, self.config, default=default)
+
+    def get_secure_msg_chunk_size(self, default):
+        return ConfigService.get_int_var(VarName.SECURE_MSG_CHUNK_SIZE, self.config, default=default)
+
+    def get_secure_msg_cipher_workers(self, default=1):
+        return ConfigService.get_int_var(VarName.SECURE_MSG_CIPHER_WORKERS, self.config, default=default)
+
+    def get_broadcast_max_workers(self, default):
+        return ConfigService.get_int_var(VarName.BROADCAST_MAX_WORKERS, self.config, default=default)
+
+    def get_broadcast_relay_fanout(self, default=0):
+        return ConfigService.get_int_var(VarName.BROADCAST_RELAY_FANOUT, self.config, default=default)
+
     def get_int_var(self, name: str, default=None):
         return ConfigService.get_int_var(name, self.config, default=default)
 
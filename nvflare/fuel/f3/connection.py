@@ -15,10 +15,11 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Union
+from typing import List, Union
 
 from nvflare.fuel.f3.drivers.connector_info import ConnectorInfo, Mode
 from nvflare.fuel.f3.drivers.driver_params import DriverParams
+from nvflare.fuel.utils.buffer_list import BufferList
 
 log = logging.getLogger(__name__)
 lock = threading.Lock()
@@ -93,6 +94,21 @@ class Connection(ABC):
         """
         pass
 
+    def send_frame_segments(self, segments: List[BytesAlike]):
+        """Send a SFM frame made of multiple buffers through the connection.
+
+        The segments are sent back-to-back as one frame. Drivers that support scatter/gather
+        IO should override this to avoid concatenating the segments. The default
+        implementation flattens the segments and calls send_frame().
+
+        Args:
+            segments: The buffers that make up the frame, in order
+
+        Raises:
+            CommError: If any error happens while sending the frame
+        """
+        self.send_frame(BufferList(segments).flatten())
+
     def register_frame_receiver(self, receiver: FrameReceiver):
         """Register frame receiver
 
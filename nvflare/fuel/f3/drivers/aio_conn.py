@@ -11,9 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import concurrent.futures
 import logging
 from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from typing import List
 
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.comm_error import CommError
 from nvflare.fuel.f3.connection import BytesAlike, Connection
 from nvflare.fuel.f3.drivers.aio_context import AioContext
@@ -43,6 +47,7 @@ class AioConnection(Connection):
         self.closing = False
         self.secure = secure
         self.conn_props = self._get_aio_properties()
+        self.send_timeout = CommConfigurator().get_streaming_send_timeout(30.0)
 
     def get_conn_properties(self) -> dict:
         return self.conn_props
@@ -62,6 +67,32 @@ class AioConnection(Connection):
         except Exception as ex:
             log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
 
+    def send_frame_segments(self, segments: List[BytesAlike]):
+        # The segments may reference buffers that the caller reuses once this returns (e.g. the chunk buffer of
+        # ByteStreamer), so they must be written before returning.
+        if self._in_aio_loop():
+            # waiting for the write in the loop thread would block the loop: send a copy instead
+            self.send_frame(b"".join(segments))
+            return
+
+        try:
+            future = self.aio_ctx.run_coro(self._async_send_frame_segments(segments))
+        except Exception as ex:
+            log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
+            return
+
+        try:
+            future.result(timeout=self.send_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            if not self.closing:
+                # Part of the frame may have been written already.
+                # Close the connection to avoid frame-boundary desync on subsequent sends.
+                self.close()
+                raise CommError(CommError.TIMEOUT, f"send_frame timeout after {self.send_timeout} seconds on {self}")
+        except Exception as ex:
+            log.error(f"Error calling send coroutine for connection {self}: {secure_format_exception(ex)}")
+
     async def read_loop(self):
         try:
             while not self.closing:
@@ -79,6 +110,12 @@ class AioConnection(Connection):
 
     # Internal methods
 
+    def _in_aio_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.aio_ctx.get_event_loop()
+        except RuntimeError:
+            return False
+
     async def _async_send_frame(self, frame: BytesAlike):
         try:
             self.writer.write(frame)
@@ -87,6 +124,14 @@ class AioConnection(Connection):
             if not self.closing:
                 log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
 
+    async def _async_send_frame_segments(self, segments: List[BytesAlike]):
+        try:
+            self.writer.writelines(segments)
+            await self.writer.drain()
+        except Exception as ex:
+            if not self.closing:
+                log.error(f"Error sending frame for connection {self}: {secure_format_exception(ex)}")
+
     async def _async_read_frame(self):
 
         prefix_buf = await self.reader.readexactly(PREFIX_LEN)
@@ -17,7 +17,7 @@ import select
 import socket
 import time
 from socketserver import BaseRequestHandler
-from typing import Any, Union
+from typing import Any, List, Union
 
 from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.comm_error import CommError
@@ -31,6 +31,9 @@ from nvflare.security.logging import secure_format_exception
 
 log = logging.getLogger(__name__)
 
+# Max number of buffers passed to one sendmsg() call, IOV_MAX on Linux
+MAX_IOV = 1024
+
 
 class SocketConnection(Connection):
     def __init__(self, sock: Any, connector: ConnectorInfo, secure: bool = False):
@@ -56,8 +59,14 @@ class SocketConnection(Connection):
             self.sock.close()
 
     def send_frame(self, frame: BytesAlike):
+        self._send(self._send_with_timeout, frame)
+
+    def send_frame_segments(self, segments: List[BytesAlike]):
+        self._send(self._send_segments_with_timeout, segments)
+
+    def _send(self, send_func, data):
         try:
-            self._send_with_timeout(frame, self.send_timeout)
+            send_func(data, self.send_timeout)
         except CommError as error:
             if not self.closing:
                 # A send timeout may occur after partial bytes are already written to the stream.
@@ -119,6 +128,50 @@ class SocketConnection(Connection):
 
             view = view[sent:]
 
+    def _send_segments_with_timeout(self, segments: List[BytesAlike], timeout_sec: float):
+        """Send all segments as one frame without concatenating them.
+
+        sendmsg() is used to gather the segments in one system call. SSL sockets don't support
+        sendmsg() so the segments are sent one after another.
+        """
+        views = [self._to_byte_view(seg) for seg in segments]
+        views = [v for v in views if v.nbytes]
+        vectored = not self.secure and hasattr(self.sock, "sendmsg")
+
+        deadline = time.monotonic() + timeout_sec
+        index = 0
+        while index < len(views):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+
+            _, writable, _ = select.select([], [self.sock], [], remaining)
+            if not writable:
+                raise CommError(CommError.TIMEOUT, f"send_frame timeout after {timeout_sec} seconds on {self.name}")
+
+            if vectored:
+                sent = self.sock.sendmsg(views[index : index + MAX_IOV])
+            else:
+                sent = self.sock.send(views[index])
+            if sent <= 0:
+                raise CommError(CommError.CLOSED, f"Connection {self.name} is closed while sending")
+
+            # Skip fully sent segments and trim the partially sent one
+            while sent:
+                size = views[index].nbytes
+                if sent < size:
+                    views[index] = views[index][sent:]
+                    break
+                sent -= size
+                index += 1
+
+    @staticmethod
+    def _to_byte_view(buf: BytesAlike) -> memoryview:
+        view = buf if isinstance(buf, memoryview) else memoryview(buf)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        return view
+
     def read_loop(self):
         try:
             self.read_frame_loop()
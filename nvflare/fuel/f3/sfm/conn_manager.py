@@ -203,14 +203,11 @@ class ConnManager(ConnMonitor):
             CommError: If any error happens while sending the data
         """
 
-        # Flatten buffer list so drivers don't have to deal with it
-        if isinstance(payload, list):
-            flat_payload = BufferList(payload).flatten()
-        else:
-            flat_payload = payload
-
         if endpoint.name == self.local_endpoint.name:
-            self.send_loopback_message(endpoint, app_id, headers, flat_payload)
+            # Flatten buffer list so the local receiver gets a single buffer
+            if isinstance(payload, list):
+                payload = BufferList(payload).flatten()
+            self.send_loopback_message(endpoint, app_id, headers, payload)
             return
 
         sfm_endpoint = self.sfm_endpoints.get(endpoint.name)
@@ -232,7 +229,8 @@ class ConnManager(ConnMonitor):
         # TODO: If multiple connections, should retry a diff connection on errors
         start = time.perf_counter()
 
-        sfm_conn.send_data(app_id, stream_id, headers, flat_payload)
+        # Buffer list is passed down as is, SfmConnection sends the segments without concatenating them
+        sfm_conn.send_data(app_id, stream_id, headers, payload)
 
         self.send_frame_stats.record_value(
             category=sfm_conn.conn.connector.driver.get_name(), value=time.perf_counter() - start
@@ -26,6 +26,9 @@ from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
 
 log = logging.getLogger(__name__)
 
+# Payloads up to this size are copied into the frame buffer, larger ones are sent as segments
+VECTORED_SEND_THRESHOLD = 64 * 1024
+
 
 class SfmConnection:
     """A wrapper of driver connection.
@@ -122,27 +125,26 @@ class SfmConnection:
         headers_bytes = self.headers_to_bytes(headers)
         header_len = len(headers_bytes) if headers_bytes else 0
 
-        length = PREFIX_LEN + header_len
-
-        if payload:
-            length += len(payload)
+        segments = self.payload_to_segments(payload)
+        payload_len = sum(self.segment_len(seg) for seg in segments)
 
-        prefix.length = length
+        prefix.length = PREFIX_LEN + header_len + payload_len
         prefix.header_len = header_len
         prefix.sequence = self.next_sequence()
 
-        buffer: bytearray = bytearray(length)
-
-        offset = 0
-        prefix.to_buffer(buffer, offset)
-        offset += PREFIX_LEN
+        buffer: bytearray = bytearray(PREFIX_LEN + header_len)
+        prefix.to_buffer(buffer, 0)
 
         if headers_bytes:
-            buffer[offset:] = headers_bytes
-            offset += header_len
+            buffer[PREFIX_LEN:] = headers_bytes
 
-        if payload:
-            buffer[offset:] = payload
+        # Small payloads are cheaper to copy than to send as separate segments
+        if payload_len <= VECTORED_SEND_THRESHOLD:
+            for seg in segments:
+                buffer += seg
+            segments = None
+        else:
+            segments.insert(0, buffer)
 
         log.debug(f"Sending frame: {prefix} on {self.conn}")
         # Only one thread can send data on a connection. Otherwise, the frames may interleave.
@@ -150,7 +152,10 @@ class SfmConnection:
             with self.send_state_lock:
                 self.send_started_at = time.monotonic()
             try:
-                self.conn.send_frame(buffer)
+                if segments:
+                    self.conn.send_frame_segments(segments)
+                else:
+                    self.conn.send_frame(buffer)
             finally:
                 with self.send_state_lock:
                     self.send_started_at = 0.0
@@ -161,6 +166,21 @@ class SfmConnection:
                 return 0.0
             return time.monotonic() - self.send_started_at
 
+    @staticmethod
+    def payload_to_segments(payload: Optional[BytesAlike]) -> list:
+        if isinstance(payload, list):
+            return [seg for seg in payload if SfmConnection.segment_len(seg)]
+        elif payload:
+            return [payload]
+        else:
+            return []
+
+    @staticmethod
+    def segment_len(segment: BytesAlike) -> int:
+        if isinstance(segment, memoryview):
+            return segment.nbytes
+        return len(segment)
+
     @staticmethod
     def headers_to_bytes(headers: Optional[dict]) -> Optional[bytes]:
         if headers:
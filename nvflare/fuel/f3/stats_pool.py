@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import csv
 import json
+import math
 import sys
 import threading
 import time
@@ -29,6 +31,14 @@ _KEY_UNIT = "unit"
 _KEY_MARKS = "marks"
 _KEY_COUNTER_NAMES = "counter_names"
 _KEY_CAT_DATA = "cat_data"
+_KEY_SKETCHES = "sketches"
+_KEY_ACCURACY = "accuracy"
+_KEY_POS_BUCKETS = "pos_buckets"
+_KEY_NEG_BUCKETS = "neg_buckets"
+_KEY_ZERO_COUNT = "zero_count"
+
+# values with smaller magnitude are counted as zero by QuantileSketch
+_MIN_SKETCH_VALUE = 1e-12
 
 
 class StatsMode:
@@ -38,9 +48,20 @@ class StatsMode:
     AVERAGE = "avg"
     MIN = "min"
     MAX = "max"
+    QUANTILE = "quantile"
+
 
+VALID_HIST_MODES = [
+    StatsMode.COUNT,
+    StatsMode.PERCENT,
+    StatsMode.AVERAGE,
+    StatsMode.MAX,
+    StatsMode.MIN,
+    StatsMode.QUANTILE,
+]
 
-VALID_HIST_MODES = [StatsMode.COUNT, StatsMode.PERCENT, StatsMode.AVERAGE, StatsMode.MAX, StatsMode.MIN]
+# quantiles shown in the QUANTILE mode of HistPool tables
+REPORTED_QUANTILES = (0.5, 0.9, 0.99, 0.999)
 
 
 def format_value(v: float, n=3):
@@ -50,6 +71,11 @@ def format_value(v: float, n=3):
     return fmt.format(v)
 
 
+def _quantile_name(q: float) -> str:
+    # 0.5 => p50, 0.99 => p99, 0.999 => p999
+    return "p" + f"{q:.6f}"[2:].rstrip("0").ljust(2, "0")
+
+
 class _Bin:
     def __init__(self, count=0, total_value=0.0, min_value=None, max_value=None):
         self.count = count
@@ -109,6 +135,242 @@ class _Bin:
         return b
 
 
+class QuantileSketch:
+    def __init__(self, relative_accuracy: float = 0.01):
+        """A mergeable quantile sketch with relative error guarantee (DDSketch).
+
+        Values are counted in logarithmically sized buckets, so that any quantile returned is within
+        relative_accuracy of the true value. Sketches with the same accuracy can be merged exactly.
+
+        Args:
+            relative_accuracy: relative accuracy of the returned quantiles. Must be in (0, 1).
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1) but got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self.gamma)
+        self.pos_buckets = {}  # bucket key => count of positive values
+        self.neg_buckets = {}  # bucket key => count of negative values, keyed by magnitude
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        if value > _MIN_SKETCH_VALUE:
+            if value == math.inf:
+                return
+            key = math.ceil(math.log(value) * self._inv_log_gamma)
+            buckets = self.pos_buckets
+            buckets[key] = buckets.get(key, 0) + 1
+        elif value < -_MIN_SKETCH_VALUE:
+            if value == -math.inf:
+                return
+            key = math.ceil(math.log(-value) * self._inv_log_gamma)
+            self.neg_buckets[key] = self.neg_buckets.get(key, 0) + 1
+        elif value == value:
+            self.zero_count += 1
+        else:
+            # NaN
+            return
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch"):
+        if other.gamma != self.gamma:
+            raise ValueError(
+                f"cannot merge sketch of accuracy {other.relative_accuracy} into sketch of accuracy "
+                f"{self.relative_accuracy}"
+            )
+        for key, c in list(other.pos_buckets.items()):
+            self.pos_buckets[key] = self.pos_buckets.get(key, 0) + c
+        for key, c in list(other.neg_buckets.items()):
+            self.neg_buckets[key] = self.neg_buckets.get(key, 0) + c
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, key: int) -> float:
+        # the value that is within relative_accuracy of every value in the bucket
+        return 2.0 * self.gamma**key / (self.gamma + 1.0)
+
+    def get_quantile(self, q: float):
+        """Get the value at the specified quantile.
+
+        Args:
+            q: the quantile, in [0, 1]
+
+        Returns: the estimated value, or None if no value has been added.
+
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"quantile must be in [0, 1] but got {q}")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.neg_buckets.keys(), reverse=True):
+            seen += self.neg_buckets[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        key = None
+        for key in sorted(self.pos_buckets.keys()):
+            seen += self.pos_buckets[key]
+            if seen > rank:
+                break
+        return self._bucket_value(key)
+
+    def to_dict(self) -> dict:
+        return {
+            _KEY_ACCURACY: self.relative_accuracy,
+            _KEY_POS_BUCKETS: [[k, c] for k, c in sorted(self.pos_buckets.items())],
+            _KEY_NEG_BUCKETS: [[k, c] for k, c in sorted(self.neg_buckets.items())],
+            _KEY_ZERO_COUNT: self.zero_count,
+        }
+
+    @staticmethod
+    def from_dict(d: dict):
+        if not isinstance(d, dict):
+            raise ValueError(f"d must be dict but got {type(d)}")
+        s = QuantileSketch(d.get(_KEY_ACCURACY, 0.01))
+        s.pos_buckets = {int(k): c for k, c in d.get(_KEY_POS_BUCKETS, [])}
+        s.neg_buckets = {int(k): c for k, c in d.get(_KEY_NEG_BUCKETS, [])}
+        s.zero_count = d.get(_KEY_ZERO_COUNT, 0)
+        s.count = s.zero_count + sum(s.pos_buckets.values()) + sum(s.neg_buckets.values())
+        return s
+
+
+class _HistData:
+    """Histogram data of one category, kept in flat lists indexed by bin."""
+
+    __slots__ = ["counts", "totals", "mins", "maxs", "sketch"]
+
+    def __init__(self, num_bins: int, relative_accuracy: float):
+        self.counts = [0] * num_bins
+        self.totals = [0.0] * num_bins
+        self.mins = [math.inf] * num_bins
+        self.maxs = [-math.inf] * num_bins
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def record_value(self, index: int, value: float):
+        self.counts[index] += 1
+        self.totals[index] += value
+        mins = self.mins
+        if value < mins[index]:
+            mins[index] = value
+        maxs = self.maxs
+        if value > maxs[index]:
+            maxs[index] = value
+        self.sketch.add(value)
+
+    def merge(self, other: "_HistData"):
+        for i in range(len(self.counts)):
+            if other.counts[i]:
+                self.counts[i] += other.counts[i]
+                self.totals[i] += other.totals[i]
+                self.mins[i] = min(self.mins[i], other.mins[i])
+                self.maxs[i] = max(self.maxs[i], other.maxs[i])
+        self.sketch.merge(other.sketch)
+
+    def get_bin(self, index: int):
+        count = self.counts[index]
+        if not count:
+            return None
+        return _Bin(count=count, total_value=self.totals[index], min_value=self.mins[index], max_value=self.maxs[index])
+
+    def set_bin(self, index: int, b: _Bin):
+        self.counts[index] = b.count
+        self.totals[index] = b.total
+        self.mins[index] = b.min if b.min is not None else math.inf
+        self.maxs[index] = b.max if b.max is not None else -math.inf
+
+
+class _CounterData:
+    """Counters of one category."""
+
+    __slots__ = ["counters"]
+
+    def __init__(self):
+        self.counters = {}  # counter_name => int
+
+    def merge(self, other: "_CounterData"):
+        for cn, v in list(other.counters.items()):
+            self.counters[cn] = self.counters.get(cn, 0) + v
+
+
+class _ShardedData:
+    def __init__(self, new_data):
+        """Per-category data of a pool, sharded by recording thread.
+
+        Each thread records into its own shards without taking any lock, and the shards are merged when the
+        data is read. Reads may miss an update that is still in progress, which is fine for statistics.
+        The shards of threads that have ended are folded into a common shard when the data is read, and when a
+        new thread starts recording, so the number of shards is bounded by the number of live threads.
+
+        Args:
+            new_data: function to create an empty data object for one category. Data objects must implement
+                merge(other).
+        """
+        self.new_data = new_data
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.thread_shards = []  # list of (thread, dict of category => data)
+        self.retired = {}  # category => data merged from the shards of ended threads
+
+    def get(self, category: str):
+        """Get the calling thread's data of the category."""
+        shards = getattr(self.local, "shards", None)
+        if shards is None:
+            shards = {}
+            self.local.shards = shards
+            with self.lock:
+                self._retire_ended_threads()
+                self.thread_shards.append((threading.current_thread(), shards))
+        data = shards.get(category)
+        if data is None:
+            data = self.new_data()
+            shards[category] = data
+        return data
+
+    def _fold(self, target: dict, shards: dict):
+        for cat, data in list(shards.items()):
+            t = target.get(cat)
+            if t is None:
+                t = self.new_data()
+                target[cat] = t
+            t.merge(data)
+
+    def _retire_ended_threads(self):
+        # must be called with the lock held
+        live = []
+        for thread, shards in self.thread_shards:
+            if thread.is_alive():
+                live.append((thread, shards))
+            else:
+                self._fold(self.retired, shards)
+        self.thread_shards = live
+
+    def merged(self) -> dict:
+        """Merge the data of all threads.
+
+        Returns: dict of category => data
+        """
+        with self.lock:
+            self._retire_ended_threads()
+            result = {}
+            self._fold(result, self.retired)
+            for _, shards in self.thread_shards:
+                self._fold(result, shards)
+            return result
+
+    def set_retired(self, category: str, data):
+        with self.lock:
+            self.retired[category] = data
+
+
 class StatsPool:
     def __init__(self, name: str, description: str):
         self.name = name
@@ -134,17 +396,37 @@ class RecordWriter:
 
 
 class HistPool(StatsPool):
-    def __init__(self, name: str, description: str, marks: Union[List[float], Tuple], unit: str, record_writer=None):
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        marks: Union[List[float], Tuple],
+        unit: str,
+        record_writer=None,
+        relative_accuracy: float = 0.01,
+    ):
+        """A pool of histograms of values, one histogram per category.
+
+        Besides the count, total, min and max of each bin, a quantile sketch is kept for each category
+        so that tail values (e.g. p99 latency) can be reported.
+
+        Args:
+            name: name of the pool
+            description: description of the pool
+            marks: increasing bin boundaries
+            unit: unit of the values
+            record_writer: if specified, every recorded value is also written to it
+            relative_accuracy: relative accuracy of the reported quantiles
+        """
         if record_writer:
             if not isinstance(record_writer, RecordWriter):
                 raise TypeError(f"record_writer must be RecordWriter but got {type(record_writer)}")
 
         StatsPool.__init__(self, name, description)
-        self.update_lock = threading.Lock()
         self.unit = unit
         self.marks = marks
         self.record_writer = record_writer  # used for writing raw records
-        self.cat_bins = {}  # category name => list of bins
+        self.relative_accuracy = relative_accuracy
 
         if not marks:
             raise ValueError("marks not specified")
@@ -166,100 +448,132 @@ class HistPool(StatsPool):
         self.ranges.append((marks[-1], m))
         self.range_names.append(f">={marks[-1]}")
 
-    def record_value(self, category: str, value: float):
-        with self.update_lock:
-            bins = self.cat_bins.get(category)
-            if bins is None:
-                bins = [None for _ in range(len(self.ranges))]
-                self.cat_bins[category] = bins
-
-            for i in range(len(self.ranges)):
-                r = self.ranges[i]
-                if r[0] <= value < r[1]:
-                    b = bins[i]
-                    if not b:
-                        b = _Bin()
-                        bins[i] = b
-                    b.record_value(value)
+        self._bisect_marks = list(marks)
+        num_bins = len(self.ranges)
+        QuantileSketch(relative_accuracy)  # validate the accuracy early
+        self.cat_data = _ShardedData(lambda: _HistData(num_bins, relative_accuracy))
 
-            if self.record_writer:
-                self.record_writer.write(pool_name=self.name, category=category, value=value, report_time=time.time())
+    def record_value(self, category: str, value: float):
+        if -sys.float_info.max < value < sys.float_info.max:
+            index = bisect.bisect_right(self._bisect_marks, value)
+            self.cat_data.get(category).record_value(index, value)
+
+        if self.record_writer:
+            self.record_writer.write(pool_name=self.name, category=category, value=value, report_time=time.time())
+
+    def get_quantile(self, category: str, q: float):
+        """Get the value at the specified quantile of the category.
+
+        Args:
+            category: the category
+            q: the quantile, in [0, 1]
+
+        Returns: the estimated value, or None if the category has no values.
+
+        """
+        data = self.cat_data.merged().get(category)
+        if not data:
+            return None
+        return data.sketch.get_quantile(q)
+
+    def _get_quantile_table(self, cat_data: dict):
+        headers = ["category", "count", "min"]
+        headers.extend(_quantile_name(q) for q in REPORTED_QUANTILES)
+        headers.append("max")
+        rows = []
+        for cat_name in sorted(cat_data.keys()):
+            data = cat_data[cat_name]
+            count = sum(data.counts)
+            r = [cat_name, str(count)]
+            if count:
+                r.append(format_value(min(data.mins)))
+                r.extend(format_value(data.sketch.get_quantile(q)) for q in REPORTED_QUANTILES)
+                r.append(format_value(max(data.maxs)))
+            else:
+                r.extend([""] * (len(headers) - 2))
+            rows.append(r)
+        return headers, rows
 
     def get_table(self, mode=StatsMode.COUNT):
-        with self.update_lock:
-            headers = ["category"]
-            has_values = [False for _ in range(len(self.ranges))]
+        cat_data = self.cat_data.merged()
+        if mode == StatsMode.QUANTILE:
+            return self._get_quantile_table(cat_data)
 
-            # determine bins that have values in any category
-            for _, bins in self.cat_bins.items():
-                for i in range(len(self.ranges)):
-                    if bins[i]:
-                        has_values[i] = True
+        headers = ["category"]
+        has_values = [False for _ in range(len(self.ranges))]
 
+        # determine bins that have values in any category
+        for _, data in cat_data.items():
             for i in range(len(self.ranges)):
-                if has_values[i]:
-                    headers.append(self.range_names[i])
+                if data.counts[i]:
+                    has_values[i] = True
 
-            headers.append("overall")
+        for i in range(len(self.ranges)):
+            if has_values[i]:
+                headers.append(self.range_names[i])
 
-            rows = []
-            for cat_name in sorted(self.cat_bins.keys()):
-                bins = self.cat_bins[cat_name]
-                total_count = 0
-                total_value = 0.0
-                overall_min = None
-                overall_max = None
-
-                for b in bins:
-                    if b:
-                        total_count += b.count
-                        total_value += b.total
-                        if b.max is not None:
-                            if overall_max is None or overall_max < b.max:
-                                overall_max = b.max
-
-                        if b.min is not None:
-                            if overall_min is None or overall_min > b.min:
-                                overall_min = b.min
-
-                r = [cat_name]
-                for i in range(len(bins)):
-                    if not has_values[i]:
-                        continue
-
-                    b = bins[i]
-                    if not b:
-                        r.append("")
-                    else:
-                        r.append(b.get_content(mode, total_count))
+        headers.append("overall")
 
-                # compute overall values
-                overall_bin = _Bin(
-                    count=total_count, total_value=total_value, max_value=overall_max, min_value=overall_min
-                )
-                r.append(overall_bin.get_content(mode, total_count))
+        rows = []
+        for cat_name in sorted(cat_data.keys()):
+            data = cat_data[cat_name]
+            bins = [data.get_bin(i) for i in range(len(self.ranges))]
+            total_count = 0
+            total_value = 0.0
+            overall_min = None
+            overall_max = None
 
-                rows.append(r)
-            return headers, rows
+            for b in bins:
+                if b:
+                    total_count += b.count
+                    total_value += b.total
+                    if b.max is not None:
+                        if overall_max is None or overall_max < b.max:
+                            overall_max = b.max
+
+                    if b.min is not None:
+                        if overall_min is None or overall_min > b.min:
+                            overall_min = b.min
+
+            r = [cat_name]
+            for i in range(len(bins)):
+                if not has_values[i]:
+                    continue
+
+                b = bins[i]
+                if not b:
+                    r.append("")
+                else:
+                    r.append(b.get_content(mode, total_count))
+
+            # compute overall values
+            overall_bin = _Bin(count=total_count, total_value=total_value, max_value=overall_max, min_value=overall_min)
+            r.append(overall_bin.get_content(mode, total_count))
+
+            rows.append(r)
+        return headers, rows
 
     def to_dict(self):
-        with self.update_lock:
-            cat_bins = {}
-            for cat, bins in self.cat_bins.items():
-                exp_bins = []
-                for b in bins:
-                    if not b:
-                        exp_bins.append("")
-                    else:
-                        exp_bins.append(b.to_dict())
-                cat_bins[cat] = exp_bins
-            return {
-                _KEY_NAME: self.name,
-                _KEY_DESC: self.description,
-                _KEY_MARKS: list(self.marks),
-                _KEY_UNIT: self.unit,
-                _KEY_CAT_DATA: cat_bins,
-            }
+        cat_bins = {}
+        sketches = {}
+        for cat, data in self.cat_data.merged().items():
+            exp_bins = []
+            for i in range(len(self.ranges)):
+                b = data.get_bin(i)
+                if not b:
+                    exp_bins.append("")
+                else:
+                    exp_bins.append(b.to_dict())
+            cat_bins[cat] = exp_bins
+            sketches[cat] = data.sketch.to_dict()
+        return {
+            _KEY_NAME: self.name,
+            _KEY_DESC: self.description,
+            _KEY_MARKS: list(self.marks),
+            _KEY_UNIT: self.unit,
+            _KEY_CAT_DATA: cat_bins,
+            _KEY_SKETCHES: sketches,
+        }
 
     @staticmethod
     def from_dict(d: dict):
@@ -273,15 +587,18 @@ class HistPool(StatsPool):
         if not cat_bins:
             return p
 
+        # dicts created before quantile sketches were added have no sketches
+        sketches = d.get(_KEY_SKETCHES) or {}
         for cat, bins in cat_bins.items():
-            in_bins = []
-            for b in bins:
-                if not b:
-                    in_bins.append(None)
-                else:
+            data = p.cat_data.new_data()
+            for i, b in enumerate(bins):
+                if b:
                     assert isinstance(b, dict)
-                    in_bins.append(_Bin.from_dict(b))
-            p.cat_bins[cat] = in_bins
+                    data.set_bin(i, _Bin.from_dict(b))
+            sketch = sketches.get(cat)
+            if sketch:
+                data.sketch = QuantileSketch.from_dict(sketch)
+            p.cat_data.set_retired(cat, data)
         return p
 
 
@@ -291,55 +608,62 @@ class CounterPool(StatsPool):
             raise ValueError("counter_names cannot be empty")
         StatsPool.__init__(self, name, description)
         self.counter_names = counter_names
-        self.cat_counters = {}  # dict of cat_name => counter dict (counter_name => int)
+        self._known_counter_names = set(counter_names) if counter_names else set()
+        self.cat_data = _ShardedData(_CounterData)
         self.dynamic_counter_name = dynamic_counter_name
         self.update_lock = threading.Lock()
 
     def increment(self, category: str, counter_name: str, amount=1):
-        with self.update_lock:
-            if counter_name not in self.counter_names:
-                if self.dynamic_counter_name:
-                    self.counter_names.append(counter_name)
-                else:
-                    raise ValueError(f"'{counter_name}' is not defined in pool '{self.name}'")
+        if counter_name not in self._known_counter_names:
+            with self.update_lock:
+                if counter_name not in self._known_counter_names:
+                    if self.dynamic_counter_name:
+                        self.counter_names.append(counter_name)
+                        self._known_counter_names.add(counter_name)
+                    else:
+                        raise ValueError(f"'{counter_name}' is not defined in pool '{self.name}'")
 
-            counters = self.cat_counters.get(category)
-            if not counters:
-                counters = {}
-                self.cat_counters[category] = counters
-            c = counters.get(counter_name, 0)
-            c += amount
-            counters[counter_name] = c
+        counters = self.cat_data.get(category).counters
+        counters[counter_name] = counters.get(counter_name, 0) + amount
+
+    @property
+    def cat_counters(self) -> dict:
+        """Counters of all categories: dict of cat_name => counter dict (counter_name => int)"""
+        return {cat: data.counters for cat, data in self.cat_data.merged().items()}
 
     def get_table(self, mode=""):
+        cat_counters = self.cat_counters
         with self.update_lock:
-            headers = ["category"]
-            eff_counter_names = []
-            for cn in self.counter_names:
-                for _, counters in self.cat_counters.items():
-                    v = counters.get(cn, 0)
-                    if v > 0:
-                        eff_counter_names.append(cn)
-                        break
-
-            headers.extend(eff_counter_names)
-            rows = []
-            for cat_name in sorted(self.cat_counters.keys()):
-                counters = self.cat_counters[cat_name]
-                r = [cat_name]
-                for cn in eff_counter_names:
-                    value = counters.get(cn, 0)
-                    r.append(str(value))
-                rows.append(r)
-            return headers, rows
+            counter_names = list(self.counter_names)
+
+        headers = ["category"]
+        eff_counter_names = []
+        for cn in counter_names:
+            for _, counters in cat_counters.items():
+                v = counters.get(cn, 0)
+                if v > 0:
+                    eff_counter_names.append(cn)
+                    break
+
+        headers.extend(eff_counter_names)
+        rows = []
+        for cat_name in sorted(cat_counters.keys()):
+            counters = cat_counters[cat_name]
+            r = [cat_name]
+            for cn in eff_counter_names:
+                value = counters.get(cn, 0)
+                r.append(str(value))
+            rows.append(r)
+        return headers, rows
 
     def to_dict(self):
+        cat_counters = self.cat_counters
         with self.update_lock:
             return {
                 _KEY_NAME: self.name,
                 _KEY_DESC: self.description,
                 _KEY_COUNTER_NAMES: list(self.counter_names),
-                _KEY_CAT_DATA: self.cat_counters,
+                _KEY_CAT_DATA: cat_counters,
             }
 
     @staticmethod
@@ -347,7 +671,10 @@ class CounterPool(StatsPool):
         p = CounterPool(
             name=d.get(_KEY_NAME, ""), description=d.get(_KEY_DESC, ""), counter_names=d.get(_KEY_COUNTER_NAMES)
         )
-        p.cat_counters = d.get(_KEY_CAT_DATA)
+        for cat, counters in (d.get(_KEY_CAT_DATA) or {}).items():
+            data = _CounterData()
+            data.counters = dict(counters)
+            p.cat_data.set_retired(cat, data)
         return p
 
 
@@ -373,6 +700,8 @@ def parse_hist_mode(mode: str) -> str:
         return StatsMode.COUNT
     elif mode.startswith("a"):
         return StatsMode.AVERAGE
+    elif mode.startswith("q"):
+        return StatsMode.QUANTILE
 
     if mode not in VALID_HIST_MODES:
         return ""
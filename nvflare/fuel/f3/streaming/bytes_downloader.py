@@ -0,0 +1,172 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Any, Optional, Tuple
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.streaming.download_service import Consumer, Downloadable, ProduceRC, download_object
+from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.fuel.utils.validation_utils import check_positive_int
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+"""
+This package implements downloading of an in-memory bytes object based on the ObjectDownloader framework.
+The download state is the number of bytes received, so a download that failed can be resumed from where it stopped
+instead of starting over.
+"""
+
+
+class _StateKey:
+    RECEIVED_BYTES = "received_bytes"
+
+
+class BytesDownloadable(Downloadable):
+
+    def __init__(self, data, chunk_size=None):
+        """Constructor of BytesDownloadable.
+
+        Args:
+            data: the bytes to be downloaded: bytes, bytearray or memoryview
+            chunk_size: size of each chunk
+
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(f"data must be bytes, bytearray or memoryview but got {type(data)}")
+        super().__init__(data)
+
+        if not chunk_size:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        check_positive_int("chunk_size", chunk_size)
+
+        self.data = memoryview(data).cast("B")
+        self.size = self.data.nbytes
+        self.chunk_size = chunk_size
+        self.logger = get_obj_logger(self)
+
+    def produce(self, state: dict, requester: str) -> Tuple[str, Any, dict]:
+        received_bytes = 0
+        if state:
+            received_bytes = state.get(_StateKey.RECEIVED_BYTES, 0)
+
+        if not isinstance(received_bytes, int) or received_bytes < 0:
+            self.logger.error(f"bad {_StateKey.RECEIVED_BYTES} {received_bytes} from {requester}")
+            return ProduceRC.ERROR, None, {}
+
+        if received_bytes >= self.size:
+            return ProduceRC.EOF, None, {}
+
+        end = min(received_bytes + self.chunk_size, self.size)
+        return ProduceRC.OK, self.data[received_bytes:end], {_StateKey.RECEIVED_BYTES: end}
+
+    def produce_chunk(self, index: int, requester: str) -> Tuple[str, Any, dict]:
+        offset = index * self.chunk_size
+        if offset >= self.size:
+            return ProduceRC.EOF, None, {}
+
+        end = min(offset + self.chunk_size, self.size)
+        return ProduceRC.OK, self.data[offset:end], {_StateKey.RECEIVED_BYTES: end}
+
+
+def add_bytes(downloader: ObjectDownloader, data, chunk_size=None, ref_id=None) -> str:
+    """Add a bytes object to be downloaded to the specified downloader.
+
+    Args:
+        downloader: the downloader to add to.
+        data: the bytes to be downloaded
+        chunk_size: chunk size in bytes
+        ref_id: ref id to be used, if provided
+
+    Returns: reference id for the bytes.
+
+    """
+    return downloader.add_object(obj=BytesDownloadable(data, chunk_size=chunk_size), ref_id=ref_id)
+
+
+class BytesConsumer(Consumer):
+
+    def __init__(self):
+        """Consumer that collects the downloaded bytes.
+
+        The same consumer can be used for multiple download attempts of the same object: each attempt that is
+        started with the resume_state continues from the last byte received.
+        """
+        Consumer.__init__(self)
+        self.buffer = bytearray()
+        self.completed = False
+        self.error = None
+
+    @property
+    def resume_state(self) -> dict:
+        """The download state to resume the download from."""
+        return {_StateKey.RECEIVED_BYTES: len(self.buffer)}
+
+    def consume(self, ref_id, state: dict, data: Any) -> dict:
+        assert isinstance(data, (bytes, bytearray, memoryview))
+        self.buffer += data
+        self.logger.debug(f"received {len(self.buffer)} bytes for {ref_id}")
+        return self.resume_state
+
+    def download_failed(self, ref_id, reason: str):
+        self.logger.debug(f"failed to download {ref_id} after {len(self.buffer)} bytes: {reason}")
+        self.error = reason
+
+    def download_completed(self, ref_id: str):
+        self.completed = True
+        self.error = None
+
+
+def download_bytes(
+    from_fqcn: str,
+    ref_id: str,
+    per_request_timeout: float,
+    cell: Cell,
+    consumer: BytesConsumer = None,
+    secure=False,
+    optional=False,
+    abort_signal=None,
+) -> Tuple[Optional[str], BytesConsumer]:
+    """Download the referenced bytes from the owner.
+
+    Args:
+        from_fqcn: FQCN of the owner.
+        ref_id: reference ID of the bytes to be downloaded.
+        per_request_timeout: timeout for requests sent to the owner.
+        cell: cell to be used for communicating to the owner.
+        consumer: consumer of a previous attempt to resume from. If not specified, the download starts from the
+            first byte.
+        secure: P2P private mode for communication
+        optional: supress log messages of communication
+        abort_signal: signal for aborting download.
+
+    Returns: tuple of (error message if any, the consumer). The received bytes are in consumer.buffer.
+
+    """
+    if consumer is None:
+        consumer = BytesConsumer()
+    consumer.error = None
+    download_object(
+        from_fqcn=from_fqcn,
+        ref_id=ref_id,
+        consumer=consumer,
+        per_request_timeout=per_request_timeout,
+        cell=cell,
+        secure=secure,
+        optional=optional,
+        abort_signal=abort_signal,
+        state=consumer.resume_state if consumer.buffer else None,
+    )
+    if not consumer.completed and not consumer.error:
+        consumer.error = "download did not complete"
+    return consumer.error, consumer
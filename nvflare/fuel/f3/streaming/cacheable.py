@@ -60,7 +60,7 @@ class CacheableObject(Downloadable):
         pass
 
     @abstractmethod
-    def produce_item(self, index: int) -> bytes:
+    def produce_item(self, index: int) -> Any:
         """This method is called to produce the chunk for the specified item.
 
         Args:
@@ -71,6 +71,19 @@ class CacheableObject(Downloadable):
         """
         pass
 
+    def get_item_size(self, item: Any) -> int:
+        """Get the number of bytes of a produced item. It is used to fit items into chunks.
+
+        The subclass must override this method if its items are not bytes-like.
+
+        Args:
+            item: the item produced by produce_item.
+
+        Returns: the size of the item
+
+        """
+        return len(item)
+
     def set_transaction(self, tx_id, ref_id):
         tx_info = DownloadService.get_transaction_info(tx_id)
         self.num_receivers = tx_info.num_receivers
@@ -106,7 +119,7 @@ class CacheableObject(Downloadable):
         with self.lock:
             self.base_obj = None
 
-    def _get_item(self, index: int, requester: str) -> bytes:
+    def _get_item(self, index: int, requester: str) -> Any:
         with self.lock:
             cache_available = bool(self.cache)
             data = None if not cache_available else self.cache[index][0]
@@ -141,7 +154,9 @@ class CacheableObject(Downloadable):
                 existing, count = self.cache[index]
                 if existing is None:
                     self.cache[index] = (data, count)
-                    self.logger.debug(f"created and cached item {index} for {requester}: {len(data)} bytes")
+                    self.logger.debug(
+                        f"created and cached item {index} for {requester}: {self.get_item_size(data)} bytes"
+                    )
                 else:
                     data = existing
                     self.logger.debug(f"got item {index} from cache for {requester} (produced concurrently)")
@@ -183,7 +198,7 @@ class CacheableObject(Downloadable):
 
         for i in range(start, self.size):
             item = self._get_item(i, requester)
-            item_size = len(item)
+            item_size = self.get_item_size(item)
             if not result or total_size + item_size < self.max_chunk_size:
                 result.append(item)
                 total_size += item_size
@@ -193,6 +208,21 @@ class CacheableObject(Downloadable):
         self.logger.debug(f"produced {len(result)} items for {requester}: {total_size} bytes")
         return ProduceRC.OK, result, {_StateKey.START: start, _StateKey.COUNT: len(result)}
 
+    def produce_chunk(self, index: int, requester: str) -> Tuple[str, Any, dict]:
+        """Produce the chunk for pipelined download. Each chunk contains exactly one item.
+
+        Since the requester doesn't acknowledge chunks in pipelined mode, the item is counted as received
+        once it is produced for the requester. If the request is retried after the item is removed from the
+        cache, the item is simply produced again.
+        """
+        if index >= self.size:
+            return ProduceRC.EOF, None, {}
+
+        item = self._get_item(index, requester)
+        self._adjust_cache(index, 1)
+        self.logger.debug(f"produced item {index} for {requester}: {self.get_item_size(item)} bytes")
+        return ProduceRC.OK, [item], {_StateKey.START: index, _StateKey.COUNT: 1}
+
 
 class ItemConsumer(Consumer):
 
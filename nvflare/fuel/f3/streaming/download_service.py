@@ -15,14 +15,18 @@ import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Tuple
 
 from nvflare.apis.signal import Signal
 from nvflare.fuel.f3.cellnet.cell import Cell
 from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
 from nvflare.fuel.f3.cellnet.utils import make_reply, new_cell_message
+from nvflare.fuel.f3.comm_config import CommConfigurator
 from nvflare.fuel.f3.message import Message
 from nvflare.fuel.utils.log_utils import get_obj_logger
+from nvflare.fuel.utils.validation_utils import check_positive_int
 from nvflare.security.logging import secure_format_exception
 
 OBJ_DOWNLOADER_CHANNEL = "download_service__"
@@ -117,6 +121,24 @@ class Downloadable(ABC):
         """
         pass
 
+    def produce_chunk(self, index: int, requester: str) -> Tuple[str, Any, dict]:
+        """Produce the chunk at the specified index (on object sender side).
+
+        This method is used by pipelined download, where the receiver keeps multiple requests in flight and asks
+        for chunks by index instead of by state. The object only needs to implement it if its chunks can be
+        produced in any order.
+
+        Args:
+            index: index of the chunk to be produced, starting from 0.
+            requester: the FQCN of the receiver that is downloading
+
+        Returns: a tuple of (return code, the chunk, state to be passed to the Consumer along with the chunk).
+            The return code is ProduceRC.EOF if the index is beyond the last chunk. The default implementation
+            returns ProduceRC.UNSUPPORTED, which makes the receiver fall back to sequential download.
+
+        """
+        return ProduceRC.UNSUPPORTED, None, {}
+
     def downloaded_to_one(self, to_receiver: str, status: str):
         """Called when an object is downloaded to a receiver.
 
@@ -161,6 +183,8 @@ class _PropKey:
     STATE = "state"
     DATA = "data"
     STATUS = "status"
+    CHUNK = "chunk"
+    DOWNLOAD_STATUS = "download_status"
 
 
 class _Ref:
@@ -201,6 +225,7 @@ class ProduceRC:
     OK = "ok"
     ERROR = "error"
     EOF = "eof"
+    UNSUPPORTED = "unsupported"
 
 
 class DownloadStatus:
@@ -474,6 +499,16 @@ class DownloadService:
         tx = ref.tx
         assert isinstance(tx, _Transaction)
 
+        chunk_index = payload.get(_PropKey.CHUNK)
+        if chunk_index is not None:
+            return cls._handle_chunk_request(ref, chunk_index, requester)
+
+        download_status = payload.get(_PropKey.DOWNLOAD_STATUS)
+        if download_status:
+            # pipelined download is finished by the requester
+            ref.obj_downloaded(requester, status=download_status)
+            return make_reply(ReturnCode.OK)
+
         try:
             rc, data, new_state = ref.obj.produce(current_state, requester)
         except Exception as ex:
@@ -492,8 +527,7 @@ class DownloadService:
             # continue — accumulate bytes for timing summary in transaction_done()
             # CacheableObject returns a list of byte-chunks; FileDownloader returns raw bytes.
             # Sum chunk lengths for lists (len(list) counts items, not bytes).
-            if data is not None:
-                tx.total_bytes += sum(len(c) for c in data) if isinstance(data, list) else len(data)
+            tx.total_bytes += _data_size(data)
             return make_reply(
                 ReturnCode.OK,
                 body={
@@ -503,6 +537,30 @@ class DownloadService:
                 },
             )
 
+    @classmethod
+    def _handle_chunk_request(cls, ref: _Ref, index, requester: str) -> Message:
+        if not isinstance(index, int) or index < 0:
+            cls._logger.error(f"bad {_PropKey.CHUNK} {index} in request from {requester}")
+            return make_reply(ReturnCode.INVALID_REQUEST)
+
+        try:
+            rc, data, state = ref.obj.produce_chunk(index, requester)
+        except Exception as ex:
+            cls._logger.error(
+                f"Object {type(ref.obj)} encountered exception when produce chunk {index}: "
+                f"{secure_format_exception(ex)}"
+            )
+            return make_reply(ReturnCode.PROCESS_EXCEPTION)
+
+        # Unlike sequential download, EOF doesn't mean the requester is done: chunks may still be in flight.
+        # The requester reports the final download status in a separate request.
+        body = {_PropKey.STATUS: rc, _PropKey.CHUNK: index}
+        if rc == ProduceRC.OK:
+            ref.tx.total_bytes += _data_size(data)
+            body[_PropKey.STATE] = state
+            body[_PropKey.DATA] = data
+        return make_reply(ReturnCode.OK, body=body)
+
     @classmethod
     def _monitor_tx(cls):
         while True:
@@ -531,6 +589,14 @@ class DownloadService:
             time.sleep(5.0)
 
 
+def _data_size(data: Any) -> int:
+    # CacheableObject produces a list of byte-chunks; FileDownloadable produces raw bytes.
+    # Sum chunk lengths for lists (len(list) counts items, not bytes).
+    if data is None:
+        return 0
+    return sum(len(c) for c in data) if isinstance(data, list) else len(data)
+
+
 class Consumer(ABC):
 
     def __init__(self):
@@ -547,6 +613,9 @@ class Consumer(ABC):
 
         Returns: new state to be sent back to the data owner.
 
+        Note: with pipelined download, data is still delivered in order, but the next chunk may already have been
+        requested, so the returned state is not sent back to the data owner.
+
         """
         pass
 
@@ -586,6 +655,8 @@ def download_object(
     optional=False,
     abort_signal: Signal = None,
     max_retries: int = 3,
+    window_size: int = None,
+    state: dict = None,
 ):
     """Download a large object from the object owner.
 
@@ -604,19 +675,58 @@ def download_object(
             _adjust_cache may run twice for the same state on retry, which
             can prematurely evict cache entries in multi-receiver scenarios
             but does not affect data correctness.
+        window_size: max number of chunk requests in flight. If not specified, the "download_window_size" in
+            comm config is used (default 1). With 1, each chunk is requested after the previous one is received.
+            With a larger window, chunks are requested by index and delivered to the consumer in order. This
+            requires the object to support produce_chunk; otherwise it falls back to sequential download.
+        state: if specified, the download state to start from, as returned by the consumer in a previous attempt.
+            This resumes a failed download instead of starting over. Resumed downloads are always sequential.
 
     Returns: None
 
     """
-    logger = get_obj_logger(download_object)
     if max_retries < 0:
         raise ValueError(f"max_retries must be non-negative, got {max_retries}")
+
+    if window_size is None:
+        window_size = CommConfigurator().get_download_window_size(1)
+    check_positive_int("window_size", window_size)
+
+    kwargs = dict(
+        from_fqcn=from_fqcn,
+        ref_id=ref_id,
+        per_request_timeout=per_request_timeout,
+        cell=cell,
+        consumer=consumer,
+        secure=secure,
+        optional=optional,
+        abort_signal=abort_signal,
+        max_retries=max_retries,
+    )
+    if state is None and window_size > 1 and _download_pipelined(window_size=window_size, **kwargs):
+        return
+    _download_sequential(state=state, **kwargs)
+
+
+def _download_sequential(
+    from_fqcn: str,
+    ref_id: str,
+    per_request_timeout: float,
+    cell: Cell,
+    consumer: Consumer,
+    secure,
+    optional,
+    abort_signal: Signal,
+    max_retries: int,
+    state: dict = None,
+):
+    logger = get_obj_logger(download_object)
     consecutive_timeouts = 0
     total_bytes = 0
     download_start = time.time()
-    # Track current download state (None = initial request).
+    # Track current download state (None = initial request, unless resuming).
     # On retry, resend the same state so producer re-generates the same chunk.
-    current_state = None
+    current_state = state
 
     while True:
         # Build a fresh request each iteration (including retries)
@@ -700,10 +810,8 @@ def download_object(
             return
 
         # continue
-        # CacheableObject sends a list of byte-chunks; FileDownloader sends raw bytes.
         data = payload.get(_PropKey.DATA)
-        if data is not None:
-            total_bytes += sum(len(c) for c in data) if isinstance(data, list) else len(data)
+        total_bytes += _data_size(data)
         state = payload.get(_PropKey.STATE)
         try:
             new_state = consumer.consume(ref_id, state, data)
@@ -721,3 +829,167 @@ def download_object(
 
         # Update state for next request
         current_state = new_state
+
+
+def _request_chunk(
+    from_fqcn: str,
+    ref_id: str,
+    index: int,
+    per_request_timeout: float,
+    cell: Cell,
+    secure,
+    optional,
+    abort_signal: Signal,
+    max_retries: int,
+) -> Tuple[Optional[Message], str]:
+    """Request the chunk at the specified index, retrying on TIMEOUT.
+
+    Returns: a tuple of (reply, error). The reply is None if there is error.
+
+    """
+    logger = get_obj_logger(download_object)
+    consecutive_timeouts = 0
+    while True:
+        request = new_cell_message(headers={}, payload={_PropKey.REF_ID: ref_id, _PropKey.CHUNK: index})
+        start_time = time.time()
+        reply = cell.send_request(
+            channel=OBJ_DOWNLOADER_CHANNEL,
+            target=from_fqcn,
+            topic=OBJ_DOWNLOADER_TOPIC,
+            request=request,
+            timeout=per_request_timeout,
+            secure=secure,
+            optional=optional,
+            abort_signal=abort_signal,
+        )
+        duration = time.time() - start_time
+
+        if abort_signal and abort_signal.triggered:
+            return None, f"download aborted after {duration} secs"
+
+        assert isinstance(reply, Message)
+        rc = reply.get_header(MessageHeaderKey.RETURN_CODE)
+        if rc == ReturnCode.OK:
+            return reply, ""
+
+        if rc == ReturnCode.TIMEOUT and consecutive_timeouts < max_retries:
+            consecutive_timeouts += 1
+            backoff = min(2.0 * (2 ** (consecutive_timeouts - 1)), 60.0)
+            logger.warning(
+                f"[DOWNLOAD_RETRY] Request for chunk {index} to {from_fqcn} timed out after {duration:.1f}s "
+                f"(ref={ref_id}, retry {consecutive_timeouts}/{max_retries}, backoff={backoff:.1f}s)."
+            )
+            time.sleep(backoff)
+            continue
+
+        return None, f"error requesting chunk {index} from {from_fqcn} after {duration} secs: {rc}"
+
+
+def _report_download_status(from_fqcn: str, ref_id: str, cell: Cell, secure, optional, status: str):
+    # Pipelined download doesn't end with an EOF request, so tell the owner that the download is finished.
+    try:
+        cell.fire_and_forget(
+            channel=OBJ_DOWNLOADER_CHANNEL,
+            topic=OBJ_DOWNLOADER_TOPIC,
+            targets=from_fqcn,
+            message=new_cell_message(headers={}, payload={_PropKey.REF_ID: ref_id, _PropKey.DOWNLOAD_STATUS: status}),
+            secure=secure,
+            optional=optional,
+        )
+    except Exception as ex:
+        get_obj_logger(download_object).warning(
+            f"failed to report download status of {ref_id} to {from_fqcn}: {secure_format_exception(ex)}"
+        )
+
+
+def _download_pipelined(
+    from_fqcn: str,
+    ref_id: str,
+    per_request_timeout: float,
+    cell: Cell,
+    consumer: Consumer,
+    secure,
+    optional,
+    abort_signal: Signal,
+    max_retries: int,
+    window_size: int,
+) -> bool:
+    """Download the object with up to window_size chunk requests in flight.
+
+    Chunks are requested by index and delivered to the consumer in index order.
+
+    Returns: False if the object owner doesn't support pipelined download. Nothing is consumed in this case and
+        the caller should fall back to sequential download. True otherwise.
+
+    """
+    logger = get_obj_logger(download_object)
+    total_bytes = 0
+    download_start = time.time()
+    pending = deque()
+    next_index = 0
+    executor = ThreadPoolExecutor(max_workers=window_size, thread_name_prefix="obj_download")
+
+    def _fail(reason: str):
+        consumer.download_failed(ref_id, reason)
+        _report_download_status(from_fqcn, ref_id, cell, secure, optional, DownloadStatus.FAILED)
+        return True
+
+    try:
+        while True:
+            while len(pending) < window_size:
+                future = executor.submit(
+                    _request_chunk,
+                    from_fqcn=from_fqcn,
+                    ref_id=ref_id,
+                    index=next_index,
+                    per_request_timeout=per_request_timeout,
+                    cell=cell,
+                    secure=secure,
+                    optional=optional,
+                    abort_signal=abort_signal,
+                    max_retries=max_retries,
+                )
+                pending.append((next_index, future))
+                next_index += 1
+
+            index, future = pending.popleft()
+            reply, error = future.result()
+            if abort_signal and abort_signal.triggered:
+                return _fail("download aborted")
+
+            if not reply:
+                return _fail(error)
+
+            payload = reply.payload
+            assert isinstance(payload, dict)
+            status = payload.get(_PropKey.STATUS)
+            if payload.get(_PropKey.CHUNK) != index or status == ProduceRC.UNSUPPORTED:
+                if index == 0:
+                    # the owner is an older version or the object can't produce chunks by index
+                    logger.debug(f"pipelined download not supported for ref={ref_id} - fall back to sequential")
+                    return False
+                return _fail(f"bad reply for chunk {index} from {from_fqcn}")
+
+            if status == ProduceRC.EOF:
+                # all chunks before this one have been consumed
+                elapsed = time.time() - download_start
+                size_mb = total_bytes / (1024 * 1024)
+                logger.info(
+                    f"[client] download ref={ref_id} done: elapsed={elapsed:.2f}s "
+                    f"size={size_mb:.1f}MB ({total_bytes:,} bytes) window={window_size}"
+                )
+                consumer.download_completed(ref_id)
+                _report_download_status(from_fqcn, ref_id, cell, secure, optional, DownloadStatus.SUCCESS)
+                return True
+            elif status != ProduceRC.OK:
+                return _fail(f"producer error for chunk {index}")
+
+            data = payload.get(_PropKey.DATA)
+            total_bytes += _data_size(data)
+            try:
+                consumer.consume(ref_id, payload.get(_PropKey.STATE), data)
+            except Exception as ex:
+                return _fail(f"exception when consuming data: {secure_format_exception(ex)}")
+    finally:
+        # requests beyond EOF may still be in flight; their replies are simply dropped
+        executor.shutdown(wait=False, cancel_futures=True)
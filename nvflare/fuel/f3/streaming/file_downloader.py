@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import mmap
 import os.path
 import tempfile
+import threading
 import uuid
 from typing import Any, Optional, Tuple
 
@@ -41,6 +43,7 @@ class FileDownloadable(Downloadable):
         file_name: str,
         chunk_size=None,
         file_downloaded_cb=None,
+        use_mmap: bool = True,
         **cb_kwargs,
     ):
         """Constructor of FileDownloadable.
@@ -49,6 +52,9 @@ class FileDownloadable(Downloadable):
             file_name: name of the file to be downloaded.
             chunk_size: size of each chunk
             file_downloaded_cb: if specified, the callback to be called when the file is downloaded to a receiver.
+            use_mmap: whether to memory-map the file. The file is mapped once on the first request, and all
+                requesters are served with memoryview slices of the shared mapping. The mapping is released
+                when the transaction is done. If False, each chunk is read from the file.
             cb_kwargs: kwargs passed to the CB.
 
         Notes: The file_downloaded_cb will be called as follows:
@@ -80,6 +86,9 @@ class FileDownloadable(Downloadable):
         self.chunk_size = chunk_size
         self.file_downloaded_cb = file_downloaded_cb
         self.cb_kwargs = cb_kwargs
+        self.use_mmap = use_mmap
+        self.mmap = None
+        self.mmap_lock = threading.Lock()
         self.logger = get_obj_logger(self)
 
     def produce(self, state: dict, requester: str) -> Tuple[str, Any, dict]:
@@ -95,22 +104,58 @@ class FileDownloadable(Downloadable):
             # already done
             return ProduceRC.EOF, None, {}
 
-        num_bytes_to_send = min(self.chunk_size, self.size - received_bytes)
-        with open(self.name, "rb") as f:
-            f.seek(received_bytes)
-            chunk = f.read(num_bytes_to_send)
-
+        chunk = self._read_chunk(received_bytes, min(self.chunk_size, self.size - received_bytes))
         self.logger.debug(f"{received_bytes=}; sending {len(chunk)} bytes")
         return ProduceRC.OK, chunk, {_StateKey.RECEIVED_BYTES: received_bytes + len(chunk)}
 
+    def produce_chunk(self, index: int, requester: str) -> Tuple[str, Any, dict]:
+        offset = index * self.chunk_size
+        if offset >= self.size:
+            return ProduceRC.EOF, None, {}
+
+        chunk = self._read_chunk(offset, min(self.chunk_size, self.size - offset))
+        self.logger.debug(f"chunk {index}; sending {len(chunk)} bytes")
+        return ProduceRC.OK, chunk, {_StateKey.RECEIVED_BYTES: offset + len(chunk)}
+
+    def _read_chunk(self, offset: int, length: int):
+        if self.use_mmap:
+            with self.mmap_lock:
+                if self.mmap is None:
+                    with open(self.name, "rb") as f:
+                        self.mmap = mmap.mmap(f.fileno(), self.size, access=mmap.ACCESS_READ)
+                    self.logger.debug(f"mapped file {self.name}: {self.size} bytes")
+                m = self.mmap
+            # zero-copy: the slice keeps the mapping alive until the chunk is sent
+            return memoryview(m)[offset : offset + length]
+
+        with open(self.name, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _unmap(self):
+        with self.mmap_lock:
+            m = self.mmap
+            self.mmap = None
+
+        if m is not None:
+            try:
+                m.close()
+            except BufferError:
+                # Chunks still being sent hold views of the mapping. It's unmapped when they are released.
+                self.logger.debug(f"mapping of {self.name} is still in use")
+
     def downloaded_to_one(self, to_receiver: str, status: str):
         if self.file_downloaded_cb:
             self.file_downloaded_cb(to_receiver, status, self.name, **self.cb_kwargs)
 
     def downloaded_to_all(self):
+        self._unmap()
         if self.file_downloaded_cb:
             self.file_downloaded_cb("", "", self.name, **self.cb_kwargs)
 
+    def transaction_done(self, transaction_id: str, status: str):
+        self._unmap()
+
 
 def add_file(
     downloader: ObjectDownloader,
@@ -153,6 +198,7 @@ def download_file(
     secure=False,
     optional=False,
     abort_signal=None,
+    window_size: int = None,
 ) -> Tuple[str, Optional[str]]:
     """Download the referenced file from the file owner.
 
@@ -165,6 +211,7 @@ def download_file(
         secure: P2P private mode for communication
         optional: supress log messages of communication
         abort_signal: signal for aborting download.
+        window_size: max number of chunk requests in flight. See download_object.
 
     Returns: tuple of (error message if any, full path of the downloaded file).
 
@@ -188,6 +235,7 @@ def download_file(
         secure=secure,
         optional=optional,
         abort_signal=abort_signal,
+        window_size=window_size,
     )
 
     return consumer.error, consumer.file_path
@@ -205,7 +253,7 @@ class _ChunkConsumer(Consumer):
         self.error = None
 
     def consume(self, ref_id, state: dict, data: Any) -> dict:
-        assert isinstance(data, bytes)
+        assert isinstance(data, (bytes, bytearray, memoryview))
         self.file.write(data)
         self.total_bytes += len(data)
         self.logger.debug(f"received {self.total_bytes} bytes for file {self.file_path}")
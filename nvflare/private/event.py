@@ -11,19 +11,33 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from nvflare.apis.fl_constant import ConfigVarName, SystemConfigs
 from nvflare.apis.fl_context import FLContext
-from nvflare.apis.utils.event import fire_event_to_components
+from nvflare.apis.utils.event import EventSubscriptionIndex, fire_event_to_components
+from nvflare.fuel.utils.config_service import ConfigService
 
 
-def fire_event(event: str, handlers: list, ctx: FLContext):
+def fire_event(event: str, handlers: list, ctx: FLContext, subscription_index: EventSubscriptionIndex = None):
     """Fires the specified event and invokes the list of handlers.
 
     Args:
         event: the event to be fired
         handlers: handlers to be invoked
         ctx: context for cross-component data sharing
+        subscription_index: optional index of the handlers of each event type
 
     Returns: N/A
 
     """
-    return fire_event_to_components(event, handlers, ctx)
+    return fire_event_to_components(event, handlers, ctx, subscription_index)
+
+
+def create_subscription_index() -> EventSubscriptionIndex:
+    """Create the index of the handlers of each event type for a run manager.
+
+    Handler timing is enabled with the event_handler_timing config var.
+    """
+    timing = ConfigService.get_bool_var(
+        name=ConfigVarName.EVENT_HANDLER_TIMING, conf=SystemConfigs.APPLICATION_CONF, default=False
+    )
+    return EventSubscriptionIndex(timing=timing)
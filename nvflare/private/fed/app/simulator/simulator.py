@@ -45,6 +45,12 @@ def define_simulator_parser(simulator_parser):
         action="store_true",
         help="flag to indicate if running END_RUN event for all clients",
     )
+    simulator_parser.add_argument(
+        "--warm_workers",
+        default=False,
+        action="store_true",
+        help="flag to reuse the client worker processes when switching clients",
+    )
 
 
 def run_simulator(simulator_args):
@@ -61,6 +67,7 @@ def run_simulator(simulator_args):
         log_config=log_config,
         max_clients=simulator_args.max_clients,
         end_run_for_all=simulator_args.end_run_for_all,
+        warm_workers=simulator_args.warm_workers,
     )
     run_status = simulator.run()
 
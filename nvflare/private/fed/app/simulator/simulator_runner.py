@@ -93,6 +93,7 @@ class SimulatorRunner(FLComponent):
         log_config=None,
         max_clients=100,
         end_run_for_all=False,
+        warm_workers=False,
     ):
         super().__init__()
 
@@ -105,6 +106,7 @@ class SimulatorRunner(FLComponent):
         self.log_config = None
         self.max_clients = max_clients
         self.end_run_for_all = end_run_for_all
+        self.warm_workers = warm_workers
 
         self.ask_to_stop = False
 
@@ -194,6 +196,7 @@ class SimulatorRunner(FLComponent):
         cwd = os.getcwd()
         self.args.job_folder = os.path.join(cwd, self.args.job_folder)
         self.args.end_run_for_all = self.end_run_for_all
+        self.args.warm_workers = self.warm_workers
 
         if not os.path.exists(self.args.workspace):
             os.makedirs(self.args.workspace)
@@ -611,6 +614,11 @@ class SimulatorClientRunner(FLComponent):
 
         self.clients_finished_end_run = []
 
+        # When warm_workers is set, each client running thread keeps its worker process after switching clients,
+        # and the process takes the identity of the next client instead of a new process being started.
+        self.warm_workers = getattr(args, "warm_workers", False)
+        self._thread_local = threading.local()
+
     def run(self, gpu):
         try:
             # self.create_clients()
@@ -674,6 +682,8 @@ class SimulatorClientRunner(FLComponent):
                 self._end_run_clients(gpu, lock, num_of_threads, timeout)
         except Exception as e:
             self.logger.error(f"run_client_thread error: {secure_format_exception(e)}")
+        finally:
+            self._stop_warm_worker(timeout)
 
     def _end_run_clients(self, gpu, lock, num_of_threads, timeout):
         """After the WF reaches the END_RUN, each running thread will try to pick up one of the remaining client
@@ -704,64 +714,13 @@ class SimulatorClientRunner(FLComponent):
         return None
 
     def do_one_task(self, client, num_of_threads, gpu, lock, timeout=60.0, task_name=RunnerTask.TASK_EXEC):
-        open_port = get_open_ports(1)[0]
-        client_workspace = os.path.join(self.args.workspace, client.client_name)
-
-        log_config_file_path = os.path.join(self.args.workspace, "local", WorkspaceConstants.LOGGING_CONFIG)
-        if not os.path.isfile(log_config_file_path):
-            log_config_file_path = os.path.join(os.path.dirname(log_utils.__file__), WorkspaceConstants.LOGGING_CONFIG)
-
-        if self.args.log_config:
-            logging_config = self.args.log_config
+        worker = getattr(self._thread_local, "worker", None)
+        self._thread_local.worker = None
+        if worker:
+            process, conn = worker
+            self.logger.debug(f"Reuse the warm worker process {process.pid} for client {client.client_name}")
         else:
-            logging_config = log_config_file_path
-
-        decomposer_module = ConfigService.get_str_var(
-            name=ConfigVarName.DECOMPOSER_MODULE, conf=SystemConfigs.RESOURCES_CONF
-        )
-
-        app_custom_folder = Workspace(root_dir=client_workspace, site_name="mgh").get_app_custom_dir(
-            SimulatorConstants.JOB_NAME
-        )
-
-        command = (
-            sys.executable
-            + " -m nvflare.private.fed.app.simulator.simulator_worker -o "
-            + client_workspace
-            + " --logging_config "
-            + logging_config
-            + " --client "
-            + client.client_name
-            + " --token "
-            + client.token
-            + " --port "
-            + str(open_port)
-            + " --parent_pid "
-            + str(os.getpid())
-            + " --simulator_root "
-            + self.simulator_root
-            + " --root_url "
-            + str(client.cell.get_root_url_for_child())
-            + " --parent_url "
-            + str(client.cell.get_internal_listener_url())
-            + " --task_name "
-            + str(task_name)
-            + " --decomposer_module "
-            + str(decomposer_module)
-        )
-        if gpu:
-            command += " --gpu " + str(gpu)
-        new_env = os.environ.copy()
-        add_custom_dir_to_path(app_custom_folder, new_env)
-        if os.path.isdir(self.server_custom_folder):
-            python_paths = new_env[SystemVarName.PYTHONPATH].split(os.pathsep)
-            if self.server_custom_folder in python_paths:
-                python_paths.remove(self.server_custom_folder)
-            new_env[SystemVarName.PYTHONPATH] = os.pathsep.join(python_paths)
-
-        process = subprocess.Popen(shlex.split(command, True), shell=False, preexec_fn=os.setsid, env=new_env)
-
-        conn = self._create_connection(open_port, timeout=timeout)
+            process, conn = self._start_worker(client, gpu, timeout, task_name)
 
         self.build_ctx["client_name"] = client.client_name
         deploy_args = copy.deepcopy(self.deploy_args)
@@ -771,11 +730,15 @@ class SimulatorClientRunner(FLComponent):
             SimulatorConstants.CLIENT_CONFIG: self.client_config,
             SimulatorConstants.DEPLOY_ARGS: deploy_args,
             SimulatorConstants.BUILD_CTX: self.build_ctx,
+            SimulatorConstants.CLIENT_NAME: client.client_name,
+            SimulatorConstants.TOKEN: client.token,
+            SimulatorConstants.TASK_NAME: task_name,
         }
-        conn.send(data)
 
         end_run_client = None
+        keep_worker = False
         try:
+            conn.send(data)
             while True:
                 if process.poll() is not None:
                     self.logger.error(
@@ -814,6 +777,7 @@ class SimulatorClientRunner(FLComponent):
                     conn.send(True)
                 else:
                     conn.send(False)
+                    keep_worker = self.warm_workers
                     break
 
             return stop_run, next_client, end_run_client
@@ -822,7 +786,94 @@ class SimulatorClientRunner(FLComponent):
             self.logger.error(f"Communication error with client {client.client_name}: {e}")
             return True, None, client.client_name
         finally:
-            # Clean up subprocess if it's still running
+            if keep_worker:
+                self._thread_local.worker = (process, conn)
+            else:
+                # Clean up subprocess if it's still running
+                self._cleanup_process(process)
+
+    def _start_worker(self, client, gpu, timeout, task_name):
+        open_port = get_open_ports(1)[0]
+        client_workspace = os.path.join(self.args.workspace, client.client_name)
+
+        log_config_file_path = os.path.join(self.args.workspace, "local", WorkspaceConstants.LOGGING_CONFIG)
+        if not os.path.isfile(log_config_file_path):
+            log_config_file_path = os.path.join(os.path.dirname(log_utils.__file__), WorkspaceConstants.LOGGING_CONFIG)
+
+        if self.args.log_config:
+            logging_config = self.args.log_config
+        else:
+            logging_config = log_config_file_path
+
+        decomposer_module = ConfigService.get_str_var(
+            name=ConfigVarName.DECOMPOSER_MODULE, conf=SystemConfigs.RESOURCES_CONF
+        )
+
+        app_custom_folder = Workspace(root_dir=client_workspace, site_name="mgh").get_app_custom_dir(
+            SimulatorConstants.JOB_NAME
+        )
+
+        command = (
+            sys.executable
+            + " -m nvflare.private.fed.app.simulator.simulator_worker -o "
+            + client_workspace
+            + " --logging_config "
+            + logging_config
+            + " --client "
+            + client.client_name
+            + " --token "
+            + client.token
+            + " --port "
+            + str(open_port)
+            + " --parent_pid "
+            + str(os.getpid())
+            + " --simulator_root "
+            + self.simulator_root
+            + " --root_url "
+            + str(client.cell.get_root_url_for_child())
+            + " --parent_url "
+            + str(client.cell.get_internal_listener_url())
+            + " --task_name "
+            + str(task_name)
+            + " --decomposer_module "
+            + str(decomposer_module)
+        )
+        if gpu:
+            command += " --gpu " + str(gpu)
+        if self.warm_workers:
+            command += " --warm_worker"
+        new_env = os.environ.copy()
+        add_custom_dir_to_path(app_custom_folder, new_env)
+        if os.path.isdir(self.server_custom_folder):
+            python_paths = new_env[SystemVarName.PYTHONPATH].split(os.pathsep)
+            if self.server_custom_folder in python_paths:
+                python_paths.remove(self.server_custom_folder)
+            new_env[SystemVarName.PYTHONPATH] = os.pathsep.join(python_paths)
+
+        process = subprocess.Popen(shlex.split(command, True), shell=False, preexec_fn=os.setsid, env=new_env)
+        try:
+            conn = self._create_connection(open_port, timeout=timeout)
+        except Exception:
+            self._cleanup_process(process)
+            raise
+        return process, conn
+
+    def _stop_warm_worker(self, timeout=5.0):
+        """Stop the warm worker process kept by the current client running thread, if any."""
+        worker = getattr(self._thread_local, "worker", None)
+        self._thread_local.worker = None
+        if not worker:
+            return
+
+        process, conn = worker
+        try:
+            # the worker process ends when it gets None instead of the next client to run
+            conn.send(None)
+            process.wait(timeout=timeout)
+        except (OSError, ConnectionError, subprocess.TimeoutExpired) as e:
+            self.logger.warning(f"Failed to stop the warm worker process {process.pid}: {e}")
+        finally:
+            conn.close()
             self._cleanup_process(process)
 
     def _cleanup_process(self, process, timeout=5.0):
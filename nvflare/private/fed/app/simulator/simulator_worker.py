@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import argparse
+import importlib
 import os
 import sys
 import threading
@@ -38,7 +39,12 @@ from nvflare.private.fed.client.fed_client import FederatedClient
 from nvflare.private.fed.simulator.simulator_app_runner import SimulatorClientAppRunner
 from nvflare.private.fed.simulator.simulator_audit import SimulatorAuditor
 from nvflare.private.fed.simulator.simulator_const import SimulatorConstants
-from nvflare.private.fed.utils.fed_utils import fobs_initialize, get_simulator_app_root, register_ext_decomposers
+from nvflare.private.fed.utils.fed_utils import (
+    custom_fobs_initialize,
+    fobs_initialize,
+    get_simulator_app_root,
+    register_ext_decomposers,
+)
 from nvflare.security.logging import secure_format_exception, secure_log_traceback
 from nvflare.security.security import EmptyAuthorizer
 
@@ -47,6 +53,10 @@ FETCH_TASK_RUN_RETRY = 3
 
 
 class ClientTaskWorker(FLComponent):
+    def __init__(self):
+        super().__init__()
+        self._client_cell = None  # cell of the client currently run by this process
+
     def create_client_engine(self, federated_client: FederatedClient, args, rank=0):
         client_engine = ClientEngine(federated_client, args, rank)
         federated_client.set_client_engine(client_engine)
@@ -137,10 +147,32 @@ class ClientTaskWorker(FLComponent):
 
     def run(self, args, conn):
         self.logger.info("ClientTaskWorker started to run")
+        try:
+            data = conn.recv()
+            while data:
+                self._switch_client(args, data)
+                if not self.run_client(args, conn, data) or not args.warm_worker:
+                    break
+
+                # a warm worker keeps running: wait for the next client to simulate. None ends the worker.
+                data = conn.recv()
+        except Exception as e:
+            self.logger.error(f"ClientTaskWorker run error: {secure_format_exception(e)}")
+
+    def run_client(self, args, conn, data) -> bool:
+        """Run the tasks of one client until the parent process switches to another client or stops the run.
+
+        Args:
+            args: worker args, with the identity of the client
+            conn: connection to the parent process
+            data: the client data sent by the parent process
+
+        Returns: whether the client ran successfully, so that the worker can be reused for another client.
+
+        """
         admin_agent = None
         client = None
         try:
-            data = conn.recv()
             client_config = data[SimulatorConstants.CLIENT_CONFIG]
             deploy_args = data[SimulatorConstants.DEPLOY_ARGS]
             build_ctx = data[SimulatorConstants.BUILD_CTX]
@@ -165,15 +197,45 @@ class ClientTaskWorker(FLComponent):
                     self.release_resources(client)
                     break
                 time.sleep(interval)
+            return True
 
         except Exception as e:
             self.logger.error(f"ClientTaskWorker run error: {secure_format_exception(e)}")
+            return False
         finally:
             if client:
                 client.cell.stop()
+                if args.warm_worker:
+                    # so that the client can run in this process again
+                    client.cell.unregister()
             if admin_agent:
                 admin_agent.shutdown()
 
+    def _switch_client(self, args, data):
+        """Take the identity and the workspace of the client to run next.
+
+        The process keeps its imports, and only the per-client state is set up again: the workspace, the log
+        config, the custom decomposers and the app custom folder in sys.path. Modules imported from the custom
+        folder of the previous client are removed from sys.modules, so that the next client imports its own.
+        """
+        args.task_name = data.get(SimulatorConstants.TASK_NAME, args.task_name)
+        client_name = data.get(SimulatorConstants.CLIENT_NAME)
+        if not client_name or client_name == args.client:
+            return
+
+        self.logger.info(f"Switch the worker process from client {args.client} to {client_name}")
+        prev_custom_folder = os.path.join(get_simulator_app_root(args.simulator_root, args.client), "custom")
+        while prev_custom_folder in sys.path:
+            sys.path.remove(prev_custom_folder)
+        sys.path_importer_cache.pop(prev_custom_folder, None)
+        _purge_modules(prev_custom_folder)
+
+        args.client = client_name
+        args.token = data[SimulatorConstants.TOKEN]
+        args.workspace = data[SimulatorConstants.DEPLOY_ARGS].workspace
+        workspace = _setup_workspace(args)
+        custom_fobs_initialize(workspace, job_id=SimulatorConstants.JOB_NAME)
+
     def _create_client(self, args, build_ctx, deploy_args):
         deployer = BaseClientDeployer()
         deployer.build(build_ctx)
@@ -207,7 +269,10 @@ class ClientTaskWorker(FLComponent):
             parent_url=parent_url,
         )
         cell.start()
-        mpm.add_cleanup_cb(cell.stop)
+        if self._client_cell is None:
+            # a warm worker runs many clients: register only once, to stop the cell of the current client
+            mpm.add_cleanup_cb(self._stop_client_cell)
+        self._client_cell = cell
         federated_client.cell = cell
         federated_client.communicator.set_cell(cell)
         federated_client.communicator.set_auth(
@@ -223,6 +288,20 @@ class ClientTaskWorker(FLComponent):
             if time.time() - start > CELL_CONNECT_CHECK_TIMEOUT:
                 raise RuntimeError("Could not connect to the server cell.")
 
+    def _stop_client_cell(self):
+        if self._client_cell:
+            self._client_cell.stop()
+
+
+def _purge_modules(folder: str):
+    """Remove the modules loaded from the specified folder from sys.modules."""
+    prefix = os.path.join(os.path.realpath(folder), "")
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if file and os.path.realpath(file).startswith(prefix):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
 
 def _create_connection(listen_port):
     address = ("localhost", int(listen_port))
@@ -231,14 +310,7 @@ def _create_connection(listen_port):
     return conn
 
 
-def main(args):
-
-    # start parent process checking thread
-    parent_pid = args.parent_pid
-    stop_event = threading.Event()
-    thread = threading.Thread(target=check_parent_alive, args=(parent_pid, stop_event))
-    thread.start()
-
+def _setup_workspace(args) -> Workspace:
     os.chdir(args.workspace)
     startup = os.path.join(args.workspace, WorkspaceConstants.STARTUP_FOLDER_NAME)
     os.makedirs(startup, exist_ok=True)
@@ -249,6 +321,18 @@ def main(args):
     dynamic_log_config(
         config=args.logging_config, dir_path=args.workspace, reload_path=workspace.get_log_config_file_path()
     )
+    return workspace
+
+
+def main(args):
+
+    # start parent process checking thread
+    parent_pid = args.parent_pid
+    stop_event = threading.Event()
+    thread = threading.Thread(target=check_parent_alive, args=(parent_pid, stop_event))
+    thread.start()
+
+    workspace = _setup_workspace(args)
 
     fobs_initialize(workspace, job_id=SimulatorConstants.JOB_NAME)
     register_ext_decomposers(args.decomposer_module)
@@ -287,6 +371,9 @@ def parse_arguments():
     parser.add_argument("--parent_url", "-p", type=str, help="cellnet parent_url")
     parser.add_argument("--task_name", type=str, help="end_run")
     parser.add_argument("--decomposer_module", type=str, help="decomposer_module name", required=True)
+    parser.add_argument(
+        "--warm_worker", action="store_true", help="keep the process to run the next client after switching clients"
+    )
     args = parser.parse_args()
     return args
 
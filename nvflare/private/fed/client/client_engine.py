@@ -144,6 +144,8 @@ class ClientEngine(ClientEngineInternalSpec, StreamableEngine):
 
         topic = request.get_header(MessageHeaderKey.TOPIC)
         with self.new_context() as fl_ctx:
+            # handlers can get the authenticated origin of the message from the cell message
+            fl_ctx.set_prop(FLContextKey.CELL_MESSAGE, request, private=True, sticky=False)
             reply = self.aux_runner.dispatch(topic=topic, request=data, fl_ctx=fl_ctx)
             assert isinstance(reply, Shareable)
             shared_fl_ctx = gen_new_peer_ctx(fl_ctx)
@@ -15,6 +15,7 @@
 from typing import Dict, List, Optional, Union
 
 from nvflare.apis.client import from_dict
+from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import FLContextKey, ProcessType, ReservedKey, SiteType
 from nvflare.apis.fl_context import FLContext, FLContextManager
@@ -27,7 +28,7 @@ from nvflare.fuel.f3.cellnet.defs import ReturnCode as CellReturnCode
 from nvflare.fuel.utils.job_utils import build_client_hierarchy
 from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.private.aux_runner import AuxMsgTarget, AuxRunner
-from nvflare.private.event import fire_event
+from nvflare.private.event import create_subscription_index, fire_event
 from nvflare.private.fed.utils.fed_utils import create_job_processing_context_properties
 from nvflare.private.stream_runner import ObjectStreamer
 from nvflare.widgets.fed_event import ClientFedEventRunner
@@ -88,6 +89,7 @@ class ClientRunManager(ClientEngineExecutorSpec, StreamableEngine):
         self.add_handler(self.object_streamer)
         self.conf = conf
         self.cell = None
+        self.event_index = create_subscription_index()
 
         self.all_clients = None
         self.name_to_clients = dict()  # client name => Client
@@ -201,7 +203,9 @@ class ClientRunManager(ClientEngineExecutorSpec, StreamableEngine):
         return self.widgets.get(widget_id)
 
     def fire_event(self, event_type: str, fl_ctx: FLContext):
-        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx)
+        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx, subscription_index=self.event_index)
+        if event_type == EventType.END_RUN and self.event_index.timing:
+            self.logger.info(f"Time spent by event handlers:\n{self.event_index.format_handler_stats()}")
 
     def add_handler(self, handler: FLComponent):
         self.handlers.append(handler)
@@ -19,7 +19,16 @@ import uuid
 from nvflare.apis.event_type import EventType
 from nvflare.apis.executor import Executor
 from nvflare.apis.fl_component import FLComponent
-from nvflare.apis.fl_constant import ConfigVarName, FilterKey, FLContextKey, ReservedKey, ReservedTopic, ReturnCode
+from nvflare.apis.fl_constant import (
+    ConfigVarName,
+    FilterKey,
+    FLContextKey,
+    ReservedKey,
+    ReservedTopic,
+    ReturnCode,
+    ServerCommandKey,
+    SystemConfigs,
+)
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.fl_exception import UnsafeJobError
 from nvflare.apis.shareable import ReservedHeaderKey, Shareable, make_reply
@@ -30,6 +39,7 @@ from nvflare.apis.utils.reliable_message import ReliableMessage
 from nvflare.apis.utils.task_utils import apply_filters
 from nvflare.fuel.f3.cellnet.fqcn import FQCN
 from nvflare.fuel.f3.streaming.download_service import DownloadService
+from nvflare.fuel.utils.config_service import ConfigService
 from nvflare.fuel.utils.msg_root_utils import delete_msg_root
 from nvflare.private.defs import SpecialTaskName, TaskConstant
 from nvflare.private.fed.client.client_engine_executor_spec import ClientEngineExecutorSpec, TaskAssignment
@@ -159,6 +169,20 @@ class ClientRunner(TBI):
         self.job_heartbeat_interval = self.get_positive_float_var(ConfigVarName.JOB_HEARTBEAT_INTERVAL, 10.0)
         self.get_task_timeout = self.get_positive_float_var(ConfigVarName.GET_TASK_TIMEOUT, None)
         self.submit_task_result_timeout = self.get_positive_float_var(ConfigVarName.SUBMIT_TASK_RESULT_TIMEOUT, None)
+
+        # 0 to disable task-ready notifications from the server, i.e. to always poll for tasks
+        self.task_ready_wait_time = ConfigService.get_float_var(
+            name=ConfigVarName.TASK_READY_WAIT_TIME, conf=SystemConfigs.APPLICATION_CONF, default=5.0
+        )
+        self._task_ready = threading.Event()
+
+        # in pipelined mode, the result of a task is sent in the background while the next task is fetched and run
+        self.pipeline_task_result = ConfigService.get_bool_var(
+            name=ConfigVarName.PIPELINE_TASK_RESULT, conf=SystemConfigs.APPLICATION_CONF, default=False
+        )
+        self._result_sender = None  # thread that sends the result of the last task in pipelined mode
+        self._result_task_id = None
+        self._result_fl_ctx = None
         self._register_aux_message_handlers(engine)
         self.register_event_handler(EventType.TASK_ASSIGNMENT_SENT, self._handle_task_sent_event)
         self.register_event_handler(EventType.TASK_RESULT_RECEIVED, self._handle_task_result_received_event)
@@ -212,6 +236,7 @@ class ClientRunner(TBI):
     def _register_aux_message_handlers(self, engine):
         engine.register_aux_message_handler(topic=ReservedTopic.END_RUN, message_handle_func=self._handle_end_run)
         engine.register_aux_message_handler(topic=ReservedTopic.DO_TASK, message_handle_func=self._handle_do_task)
+        engine.register_aux_message_handler(topic=ReservedTopic.TASK_READY, message_handle_func=self._handle_task_ready)
 
     @staticmethod
     def _reply_and_audit(reply: Shareable, ref, msg, fl_ctx: FLContext) -> Shareable:
@@ -487,10 +512,16 @@ class ClientRunner(TBI):
         heartbeat_thread = threading.Thread(target=self._send_job_heartbeat, args=[], daemon=True)
         heartbeat_thread.start()
 
-        while not self.run_abort_signal.triggered:
-            with self.engine.new_context() as fl_ctx:
-                task_fetch_interval, _ = self.fetch_and_run_one_task(fl_ctx)
-            time.sleep(task_fetch_interval)
+        try:
+            while not self.run_abort_signal.triggered:
+                # a notification received from now on means that a task may be ready
+                self._task_ready.clear()
+                with self.engine.new_context() as fl_ctx:
+                    task_fetch_interval, _ = self.fetch_and_run_one_task(fl_ctx, pipelined=self.pipeline_task_result)
+                self._task_ready.wait(task_fetch_interval)
+        finally:
+            # the result sender stops trying once the job is aborted
+            self._wait_for_result_sender()
 
     def _send_job_heartbeat(self):
         request = Shareable()
@@ -511,14 +542,27 @@ class ClientRunner(TBI):
             # sleep very short time so that we can check stop condition (e.g. abort signal)
             time.sleep(0.2)
 
-    def fetch_and_run_one_task(self, fl_ctx) -> (float, bool):
+    def fetch_and_run_one_task(self, fl_ctx, pipelined: bool = False) -> (float, bool):
         """Fetches and runs a task.
 
+        Args:
+            fl_ctx: FLContext
+            pipelined: whether to send the task result in the background and return right after the task is run.
+                Results are still sent in the order of the tasks: the result of the previous task must have been
+                sent before the result of this task is sent.
+
         Returns:
             A tuple of (task_fetch_interval, task_processed).
         """
         default_task_fetch_interval = self.default_task_fetch_interval
         self.log_debug(fl_ctx, "fetching task from server ...")
+        if self.task_ready_wait_time > 0:
+            fl_ctx.set_prop(FLContextKey.ACCEPT_TASK_READY_NOTIFY, True, private=True, sticky=False)
+        self._wait_for_result_sender(block=False)
+        result_sender = self._result_sender
+        if result_sender and result_sender.is_alive():
+            # prevent the server from sending the task again while its result is being sent
+            fl_ctx.set_prop(FLContextKey.SUBMITTING_TASK_ID, self._result_task_id, private=True, sticky=False)
         task = self.engine.get_task_assignment(fl_ctx, self.get_task_timeout)
 
         if not task:
@@ -533,6 +577,10 @@ class ClientRunner(TBI):
             task_fetch_interval = default_task_fetch_interval
             if task_data and isinstance(task_data, Shareable):
                 task_fetch_interval = task_data.get_header(TaskConstant.WAIT_TIME, task_fetch_interval)
+                if self.task_ready_wait_time > 0 and task_data.get_header(ServerCommandKey.TASK_READY_NOTIFY):
+                    # the server will notify us when a task is ready, which ends the wait early
+                    # never wait longer than the server suggests in case the notification is lost
+                    task_fetch_interval = min(task_fetch_interval, self.task_ready_wait_time)
             self.log_debug(fl_ctx, "server asked to try again - will try in {} secs".format(task_fetch_interval))
             return task_fetch_interval, False
 
@@ -544,14 +592,58 @@ class ClientRunner(TBI):
 
         task_reply = self._process_task(task, fl_ctx)
 
+        # results must be sent in order
+        self._wait_for_result_sender()
+        if pipelined:
+            # events are fired on this thread; AFTER_SEND_TASK_RESULT when the sender is done
+            self.log_debug(fl_ctx, "firing event EventType.BEFORE_SEND_TASK_RESULT")
+            self.fire_event(EventType.BEFORE_SEND_TASK_RESULT, fl_ctx)
+            self._result_task_id = task.task_id
+            self._result_fl_ctx = fl_ctx
+            self._result_sender = threading.Thread(
+                target=self._send_task_result_in_background,
+                args=(task_reply, task.task_id, fl_ctx),
+                name=f"send_result_{task.task_id}",
+                daemon=True,
+            )
+            self._result_sender.start()
+        else:
+            self._submit_task_result(task_reply, task.task_id, fl_ctx)
+
+        return task_fetch_interval, True
+
+    def _submit_task_result(self, result: Shareable, task_id: str, fl_ctx: FLContext):
         self.log_debug(fl_ctx, "firing event EventType.BEFORE_SEND_TASK_RESULT")
         self.fire_event(EventType.BEFORE_SEND_TASK_RESULT, fl_ctx)
 
-        self._send_task_result(task_reply, task.task_id, fl_ctx)
+        self._send_task_result(result, task_id, fl_ctx)
         self.log_debug(fl_ctx, "firing event EventType.AFTER_SEND_TASK_RESULT")
         self.fire_event(EventType.AFTER_SEND_TASK_RESULT, fl_ctx)
 
-        return task_fetch_interval, True
+    def _send_task_result_in_background(self, result: Shareable, task_id: str, fl_ctx: FLContext):
+        try:
+            self._send_task_result(result, task_id, fl_ctx)
+        except Exception as e:
+            self.log_exception(
+                fl_ctx, f"processing error in sending result of task {task_id}: {secure_format_exception(e)}"
+            )
+
+    def _wait_for_result_sender(self, block: bool = True):
+        """Wait for the result of the last task to be sent, and fire AFTER_SEND_TASK_RESULT for it.
+
+        Args:
+            block: whether to wait if the result is still being sent. If False, return right away in that case.
+        """
+        result_sender = self._result_sender
+        if not result_sender or (not block and result_sender.is_alive()):
+            return
+
+        result_sender.join()
+        self._result_sender = None
+        fl_ctx = self._result_fl_ctx
+        self._result_fl_ctx = None
+        self.log_debug(fl_ctx, "firing event EventType.AFTER_SEND_TASK_RESULT")
+        self.fire_event(EventType.AFTER_SEND_TASK_RESULT, fl_ctx)
 
     def _send_task_result(self, result: Shareable, task_id: str, fl_ctx: FLContext):
         try_count = 1
@@ -827,6 +919,13 @@ class ClientRunner(TBI):
         # Usually at the end of the workflow.
         self.log_info(fl_ctx, "received request from Server to end current RUN")
         self.run_abort_signal.trigger(True)
+        self._task_ready.set()
+        return make_reply(ReturnCode.OK)
+
+    def _handle_task_ready(self, topic: str, request: Shareable, fl_ctx: FLContext) -> Shareable:
+        # the server has a task that may be ready for us - ask for it now instead of waiting for the next poll
+        self.log_debug(fl_ctx, "received task-ready notification from server")
+        self._task_ready.set()
         return make_reply(ReturnCode.OK)
 
     def _handle_do_task(self, topic: str, request: Shareable, fl_ctx: FLContext) -> Shareable:
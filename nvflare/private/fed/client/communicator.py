@@ -359,6 +359,13 @@ class Communicator:
         shareable.set_peer_context(shared_fl_ctx)
         if self.last_task_id:
             shareable.set_header(ServerCommandKey.LAST_TASK_ID, self.last_task_id)
+        if fl_ctx.get_prop(FLContextKey.ACCEPT_TASK_READY_NOTIFY):
+            # ask the server to notify us when a task is ready, instead of waiting for the next poll
+            shareable.set_header(ServerCommandKey.ACCEPT_TASK_READY_NOTIFY, True)
+        submitting_task_id = fl_ctx.get_prop(FLContextKey.SUBMITTING_TASK_ID)
+        if submitting_task_id:
+            # the result of this task is still being sent - the server must not send the task again
+            shareable.set_header(ServerCommandKey.SUBMITTING_TASK_ID, submitting_task_id)
 
         task_message = new_cell_message(
             {
@@ -433,7 +440,8 @@ class Communicator:
                     f"({size} Bytes) time: {end_time - start_time:.6f} seconds"
                 )
                 self.last_task_id = task_data.get_header(FLContextKey.TASK_ID)
-                self.pending_task = task_data
+                with self._state_lock:
+                    self.pending_task = task_data
         elif return_code == ReturnCode.AUTHENTICATION_ERROR:
             self.logger.warning("get_task request authentication failed.")
             task = None
@@ -443,6 +451,21 @@ class Communicator:
 
         return task
 
+    def _clear_pending_task(self, task_id):
+        """Unset the pending task if it is the task whose result is being submitted.
+
+        Args:
+            task_id: id of the task whose result is being submitted. If not known, the pending task is unset.
+        """
+        with self._state_lock:
+            pending_task = self.pending_task
+            if pending_task is None:
+                return
+            if task_id and pending_task.get_header(FLContextKey.TASK_ID) != task_id:
+                # the next task has already been received
+                return
+            self.pending_task = None
+
     def submit_update(
         self, project_name, token, ssid, fl_ctx: FLContext, client_name, shareable, execute_task_name, timeout=None
     ):
@@ -461,9 +484,9 @@ class Communicator:
         Returns:
             ReturnCode
         """
-        # Set the pending_task to None immediately to reduce the chance that we send this task to a child
-        # while we are still processing.
-        self.pending_task = None
+        # Unset the pending_task immediately to reduce the chance that we send this task to a child
+        # while we are still processing. With pipelined results, the next task may already be pending.
+        self._clear_pending_task(shareable.get_header(ReservedHeaderKey.TASK_ID))
 
         start_time = time.time()
         shared_fl_ctx = gen_new_peer_ctx(fl_ctx)
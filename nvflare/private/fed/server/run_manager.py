@@ -16,13 +16,15 @@ from typing import List, Optional, Tuple
 
 from nvflare.apis.client import Client
 from nvflare.apis.engine_spec import EngineSpec
+from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_component import FLComponent
 from nvflare.apis.fl_constant import FLContextKey, ProcessType
 from nvflare.apis.fl_context import FLContext, FLContextManager
 from nvflare.apis.server_engine_spec import ServerEngineSpec
 from nvflare.apis.workspace import Workspace
+from nvflare.fuel.utils.log_utils import get_obj_logger
 from nvflare.private.aux_runner import AuxRunner
-from nvflare.private.event import fire_event
+from nvflare.private.event import create_subscription_index, fire_event
 from nvflare.private.fed.utils.fed_utils import create_job_processing_context_properties
 from nvflare.private.stream_runner import ObjectStreamer
 
@@ -77,6 +79,8 @@ class RunManager(EngineSpec):
 
         self.components = components
         self.cell = None
+        self.event_index = create_subscription_index()
+        self.logger = get_obj_logger(self)
 
     def get_server_name(self):
         return self.server_name
@@ -100,7 +104,9 @@ class RunManager(EngineSpec):
         self.components[component_id] = component
 
     def fire_event(self, event_type: str, fl_ctx: FLContext):
-        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx)
+        fire_event(event=event_type, handlers=self.handlers, ctx=fl_ctx, subscription_index=self.event_index)
+        if event_type == EventType.END_RUN and self.event_index.timing:
+            self.logger.info(f"Time spent by event handlers:\n{self.event_index.format_handler_stats()}")
 
     def add_handler(self, handler: FLComponent):
         self.handlers.append(handler)
@@ -160,6 +160,11 @@ class GetTaskCommand(CommandProcessor, ServerStateCheck):
         client = data.get_header(ServerCommandKey.FL_CLIENT)
         self.logger.debug(f"Got the GET_TASK request from client: {client.name}")
         fl_ctx.set_peer_context(shared_fl_ctx)
+        if data.get_header(ServerCommandKey.ACCEPT_TASK_READY_NOTIFY):
+            fl_ctx.set_prop(FLContextKey.ACCEPT_TASK_READY_NOTIFY, True, private=True, sticky=False)
+        submitting_task_id = data.get_header(ServerCommandKey.SUBMITTING_TASK_ID)
+        if submitting_task_id:
+            fl_ctx.set_prop(FLContextKey.SUBMITTING_TASK_ID, submitting_task_id, private=True, sticky=False)
         server_runner = fl_ctx.get_prop(FLContextKey.RUNNER)
         if not server_runner:
             # this is possible only when the client request is received before the
@@ -188,6 +193,10 @@ class GetTaskCommand(CommandProcessor, ServerStateCheck):
         if min_get_task_timeout is not None:
             shareable.set_header(key=ServerCommandKey.MIN_GET_TASK_TIMEOUT, value=min_get_task_timeout)
 
+        # tell the client that it will be notified when a task is ready, so it can poll less often
+        if taskname == SpecialTaskName.TRY_AGAIN and fl_ctx.get_prop(FLContextKey.TASK_READY_NOTIFY):
+            shareable.set_header(key=ServerCommandKey.TASK_READY_NOTIFY, value=True)
+
         shared_fl_ctx = gen_new_peer_ctx(fl_ctx)
         shareable.set_peer_context(shared_fl_ctx)
 
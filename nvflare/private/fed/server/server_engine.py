@@ -481,6 +481,8 @@ class ServerEngine(ServerEngineInternalSpec, StreamableEngine):
 
         topic = request.get_header(MessageHeaderKey.TOPIC)
         with self.new_context() as fl_ctx:
+            # handlers can get the authenticated origin of the message from the cell message
+            fl_ctx.set_prop(FLContextKey.CELL_MESSAGE, request, private=True, sticky=False)
             reply = self.run_manager.aux_runner.dispatch(topic=topic, request=data, fl_ctx=fl_ctx)
             shared_fl_ctx = gen_new_peer_ctx(fl_ctx)
             reply.set_peer_context(shared_fl_ctx)
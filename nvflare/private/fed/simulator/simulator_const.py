@@ -20,3 +20,6 @@ class SimulatorConstants:
     CLIENT_CONFIG = "client_config"
     DEPLOY_ARGS = "deploy_args"
     BUILD_CTX = "build_ctx"
+    CLIENT_NAME = "client_name"
+    TOKEN = "token"
+    TASK_NAME = "task_name"
@@ -0,0 +1,80 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+
+from nvflare.app_common.aggregators.sharded_aggregation_helper import ShardedWeightedAggregationHelper
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+
+
+def make_model(model_mb: int, num_layers: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    layer_size = model_mb * 1024 * 1024 // 4 // num_layers
+    return {f"layer_{i}.weight": rng.standard_normal(layer_size, dtype=np.float32) for i in range(num_layers)}
+
+
+def run_once(helper, models: list, concurrent: bool) -> float:
+    start = time.perf_counter()
+    if concurrent:
+        threads = [threading.Thread(target=helper.add, args=(m, 1.0, f"site-{i}", 0)) for i, m in enumerate(models)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    else:
+        for i, m in enumerate(models):
+            helper.add(m, 1.0, f"site-{i}", 0)
+    helper.get_result()
+    return time.perf_counter() - start
+
+
+def run(helper, models: list, concurrent: bool, repeat: int) -> float:
+    return min(run_once(helper, models, concurrent) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sharded weighted aggregation")
+    parser.add_argument("--model_mb", type=int, default=256, help="model size in MB")
+    parser.add_argument("--num_layers", type=int, default=4, help="number of layers in the model")
+    parser.add_argument("--num_clients", type=int, default=8, help="number of contributions")
+    parser.add_argument("--shards", type=str, default="1,2,4,8", help="comma separated list of shard counts")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best one is reported")
+    parser.add_argument("--concurrent", action="store_true", help="add contributions from concurrent threads")
+    args = parser.parse_args()
+
+    models = [make_model(args.model_mb, args.num_layers, i) for i in range(args.num_clients)]
+    print(
+        f"model={args.model_mb}MB layers={args.num_layers} clients={args.num_clients} "
+        f"concurrent={args.concurrent} cpus={os.cpu_count()}"
+    )
+
+    baseline = run(WeightedAggregationHelper(), models, args.concurrent, args.repeat)
+    print(f"{'unsharded':>10}: {baseline:8.3f}s")
+
+    for num_shards in [int(s) for s in args.shards.split(",")]:
+        helper = ShardedWeightedAggregationHelper(num_shards=num_shards, split_threshold=1024 * 1024)
+        try:
+            elapsed = run(helper, models, args.concurrent, args.repeat)
+        finally:
+            helper.shutdown()
+        print(f"{num_shards:>4} shards: {elapsed:8.3f}s  speedup={baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
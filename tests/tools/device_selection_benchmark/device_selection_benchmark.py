@@ -0,0 +1,97 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import random
+import time
+
+from nvflare.apis.fl_context import FLContext
+from nvflare.edge.assessors.buff_device_manager import BuffDeviceManager
+from nvflare.edge.mud import Device
+
+
+def make_devices(num_devices: int, num_clients: int, skew: float) -> dict:
+    """Make a synthetic device population. With skew > 0, the number of devices per client follows a power law."""
+    weights = [1.0 / (i + 1) ** skew for i in range(num_clients)]
+    clients = random.choices([f"site-{i}" for i in range(num_clients)], weights=weights, k=num_devices)
+    return {f"device-{i}": Device(f"device-{i}", c, 0.0) for i, c in enumerate(clients)}
+
+
+def run(devices: dict, args) -> dict:
+    fl_ctx = FLContext()
+    manager = BuffDeviceManager(
+        device_selection_size=args.selection_size,
+        min_hole_to_fill=args.holes,
+        device_reuse=True,
+        device_sampling_strategy=args.strategy,
+    )
+
+    start = time.perf_counter()
+    manager.update_available_devices(devices, fl_ctx)
+    register_time = time.perf_counter() - start
+
+    # children report all their available devices with every update
+    start = time.perf_counter()
+    manager.update_available_devices(devices, fl_ctx)
+    refresh_time = time.perf_counter() - start
+
+    fill_time = 0.0
+    report_time = 0.0
+    for version in range(1, args.num_fills + 1):
+        start = time.perf_counter()
+        manager.fill_selection(version, fl_ctx)
+        fill_time += time.perf_counter() - start
+
+        # devices report back: they leave the selection and can be reused
+        done = set(random.sample(sorted(manager.current_selection.keys()), args.holes))
+        start = time.perf_counter()
+        manager.remove_devices_from_selection(done, fl_ctx)
+        manager.remove_devices_from_used(done, fl_ctx)
+        manager.has_enough_devices_and_clients(fl_ctx)
+        report_time += time.perf_counter() - start
+
+    return {
+        "register": register_time,
+        "refresh": refresh_time,
+        "fill": fill_time / args.num_fills,
+        "report": report_time / args.num_fills,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark device selection of BuffDeviceManager")
+    parser.add_argument("--num_devices", type=str, default="10000,100000,1000000", help="comma separated list")
+    parser.add_argument("--num_clients", type=int, default=100, help="number of leaf clients")
+    parser.add_argument("--skew", type=float, default=0.0, help="power-law skew of devices per client, 0 is uniform")
+    parser.add_argument("--selection_size", type=int, default=1000, help="device selection size")
+    parser.add_argument("--holes", type=int, default=10, help="number of devices that report back between fills")
+    parser.add_argument("--num_fills", type=int, default=20, help="number of fill_selection calls")
+    parser.add_argument("--strategy", type=str, default="balanced", choices=["balanced", "random"])
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(
+        f"clients={args.num_clients} skew={args.skew} selection={args.selection_size} holes={args.holes} "
+        f"strategy={args.strategy}"
+    )
+    for num_devices in [int(n) for n in args.num_devices.split(",")]:
+        result = run(make_devices(num_devices, args.num_clients, args.skew), args)
+        print(
+            f"{num_devices:>9} devices: register={result['register']:7.3f}s refresh={result['refresh']:7.3f}s "
+            f"fill={result['fill'] * 1000:9.3f}ms report={result['report'] * 1000:8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
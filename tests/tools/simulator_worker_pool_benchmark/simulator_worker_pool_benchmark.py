@@ -0,0 +1,125 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+
+from nvflare.private.fed.app.simulator.simulator_runner import SimulatorRunner
+
+
+def make_job(job_dir: str, num_clients: int, num_rounds: int):
+    """Make a numpy ScatterAndGather job, whose clients finish their tasks right away."""
+    config_dir = os.path.join(job_dir, "app", "config")
+    os.makedirs(config_dir)
+    meta = {"name": "worker_pool_benchmark", "resource_spec": {}, "min_clients": 1, "deploy_map": {"app": ["@ALL"]}}
+    server_config = {
+        "format_version": 2,
+        "components": [
+            {"id": "persistor", "path": "nvflare.app_common.np.np_model_persistor.NPModelPersistor", "args": {}},
+            {
+                "id": "shareable_generator",
+                "path": "nvflare.app_common.shareablegenerators.full_model_shareable_generator."
+                "FullModelShareableGenerator",
+                "args": {},
+            },
+            {
+                "id": "aggregator",
+                "path": "nvflare.app_common.aggregators.intime_accumulate_model_aggregator."
+                "InTimeAccumulateWeightedAggregator",
+                "args": {"expected_data_kind": "WEIGHTS"},
+            },
+        ],
+        "workflows": [
+            {
+                "id": "scatter_and_gather",
+                "path": "nvflare.app_common.workflows.scatter_and_gather.ScatterAndGather",
+                "args": {
+                    "min_clients": num_clients,
+                    "num_rounds": num_rounds,
+                    "wait_time_after_min_received": 0,
+                    "aggregator_id": "aggregator",
+                    "persistor_id": "persistor",
+                    "shareable_generator_id": "shareable_generator",
+                    "train_timeout": 6000,
+                },
+            }
+        ],
+    }
+    client_config = {
+        "format_version": 2,
+        "executors": [{"tasks": ["train"], "executor": {"path": "nvflare.app_common.np.np_trainer.NPTrainer"}}],
+    }
+    for file_name, config in [
+        (os.path.join(job_dir, "meta.json"), meta),
+        (os.path.join(config_dir, "config_fed_server.json"), server_config),
+        (os.path.join(config_dir, "config_fed_client.json"), client_config),
+    ]:
+        with open(file_name, "w") as f:
+            json.dump(config, f)
+
+
+def count_worker_processes(workspace: str) -> int:
+    count = 0
+    for log_file in glob.glob(os.path.join(workspace, "site-*", "log.txt")):
+        with open(log_file) as f:
+            count += f.read().count("ClientTaskWorker started to run")
+    return count
+
+
+def run(job_dir: str, args, warm_workers: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = os.path.join(tmp_dir, "workspace")
+        runner = SimulatorRunner(
+            job_folder=job_dir,
+            workspace=workspace,
+            n_clients=args.num_clients,
+            threads=args.threads,
+            max_clients=max(args.num_clients, 100),
+            warm_workers=warm_workers,
+        )
+        start = time.perf_counter()
+        status = runner.run()
+        elapsed = time.perf_counter() - start
+        return {"status": status, "elapsed": elapsed, "processes": count_worker_processes(workspace)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the client worker processes of the FL simulator")
+    parser.add_argument("--num_clients", type=int, default=8, help="number of simulated clients")
+    parser.add_argument("--threads", type=int, default=1, help="number of clients running in parallel")
+    parser.add_argument("--num_rounds", type=int, default=3, help="number of rounds")
+    parser.add_argument("--mode", type=str, default="both", choices=["cold", "warm", "both"])
+    args = parser.parse_args()
+
+    modes = ["cold", "warm"] if args.mode == "both" else [args.mode]
+    print(f"clients={args.num_clients} threads={args.threads} rounds={args.num_rounds}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        job_dir = os.path.join(tmp_dir, "job")
+        make_job(job_dir, args.num_clients, args.num_rounds)
+        for mode in modes:
+            result = run(job_dir, args, warm_workers=mode == "warm")
+            client_runs = args.num_clients * args.num_rounds
+            print(
+                f"{mode:>5}: status={result['status']} time={result['elapsed']:8.1f}s "
+                f"worker_processes={result['processes']:5d} "
+                f"clients_per_minute={client_runs * 60.0 / result['elapsed']:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import time
+from io import BytesIO
+
+import numpy as np
+
+from nvflare.app_common.np.np_downloader import ArrayConsumer, ArrayDownloadable
+from nvflare.fuel.utils.fobs import lobs
+
+
+def make_arrays(model_mb: int, num_layers: int) -> dict:
+    rng = np.random.default_rng(0)
+    layer_size = model_mb * 1024 * 1024 // 4 // num_layers
+    return {f"layer_{i}.weight": rng.standard_normal(layer_size, dtype=np.float32) for i in range(num_layers)}
+
+
+def npz_item(arrays: dict, key: str) -> bytes:
+    # the item format used before the raw-buffer format
+    stream = BytesIO()
+    np.savez(allow_pickle=False, file=stream, **{key: arrays[key]})
+    return stream.getvalue()
+
+
+def safetensors_item(tensors: dict, key: str) -> bytes:
+    from safetensors.torch import save
+
+    return save({key: tensors[key]})
+
+
+def transfer(keys: list, produce_item, consumer, repeat: int):
+    """Send every item in its own download reply, the way pipelined download does, and consume it.
+
+    Returns: tuple of (best send time, best receive time, bytes on the wire)
+    """
+    best_send = best_recv = float("inf")
+    wire_bytes = 0
+    for _ in range(repeat):
+        send_time = recv_time = 0.0
+        wire_bytes = 0
+        result = None
+        for key in keys:
+            start = time.perf_counter()
+            buffers = lobs.dump_to_bytes({"status": "ok", "data": [produce_item(key)]}, buffer_list=True)
+            send_time += time.perf_counter() - start
+
+            # the receiver gets the frame as one contiguous buffer
+            frame = b"".join(buffers)
+            wire_bytes += len(frame)
+            del buffers
+
+            start = time.perf_counter()
+            reply = lobs.load_from_bytes(frame)
+            result = consumer.consume_items(reply["data"], result)
+            recv_time += time.perf_counter() - start
+            del frame, reply
+        best_send = min(best_send, send_time)
+        best_recv = min(best_recv, recv_time)
+    return best_send, best_recv, wire_bytes
+
+
+def report(name: str, send: float, recv: float, wire_bytes: int, baseline=None):
+    line = f"{name:>12}: send={send:8.3f}s  receive={recv:8.3f}s  total={send + recv:8.3f}s  wire={wire_bytes / 2**20:9.1f}MB"
+    if baseline:
+        line += f"  speedup={baseline / (send + recv):5.2f}x"
+    print(line)
+
+
+def bench_numpy(arrays: dict, repeat: int):
+    keys = list(arrays.keys())
+    downloadable = ArrayDownloadable(arrays, max_chunk_size=0, raw_buffer=True)
+    index = {k: i for i, k in enumerate(keys)}
+
+    send, recv, wire = transfer(keys, lambda k: npz_item(arrays, k), ArrayConsumer(None, {}), repeat)
+    report("npz", send, recv, wire)
+    baseline = send + recv
+
+    send, recv, wire = transfer(keys, lambda k: downloadable.produce_item(index[k]), ArrayConsumer(None, {}), repeat)
+    report("raw", send, recv, wire, baseline)
+
+
+def bench_torch(arrays: dict, repeat: int):
+    import torch
+
+    from nvflare.app_opt.pt.tensor_downloader import TensorConsumer, TensorDownloadable
+
+    tensors = {k: torch.from_numpy(v) for k, v in arrays.items()}
+    keys = list(tensors.keys())
+    downloadable = TensorDownloadable(tensors, max_chunk_size=0, raw_buffer=True)
+    index = {k: i for i, k in enumerate(keys)}
+
+    send, recv, wire = transfer(keys, lambda k: safetensors_item(tensors, k), TensorConsumer(None, {}), repeat)
+    report("safetensors", send, recv, wire)
+    baseline = send + recv
+
+    send, recv, wire = transfer(keys, lambda k: downloadable.produce_item(index[k]), TensorConsumer(None, {}), repeat)
+    report("raw", send, recv, wire, baseline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark wire formats of arrays and tensors")
+    parser.add_argument("--model_mb", type=int, default=1024, help="model size in MB")
+    parser.add_argument("--num_layers", type=int, default=16, help="number of layers in the model")
+    parser.add_argument("--framework", choices=["numpy", "torch", "all"], default="all", help="what to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best one is reported")
+    args = parser.parse_args()
+
+    arrays = make_arrays(args.model_mb, args.num_layers)
+    print(f"model={args.model_mb}MB layers={args.num_layers}")
+
+    if args.framework in ("numpy", "all"):
+        print("numpy:")
+        bench_numpy(arrays, args.repeat)
+    if args.framework in ("torch", "all"):
+        print("torch:")
+        bench_torch(arrays, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@ from unittest import mock
 
 from nvflare.apis.fl_context import FLContext
 from nvflare.apis.impl.job_def_manager import SimpleJobDefManager
-from nvflare.apis.job_def import JobMetaKey
+from nvflare.apis.job_def import JobMetaKey, RunStatus
 from nvflare.apis.storage import WORKSPACE
 from nvflare.app_common.storages.filesystem_storage import FilesystemStorage
 from nvflare.fuel.utils.zip_utils import zip_directory_to_bytes
@@ -63,3 +63,44 @@ class TestJobManager(unittest.TestCase):
             self.job_manager.save_workspace(job_id, data, self.fl_ctx)
             result = self.job_manager.get_storage_component(job_id, WORKSPACE, self.fl_ctx)
             assert result == data
+
+    def test_job_catalog(self):
+        with mock.patch("nvflare.apis.impl.job_def_manager.SimpleJobDefManager._get_job_store") as mock_store:
+            store = FilesystemStorage()
+            mock_store.return_value = store
+
+            _, meta1 = self._create_job()
+            _, meta2 = self._create_job()
+            job_id1 = meta1.get(JobMetaKey.JOB_ID)
+            job_id2 = meta2.get(JobMetaKey.JOB_ID)
+
+            # the catalog is built from the store on first use
+            assert {j.job_id for j in self.job_manager.get_jobs_to_schedule(self.fl_ctx)} == {job_id1, job_id2}
+
+            _, meta3 = self._create_job()
+            job_id3 = meta3.get(JobMetaKey.JOB_ID)
+            self.job_manager.set_status(job_id1, RunStatus.RUNNING, self.fl_ctx)
+            self.job_manager.update_meta(job_id2, {JobMetaKey.STATUS.value: RunStatus.DISPATCHED.value}, self.fl_ctx)
+            self.job_manager.delete(job_id3, self.fl_ctx)
+
+            with mock.patch.object(store, "get_meta", side_effect=AssertionError("job store is scanned")):
+                assert self.job_manager.get_jobs_to_schedule(self.fl_ctx) == []
+                running = self.job_manager.get_jobs_by_status([RunStatus.RUNNING, RunStatus.DISPATCHED], self.fl_ctx)
+                assert {j.job_id for j in running} == {job_id1, job_id2}
+                assert [j.job_id for j in self.job_manager.get_jobs_by_status(RunStatus.RUNNING, self.fl_ctx)] == [
+                    job_id1
+                ]
+                assert {j.job_id for j in self.job_manager.get_all_jobs(self.fl_ctx)} == {job_id1, job_id2}
+
+                # jobs returned are copies of the catalog entries
+                job = self.job_manager.get_jobs_by_status(RunStatus.RUNNING, self.fl_ctx)[0]
+                job.meta[JobMetaKey.STATUS.value] = RunStatus.FINISHED_COMPLETED.value
+                assert len(self.job_manager.get_jobs_by_status(RunStatus.RUNNING, self.fl_ctx)) == 1
+
+            # the catalog agrees with a full scan of the store
+            scan_manager = SimpleJobDefManager(uri_root=self.uri_root, use_catalog=False)
+            with mock.patch.object(scan_manager, "_get_job_store", return_value=store):
+                for status in [RunStatus.SUBMITTED, RunStatus.RUNNING, RunStatus.DISPATCHED]:
+                    expected = scan_manager.get_jobs_by_status(status, self.fl_ctx)
+                    result = self.job_manager.get_jobs_by_status(status, self.fl_ctx)
+                    assert [j.meta for j in result] == [j.meta for j in expected]
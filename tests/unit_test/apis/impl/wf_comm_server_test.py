@@ -0,0 +1,246 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from nvflare.apis.client import Client
+from nvflare.apis.controller_spec import SendOrder, Task, TaskCompletionStatus
+from nvflare.apis.fl_constant import FLContextKey, ReservedTopic
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.impl.bcast_manager import BcastTaskManager
+from nvflare.apis.impl.wf_comm_server import WFCommServer
+from nvflare.apis.shareable import Shareable
+
+
+def _create_server():
+    server = WFCommServer()
+    server._engine = MagicMock()
+    server._engine.new_context.return_value.__enter__.return_value = FLContext()
+    return server
+
+
+class TestTaskIndex:
+    def test_only_tasks_targeting_the_client_are_checked(self):
+        server = _create_server()
+        fl_ctx = FLContext()
+        for i in range(20):
+            server.broadcast(Task(name=f"task_{i}", data=Shareable()), fl_ctx, targets=[f"site-{i}"])
+        # open task, which may be sent to any client
+        server.relay(Task(name="relay", data=Shareable()), fl_ctx, targets=["site-0"], send_order=SendOrder.ANY)
+
+        check_task_send = BcastTaskManager.check_task_send
+        with patch.object(BcastTaskManager, "check_task_send", autospec=True, side_effect=check_task_send) as spy:
+            task_name, _, _ = server.process_task_request(Client("site-7", None), FLContext())
+
+        assert task_name == "task_7"
+        assert spy.call_count == 1
+
+        # a client that is not a target of any broadcast only gets the open task
+        task_name, _, _ = server.process_task_request(Client("site-99", None), FLContext())
+        assert task_name == "relay"
+
+    def test_tasks_are_checked_in_order_of_scheduling(self):
+        server = _create_server()
+        fl_ctx = FLContext()
+        server.relay(Task(name="relay", data=Shareable()), fl_ctx, dynamic_targets=True, targets=["site-1"])
+        server.broadcast(Task(name="bcast", data=Shareable()), fl_ctx, targets=["site-1"])
+
+        task_name, _, _ = server.process_task_request(Client("site-1", None), FLContext())
+        assert task_name == "relay"
+        task_name, _, _ = server.process_task_request(Client("site-1", None), FLContext())
+        assert task_name == "bcast"
+
+    def test_exited_tasks_are_removed_from_index(self):
+        server = _create_server()
+        fl_ctx = FLContext()
+        task = Task(name="task", data=Shareable(), timeout=1)
+        server.broadcast(task, fl_ctx, targets=["site-1", "site-2"])
+        open_task = Task(name="open", data=Shareable())
+        server.relay(open_task, fl_ctx, dynamic_targets=True)
+        assert set(server._target_task_index.keys()) == {"site-1", "site-2"}
+
+        server.cancel_task(open_task)
+        task.schedule_time = time.time() - 2
+        server._task_deadlines = [(task.schedule_time + task.timeout, task.props["___seq"])]
+        server._do_check_tasks()
+
+        assert task.completion_status == TaskCompletionStatus.TIMEOUT
+        assert open_task.completion_status == TaskCompletionStatus.CANCELLED
+        assert server.get_num_standing_tasks() == 0
+        assert server._target_task_index == {}
+        assert server._open_tasks == {}
+
+
+class TestTaskCompletionSignal:
+    def test_waiter_wakes_up_when_task_is_done(self):
+        # with a long check period, the round would take seconds if the waiter and monitor polled
+        server = WFCommServer(task_check_period=5.0)
+        server._engine = MagicMock()
+        server._engine.new_context.return_value.__enter__.return_value = FLContext()
+        server._engine.get_clients.return_value = []
+        server._task_monitor.start()
+
+        task = Task(name="task", data=Shareable())
+        waiter = threading.Thread(
+            target=server.broadcast_and_wait, args=(task, FLContext()), kwargs={"targets": ["site-1"]}, daemon=True
+        )
+        try:
+            start = time.time()
+            waiter.start()
+            while not server.get_num_standing_tasks():
+                time.sleep(0.01)
+
+            client = Client("site-1", None)
+            task_name, task_id, _ = server.process_task_request(client, FLContext())
+            server.process_submission(client, task_name, task_id, Shareable(), FLContext())
+            waiter.join(timeout=3.0)
+
+            assert not waiter.is_alive()
+            assert task.completion_status == TaskCompletionStatus.OK
+            assert time.time() - start < 3.0
+        finally:
+            server.finalize_run(FLContext())
+
+    def test_cancel_wakes_up_waiter(self):
+        server = WFCommServer(task_check_period=5.0)
+        task = Task(name="task", data=Shareable())
+        waiter = threading.Thread(target=server.wait_for_task, args=(task, None), daemon=True)
+        waiter.start()
+        time.sleep(0.1)
+
+        server.cancel_task(task)
+        waiter.join(timeout=1.0)
+        assert not waiter.is_alive()
+
+
+def _notify_ctx():
+    fl_ctx = FLContext()
+    fl_ctx.set_prop(FLContextKey.ACCEPT_TASK_READY_NOTIFY, True, private=True, sticky=False)
+    return fl_ctx
+
+
+def _notified_clients(server):
+    result = []
+    for c in server._engine.send_aux_request.call_args_list:
+        assert c.kwargs["topic"] == ReservedTopic.TASK_READY
+        result.append(sorted(c.kwargs["targets"]))
+    return result
+
+
+class TestTaskReadyNotification:
+    def test_waiting_targets_are_notified_when_task_is_scheduled(self):
+        server = _create_server()
+        for name in ["site-1", "site-2", "site-3"]:
+            fl_ctx = _notify_ctx()
+            task_name, _, _ = server.process_task_request(Client(name, None), fl_ctx)
+            assert not task_name
+            assert fl_ctx.get_prop(FLContextKey.TASK_READY_NOTIFY)
+
+        # clients that do not accept notifications are not registered
+        fl_ctx = FLContext()
+        server.process_task_request(Client("site-4", None), fl_ctx)
+        assert not fl_ctx.get_prop(FLContextKey.TASK_READY_NOTIFY)
+
+        server.broadcast(Task(name="bcast", data=Shareable()), FLContext(), targets=["site-1", "site-2", "site-4"])
+        assert _notified_clients(server) == [["site-1", "site-2"]]
+        assert server._waiting_clients == {"site-3"}
+
+        # an open task notifies all waiting clients
+        server.relay(Task(name="relay", data=Shareable()), FLContext(), dynamic_targets=True)
+        assert _notified_clients(server)[-1] == ["site-3"]
+        assert not server._waiting_clients
+
+    def test_client_is_not_waiting_after_getting_task(self):
+        server = _create_server()
+        server.broadcast(Task(name="bcast", data=Shareable()), FLContext(), targets=["site-1"])
+        task_name, _, _ = server.process_task_request(Client("site-1", None), _notify_ctx())
+        assert task_name == "bcast"
+        assert not server._waiting_clients
+
+        server.broadcast(Task(name="bcast2", data=Shareable()), FLContext(), targets=["site-1"])
+        server._engine.send_aux_request.assert_not_called()
+
+    def test_waiting_clients_are_notified_of_relay_result(self):
+        server = _create_server()
+        task = Task(name="relay", data=Shareable())
+        server.relay(task, FLContext(), targets=["site-1", "site-2"], send_order=SendOrder.SEQUENTIAL)
+
+        task_name, task_id, _ = server.process_task_request(Client("site-1", None), _notify_ctx())
+        assert task_name == "relay"
+        # site-2 must wait for the result of site-1
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert not task_name
+
+        server.process_submission(Client("site-1", None), "relay", task_id, Shareable(), FLContext())
+        assert _notified_clients(server) == [["site-2"]]
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert task_name == "relay"
+
+    def test_next_target_is_notified_on_task_assignment_timeout(self):
+        server = _create_server()
+        task = Task(name="send", data=Shareable())
+        server.send(task, FLContext(), targets=["site-1", "site-2"], task_assignment_timeout=1)
+
+        # site-1 never asks for the task, so site-2 becomes eligible after the assignment timeout
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert not task_name
+        server.check_tasks()
+        server._engine.send_aux_request.assert_not_called()
+
+        time.sleep(1.05)
+        server.check_tasks()
+        assert _notified_clients(server) == [["site-2"]]
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert task_name == "send"
+
+    def test_blocked_targets_are_notified_when_task_exits(self):
+        server = _create_server()
+        task = Task(name="send", data=Shareable(), timeout=1)
+        server.send(task, FLContext(), targets=["site-1", "site-2"])
+        server.broadcast(Task(name="bcast", data=Shareable()), FLContext(), targets=["site-2"])
+        server._engine.send_aux_request.reset_mock()
+
+        # site-2 is blocked by the send task until it exits
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert not task_name
+
+        server.cancel_task(task)
+        server.check_tasks()
+        assert _notified_clients(server) == [["site-2"]]
+        task_name, _, _ = server.process_task_request(Client("site-2", None), _notify_ctx())
+        assert task_name == "bcast"
+
+    def test_waiting_clients_are_notified_when_run_is_finalized(self):
+        server = _create_server()
+        server.process_task_request(Client("site-1", None), _notify_ctx())
+        server.finalize_run(FLContext())
+        assert _notified_clients(server) == [["site-1"]]
+
+
+def test_task_is_not_resent_while_client_sends_its_result():
+    server = _create_server()
+    server.broadcast(Task(name="bcast", data=Shareable()), FLContext(), targets=["site-1", "site-2"])
+    task_name, task_id, _ = server.process_task_request(Client("site-1", None), FLContext())
+    assert task_name == "bcast"
+
+    fl_ctx = FLContext()
+    fl_ctx.set_prop(FLContextKey.SUBMITTING_TASK_ID, task_id, private=True, sticky=False)
+    task_name, _, _ = server.process_task_request(Client("site-1", None), fl_ctx)
+    assert not task_name
+
+    # the task is sent again if the client is not sending its result
+    task_name, resent_id, _ = server.process_task_request(Client("site-1", None), FLContext())
+    assert (task_name, resent_id) == ("bcast", task_id)
@@ -0,0 +1,122 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nvflare.apis.fl_component import FLComponent
+from nvflare.apis.fl_constant import FLContextKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.utils.event import EventSubscriptionIndex, fire_event_to_components
+
+
+class _Recorder(FLComponent):
+    def __init__(self, calls, name):
+        super().__init__()
+        self.calls = calls
+        self.recorder_name = name
+
+
+class _DefaultHandler(_Recorder):
+    def handle_event(self, event_type: str, fl_ctx: FLContext):
+        self.calls.append((self.recorder_name, event_type, fl_ctx.get_prop(FLContextKey.EVENT_DATA)))
+        if event_type == "outer":
+            # fire a nested event on the same context
+            fl_ctx.set_prop(FLContextKey.EVENT_DATA, "nested data", private=True, sticky=False)
+            fire_event_to_components("nested", [self], fl_ctx)
+
+
+class _RegisteredHandler(_Recorder):
+    def __init__(self, calls, name, event_type):
+        super().__init__(calls, name)
+        self.register_event_handler(event_type, self._handle)
+
+    def _handle(self, event_type: str, fl_ctx: FLContext):
+        self.calls.append((self.recorder_name, event_type, fl_ctx.get_prop(FLContextKey.EVENT_DATA)))
+
+
+class _FailingHandler(FLComponent):
+    def handle_event(self, event_type: str, fl_ctx: FLContext):
+        raise ValueError("failed")
+
+
+@pytest.mark.parametrize("use_index", [False, True])
+def test_only_subscribers_are_called(use_index):
+    calls = []
+    components = [
+        _Recorder(calls, "ignores"),
+        _RegisteredHandler(calls, "registered", "outer"),
+        _DefaultHandler(calls, "default"),
+        _RegisteredHandler(calls, "other", "other_event"),
+    ]
+    index = EventSubscriptionIndex() if use_index else None
+    if index:
+        assert [h.recorder_name for h, _ in index.get_subscribers("outer", components)] == ["registered", "default"]
+        assert [h.recorder_name for h, _ in index.get_subscribers("other_event", components)] == ["default", "other"]
+
+    ctx = FLContext()
+    ctx.set_prop(FLContextKey.EVENT_DATA, "outer data", private=True, sticky=False)
+    fire_event_to_components("outer", components, ctx, index)
+    assert calls == [
+        ("registered", "outer", "outer data"),
+        ("default", "outer", "outer data"),
+        ("default", "nested", "nested data"),
+    ]
+
+    # the handlers after a nested event still get the data of their own event
+    calls.clear()
+    components.append(_RegisteredHandler(calls, "last", "outer"))
+    ctx.set_prop(FLContextKey.EVENT_DATA, "outer data", private=True, sticky=False)
+    fire_event_to_components("outer", components, ctx, index)
+    assert calls[-1] == ("last", "outer", "outer data")
+
+
+def test_index_is_rebuilt_on_changes():
+    calls = []
+    index = EventSubscriptionIndex()
+    component = _Recorder(calls, "late")
+    components = [component]
+    assert index.get_subscribers("e", components) == []
+
+    # a handler registered after the index was built
+    component.register_event_handler("e", lambda event_type, fl_ctx: calls.append(event_type))
+    assert [h for h, _ in index.get_subscribers("e", components)] == [component]
+
+    # the list of components changed
+    components.append(_DefaultHandler(calls, "added"))
+    assert len(index.get_subscribers("e", components)) == 2
+
+    fire_event_to_components("e", components, FLContext(), index)
+    assert calls == ["e", ("added", "e", None)]
+
+
+def test_handler_timing_and_exceptions():
+    calls = []
+    index = EventSubscriptionIndex(timing=True)
+    components = [_FailingHandler(), _DefaultHandler(calls, "default")]
+    ctx = FLContext()
+    for _ in range(3):
+        fire_event_to_components("e", components, ctx, index)
+
+    # the exception of a handler does not stop the other handlers
+    assert len(calls) == 3
+    assert isinstance(ctx.get_prop(FLContextKey.EXCEPTIONS)["_FailingHandler"], ValueError)
+
+    stats = index.get_handler_stats()
+    assert {(name, event, count) for name, event, count, _ in stats} == {("_DefaultHandler", "e", 3)}
+    assert "_DefaultHandler" in index.format_handler_stats()
+
+
+def test_non_component_handler():
+    with pytest.raises(TypeError):
+        fire_event_to_components("e", [object()], FLContext(), EventSubscriptionIndex())
@@ -0,0 +1,248 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import copy
+import os
+import threading
+
+import pytest
+
+import nvflare.apis.utils.reliable_message as reliable_message
+import nvflare.fuel.f3.streaming.bytes_downloader as bytes_downloader
+from nvflare.apis.fl_constant import FLContextKey, ProcessType, ReservedKey
+from nvflare.apis.fl_context import FLContextManager
+from nvflare.apis.shareable import ReturnCode, Shareable
+from nvflare.apis.utils.reliable_message import (
+    HEADER_OP,
+    HEADER_PAYLOAD_REF,
+    OP_REQUEST,
+    TOPIC_RELIABLE_REPLY,
+    TOPIC_RELIABLE_REQUEST,
+    ReliableMessage,
+)
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey
+from nvflare.fuel.f3.cellnet.defs import ReturnCode as CellReturnCode
+from nvflare.fuel.f3.cellnet.fqcn import FQCN
+from nvflare.fuel.f3.cellnet.utils import make_reply
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.download_service import DownloadService
+
+TOPIC = "test_topic"
+
+
+class _Cell:
+    """Serves download requests of the in-process DownloadService, failing the requests at the specified calls."""
+
+    def __init__(self, fqcn: str, fail_calls=()):
+        self.fqcn = fqcn
+        self.fail_calls = set(fail_calls)
+        self.states = []
+        self.targets = []
+
+    def get_fqcn(self):
+        return self.fqcn
+
+    def register_request_cb(self, channel, topic, cb):
+        pass
+
+    def send_request(self, channel, target, topic, request, timeout, secure=False, optional=False, abort_signal=None):
+        self.states.append(request.payload.get("state"))
+        self.targets.append(target)
+        if len(self.states) in self.fail_calls:
+            return make_reply(CellReturnCode.COMM_ERROR)
+        request.set_header(MessageHeaderKey.ORIGIN, self.fqcn)
+        return DownloadService._handle_download(request)
+
+
+class _Engine:
+    """Delivers aux messages between the sites in process."""
+
+    def __init__(self, network: dict, name: str, cell=None):
+        self.network = network
+        self.name = name
+        self.cell = cell
+        self.handlers = {}
+        self.sent = []  # (topic, request)
+        process_type = ProcessType.SERVER_JOB if name == "server" else ProcessType.CLIENT_JOB
+        self.ctx_manager = FLContextManager(
+            engine=self, identity_name=name, job_id="job", private_stickers={ReservedKey.PROCESS_TYPE: process_type}
+        )
+        network[name] = self
+
+    def register_aux_message_handler(self, topic, message_handle_func):
+        self.handlers[topic] = message_handle_func
+
+    def send_aux_request(self, targets, topic, request, timeout, fl_ctx, secure=False, optional=False):
+        replies = {}
+        for t in targets:
+            req = copy.deepcopy(request)
+            req.set_peer_props({ReservedKey.IDENTITY_NAME: self.name})
+            self.sent.append((topic, req))
+            peer = self.network[t]
+            ctx = peer.ctx_manager.new_context()
+            ctx.set_peer_context(self.ctx_manager.new_context())
+            if self.cell:
+                cell_msg = Message(headers={MessageHeaderKey.ORIGIN: self.cell.get_fqcn()}, payload=req)
+                ctx.set_prop(FLContextKey.CELL_MESSAGE, cell_msg, private=True, sticky=False)
+            replies[t] = peer.handlers[topic](topic, req, ctx)
+        return replies
+
+
+class _Client:
+    def __init__(self, name: str):
+        self.name = name
+
+    def get_fqcn(self):
+        return self.name
+
+
+class _CellEngine(_Engine):
+    def get_cell(self):
+        return self.cell
+
+    def get_client_from_name(self, client_name):
+        return _Client(client_name) if client_name in self.network else None
+
+
+def _handle(topic, request: Shareable, fl_ctx):
+    result = Shareable()
+    result["data"] = request["data"][::-1]
+    return result
+
+
+@pytest.fixture
+def rm(monkeypatch):
+    monkeypatch.setattr(ReliableMessage, "_enabled", True)
+    monkeypatch.setattr(ReliableMessage, "_shutdown_asked", False)
+    monkeypatch.setattr(ReliableMessage, "_query_interval", 0.1)
+    monkeypatch.setattr(ReliableMessage, "_stage_payload", True)
+    monkeypatch.setattr(ReliableMessage, "_topic_to_handle", {})
+    monkeypatch.setattr(ReliableMessage, "_req_receivers", {})
+    monkeypatch.setattr(ReliableMessage, "_req_completed", {})
+    monkeypatch.setattr(ReliableMessage, "_reply_receivers", {})
+    monkeypatch.setattr(bytes_downloader, "DEFAULT_CHUNK_SIZE", 1024)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(ReliableMessage, "_executor", executor)
+    yield ReliableMessage
+    executor.shutdown(wait=True)
+
+
+def _make_sites(engine_class, server_cell=None, client_cell=None):
+    network = {}
+    server = engine_class(network, "server", server_cell)
+    client = engine_class(network, "site-1", client_cell)
+    for engine in (server, client):
+        engine.register_aux_message_handler(TOPIC_RELIABLE_REQUEST, ReliableMessage._receive_request)
+        engine.register_aux_message_handler(TOPIC_RELIABLE_REPLY, ReliableMessage._receive_reply)
+    ReliableMessage.register_request_handler(TOPIC, _handle, server.ctx_manager.new_context())
+    return server, client
+
+
+def _send(client, data):
+    request = Shareable()
+    request["data"] = data
+    return ReliableMessage.send_request(
+        target="server",
+        topic=TOPIC,
+        request=request,
+        per_msg_timeout=2.0,
+        tx_timeout=10.0,
+        abort_signal=None,
+        fl_ctx=client.ctx_manager.new_context(),
+    )
+
+
+class TestReliableMessage:
+    def test_staged_request_and_result(self, rm):
+        server, client = _make_sites(_CellEngine, _Cell("server.job"), _Cell("site-1.job"))
+        data = os.urandom(5000)
+        result = _send(client, data)
+
+        assert result.get_return_code() == ReturnCode.OK
+        assert result["data"] == data[::-1]
+
+        # only control messages are sent: the request and the result are downloaded
+        assert client.sent and all(req.get_header(HEADER_PAYLOAD_REF) for _, req in client.sent)
+        assert all("data" not in req for _, req in client.sent)
+        assert [topic for topic, _ in server.sent] == [TOPIC_RELIABLE_REPLY]
+        assert "data" not in server.sent[0][1]
+        assert server.cell.states.count(None) == 1
+        assert client.cell.states.count(None) == 1
+
+        # the payloads are downloaded from the peer cell, as authenticated by the cellnet
+        assert set(server.cell.targets) == {FQCN.join(["site-1", "job"])}
+        assert set(client.cell.targets) == {FQCN.join([FQCN.ROOT_SERVER, "job"])}
+
+    def test_interrupted_download_is_resumed(self, rm):
+        # the 3rd download request of the request payload fails
+        server, client = _make_sites(_CellEngine, _Cell("server.job", fail_calls=[3]), _Cell("site-1.job"))
+        data = os.urandom(5000)
+        result = _send(client, data)
+
+        assert result.get_return_code() == ReturnCode.OK
+        assert result["data"] == data[::-1]
+
+        # the request is sent once, and the download continues from the 2 chunks already received
+        assert [req.get_header(HEADER_OP) for _, req in client.sent] == [OP_REQUEST]
+        states = server.cell.states
+        assert states.count(None) == 1
+        assert states[3] == {"received_bytes": 2048}
+
+    def test_without_cell(self, rm):
+        server, client = _make_sites(_Engine)
+        data = os.urandom(100)
+        result = _send(client, data)
+
+        assert result.get_return_code() == ReturnCode.OK
+        assert result["data"] == data[::-1]
+        assert client.sent[0][1]["data"] == data
+        assert server.sent[0][1]["data"] == data[::-1]
+        assert server.sent[0][1].get_header(HEADER_PAYLOAD_REF) is None
+
+    def test_staged_request_without_origin(self, rm, monkeypatch):
+        # a staged request is only downloaded from the cell it came from
+        monkeypatch.setattr(reliable_message, "_get_msg_origin", lambda fl_ctx: None)
+        server, client = _make_sites(_CellEngine, _Cell("server.job"), _Cell("site-1.job"))
+        result = _send(client, os.urandom(100))
+
+        assert result.get_return_code() == ReturnCode.COMMUNICATION_ERROR
+        assert not server.cell.targets
+
+    def test_staging_disabled(self, rm, monkeypatch):
+        monkeypatch.setattr(ReliableMessage, "_stage_payload", False)
+        server, client = _make_sites(_CellEngine, _Cell("server.job"), _Cell("site-1.job"))
+        data = os.urandom(100)
+        result = _send(client, data)
+
+        assert result["data"] == data[::-1]
+        assert client.sent[0][1]["data"] == data
+        assert server.sent[0][1]["data"] == data[::-1]
+        assert not server.cell.targets and not client.cell.targets
+
+    def test_concurrent_requests(self, rm):
+        server, client = _make_sites(_CellEngine, _Cell("server.job"), _Cell("site-1.job"))
+        payloads = [os.urandom(3000) for _ in range(4)]
+        results = [None] * len(payloads)
+
+        def _run(i):
+            results[i] = _send(client, payloads[i])
+
+        threads = [threading.Thread(target=_run, args=(i,)) for i in range(len(payloads))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for data, result in zip(payloads, results):
+            assert result["data"] == data[::-1]
@@ -0,0 +1,152 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import numpy as np
+import pytest
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.app_common.aggregators.dxo_aggregator import DXOAggregator
+from nvflare.app_common.aggregators.sharded_aggregation_helper import ShardedWeightedAggregationHelper
+from nvflare.app_common.aggregators.weighted_aggregation_helper import WeightedAggregationHelper
+from nvflare.app_common.app_constant import AppConstants
+
+
+def _make_model(seed):
+    rng = np.random.default_rng(seed)
+    return {
+        "conv.weight": rng.standard_normal((8, 4, 3, 3)).astype(np.float32),
+        "conv.bias": rng.standard_normal(8).astype(np.float32),
+        "fc.weight": rng.standard_normal((64, 32)).astype(np.float32),
+        "fc.bias": rng.standard_normal(32),
+        "bn.num_batches_tracked": np.array(seed, dtype=np.int64),
+        "scale": float(seed),
+    }
+
+
+class TestShardedWeightedAggregationHelper:
+    @pytest.fixture
+    def helper(self, request):
+        num_shards, split_threshold = request.param
+        helper = ShardedWeightedAggregationHelper(num_shards=num_shards, split_threshold=split_threshold)
+        yield helper
+        helper.shutdown()
+
+    @pytest.mark.parametrize("helper", [(1, 1024), (3, 1 << 20), (4, 256)], indirect=True)
+    def test_matches_unsharded_helper(self, helper):
+        expected = WeightedAggregationHelper()
+        for i in range(5):
+            model = _make_model(i)
+            helper.add(model, weight=i + 1.0, contributor_name=f"site-{i}", contribution_round=0)
+            expected.add(model, weight=i + 1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        assert helper.get_len() == 5
+        assert helper.get_history() == expected.get_history()
+
+        result = helper.get_result()
+        expected_result = expected.get_result()
+        assert set(result.keys()) == set(expected_result.keys())
+        for k, v in expected_result.items():
+            if isinstance(v, np.ndarray):
+                assert result[k].shape == v.shape
+                assert result[k].dtype == v.dtype
+            np.testing.assert_allclose(result[k], v, rtol=1e-6)
+
+        # get_result resets the stats
+        assert helper.get_len() == 0
+        assert helper.get_result() == {}
+
+    def test_large_arrays_are_split_across_shards(self):
+        helper = ShardedWeightedAggregationHelper(num_shards=4, split_threshold=256)
+        try:
+            model = _make_model(1)
+            helper.add(model, weight=1.0, contributor_name="site-1", contribution_round=0)
+
+            assert set(helper.split_layout.keys()) == {"conv.weight", "fc.weight"}
+            assert all(len(shard.total) > 0 for shard in helper.shards)
+
+            result = helper.get_result()
+            np.testing.assert_array_equal(result["fc.weight"], model["fc.weight"])
+            np.testing.assert_array_equal(result["conv.weight"], model["conv.weight"])
+        finally:
+            helper.shutdown()
+
+    def test_exclude_vars(self):
+        helper = ShardedWeightedAggregationHelper(num_shards=2, exclude_vars="bias")
+        try:
+            helper.add(_make_model(1), weight=1.0, contributor_name="site-1", contribution_round=0)
+            result = helper.get_result()
+            assert "conv.bias" not in result
+            assert "fc.bias" not in result
+            assert "fc.weight" in result
+        finally:
+            helper.shutdown()
+
+    def test_shape_change_of_split_array(self):
+        helper = ShardedWeightedAggregationHelper(num_shards=2, split_threshold=16)
+        try:
+            helper.add({"w": np.ones(16)}, weight=1.0, contributor_name="site-1", contribution_round=0)
+            with pytest.raises(ValueError, match="shape of w changed"):
+                helper.add({"w": np.ones(8)}, weight=1.0, contributor_name="site-2", contribution_round=0)
+        finally:
+            helper.shutdown()
+
+    def test_concurrent_adds(self):
+        num_clients = 16
+        helper = ShardedWeightedAggregationHelper(num_shards=4, split_threshold=1024)
+        expected = WeightedAggregationHelper()
+        models = [_make_model(i) for i in range(num_clients)]
+        for i, model in enumerate(models):
+            expected.add(model, weight=1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        def _add(i):
+            helper.add(models[i], weight=1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        try:
+            threads = [threading.Thread(target=_add, args=(i,)) for i in range(num_clients)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert helper.get_len() == num_clients
+            result = helper.get_result()
+            # float32 sums depend on the order in which the contributions arrive
+            for k, v in expected.get_result().items():
+                np.testing.assert_allclose(result[k], v, rtol=1e-5, atol=1e-6)
+        finally:
+            helper.shutdown()
+
+    @pytest.mark.parametrize("num_shards", [0, -1])
+    def test_bad_num_shards(self, num_shards):
+        with pytest.raises(ValueError):
+            ShardedWeightedAggregationHelper(num_shards=num_shards)
+
+
+def test_dxo_aggregator_with_shards():
+    aggregator = DXOAggregator(exclude_vars=None, expected_data_kind=DataKind.WEIGHTS, num_shards=2)
+    assert isinstance(aggregator.aggregation_helper, ShardedWeightedAggregationHelper)
+
+    fl_ctx = FLContext()
+    fl_ctx.set_prop(AppConstants.CURRENT_ROUND, 0)
+    for i in range(3):
+        dxo = DXO(DataKind.WEIGHTS, data={"w": np.full(4, float(i), dtype=np.float32)})
+        dxo.set_meta_prop(MetaKey.NUM_STEPS_CURRENT_ROUND, 1)
+        assert aggregator.accept(dxo, f"site-{i}", 0, fl_ctx)
+
+    result = aggregator.aggregate(fl_ctx)
+    np.testing.assert_allclose(result.data["w"], np.ones(4))
+    aggregator.shutdown()
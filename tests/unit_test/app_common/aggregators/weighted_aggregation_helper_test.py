@@ -440,6 +440,115 @@ class TestWeightedAggregationHelper:
         result = helper.get_result()
         assert result["w"] == pytest.approx(3.0)
 
+    def test_numpy_accumulation_does_not_mutate_input(self):
+        """Test that the NumPy accumulator never aliases the contributed arrays."""
+        helper = WeightedAggregationHelper()
+
+        data1 = {"w": np.array([1.0, 2.0], dtype=np.float32)}
+        data2 = {"w": np.array([3.0, 4.0], dtype=np.float32)}
+        helper.add(data1, weight=1.0, contributor_name="site-1", contribution_round=0)
+        helper.add(data2, weight=3.0, contributor_name="site-2", contribution_round=0)
+
+        result = helper.get_result()
+
+        np.testing.assert_array_equal(data1["w"], np.array([1.0, 2.0], dtype=np.float32))
+        np.testing.assert_array_equal(data2["w"], np.array([3.0, 4.0], dtype=np.float32))
+        assert result["w"].dtype == np.float32
+        np.testing.assert_allclose(result["w"], np.array([2.5, 3.5]))
+
+    def test_numpy_int_arrays_accumulate_in_float64(self):
+        """Test that integer arrays are averaged in float64, as with out-of-place math."""
+        helper = WeightedAggregationHelper()
+
+        helper.add({"w": np.array([1, 2])}, weight=1.0, contributor_name="site-1", contribution_round=0)
+        helper.add({"w": np.array([2, 3])}, weight=1.0, contributor_name="site-2", contribution_round=0)
+
+        result = helper.get_result()
+        assert result["w"].dtype == np.float64
+        np.testing.assert_allclose(result["w"], np.array([1.5, 2.5]))
+
+    def test_numpy_accumulator_dtype(self):
+        """Test that a configured accumulator dtype is used and the result keeps the input dtype."""
+        helper = WeightedAggregationHelper(accumulator_dtype="float64")
+
+        data = {"w": np.array([1e8, 1.0], dtype=np.float32)}
+        helper.add(data, weight=1.0, contributor_name="site-1", contribution_round=0)
+        assert helper.total["w"].dtype == np.float64
+        helper.add(data, weight=1.0, contributor_name="site-2", contribution_round=0)
+
+        result = helper.get_result()
+        assert result["w"].dtype == np.float32
+        np.testing.assert_allclose(result["w"], data["w"])
+
+    @pytest.mark.parametrize("weigh_by_local_iter", [True, False])
+    def test_flat_buffer_matches_per_array_mode(self, weigh_by_local_iter):
+        """Test that flat buffer mode produces the same result as per-array accumulation."""
+        rng = np.random.default_rng(0)
+        contributions = [
+            {
+                "conv.weight": rng.standard_normal((4, 3, 3)).astype(np.float32),
+                "conv.bias": rng.standard_normal(4).astype(np.float32),
+                "fc.weight": rng.standard_normal((2, 5)),
+            }
+            for _ in range(3)
+        ]
+
+        flat = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter, flat_buffer=True)
+        per_array = WeightedAggregationHelper(weigh_by_local_iter=weigh_by_local_iter)
+        for i, data in enumerate(contributions):
+            flat.add(data, weight=i + 1.0, contributor_name=f"site-{i}", contribution_round=0)
+            per_array.add(data, weight=i + 1.0, contributor_name=f"site-{i}", contribution_round=0)
+
+        assert flat.flat_total is not None
+        flat_result = flat.get_result()
+        expected = per_array.get_result()
+        for k, v in expected.items():
+            assert flat_result[k].dtype == v.dtype
+            assert flat_result[k].shape == v.shape
+            # mixed dtypes share a float64 flat buffer, which is slightly more precise for float32 arrays
+            np.testing.assert_allclose(flat_result[k], v, rtol=1e-5, atol=1e-6)
+
+    def test_flat_buffer_with_mismatched_contribution(self):
+        """Test that a contribution with different keys falls back to per-array accumulation."""
+        helper = WeightedAggregationHelper(flat_buffer=True)
+
+        helper.add(
+            {"a": np.array([1.0]), "b": np.array([2.0])}, weight=1.0, contributor_name="site-1", contribution_round=0
+        )
+        helper.add(
+            {"b": np.array([4.0]), "c": np.array([5.0])}, weight=1.0, contributor_name="site-2", contribution_round=0
+        )
+
+        result = helper.get_result()
+        np.testing.assert_allclose(result["a"], [1.0])
+        np.testing.assert_allclose(result["b"], [3.0])
+        np.testing.assert_allclose(result["c"], [5.0])
+
+    @pytest.mark.parametrize("flat_buffer", [False, True])
+    def test_mixed_contributions_do_not_depend_on_order(self, flat_buffer):
+        """Test that a non-ndarray contribution to an array var is accumulated the same way in any order."""
+        contributions = [
+            ({"a": np.array([1.0, 2.0]), "b": np.array([3.0])}, 1.0),
+            ({"a": [3.0, 4.0], "b": np.array([5.0])}, 3.0),
+            ({"a": np.array([5.0, 6.0]), "b": 7.0}, 2.0),
+        ]
+        expected = {"a": np.array([20.0, 26.0]) / 6.0, "b": np.array([32.0]) / 6.0}
+
+        for order in ([0, 1, 2], [0, 2, 1], [2, 1, 0]):
+            helper = WeightedAggregationHelper(flat_buffer=flat_buffer)
+            for i in order:
+                data, weight = contributions[i]
+                helper.add(data, weight=weight, contributor_name=f"site-{i}", contribution_round=0)
+            result = helper.get_result()
+            for k, v in expected.items():
+                np.testing.assert_allclose(result[k], v)
+
+    def test_non_numeric_contribution_to_array_is_rejected(self):
+        helper = WeightedAggregationHelper(flat_buffer=True)
+        helper.add({"a": np.array([1.0])}, weight=1.0, contributor_name="site-1", contribution_round=0)
+        with pytest.raises(TypeError):
+            helper.add({"a": "bad"}, weight=1.0, contributor_name="site-2", contribution_round=0)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
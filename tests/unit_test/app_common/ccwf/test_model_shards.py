@@ -0,0 +1,80 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from nvflare.app_common.ccwf.model_shards import make_shard_layout, merge_shards, split_into_shards
+
+
+def _make_model():
+    rng = np.random.default_rng(0)
+    return {
+        "conv.weight": rng.standard_normal((8, 4, 3, 3)).astype(np.float32),
+        "conv.bias": rng.standard_normal(8).astype(np.float32),
+        "fc.weight": rng.standard_normal((64, 32)),
+        "fc.bias": rng.standard_normal(32).astype(np.float16),
+        "bn.num_batches_tracked": np.array(3, dtype=np.int64),
+        "scale": 0.5,
+    }
+
+
+class TestModelShards(unittest.TestCase):
+    def test_round_trip(self):
+        model = _make_model()
+        for num_shards in [1, 2, 3, 7, 50]:
+            layout = make_shard_layout(model, num_shards)
+            self.assertEqual(len(layout), num_shards)
+            shards = split_into_shards(model, layout)
+            result = merge_shards(list(zip(layout, shards)))
+            self.assertEqual(set(result.keys()), set(model.keys()))
+            for k, v in model.items():
+                if isinstance(v, np.ndarray):
+                    self.assertEqual(result[k].dtype, v.dtype)
+                    np.testing.assert_array_equal(result[k], v)
+                else:
+                    self.assertEqual(result[k], v)
+
+    def test_shards_are_balanced(self):
+        model = _make_model()
+        total = sum(getattr(v, "nbytes", 1) for v in model.values())
+        layout = make_shard_layout(model, 4)
+        for shard in split_into_shards(model, layout):
+            size = sum(getattr(v, "nbytes", 1) for v in shard.values())
+            # a shard can only exceed its share by the items that are not split
+            self.assertLessEqual(abs(size - total / 4), 16)
+
+    def test_layout_is_deterministic(self):
+        model = _make_model()
+        reordered = dict(reversed(list(model.items())))
+        self.assertEqual(make_shard_layout(model, 3), make_shard_layout(reordered, 3))
+
+    def test_merge_in_any_order(self):
+        model = _make_model()
+        layout = make_shard_layout(model, 3)
+        shards = list(zip(layout, split_into_shards(model, layout)))
+        result = merge_shards(list(reversed(shards)))
+        np.testing.assert_array_equal(result["fc.weight"], model["fc.weight"])
+
+    def test_missing_shard(self):
+        model = {"w": np.arange(100, dtype=np.float32)}
+        layout = make_shard_layout(model, 2)
+        shards = split_into_shards(model, layout)
+        with self.assertRaises(ValueError):
+            merge_shards([(layout[0], shards[0])])
+
+    def test_bad_num_shards(self):
+        with self.assertRaises(ValueError):
+            make_shard_layout(_make_model(), 0)
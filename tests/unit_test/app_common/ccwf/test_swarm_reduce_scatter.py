@@ -0,0 +1,261 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from nvflare.apis.dxo import DXO, DataKind, MetaKey, from_shareable
+from nvflare.apis.event_type import EventType
+from nvflare.apis.fl_constant import ReservedKey, ReturnCode
+from nvflare.apis.fl_context import FLContextManager
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.signal import Signal
+from nvflare.app_common.aggregators.intime_accumulate_model_aggregator import InTimeAccumulateWeightedAggregator
+from nvflare.app_common.app_constant import AppConstants
+from nvflare.app_common.ccwf.common import AggregationMode, Constant, NumberMetricComparator
+from nvflare.app_common.ccwf.swarm_client_ctl import SwarmClientController
+from nvflare.app_common.ccwf.swarm_server_ctl import SwarmServerController
+from nvflare.app_common.shareablegenerators.full_model_shareable_generator import FullModelShareableGenerator
+
+CLIENTS = ["site-1", "site-2", "site-3"]
+OWNERS = ["site-1", "site-2"]
+
+
+def _make_model(value: float):
+    return {"fc.weight": np.full((16, 8), value, dtype=np.float32), "fc.bias": np.full(8, value, dtype=np.float32)}
+
+
+class _Network:
+    """Delivers aux messages between the clients in process."""
+
+    def __init__(self):
+        self.handlers = {}  # (site, topic) => handler
+        self.ctx_managers = {}  # site => FLContextManager
+        self.sent = []  # (sender, target, topic, request)
+        self.lock = threading.Lock()
+
+
+class _Engine:
+    def __init__(self, network: _Network, name: str):
+        self.network = network
+        self.name = name
+
+    def new_context(self):
+        return self.network.ctx_managers[self.name].new_context()
+
+    def fire_event(self, event_type, fl_ctx):
+        pass
+
+    def register_aux_message_handler(self, topic, message_handle_func):
+        self.network.handlers[(self.name, topic)] = message_handle_func
+
+    def send_aux_request(self, targets, topic, request, timeout, fl_ctx, secure=False, optional=False):
+        replies = {}
+        for t in targets:
+            req = copy.deepcopy(request)
+            req.set_peer_props({ReservedKey.IDENTITY_NAME: self.name})
+            with self.network.lock:
+                self.network.sent.append((self.name, t, topic, req))
+            ctx = self.network.ctx_managers[t].new_context()
+            ctx.set_peer_context(self.new_context())
+            replies[t] = self.network.handlers[(t, topic)](topic, req, ctx)
+        return replies
+
+
+class _Trainer:
+    def __init__(self, model: dict):
+        self.model = model
+
+    def execute(self, task_name, shareable, fl_ctx, abort_signal):
+        dxo = DXO(data_kind=DataKind.WEIGHTS, data=self.model)
+        dxo.set_meta_prop(MetaKey.NUM_STEPS_CURRENT_ROUND, 1)
+        return dxo.to_shareable()
+
+
+def _make_clients(num_rounds: int):
+    network = _Network()
+    clients = {}
+    for i, name in enumerate(CLIENTS):
+        engine = _Engine(network, name)
+        network.ctx_managers[name] = FLContextManager(engine=engine, identity_name=name, job_id="job")
+        ctl = SwarmClientController(wait_time_after_min_resps_received=0.1)
+        ctl.engine = engine
+        ctl.me = name
+        ctl.workflow_id = "swarm"
+        ctl.config = {
+            Constant.CLIENTS: CLIENTS,
+            Constant.TRAIN_CLIENTS: CLIENTS,
+            Constant.AGGR_CLIENTS: OWNERS,
+            Constant.AGGREGATION_MODE: AggregationMode.REDUCE_SCATTER,
+            Constant.START_ROUND: 0,
+            AppConstants.NUM_ROUNDS: num_rounds,
+        }
+        ctl.aggregator = InTimeAccumulateWeightedAggregator(expected_data_kind=DataKind.WEIGHTS)
+        ctl.aggregator.handle_event(EventType.START_RUN, engine.new_context())
+        ctl.shareable_generator = FullModelShareableGenerator()
+        ctl.metric_comparator = NumberMetricComparator()
+        ctl.learn_executor = _Trainer(_make_model(i + 1.0))
+        ctl.update_status = MagicMock()
+        ctl._distribute_final_results = MagicMock()
+        ctl.process_config(engine.new_context())
+        clients[name] = ctl
+    return network, clients
+
+
+def _run_round(network: _Network, clients: dict, for_round: int):
+    monitors = []
+    for ctl in clients.values():
+        t = threading.Thread(target=ctl._monitor_gather, daemon=True)
+        t.start()
+        monitors.append(t)
+
+    learners = []
+    for name, ctl in clients.items():
+        task_data = DXO(data_kind=DataKind.WEIGHTS, data=_make_model(0.0)).to_shareable()
+        task_data.set_header(AppConstants.CURRENT_ROUND, for_round)
+        task_data.add_cookie(AppConstants.CONTRIBUTION_ROUND, for_round)
+        t = threading.Thread(
+            target=ctl.do_learn_task,
+            args=(AppConstants.TASK_TRAIN, task_data, network.ctx_managers[name].new_context(), Signal()),
+            daemon=True,
+        )
+        t.start()
+        learners.append(t)
+    for t in learners:
+        t.join(10.0)
+
+    deadline = time.time() + 10.0
+    while time.time() < deadline and any(ctl.last_round != for_round for ctl in clients.values()):
+        time.sleep(0.05)
+    for ctl in clients.values():
+        ctl.asked_to_stop = True
+    for t in monitors:
+        t.join(1.0)
+
+
+class TestSwarmReduceScatter(unittest.TestCase):
+    def test_round_is_aggregated_by_shard_owners(self):
+        network, clients = _make_clients(num_rounds=2)
+        _run_round(network, clients, for_round=0)
+
+        expected = _make_model(2.0)  # average of the models 1.0, 2.0 and 3.0
+        for name, ctl in clients.items():
+            self.assertEqual(ctl.last_round, 0, name)
+            ctl.update_status.assert_any_call(last_round=0, action="finished_learn_task")
+
+            # every client starts the next round on its own with the global model
+            task = ctl.learn_task
+            self.assertIsNotNone(task, name)
+            self.assertEqual(task.task_data.get_header(AppConstants.CURRENT_ROUND), 1)
+            data = from_shareable(task.task_data).data
+            for k, v in expected.items():
+                np.testing.assert_allclose(data[k], v)
+            ctl._distribute_final_results.assert_not_called()
+
+        model_size = sum(v.nbytes for v in expected.values())
+        reduce_scatter_topic = clients["site-1"].topic_for_my_workflow(Constant.TOPIC_REDUCE_SCATTER)
+        all_gather_topic = clients["site-1"].topic_for_my_workflow(Constant.TOPIC_ALL_GATHER)
+        for sender, target, topic, request in network.sent:
+            self.assertIn(topic, [reduce_scatter_topic, all_gather_topic])
+            self.assertIn(sender if topic == all_gather_topic else target, OWNERS)
+            # only a shard of the model is sent
+            size = sum(v.nbytes for v in from_shareable(request).data.values())
+            self.assertEqual(size, model_size // len(OWNERS))
+
+        # each trainer sends a shard to each remote owner; each owner sends its shard to all other clients
+        num_shard_results = sum(1 for _, _, topic, _ in network.sent if topic == reduce_scatter_topic)
+        num_aggregated_shards = sum(1 for _, _, topic, _ in network.sent if topic == all_gather_topic)
+        self.assertEqual(num_shard_results, len(CLIENTS) * len(OWNERS) - len(OWNERS))
+        self.assertEqual(num_aggregated_shards, len(OWNERS) * (len(CLIENTS) - 1))
+
+    def test_final_results_distributed_by_first_owner(self):
+        network, clients = _make_clients(num_rounds=1)
+        _run_round(network, clients, for_round=0)
+
+        for name, ctl in clients.items():
+            self.assertEqual(ctl.last_round, 0, name)
+            self.assertIsNone(ctl.learn_task, name)
+            if name == OWNERS[0]:
+                ctl._distribute_final_results.assert_called_once()
+            else:
+                ctl._distribute_final_results.assert_not_called()
+
+    def test_merge_keeps_best_metric(self):
+        _, clients = _make_clients(num_rounds=1)
+        ctl = clients["site-3"]
+        shards = {}
+        for i, owner in enumerate(OWNERS):
+            shard = DXO(data_kind=DataKind.WEIGHTS, data={f"w{i}": np.ones(2)}).to_shareable()
+            shard.set_header(Constant.SHARD_LAYOUT, {f"w{i}": None})
+            shard.set_header(Constant.METRIC, 0.5 + i)
+            shard.set_header(Constant.CLIENT, owner)
+            shard.set_header(Constant.ROUND, i)
+            shards[owner] = shard
+
+        result = ctl._merge_aggregated_shards(shards)
+        self.assertEqual(set(from_shareable(result).data.keys()), {"w0", "w1"})
+        self.assertEqual(result.get_header(Constant.CLIENT), OWNERS[1])
+        self.assertEqual(result.get_header(Constant.METRIC), 1.5)
+        self.assertEqual(result.get_header(Constant.ROUND), 1)
+
+    def test_late_aggregated_shard_is_dropped(self):
+        network, clients = _make_clients(num_rounds=1)
+        ctl = clients["site-3"]
+        ctl.last_all_gather_round = 1
+        shard = Shareable()
+        shard.set_header(AppConstants.CURRENT_ROUND, 1)
+        ctl._add_aggregated_shard("site-1", shard, network.ctx_managers["site-3"].new_context())
+        self.assertEqual(ctl.aggregated_shards, {})
+
+    def test_missing_aggregated_shard_fails_round(self):
+        network, clients = _make_clients(num_rounds=1)
+        ctl = clients["site-3"]
+        ctl.all_gather_timeout = 0.1
+        shard = Shareable()
+        shard.set_header(AppConstants.CURRENT_ROUND, 0)
+        ctl._add_aggregated_shard("site-1", shard, network.ctx_managers["site-3"].new_context())
+
+        ctl._check_all_gather_timeout()
+        ctl.update_status.assert_not_called()
+
+        time.sleep(0.2)
+        ctl._check_all_gather_timeout()
+        ctl.update_status.assert_called_once_with(action="all_gather", error=ReturnCode.EXECUTION_EXCEPTION)
+        self.assertEqual(ctl.aggregated_shards, {})
+        self.assertEqual(ctl.all_gather_deadlines, {})
+        self.assertEqual(ctl.last_all_gather_round, 0)
+
+        # the shard that comes after the deadline is dropped
+        shard = Shareable()
+        shard.set_header(AppConstants.CURRENT_ROUND, 0)
+        ctl._add_aggregated_shard("site-2", shard, network.ctx_managers["site-3"].new_context())
+        self.assertEqual(ctl.aggregated_shards, {})
+        self.assertIsNone(ctl.last_result)
+
+
+class TestSwarmServerAggregationMode(unittest.TestCase):
+    def test_mode_is_in_config(self):
+        ctl = SwarmServerController(
+            num_rounds=2, starting_client="site-1", aggregation_mode=AggregationMode.REDUCE_SCATTER
+        )
+        self.assertEqual(ctl.prepare_config()[Constant.AGGREGATION_MODE], AggregationMode.REDUCE_SCATTER)
+
+    def test_bad_mode(self):
+        with self.assertRaises(ValueError):
+            SwarmServerController(num_rounds=2, starting_client="site-1", aggregation_mode="ring")
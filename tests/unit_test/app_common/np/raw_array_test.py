@@ -0,0 +1,222 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from nvflare.app_common.decomposers import numpy_decomposers
+from nvflare.app_common.np.np_downloader import ArrayConsumer, ArrayDownloadable
+from nvflare.app_common.np.raw_array import (
+    RawBufferAssembler,
+    RawBufferKey,
+    decode_array,
+    encode_array,
+    encode_array_part,
+    get_part_ranges,
+    is_raw_buffer,
+    is_raw_buffer_part,
+    raw_buffer_size,
+)
+from nvflare.fuel.utils import fobs
+
+
+def _received(item: dict) -> dict:
+    # data received from the wire is bytes
+    result = dict(item)
+    result[RawBufferKey.DATA] = bytes(item[RawBufferKey.DATA])
+    return result
+
+
+class TestRawArray:
+    @pytest.mark.parametrize(
+        "array",
+        [
+            np.arange(12, dtype=np.float32).reshape(3, 4),
+            np.asfortranarray(np.arange(12, dtype=np.int64).reshape(3, 4)),
+            np.arange(24, dtype=np.float64).reshape(4, 6)[:, ::2],
+            np.array(1.5),
+            np.zeros((0, 3), dtype=np.int8),
+            np.array([True, False]),
+            np.arange(4, dtype=">i4"),
+        ],
+    )
+    def test_round_trip(self, array):
+        item = encode_array(array)
+        assert raw_buffer_size(item) == array.nbytes
+
+        result = decode_array(_received(item))
+        assert result.dtype == array.dtype
+        assert result.shape == array.shape
+        np.testing.assert_array_equal(result, array)
+        assert result.flags.writeable
+
+    def test_encode_does_not_copy(self):
+        array = np.ones((64, 64), dtype=np.float32)
+        item = encode_array(array, name="w")
+        assert item[RawBufferKey.NAME] == "w"
+        assert np.shares_memory(np.frombuffer(item[RawBufferKey.DATA], dtype=np.uint8), array)
+
+    def test_decode_does_not_copy_writable_buffer(self):
+        buffer = bytearray(np.arange(8, dtype=np.float32).tobytes())
+        item = {RawBufferKey.DTYPE: "<f4", RawBufferKey.SHAPE: [2, 4], RawBufferKey.DATA: buffer}
+
+        result = decode_array(item)
+        buffer[0:4] = np.float32(9).tobytes()
+        assert result[0, 0] == 9
+
+    def test_decode_read_only(self):
+        item = _received(encode_array(np.arange(4.0)))
+        assert not decode_array(item, writable=False).flags.writeable
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            {RawBufferKey.SHAPE: [1], RawBufferKey.DATA: b"\x00"},
+            {RawBufferKey.DTYPE: "O", RawBufferKey.SHAPE: [1], RawBufferKey.DATA: b"\x00" * 8},
+            {RawBufferKey.DTYPE: "<f4", RawBufferKey.SHAPE: None, RawBufferKey.DATA: b"\x00" * 4},
+        ],
+    )
+    def test_decode_invalid(self, item):
+        with pytest.raises(ValueError):
+            decode_array(item)
+
+    def test_object_array(self):
+        with pytest.raises(ValueError):
+            encode_array(np.array([{}, None]))
+
+
+class TestRawArrayTransfer:
+    def test_downloadable_and_consumer(self):
+        arrays = {"w": np.random.rand(8, 8), "b": np.arange(8, dtype=np.int32)}
+        downloadable = ArrayDownloadable(arrays, max_chunk_size=1024, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(downloadable.get_item_count())]
+        assert downloadable.get_item_size(items[0]) == arrays["w"].nbytes
+
+        result = ArrayConsumer(None, {}).consume_items(items, None)
+        assert result.keys() == arrays.keys()
+        for k, v in arrays.items():
+            np.testing.assert_array_equal(result[k], v)
+
+    @pytest.mark.parametrize(
+        "array",
+        [
+            np.random.rand(40, 30),
+            np.asfortranarray(np.random.rand(40, 30).astype(np.float32)),
+            np.random.rand(40, 60)[:, ::2],
+        ],
+    )
+    def test_large_array_is_split(self, array):
+        arrays = {"w": array, "b": np.arange(8, dtype=np.int32)}
+        downloadable = ArrayDownloadable(arrays, max_chunk_size=1000, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(downloadable.get_item_count())]
+        parts = [item for item in items if is_raw_buffer_part(item)]
+        assert len(parts) == len(items) - 1
+        assert all(raw_buffer_size(item) <= 1000 for item in items)
+
+        # parts can be received in any order and more than once
+        consumer = ArrayConsumer(None, {})
+        result = consumer.consume_items(items[::-1], None)
+        result = consumer.consume_items(parts[:2], result)
+        consumer.download_completed("ref")
+        assert consumer.error is None
+        assert result.keys() == arrays.keys()
+        for k, v in arrays.items():
+            np.testing.assert_array_equal(result[k], v)
+        assert result["w"].flags.writeable
+
+    def test_missing_part_fails_download(self):
+        downloadable = ArrayDownloadable({"w": np.random.rand(100)}, max_chunk_size=256, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(1, downloadable.get_item_count())]
+        consumer = ArrayConsumer(None, {})
+        assert consumer.consume_items(items, None) == {}
+        consumer.download_completed("ref")
+        assert "w" in consumer.error
+
+    def test_flat_arrays_released_when_transaction_done(self):
+        downloadable = ArrayDownloadable({"w": np.random.rand(20, 10).T}, max_chunk_size=256, raw_buffer=True)
+        downloadable.produce_item(0)
+        assert downloadable.flat_arrays
+        downloadable.transaction_done("tx", "ok")
+        assert not downloadable.flat_arrays
+
+    def test_part_ranges(self):
+        assert get_part_ranges(10, 4, 0) == [(0, 10)]
+        assert get_part_ranges(10, 4, 40) == [(0, 10)]
+        assert get_part_ranges(10, 4, 16) == [(0, 4), (4, 8), (8, 10)]
+        # parts are aligned to elements
+        assert get_part_ranges(3, 8, 12) == [(0, 1), (1, 2), (2, 3)]
+
+    def test_assembler_rejects_bad_range(self):
+        item = _received(encode_array(np.arange(4, dtype=np.int32), name="w"))
+        item[RawBufferKey.OFFSET] = 8
+        item[RawBufferKey.TOTAL_SIZE] = 16
+        with pytest.raises(ValueError, match="exceeds"):
+            RawBufferAssembler().add_part(item)
+
+    def test_assembler_rejects_overlapping_parts(self):
+        flat = np.arange(8, dtype=np.int32)
+        parts = [encode_array_part(flat, start, end, "w", flat.shape, "C") for start, end in [(0, 4), (4, 8)]]
+        assembler = RawBufferAssembler()
+        assert assembler.add_part(_received(parts[0])) is None
+
+        # a part at a received offset with a different length
+        with pytest.raises(ValueError, match="overlaps"):
+            assembler.add_part(_received(encode_array_part(flat, 0, 2, "w", flat.shape, "C")))
+        # a part that overlaps a received part, though the total size would be reached
+        with pytest.raises(ValueError, match="overlaps"):
+            assembler.add_part(_received(encode_array_part(flat, 2, 6, "w", flat.shape, "C")))
+
+        # a part received again is ignored
+        assert assembler.add_part(_received(parts[0])) is None
+        result = assembler.add_part(_received(parts[1]))
+        np.testing.assert_array_equal(decode_array(result), flat)
+
+    def test_consumer_accepts_npz(self):
+        stream = BytesIO()
+        np.savez(stream, w=np.arange(3))
+        result = ArrayConsumer(None, {}).consume_items([stream.getvalue()], None)
+        np.testing.assert_array_equal(result["w"], np.arange(3))
+
+    def test_default_is_npz(self):
+        arrays = {"w": np.random.rand(300), "b": np.arange(4)}
+        downloadable = ArrayDownloadable(arrays, max_chunk_size=256)
+        assert downloadable.get_item_count() == 2
+        items = [downloadable.produce_item(i) for i in range(downloadable.get_item_count())]
+        assert all(isinstance(item, bytes) for item in items)
+        assert downloadable.get_item_size(items[1]) == len(items[1])
+
+        result = ArrayConsumer(None, {}).consume_items(items, None)
+        for k, v in arrays.items():
+            np.testing.assert_array_equal(result[k], v)
+
+    def test_native_decomposer(self, monkeypatch):
+        numpy_decomposers.register()
+        array = np.random.rand(16, 4).astype(np.float32)
+        decomposer = numpy_decomposers.NumpyArrayDecomposer()
+        data = decomposer.native_decompose(array)
+        assert isinstance(data, bytes)
+        np.testing.assert_array_equal(decomposer.native_recompose(data), array)
+
+        monkeypatch.setattr(numpy_decomposers.NumpyArrayDecomposer, "_use_raw_buffer", lambda self: True)
+        data = decomposer.native_decompose(array)
+        assert is_raw_buffer(data)
+        np.testing.assert_array_equal(fobs.loads(fobs.dumps(array)), array)
+
+        # data created with np.save is still accepted
+        stream = BytesIO()
+        np.save(stream, array, allow_pickle=False)
+        result = numpy_decomposers.NumpyArrayDecomposer().native_recompose(stream.getvalue())
+        np.testing.assert_array_equal(result, array)
@@ -16,8 +16,10 @@ import threading
 import time
 from unittest.mock import MagicMock, patch
 
+from nvflare.apis.analytix import AnalyticsDataType, TrackConst
 from nvflare.apis.dxo import DXO
 from nvflare.apis.event_type import EventType
+from nvflare.apis.utils.analytix_utils import create_analytic_dxo, is_analytic_batch_dxo, split_analytic_batch_dxo
 from nvflare.app_common.widgets.metric_relay import MetricRelay
 from nvflare.fuel.utils.constants import Mode
 from nvflare.fuel.utils.pipe.pipe import Message, Pipe, Topic
@@ -323,3 +325,34 @@ class TestMetricRelayWithRealHandler:
             assert handler.reader is not None and handler.reader.is_alive()
 
             handler.stop(close_pipe=False)
+
+
+class TestMetricRelayBatching:
+    def _relay_metrics(self, relay, num_records):
+        for i in range(num_records):
+            dxo = create_analytic_dxo(tag="loss", value=float(i), data_type=AnalyticsDataType.SCALAR, global_step=i)
+            relay._pipe_msg_cb(Message.new_request("metrics", dxo))
+
+    def test_records_are_relayed_one_by_one_by_default(self):
+        relay = MetricRelay(pipe_id="pipe")
+        _start_run(relay)
+        with patch("nvflare.app_common.widgets.metric_relay.send_analytic_dxo") as send:
+            self._relay_metrics(relay, 3)
+        assert send.call_count == 3
+
+    def test_records_are_relayed_in_batches(self):
+        relay = MetricRelay(pipe_id="pipe", batch_size=4, flush_interval=60.0)
+        fl_ctx = _start_run(relay)
+        with patch("nvflare.app_common.widgets.metric_relay.send_analytic_dxo") as send:
+            self._relay_metrics(relay, 10)
+            assert send.call_count == 2
+
+            # the rest is relayed at the end of the task
+            relay.handle_event(EventType.AFTER_TASK_EXECUTION, fl_ctx)
+            assert send.call_count == 3
+            relay.handle_event(EventType.ABOUT_TO_END_RUN, fl_ctx)
+
+        batches = [c.args[1] for c in send.call_args_list]
+        assert all(is_analytic_batch_dxo(dxo) for dxo in batches)
+        steps = [r.data[TrackConst.GLOBAL_STEP_KEY] for dxo in batches for r in split_analytic_batch_dxo(dxo)]
+        assert steps == list(range(10))
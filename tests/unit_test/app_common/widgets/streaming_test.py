@@ -12,15 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from typing import Optional
 
 import pytest
 
-from nvflare.apis.analytix import AnalyticsDataType, LogWriterName, TrackConst
-from nvflare.apis.dxo import DXO, DataKind
+from nvflare.apis.analytix import ANALYTIC_EVENT_TYPE, AnalyticsDataType, LogWriterName, TrackConst
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.apis.event_type import EventType
 from nvflare.apis.fl_component import FLComponent
+from nvflare.apis.fl_constant import FLContextKey, ReservedKey
 from nvflare.apis.fl_context import FLContext
-from nvflare.apis.utils.analytix_utils import create_analytic_dxo, send_analytic_dxo
+from nvflare.apis.shareable import Shareable
+from nvflare.apis.utils.analytix_utils import (
+    AnalyticsBatcher,
+    create_analytic_batch_dxo,
+    create_analytic_dxo,
+    is_analytic_batch_dxo,
+    send_analytic_dxo,
+    split_analytic_batch_dxo,
+)
+from nvflare.app_common.widgets.streaming import AnalyticsReceiver
 
 INVALID_TEST_CASES = [
     (list(), dict(), FLContext(), TypeError, f"expect comp to be an instance of FLComponent, but got {type(list())}"),
@@ -223,3 +235,125 @@ class TestAnalyticsSender:
     def test_add_invalid(self, tag, value, data_type, global_step, kwargs, expected_error, expected_msg):
         with pytest.raises(expected_error, match=expected_msg):
             dxo = mock_add(tag=tag, value=value, data_type=data_type, global_step=global_step, **kwargs)
+
+
+def _scalar_dxo(tag, value, step=None, data_type=AnalyticsDataType.SCALAR, writer=LogWriterName.TORCH_TB, **kwargs):
+    if step is not None:
+        kwargs[TrackConst.GLOBAL_STEP_KEY] = step
+    return create_analytic_dxo(tag=tag, value=value, data_type=data_type, writer=writer, **kwargs)
+
+
+class TestAnalyticsBatch:
+    def test_split_restores_records(self):
+        dxos = [
+            _scalar_dxo("loss", 0.5, step=0),
+            _scalar_dxo("acc", {"train": 0.1, "val": 0.2}, step=1, data_type=AnalyticsDataType.SCALARS, path="p"),
+            _scalar_dxo("lr", 0.01),
+        ]
+        batch = create_analytic_batch_dxo(dxos)
+        assert is_analytic_batch_dxo(batch)
+        assert not is_analytic_batch_dxo(dxos[0])
+        assert batch.data[TrackConst.BATCH_TRACK_KEYS] == ["loss", "acc", "lr"]
+        assert batch.data[TrackConst.BATCH_GLOBAL_STEPS] == [0, 1, None]
+
+        received = from_shareable(batch.to_shareable())
+        records = split_analytic_batch_dxo(received)
+        assert [(r.data, r.meta) for r in records] == [(d.data, d.meta) for d in dxos]
+
+    def test_writers_cannot_be_mixed(self):
+        with pytest.raises(ValueError, match="writer"):
+            create_analytic_batch_dxo([_scalar_dxo("loss", 0.5), _scalar_dxo("loss", 0.5, writer=LogWriterName.MLFLOW)])
+
+
+class TestAnalyticsBatcher:
+    def _make_batcher(self, batch_size=3, flush_interval=60.0):
+        sent = []
+        return AnalyticsBatcher(sent.append, batch_size=batch_size, flush_interval=flush_interval), sent
+
+    def test_flush_on_batch_size(self):
+        batcher, sent = self._make_batcher()
+        for i in range(7):
+            batcher.add(_scalar_dxo("loss", float(i), step=i))
+        assert len(sent) == 2
+        assert all(is_analytic_batch_dxo(dxo) for dxo in sent)
+
+        # a single record is sent as it is
+        batcher.close()
+        assert len(sent) == 3
+        assert sent[2].data[TrackConst.TRACK_VALUE] == 6.0
+        steps = [r.data[TrackConst.GLOBAL_STEP_KEY] for dxo in sent[:2] for r in split_analytic_batch_dxo(dxo)]
+        assert steps == list(range(6))
+
+    def test_other_data_types_keep_order(self):
+        batcher, sent = self._make_batcher()
+        batcher.add(_scalar_dxo("loss", 0.1))
+        batcher.add(_scalar_dxo("loss", 0.2))
+        batcher.add(_scalar_dxo("msg", "text", data_type=AnalyticsDataType.TEXT))
+        assert len(sent) == 2
+        assert len(split_analytic_batch_dxo(sent[0])) == 2
+        assert sent[1].get_meta_prop(TrackConst.DATA_TYPE_KEY) == AnalyticsDataType.TEXT
+        batcher.close()
+
+    def test_records_are_buffered_per_writer(self):
+        batcher, sent = self._make_batcher(batch_size=2)
+        batcher.add(_scalar_dxo("loss", 0.1))
+        batcher.add(_scalar_dxo("loss", 0.2, writer=LogWriterName.MLFLOW, data_type=AnalyticsDataType.METRIC))
+        assert sent == []
+        batcher.flush()
+        assert [dxo.get_meta_prop(TrackConst.TRACKER_KEY) for dxo in sent] == [
+            LogWriterName.TORCH_TB,
+            LogWriterName.MLFLOW,
+        ]
+        batcher.close()
+
+    def test_flush_on_interval(self):
+        batcher, sent = self._make_batcher(batch_size=100, flush_interval=0.05)
+        batcher.add(_scalar_dxo("loss", 0.1))
+        batcher.add(_scalar_dxo("loss", 0.2))
+        deadline = time.time() + 5
+        while not sent and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(sent) == 1
+        assert len(split_analytic_batch_dxo(sent[0])) == 2
+        batcher.close()
+
+    def test_add_after_close_is_sent_right_away(self):
+        batcher, sent = self._make_batcher()
+        batcher.close()
+        batcher.add(_scalar_dxo("loss", 0.1))
+        assert len(sent) == 1
+
+    @pytest.mark.parametrize("batch_size,flush_interval", [(0, 1.0), (2, 0)])
+    def test_invalid_args(self, batch_size, flush_interval):
+        with pytest.raises(ValueError):
+            AnalyticsBatcher(lambda dxo: None, batch_size=batch_size, flush_interval=flush_interval)
+
+
+class _RecordingReceiver(AnalyticsReceiver):
+    def __init__(self):
+        super().__init__()
+        self.saved = []
+
+    def initialize(self, fl_ctx: FLContext):
+        pass
+
+    def save(self, fl_ctx: FLContext, shareable: Shareable, record_origin: str):
+        self.saved.append((from_shareable(shareable).data[TrackConst.TRACK_VALUE], record_origin))
+
+    def finalize(self, fl_ctx: FLContext):
+        pass
+
+
+class TestAnalyticsReceiver:
+    def _fire(self, receiver, dxo):
+        fl_ctx = FLContext()
+        fl_ctx.set_prop(ReservedKey.IDENTITY_NAME, "site-1", private=False, sticky=False)
+        fl_ctx.set_prop(FLContextKey.EVENT_DATA, dxo.to_shareable(), private=True, sticky=False)
+        receiver.handle_event(ANALYTIC_EVENT_TYPE, fl_ctx)
+
+    def test_batch_is_saved_record_by_record(self):
+        receiver = _RecordingReceiver()
+        receiver.handle_event(EventType.START_RUN, FLContext())
+        self._fire(receiver, _scalar_dxo("loss", 0.1))
+        self._fire(receiver, create_analytic_batch_dxo([_scalar_dxo("loss", 0.2), _scalar_dxo("loss", 0.3)]))
+        assert receiver.saved == [(0.1, "site-1"), (0.2, "site-1"), (0.3, "site-1")]
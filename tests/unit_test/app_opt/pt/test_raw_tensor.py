@@ -0,0 +1,192 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+
+import pytest
+import torch
+from safetensors import safe_open
+from safetensors.torch import save as save_tensors
+
+from nvflare.app_common.np.raw_array import RawBufferKey, is_raw_buffer_part
+from nvflare.app_opt.pt.decomposers import TensorDecomposer
+from nvflare.app_opt.pt.raw_tensor import decode_tensor, encode_tensor, encode_tensor_part, write_safetensors_file
+from nvflare.app_opt.pt.tensor_downloader import DiskTensorConsumer, TensorConsumer, TensorDownloadable
+
+
+def _received(item: dict) -> dict:
+    # data received from the wire is bytes
+    result = dict(item)
+    result[RawBufferKey.DATA] = bytes(item[RawBufferKey.DATA])
+    return result
+
+
+@pytest.fixture
+def temp_dir():
+    d = tempfile.mkdtemp(prefix="nvflare_test_raw_")
+    yield d
+    shutil.rmtree(d, ignore_errors=True)
+
+
+class TestRawTensor:
+    @pytest.mark.parametrize(
+        "tensor",
+        [
+            torch.randn(3, 4),
+            torch.randn(4, 6).t(),
+            torch.randn(5).to(torch.bfloat16),
+            torch.tensor(2.5, dtype=torch.float16),
+            torch.zeros(0, 3, dtype=torch.int64),
+            torch.tensor([True, False]),
+        ],
+    )
+    def test_round_trip(self, tensor):
+        result = decode_tensor(_received(encode_tensor(tensor)))
+        assert result.dtype == tensor.dtype
+        assert result.shape == tensor.shape
+        assert torch.equal(result, tensor)
+
+    def test_encode_does_not_copy(self):
+        tensor = torch.ones(16, 16)
+        item = encode_tensor(tensor, name="w")
+        tensor[0, 0] = 7.0
+        assert torch.frombuffer(bytearray(item[RawBufferKey.DATA][:4]), dtype=torch.float32).item() == 7.0
+
+    def test_decode_does_not_copy_writable_buffer(self):
+        item = encode_tensor(torch.arange(4, dtype=torch.float32))
+        buffer = bytearray(item[RawBufferKey.DATA])
+        item[RawBufferKey.DATA] = buffer
+
+        result = decode_tensor(item)
+        result[0] = 5.0
+        assert torch.frombuffer(buffer, dtype=torch.float32)[0].item() == 5.0
+
+    def test_decode_unknown_dtype(self):
+        item = _received(encode_tensor(torch.ones(2)))
+        item[RawBufferKey.DTYPE] = "Tensor"
+        with pytest.raises(ValueError):
+            decode_tensor(item)
+
+    def test_native_decomposer(self, monkeypatch):
+        tensor = torch.randn(8, 2)
+        decomposer = TensorDecomposer()
+        data = decomposer.native_decompose(tensor)
+        assert isinstance(data, bytes)
+        assert torch.equal(decomposer.native_recompose(data), tensor)
+
+        monkeypatch.setattr(TensorDecomposer, "_use_raw_buffer", lambda self: True)
+        assert torch.equal(decomposer.native_recompose(_received(decomposer.native_decompose(tensor))), tensor)
+
+
+class TestRawTensorTransfer:
+    def test_downloadable_and_consumer(self):
+        tensors = {"w": torch.randn(4, 4), "b": torch.arange(4)}
+        downloadable = TensorDownloadable(tensors, max_chunk_size=1024, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(downloadable.get_item_count())]
+        assert downloadable.get_item_size(items[0]) == 64
+
+        result = TensorConsumer(None, {}).consume_items(items, None)
+        assert result.keys() == tensors.keys()
+        for k, v in tensors.items():
+            assert torch.equal(result[k], v)
+
+        # safetensors items sent by earlier versions are still accepted
+        result = TensorConsumer(None, {}).consume_items([save_tensors({"w": tensors["w"]})], None)
+        assert torch.equal(result["w"], tensors["w"])
+
+    def test_default_is_safetensors(self):
+        tensors = {"w": torch.randn(300), "b": torch.arange(4)}
+        downloadable = TensorDownloadable(tensors, max_chunk_size=256)
+        assert downloadable.get_item_count() == 2
+        items = [downloadable.produce_item(i) for i in range(downloadable.get_item_count())]
+        assert all(isinstance(item, bytes) for item in items)
+        assert downloadable.get_item_size(items[1]) == len(items[1])
+
+        result = TensorConsumer(None, {}).consume_items(items, None)
+        for k, v in tensors.items():
+            assert torch.equal(result[k], v)
+
+    def test_write_safetensors_file(self, temp_dir):
+        tensor = torch.randn(3, 5).to(torch.bfloat16)
+        file_path = os.path.join(temp_dir, "t.safetensors")
+        write_safetensors_file(file_path, _received(encode_tensor(tensor, name="layer.weight")))
+
+        with safe_open(file_path, framework="pt") as f:
+            assert list(f.keys()) == ["layer.weight"]
+            assert torch.equal(f.get_tensor("layer.weight"), tensor)
+
+    def test_disk_consumer(self, temp_dir):
+        tensors = {"a": torch.randn(2, 2), "b": torch.randn(3)}
+        items = [_received(encode_tensor(v, name=k)) for k, v in tensors.items()]
+        result = DiskTensorConsumer(temp_dir).consume_items(items, None)
+
+        assert result.keys() == tensors.keys()
+        for k, (file_path, st_key) in result.items():
+            with safe_open(file_path, framework="pt") as f:
+                assert torch.equal(f.get_tensor(st_key), tensors[k])
+
+    def test_large_tensor_is_split(self):
+        tensors = {"w": torch.randn(40, 30).to(torch.bfloat16), "t": torch.randn(30, 20).t(), "b": torch.arange(4)}
+        downloadable = TensorDownloadable(tensors, max_chunk_size=1000, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(downloadable.get_item_count())]
+        assert sum(is_raw_buffer_part(item) for item in items) == len(items) - 1
+
+        consumer = TensorConsumer(None, {})
+        result = consumer.consume_items(items[::-1] + items[:2], None)
+        consumer.download_completed("ref")
+        assert consumer.error is None
+        assert result.keys() == tensors.keys()
+        for k, v in tensors.items():
+            assert torch.equal(result[k], v)
+
+    def test_flat_tensors_released_when_transaction_done(self):
+        downloadable = TensorDownloadable({"t": torch.randn(30, 20).t()}, max_chunk_size=1000, raw_buffer=True)
+        downloadable.produce_item(0)
+        assert downloadable.flat_tensors
+        downloadable.transaction_done("tx", "ok")
+        assert not downloadable.flat_tensors
+
+    def test_disk_consumer_with_parts(self, temp_dir):
+        tensors = {"w": torch.randn(40, 30), "b": torch.randn(3)}
+        downloadable = TensorDownloadable(tensors, max_chunk_size=1000, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(downloadable.get_item_count())]
+
+        consumer = DiskTensorConsumer(temp_dir)
+        result = consumer.consume_items(items[::-1][:-1], None)
+        assert "w" not in result
+        result = consumer.consume_items(items[:2], result)
+        consumer.download_completed("ref")
+        assert consumer.error is None
+
+        assert result.keys() == tensors.keys()
+        for k, (file_path, st_key) in result.items():
+            with safe_open(file_path, framework="pt") as f:
+                assert torch.equal(f.get_tensor(st_key), tensors[k])
+
+    def test_disk_consumer_missing_part_fails_download(self, temp_dir):
+        downloadable = TensorDownloadable({"w": torch.randn(100)}, max_chunk_size=256, raw_buffer=True)
+        items = [_received(downloadable.produce_item(i)) for i in range(1, downloadable.get_item_count())]
+        consumer = DiskTensorConsumer(temp_dir)
+        assert consumer.consume_items(items, None) == {}
+        consumer.download_completed("ref")
+        assert "w" in consumer.error
+
+    def test_disk_consumer_rejects_overlapping_parts(self, temp_dir):
+        flat = torch.arange(8, dtype=torch.int32)
+        consumer = DiskTensorConsumer(temp_dir)
+        assert consumer.consume_items([_received(encode_tensor_part(flat, 0, 4, "w", flat.shape))], None) == {}
+        with pytest.raises(ValueError, match="overlaps"):
+            consumer.consume_items([_received(encode_tensor_part(flat, 2, 6, "w", flat.shape))], {})
@@ -21,7 +21,7 @@ from tensorboard.backend.event_processing.event_accumulator import EventAccumula
 
 from nvflare.apis.analytix import AnalyticsDataType
 from nvflare.apis.fl_context import FLContext
-from nvflare.apis.utils.analytix_utils import create_analytic_dxo
+from nvflare.apis.utils.analytix_utils import create_analytic_batch_dxo, create_analytic_dxo, split_analytic_batch_dxo
 from nvflare.app_opt.tracking.tb.tb_receiver import TBAnalyticsReceiver
 
 
@@ -200,3 +200,22 @@ class TestTBAnalyticsReceiver:
         assert len(recall_events) == 1
         assert recall_events[0].step == 5
         assert recall_events[0].value == pytest.approx(0.7)
+
+    def test_save_batch_writes_all_records(self, tmp_path):
+        receiver = TBAnalyticsReceiver()
+        fl_ctx = _make_fl_ctx(tmp_path / "run")
+        receiver.initialize(fl_ctx)
+
+        batch = create_analytic_batch_dxo(
+            [
+                create_analytic_dxo(tag="loss", value=1.0 / (i + 1), data_type=AnalyticsDataType.SCALAR, global_step=i)
+                for i in range(5)
+            ]
+        )
+        receiver.save_batch(fl_ctx, split_analytic_batch_dxo(batch), "site-1")
+        receiver.finalize(fl_ctx)
+
+        accumulator = _read_accumulator(tmp_path / "run" / "tb_events" / "site-1")
+        events = accumulator.Scalars("loss")
+        assert [event.step for event in events] == list(range(5))
+        assert [event.value for event in events] == pytest.approx([1.0 / (i + 1) for i in range(5)])
@@ -11,7 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
+import struct
+
+import numpy as np
+
+from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import (
+    DATA_TYPE_FLOAT_ARRAY,
+    DATA_TYPE_INT_ARRAY,
+    PREFIX_LEN,
+    SIGNATURE,
+    DamDecoder,
+    DamEncoder,
+)
 
 DATA_SET = 123456
 INT_ARRAY = [123, 456, 789]
@@ -34,3 +45,33 @@ class TestDam:
 
         float_array = decoder.decode_float_array()
         assert float_array == FLOAT_ARRAY
+
+    def test_wire_format(self):
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(INT_ARRAY)
+        encoder.add_float_array(FLOAT_ARRAY)
+        buffer = encoder.finish()
+
+        # one 8-byte value at a time, as written by DAM encoders in other languages
+        size = PREFIX_LEN + 2 * 16 + 8 * (len(INT_ARRAY) + len(FLOAT_ARRAY))
+        expected = SIGNATURE.encode("utf-8") + struct.pack("qq", size, DATA_SET)
+        expected += struct.pack("qq", DATA_TYPE_INT_ARRAY, len(INT_ARRAY))
+        expected += b"".join(struct.pack("q", x) for x in INT_ARRAY)
+        expected += struct.pack("qq", DATA_TYPE_FLOAT_ARRAY, len(FLOAT_ARRAY))
+        expected += b"".join(struct.pack("d", x) for x in FLOAT_ARRAY)
+        assert buffer == expected
+
+    def test_encode_decode_ndarray(self):
+        ints = np.arange(-5, 1000, dtype=np.int32)
+        floats = np.linspace(-1.0, 1.0, 777)
+        encoder = DamEncoder(DATA_SET)
+        encoder.add_int_array(ints)
+        encoder.add_float_array(floats)
+        encoder.add_int_array([])
+
+        decoder = DamDecoder(encoder.finish())
+        int_array = decoder.decode_int_ndarray()
+        assert int_array.dtype == np.int64
+        np.testing.assert_array_equal(int_array, ints)
+        np.testing.assert_array_equal(decoder.decode_float_ndarray(), floats)
+        assert decoder.decode_int_ndarray().size == 0
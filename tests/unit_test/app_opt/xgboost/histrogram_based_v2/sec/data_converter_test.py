@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 
 from nvflare.app_opt.xgboost.histogram_based_v2.sec.dam import DamDecoder, DamEncoder
@@ -124,3 +125,27 @@ class TestDataConverter:
 
         histo2 = decoder.decode_float_array()
         assert histo2 == [1.1, 1.2, 2.1, 2.2, 3.1, 3.2, 4.1, 4.2, 5.1, 5.2]
+
+    def test_slots_to_bins(self, data_converter):
+        rng = np.random.default_rng(0)
+        cuts = np.array([0, 3, 3, 10, 17, 20])
+        slots = rng.integers(-1, 20, size=(100, 4))
+
+        bins = data_converter.slots_to_bins(cuts, slots)
+        expected = [[data_converter.slot_to_bin(cuts.tolist(), int(s))[1] for s in row] for row in slots]
+        assert bins.tolist() == expected
+
+        with pytest.raises(RuntimeError, match="Invalid slot 20"):
+            data_converter.slots_to_bins(cuts, np.array([1, 20]))
+
+    def test_gh_pairs_match_scalar_conversion(self, data_converter):
+        gh = np.random.default_rng(0).standard_normal(1001)
+        encoder = DamEncoder(DATA_SET_GH_PAIRS)
+        encoder.add_float_array(gh)
+        pairs = data_converter.decode_gh_pairs(encoder.finish(), None)
+
+        expected = [
+            (data_converter.float_to_int(gh[2 * i]), data_converter.float_to_int(gh[2 * i + 1])) for i in range(500)
+        ]
+        assert pairs == expected
+        assert all(type(g) is int and type(h) is int for g, h in pairs)
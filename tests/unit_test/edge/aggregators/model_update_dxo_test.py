@@ -0,0 +1,49 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from nvflare.apis.dxo import DXO, DataKind, from_shareable
+from nvflare.apis.fl_context import FLContext
+from nvflare.edge.aggregators.model_update_dxo import ModelUpdateDXOAggregator
+
+
+def _make_update(weights, count=1):
+    return DXO(data_kind=DataKind.WEIGHT_DIFF, data={"dict": weights, "count": count}).to_shareable()
+
+
+class TestModelUpdateDXOAggregator:
+    def test_aggregate_arrays_and_lists(self):
+        aggr = ModelUpdateDXOAggregator()
+        fl_ctx = FLContext()
+        first = {"w": np.ones((2, 3), dtype=np.float32), "n": {"b": np.arange(3)}}
+        aggr.accept(_make_update(first), fl_ctx)
+        aggr.accept(_make_update({"w": [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], "n": {"b": [1, 1, 1]}}, count=2), fl_ctx)
+        aggr.accept(_make_update({"w": np.full((2, 3), 0.5), "n": {"b": np.full(3, 0.5)}}), fl_ctx)
+
+        # the first update is not changed by the following ones
+        np.testing.assert_array_equal(first["w"], np.ones((2, 3)))
+        np.testing.assert_array_equal(first["n"]["b"], np.arange(3))
+
+        result = from_shareable(aggr.aggregate(fl_ctx))
+        assert result.data["count"] == 4
+        w = result.data["dict"]["w"]
+        assert w.dtype == np.float32
+        np.testing.assert_allclose(w, [[2.5, 3.5, 4.5], [5.5, 6.5, 7.5]])
+        # int arrays cannot hold the float update, so it is added out of place
+        np.testing.assert_allclose(result.data["dict"]["n"]["b"], [1.5, 2.5, 3.5])
+
+        # the aggregator is reset after aggregate
+        assert aggr.dict is None
+        assert aggr.count == 0
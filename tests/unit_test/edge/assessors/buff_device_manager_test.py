@@ -0,0 +1,109 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from collections import Counter
+
+import pytest
+
+from nvflare.apis.fl_context import FLContext
+from nvflare.edge.assessors.buff_device_manager import BuffDeviceManager
+from nvflare.edge.mud import Device
+
+
+def _make_devices(num_clients, devices_per_client, start=0):
+    devices = {}
+    for c in range(num_clients):
+        for d in range(start, start + devices_per_client):
+            device_id = f"site-{c}-dev-{d}"
+            devices[device_id] = Device(device_id, f"site-{c}", 0.0)
+    return devices
+
+
+def _usable(manager):
+    return set(manager.available_devices.keys()) - set(manager.used_devices.keys())
+
+
+class TestBuffDeviceManager:
+    @pytest.mark.parametrize("strategy", ["balanced", "random"])
+    def test_selection_is_consistent_with_usable_devices(self, strategy):
+        random.seed(0)
+        fl_ctx = FLContext()
+        manager = BuffDeviceManager(device_selection_size=10, device_sampling_strategy=strategy)
+        manager.update_available_devices(_make_devices(3, 5), fl_ctx)
+
+        for version in range(1, 20):
+            usable = _usable(manager)
+            assert manager.get_num_usable_devices(fl_ctx) == len(usable)
+            before = set(manager.current_selection.keys())
+            manager.fill_selection(version, fl_ctx)
+            new = set(manager.current_selection.keys()) - before
+            assert new <= usable
+            assert len(manager.current_selection) == min(10, len(before) + len(usable))
+
+            # some devices report back, and more devices become available
+            done = set(random.sample(sorted(manager.current_selection.keys()), 4))
+            manager.remove_devices_from_selection(done, fl_ctx)
+            manager.remove_devices_from_used(done, fl_ctx)
+            manager.update_available_devices(_make_devices(3, 1, start=5 + version), fl_ctx)
+
+        assert manager.get_num_usable_devices(fl_ctx) == len(_usable(manager))
+
+    def test_balanced_sampling(self):
+        fl_ctx = FLContext()
+        manager = BuffDeviceManager(device_selection_size=9, initial_min_client_num=3)
+        manager.update_available_devices(_make_devices(3, 100), fl_ctx)
+        assert manager.has_enough_devices_and_clients(fl_ctx)
+
+        manager.fill_selection(1, fl_ctx)
+        counts = Counter(manager.device_client_map[d] for d in manager.current_selection)
+        assert counts == {"site-0": 3, "site-1": 3, "site-2": 3}
+
+    def test_balanced_sampling_with_uneven_clients(self):
+        fl_ctx = FLContext()
+        manager = BuffDeviceManager(device_selection_size=8)
+        devices = _make_devices(1, 1)
+        devices.update({f"big-{i}": Device(f"big-{i}", "site-big", 0.0) for i in range(20)})
+        manager.update_available_devices(devices, fl_ctx)
+
+        manager.fill_selection(1, fl_ctx)
+        counts = Counter(manager.device_client_map[d] for d in manager.current_selection)
+        assert counts == {"site-0": 1, "site-big": 7}
+
+    def test_devices_are_not_reused_without_release(self):
+        fl_ctx = FLContext()
+        manager = BuffDeviceManager(device_selection_size=4, device_reuse=False)
+        manager.update_available_devices(_make_devices(2, 3), fl_ctx)
+        manager.fill_selection(1, fl_ctx)
+        first = set(manager.current_selection.keys())
+        manager.remove_devices_from_selection(first, fl_ctx)
+
+        # devices that are reported again are still used
+        manager.update_available_devices(_make_devices(2, 3), fl_ctx)
+        manager.fill_selection(2, fl_ctx)
+        assert len(manager.current_selection) == 2
+        assert not set(manager.current_selection.keys()) & first
+        assert not manager.has_enough_devices_and_clients(fl_ctx)
+
+    def test_device_moved_to_another_client(self):
+        fl_ctx = FLContext()
+        manager = BuffDeviceManager(device_selection_size=1)
+        manager.update_available_devices({"d": Device("d", "site-1", 0.0)}, fl_ctx)
+        manager.update_available_devices({"d": Device("d", "site-2", 1.0)}, fl_ctx)
+        assert manager.device_client_map["d"] == "site-2"
+        assert manager.get_num_usable_devices(fl_ctx) == 1
+
+        manager.fill_selection(1, fl_ctx)
+        assert manager.current_selection == {"d": 1}
+        assert manager.get_num_usable_devices(fl_ctx) == 0
@@ -0,0 +1,65 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import numpy as np
+import pytest
+
+from nvflare.edge.model_protocol import ArrayEncoding, decode_arrays, encode_arrays
+
+
+def _make_model():
+    rng = np.random.default_rng(0)
+    return {
+        "conv.weight": rng.standard_normal((4, 2, 3, 3)).astype(np.float32),
+        "fc.weight": np.asfortranarray(rng.standard_normal((8, 5))),
+        "bn.num_batches_tracked": np.array(7, dtype=np.int64),
+        "scale": np.float32(0.5),
+        "nested": {"b": np.arange(3, dtype=np.int16)},
+        "name": "model",
+    }
+
+
+class TestArrayEncoding:
+    @pytest.mark.parametrize("encoding", [ArrayEncoding.LIST, ArrayEncoding.RAW])
+    def test_round_trip_through_json(self, encoding):
+        model = _make_model()
+        received = decode_arrays(json.loads(json.dumps(encode_arrays(model, encoding))))
+
+        assert received["name"] == "model"
+        assert received["scale"] == 0.5
+        for k in ["conv.weight", "fc.weight", "bn.num_batches_tracked"]:
+            np.testing.assert_array_equal(received[k], model[k])
+        np.testing.assert_array_equal(received["nested"]["b"], model["nested"]["b"])
+
+    def test_raw_keeps_dtype_and_is_compact(self):
+        model = _make_model()
+        raw = encode_arrays(model, ArrayEncoding.RAW)
+        received = decode_arrays(json.loads(json.dumps(raw)))
+        for k in ["conv.weight", "fc.weight", "bn.num_batches_tracked"]:
+            assert received[k].dtype == model[k].dtype
+            assert received[k].shape == model[k].shape
+        assert received["nested"]["b"].dtype == np.int16
+        assert len(json.dumps(raw)) < len(json.dumps(encode_arrays(model, ArrayEncoding.LIST)))
+
+    def test_unsupported_encoding(self):
+        with pytest.raises(ValueError):
+            encode_arrays({"w": np.zeros(2)}, "npz")
+
+    def test_bad_raw_data(self):
+        raw = encode_arrays({"w": np.zeros(4, dtype=np.float32)}, ArrayEncoding.RAW)
+        raw["w"]["data"] = raw["w"]["data"][:4]
+        with pytest.raises(ValueError):
+            decode_arrays(raw)
@@ -0,0 +1,189 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import pickle
+import threading
+
+import pytest
+
+from nvflare.apis.dxo import DXO, from_dict
+from nvflare.edge.constants import CookieKey, EdgeApiStatus, SpecialDeviceId
+from nvflare.edge.simulation.async_simulator import AsyncRequestSender, AsyncSimulator, RequestKind, RequestStats
+from nvflare.edge.simulation.devices.num import NumDeviceFactory
+from nvflare.edge.web.models.job_request import JobRequest
+from nvflare.edge.web.models.job_response import JobResponse
+from nvflare.edge.web.models.result_report import ResultReport
+from nvflare.edge.web.models.result_response import ResultResponse
+from nvflare.edge.web.models.selection_request import SelectionRequest
+from nvflare.edge.web.models.selection_response import SelectionResponse
+from nvflare.edge.web.models.task_request import TaskRequest
+from nvflare.edge.web.models.task_response import TaskResponse
+
+NUM_DEVICES = 200
+
+
+class _FakeServer:
+    """Selects all devices of the simulator once, and ends the job when all of them reported their results."""
+
+    def __init__(self, simulator: AsyncSimulator):
+        self.simulator = simulator
+        self.results = {}
+        self.range_device_ids = []
+        self.lock = threading.Lock()
+
+    def handle(self, request):
+        if isinstance(request, JobRequest):
+            return JobResponse(EdgeApiStatus.OK, job_id="job", job_name="test", method="edge", job_data={})
+        if isinstance(request, SelectionRequest):
+            self.range_device_ids.append(request.get_device_id())
+            if len(self.results) == NUM_DEVICES:
+                return SelectionResponse(EdgeApiStatus.NO_JOB)
+            prefix = self.simulator.device_id_prefix
+            selection = {f"{prefix}{SpecialDeviceId.NUM_INDICATOR}{i}": 1 for i in range(NUM_DEVICES)}
+            return SelectionResponse(EdgeApiStatus.OK, job_id="job", task_id="t1", selection=selection)
+        if isinstance(request, TaskRequest):
+            model = DXO(data_kind="number", data={"value": 1})
+            return TaskResponse(
+                EdgeApiStatus.OK,
+                job_id="job",
+                task_id="t1",
+                task_name="train",
+                task_data=model.to_dict(),
+                cookie={CookieKey.DEVICE_SELECTION_ID: 1},
+            )
+        if isinstance(request, ResultReport):
+            with self.lock:
+                assert request.get_device_id() not in self.results
+                self.results[request.get_device_id()] = from_dict(request.result).data["value"]
+            return ResultResponse(EdgeApiStatus.OK, task_id=request.task_id, task_name=request.task_name)
+        raise ValueError(f"unexpected request {type(request)}")
+
+
+class _AsyncSender(AsyncRequestSender):
+    def __init__(self, server: _FakeServer):
+        self.server = server
+        self.opened = False
+        self.closed = False
+
+    async def open(self):
+        self.opened = True
+
+    async def close(self):
+        self.closed = True
+
+    async def send(self, request, device):
+        await asyncio.sleep(0.001)
+        return self.server.handle(request)
+
+
+def _make_simulator(use_async: bool, train_time: float = 0.05):
+    return AsyncSimulator(
+        job_name="test",
+        device_factory=NumDeviceFactory(min_train_time=train_time, max_train_time=train_time, use_async=use_async),
+        num_devices=NUM_DEVICES,
+        num_workers=4,
+        max_concurrent_requests=16,
+        query_interval=0.05,
+        stats_report_interval=0,
+    )
+
+
+class TestAsyncSimulator:
+    def test_async_devices(self):
+        simulator = _make_simulator(use_async=True)
+        server = _FakeServer(simulator)
+        sender = _AsyncSender(server)
+        simulator.set_sender(sender)
+        simulator.start()
+
+        assert sender.opened and sender.closed
+        assert len(server.results) == NUM_DEVICES
+        assert all(v == 2 for v in server.results.values())
+        # the device range is only sent until the first selection is received
+        assert server.range_device_ids[0].endswith(f"{SpecialDeviceId.MAX_INDICATOR}{NUM_DEVICES}")
+        assert set(server.range_device_ids[1:]) == {SpecialDeviceId.DUMMY}
+        assert not simulator.busy_devices
+        # async devices train concurrently, not limited by the worker threads
+        assert simulator.stats.get_elapsed() < NUM_DEVICES * 0.05 / 4
+
+        summary = simulator.stats.summary()
+        assert summary[RequestKind.TASK]["count"] == NUM_DEVICES
+        assert summary[RequestKind.RESULT]["count"] == NUM_DEVICES
+        assert summary[RequestKind.JOB]["count"] == 1
+        assert all(s["errors"] == 0 for s in summary.values())
+
+    def test_blocking_send_func(self):
+        simulator = _make_simulator(use_async=False, train_time=0.005)
+        server = _FakeServer(simulator)
+        simulator.set_send_func(lambda request, device: server.handle(request))
+        simulator.start()
+        assert len(server.results) == NUM_DEVICES
+
+    def test_no_response(self, caplog):
+        simulator = _make_simulator(use_async=True, train_time=0.005)
+        server = _FakeServer(simulator)
+        asked = set()
+
+        def _handle(request):
+            # the first task request of each device gets no response
+            if isinstance(request, TaskRequest) and request.get_device_id() not in asked:
+                asked.add(request.get_device_id())
+                return None
+            return server.handle(request)
+
+        simulator.set_send_func(lambda request, device: _handle(request))
+        with caplog.at_level(logging.ERROR):
+            simulator.start()
+        assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+        assert len(server.results) == NUM_DEVICES
+        assert simulator.stats.summary()[RequestKind.TASK]["errors"] == NUM_DEVICES
+
+    def test_no_sender(self):
+        with pytest.raises(ValueError):
+            _make_simulator(use_async=True).start()
+
+
+def test_request_stats_merge():
+    s1 = RequestStats()
+    s1.add(RequestKind.TASK, 0.01, True)
+    s1.add(RequestKind.TASK, 0.03, False)
+    s2 = RequestStats()
+    s2.add(RequestKind.TASK, 0.02, True)
+    s2.add(RequestKind.RESULT, 0.5, True)
+    d1 = s1.to_dict()
+    d1["elapsed"] = 2.0
+    d2 = s2.to_dict()
+    d2["elapsed"] = 1.0
+
+    summary = RequestStats.merge([d1, d2]).summary()
+    assert summary[RequestKind.TASK]["count"] == 3
+    assert summary[RequestKind.TASK]["errors"] == 1
+    assert summary[RequestKind.TASK]["throughput"] == pytest.approx(1.5)
+    assert summary[RequestKind.TASK]["p50"] == pytest.approx(20.0, rel=0.01)
+    assert summary[RequestKind.RESULT]["max"] == pytest.approx(500.0)
+
+
+def test_request_stats_size_is_bounded():
+    stats = RequestStats()
+    for i in range(10000):
+        stats.add(RequestKind.TASK, 0.01 + i % 100 * 0.001, i % 2 == 0)
+
+    # the latencies are not kept, only their sketch
+    assert len(pickle.dumps(stats.to_dict())) < 10000
+
+    summary = RequestStats.merge([stats.to_dict()]).summary()
+    assert summary[RequestKind.TASK]["count"] == 10000
+    assert summary[RequestKind.TASK]["errors"] == 5000
@@ -0,0 +1,245 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.cell import RELAY_TOPIC, Cell, _RelayKey, make_relay_groups
+from nvflare.fuel.f3.cellnet.defs import CellChannel, MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.cellnet.utils import make_reply
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.utils.network_utils import get_open_ports
+
+TEST_CHANNEL = "broadcast_test"
+TEST_TOPIC = "echo"
+NUM_CLIENTS = 7
+
+
+@pytest.mark.parametrize(
+    "num_targets, fanout, expected",
+    [
+        (3, 0, [("t0", []), ("t1", []), ("t2", [])]),
+        (3, 3, [("t0", []), ("t1", []), ("t2", [])]),
+        (5, 2, [("t0", ["t1", "t2"]), ("t3", ["t4"])]),
+        (7, 3, [("t0", ["t1", "t2"]), ("t3", ["t4", "t5"]), ("t6", [])]),
+    ],
+)
+def test_make_relay_groups(num_targets, fanout, expected):
+    assert make_relay_groups([f"t{i}" for i in range(num_targets)], fanout) == expected
+
+
+MAX_WORKERS = 2
+
+
+def _start_cells():
+    url = f"tcp://localhost:{get_open_ports(1)[0]}"
+    server = Cell(fqcn="server", root_url=url, secure=False, credentials={})
+    server.start()
+    received = {}
+    lock = threading.Lock()
+
+    def _echo(request: Message):
+        cell_name = request.get_header(MessageHeaderKey.DESTINATION)
+        with lock:
+            received.setdefault(cell_name, []).append(
+                (request.get_header(MessageHeaderKey.ORIGIN), request.get_header(MessageHeaderKey.BROADCAST_ORIGIN))
+            )
+        return make_reply(ReturnCode.OK, body={"cell": cell_name, "data": request.payload["data"]})
+
+    clients = []
+    for i in range(NUM_CLIENTS):
+        client = Cell(fqcn=f"site-{i}", root_url=url, secure=False, credentials={})
+        client.register_request_cb(channel=TEST_CHANNEL, topic=TEST_TOPIC, cb=_echo)
+        client.start()
+        clients.append(client)
+
+    # wait for the clients to connect
+    deadline = time.time() + 10
+    while len(server.get_sub_cell_names()[1]) < NUM_CLIENTS and time.time() < deadline:
+        time.sleep(0.1)
+
+    return server, clients, received
+
+
+@pytest.fixture(scope="module")
+def cells():
+    # relaying is enabled on all cells, and broadcasts are sent in waves of MAX_WORKERS requests
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(CommConfigurator, "get_broadcast_relay_fanout", lambda self, default=0: 2)
+        mp.setattr(CommConfigurator, "get_broadcast_max_workers", lambda self, default: MAX_WORKERS)
+        server, clients, received = _start_cells()
+
+    yield server, clients, received
+    for c in clients:
+        c.stop()
+    server.stop()
+
+
+class TestCellBroadcast:
+    @pytest.mark.parametrize("relay_fanout", [0, 2, 3])
+    def test_broadcast(self, cells, relay_fanout):
+        server, clients, received = cells
+        received.clear()
+        targets = [c.get_fqcn() for c in clients]
+        replies = server.broadcast_request(
+            channel=TEST_CHANNEL,
+            topic=TEST_TOPIC,
+            targets=targets,
+            request=Message(payload={"data": b"x" * 1000}),
+            timeout=10.0,
+            relay_fanout=relay_fanout,
+        )
+
+        assert replies.keys() == set(targets)
+        for t, reply in replies.items():
+            assert reply.get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.OK
+            assert reply.payload == {"cell": t, "data": b"x" * 1000}
+
+        # every target receives the request once
+        assert sorted(received.keys()) == sorted(targets)
+        assert all(len(v) == 1 for v in received.values())
+        origins = {t: v[0] for t, v in received.items()}
+        if relay_fanout:
+            # the server only sends to the relays, which forward the request to themselves and their subtrees
+            groups = make_relay_groups(targets, relay_fanout)
+            assert len(groups) == relay_fanout
+            for relay, subtree in groups:
+                if subtree:
+                    assert origins[relay] == (relay, "server")
+                    assert all(origins[t][0] in targets and origins[t][1] == "server" for t in subtree)
+                else:
+                    assert origins[relay] == ("server", None)
+        else:
+            assert all(origin == ("server", None) for origin in origins.values())
+
+    def test_secure_broadcast_is_not_relayed(self, cells):
+        server, clients, _ = cells
+        requests = []
+        server._send_relay_request = lambda *args: requests.append(args)
+        server._send_one_request = lambda **kwargs: make_reply(ReturnCode.OK)
+        try:
+            replies = server.broadcast_request(
+                channel=TEST_CHANNEL,
+                topic=TEST_TOPIC,
+                targets=[c.get_fqcn() for c in clients],
+                request=Message(payload={"data": b""}),
+                timeout=1.0,
+                secure=True,
+                relay_fanout=2,
+            )
+        finally:
+            del server._send_relay_request
+            del server._send_one_request
+        assert not requests
+        assert len(replies) == NUM_CLIENTS
+
+    def test_broadcast_pool_is_bounded(self, cells):
+        server, clients, _ = cells
+        replies = server.broadcast_request(
+            channel=TEST_CHANNEL,
+            topic=TEST_TOPIC,
+            targets=[c.get_fqcn() for c in clients],
+            request=Message(payload={"data": b""}),
+            timeout=10.0,
+            relay_fanout=0,
+        )
+        assert len(replies) == NUM_CLIENTS
+        executor = server._broadcast_executor
+        assert 0 < len(executor._threads) <= MAX_WORKERS
+
+        # the pool is kept for the next broadcast
+        server.broadcast_request(
+            channel=TEST_CHANNEL,
+            topic=TEST_TOPIC,
+            targets=[c.get_fqcn() for c in clients],
+            request=Message(payload={"data": b""}),
+            timeout=10.0,
+            relay_fanout=0,
+        )
+        assert server._broadcast_executor is executor
+
+    def test_relay_timeout_covers_waves(self, cells, monkeypatch):
+        server, _, _ = cells
+        timeouts = []
+
+        def _send_request(**kwargs):
+            timeouts.append(kwargs["timeout"])
+            return make_reply(ReturnCode.TIMEOUT)
+
+        monkeypatch.setattr(server, "_send_request", _send_request)
+        subtree = [f"site-{i}" for i in range(1, 5)]
+        replies = server._send_relay_request(
+            "site-0", subtree, TEST_CHANNEL, TEST_TOPIC, Message(headers={}), 1.0, False, False, None
+        )
+
+        # the relay sends to itself and 4 other targets in 3 waves of 2 requests; then it replies
+        assert timeouts == [4.0]
+        assert len(replies) == 5
+
+    def _relay_request(self, cell, relay, channel=TEST_CHANNEL, secure=False):
+        spec = {
+            _RelayKey.CHANNEL: channel,
+            _RelayKey.TOPIC: TEST_TOPIC,
+            _RelayKey.TARGETS: [],
+            _RelayKey.TIMEOUT: 1.0,
+            _RelayKey.SECURE: secure,
+            _RelayKey.HEADERS: {},
+            _RelayKey.PAYLOAD: b"",
+        }
+        reply = cell.send_request(
+            channel=CellChannel.BROADCAST_RELAY,
+            topic=RELAY_TOPIC,
+            target=relay.get_fqcn(),
+            request=Message(payload=spec),
+            timeout=5.0,
+        )
+        return reply.get_header(MessageHeaderKey.RETURN_CODE)
+
+    def test_relay_request_from_peer_is_rejected(self, cells):
+        _, clients, received = cells
+        received.clear()
+        assert self._relay_request(clients[1], clients[0]) == ReturnCode.UNAUTHENTICATED
+        assert not received
+
+    @pytest.mark.parametrize("channel", [CellChannel.SERVER_COMMAND, CellChannel.BROADCAST_RELAY, "_net_manager"])
+    def test_relay_request_on_reserved_channel_is_rejected(self, cells, channel):
+        server, clients, _ = cells
+        assert self._relay_request(server, clients[0], channel=channel) == ReturnCode.INVALID_REQUEST
+
+    def test_secure_relay_request_is_rejected(self, cells):
+        server, clients, _ = cells
+        assert self._relay_request(server, clients[0], secure=True) == ReturnCode.INVALID_REQUEST
+
+    def test_relay_to_missing_target(self, cells):
+        server, clients, _ = cells
+        targets = [clients[0].get_fqcn(), "site-missing"]
+        replies = server.broadcast_request(
+            channel=TEST_CHANNEL,
+            topic=TEST_TOPIC,
+            targets=targets,
+            request=Message(payload={"data": b""}),
+            timeout=1.0,
+            relay_fanout=1,
+        )
+        assert replies[clients[0].get_fqcn()].get_header(MessageHeaderKey.RETURN_CODE) == ReturnCode.OK
+        assert replies["site-missing"].get_header(MessageHeaderKey.RETURN_CODE) != ReturnCode.OK
+
+
+def test_relay_handler_not_registered_by_default():
+    cell = Cell(fqcn="site-x", root_url="tcp://localhost:1", secure=False, credentials={})
+    assert cell.broadcast_relay_fanout == 0
+    assert not cell.core_cell.req_reg.find(CellChannel.BROADCAST_RELAY, RELAY_TOPIC)
@@ -0,0 +1,119 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from nvflare.fuel.f3.cellnet import cell_cipher
+from nvflare.fuel.f3.cellnet.cell_cipher import (
+    GCM_HEADER_LENGTH,
+    GCM_PARAMS_LENGTH,
+    GCM_TAG_LENGTH,
+    KEY_ENC_LENGTH,
+    SimpleCellCipher,
+)
+from nvflare.lighter.utils import Identity, generate_cert, generate_keys
+
+
+@pytest.fixture(scope="module")
+def credentials():
+    root_pri_key, root_pub_key = generate_keys()
+    root = Identity("root", "nvidia")
+    root_cert = generate_cert(root, root, root_pri_key, root_pub_key, ca=True)
+    result = {}
+    for name in ["server", "site-1"]:
+        pri_key, pub_key = generate_keys()
+        result[name] = (pri_key, generate_cert(Identity(name, "nvidia"), root, root_pri_key, pub_key))
+    return root_cert, result
+
+
+def _make_ciphers(credentials, chunk_size=16, max_workers=1):
+    root_cert, creds = credentials
+    sender = SimpleCellCipher(root_cert, *creds["server"], chunk_size=chunk_size, max_workers=max_workers)
+    receiver = SimpleCellCipher(root_cert, *creds["site-1"], chunk_size=chunk_size, max_workers=max_workers)
+    return sender, receiver, creds["server"][1], creds["site-1"][1]
+
+
+class TestSimpleCellCipher:
+    @pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 100])
+    def test_chunked_round_trip(self, credentials, size):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials)
+        data = os.urandom(size)
+        encrypted = sender.encrypt_chunked(data, receiver_cert)
+        num_chunks = max(1, -(-size // 16))
+        assert len(encrypted) == GCM_HEADER_LENGTH + size + num_chunks * GCM_TAG_LENGTH
+        assert receiver.decrypt_chunked(bytes(encrypted), sender_cert) == data
+
+    def test_chunked_buffer_list(self, credentials):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials, max_workers=3)
+        buffers = [os.urandom(5), memoryview(os.urandom(40)), bytearray(os.urandom(3)), b""]
+        encrypted = sender.encrypt_chunked(buffers, receiver_cert)
+        assert receiver.decrypt_chunked(memoryview(encrypted), sender_cert) == b"".join(bytes(b) for b in buffers)
+
+    def test_chunked_each_message_uses_new_key(self, credentials):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials)
+        data = os.urandom(32)
+        e1 = sender.encrypt_chunked(data, receiver_cert)
+        e2 = sender.encrypt_chunked(data, receiver_cert)
+        # same session key, different key salts
+        assert e1[:KEY_ENC_LENGTH] == e2[:KEY_ENC_LENGTH]
+        assert (
+            e1[GCM_HEADER_LENGTH - GCM_PARAMS_LENGTH : GCM_HEADER_LENGTH]
+            != e2[GCM_HEADER_LENGTH - GCM_PARAMS_LENGTH : GCM_HEADER_LENGTH]
+        )
+        assert e1[GCM_HEADER_LENGTH:] != e2[GCM_HEADER_LENGTH:]
+        assert receiver.decrypt_chunked(e1, sender_cert) == data
+        assert receiver.decrypt_chunked(e2, sender_cert) == data
+
+    def test_chunked_too_many_chunks(self, credentials, monkeypatch):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials)
+        encrypted = sender.encrypt_chunked(os.urandom(64), receiver_cert)
+
+        monkeypatch.setattr(cell_cipher, "GCM_MAX_CHUNKS", 3)
+        with pytest.raises(ValueError, match="too many chunks"):
+            sender.encrypt_chunked(os.urandom(64), receiver_cert)
+        with pytest.raises(ValueError, match="too many chunks"):
+            receiver.decrypt_chunked(encrypted, sender_cert)
+
+    @pytest.mark.parametrize(
+        "tamper",
+        [
+            lambda e: e[:GCM_HEADER_LENGTH] + bytes([e[GCM_HEADER_LENGTH] ^ 1]) + e[GCM_HEADER_LENGTH + 1 :],
+            lambda e: e[:-1] + bytes([e[-1] ^ 1]),
+            # swap the first two chunks
+            lambda e: e[:GCM_HEADER_LENGTH]
+            + e[GCM_HEADER_LENGTH + 32 : GCM_HEADER_LENGTH + 64]
+            + e[GCM_HEADER_LENGTH : GCM_HEADER_LENGTH + 32]
+            + e[GCM_HEADER_LENGTH + 64 :],
+            # drop the last chunk
+            lambda e: e[:-32],
+            # change the chunk size in the header
+            lambda e: e[: GCM_HEADER_LENGTH - 9] + bytes([e[GCM_HEADER_LENGTH - 9] ^ 1]) + e[GCM_HEADER_LENGTH - 8 :],
+        ],
+    )
+    def test_chunked_tampering_detected(self, credentials, tamper):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials)
+        encrypted = bytes(sender.encrypt_chunked(os.urandom(48), receiver_cert))
+        with pytest.raises(ValueError):
+            receiver.decrypt_chunked(tamper(encrypted), sender_cert)
+
+    def test_cbc_still_supported(self, credentials):
+        sender, receiver, sender_cert, receiver_cert = _make_ciphers(credentials)
+        data = os.urandom(100)
+        assert receiver.decrypt(sender.encrypt(data, receiver_cert), sender_cert) == data
+
+    def test_bad_chunk_size(self, credentials):
+        with pytest.raises(ValueError):
+            _make_ciphers(credentials, chunk_size=0)
@@ -0,0 +1,40 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.cell import Cell
+from nvflare.fuel.f3.cellnet.core_cell import CoreCell
+from nvflare.fuel.f3.stats_pool import StatsPoolManager
+from nvflare.fuel.utils.network_utils import get_open_ports
+
+
+def test_unregister_stopped_cell():
+    url = f"tcp://localhost:{get_open_ports(1)[0]}"
+    fqcn = "site-unregister.simulate_job"
+    cell = Cell(fqcn=fqcn, root_url=url, secure=False, credentials={})
+    pool_name = cell.core_cell.msg_stats_pool.name
+    cell.start()
+    with pytest.raises(RuntimeError):
+        cell.unregister()
+    cell.stop()
+    cell.unregister()
+    assert fqcn not in CoreCell.ALL_CELLS
+    assert StatsPoolManager.get_pool(pool_name) is None
+
+    # a cell of the same name can be created again
+    cell = Cell(fqcn=fqcn, root_url=url, secure=False, credentials={})
+    assert CoreCell.ALL_CELLS[fqcn] is cell.core_cell
+    cell.stop()
+    cell.unregister()
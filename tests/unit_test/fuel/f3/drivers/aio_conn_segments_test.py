@@ -0,0 +1,117 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from nvflare.fuel.f3.comm_error import CommError
+from nvflare.fuel.f3.drivers.aio_conn import AioConnection
+from nvflare.fuel.f3.drivers.aio_context import AioContext
+from nvflare.fuel.f3.drivers.connector_info import Mode
+
+
+class SlowWriter:
+    """Keeps references to the written buffers, and only copies them out when draining, like a transport does."""
+
+    def __init__(self):
+        self.pending = []
+        self.data = bytearray()
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+    def write(self, data):
+        self.pending.append(data)
+
+    def writelines(self, data):
+        self.pending.extend(data)
+
+    async def drain(self):
+        await asyncio.sleep(0.05)
+        for buf in self.pending:
+            self.data += bytes(buf)
+        self.pending.clear()
+
+
+class StuckWriter(SlowWriter):
+    """A writer whose peer stopped reading."""
+
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    async def drain(self):
+        await asyncio.sleep(60)
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+@pytest.fixture
+def aio_ctx():
+    return AioContext.get_global_context()
+
+
+def _make_conn(aio_ctx):
+    writer = SlowWriter()
+    conn = AioConnection(SimpleNamespace(mode=Mode.ACTIVE), aio_ctx, None, writer)
+    return conn, writer
+
+
+def test_reused_buffer_is_not_corrupted(aio_ctx):
+    conn, writer = _make_conn(aio_ctx)
+    header = b"header"
+    buffer = bytearray(os.urandom(1000))
+    expected = bytearray()
+    for _ in range(3):
+        conn.send_frame_segments([header, memoryview(buffer)])
+        expected += header + buffer
+
+        # the buffer is refilled for the next chunk right after the send
+        buffer[:] = os.urandom(len(buffer))
+
+    assert writer.data == expected
+
+
+def test_send_from_aio_loop(aio_ctx):
+    conn, writer = _make_conn(aio_ctx)
+    buffer = bytearray(os.urandom(100))
+
+    async def _send():
+        conn.send_frame_segments([b"header", memoryview(buffer)])
+
+    expected = b"header" + bytes(buffer)
+    asyncio.run_coroutine_threadsafe(_send(), aio_ctx.get_event_loop()).result()
+    buffer[:] = bytes(len(buffer))
+    asyncio.run_coroutine_threadsafe(writer.drain(), aio_ctx.get_event_loop()).result()
+    assert writer.data == expected
+
+
+def test_send_timeout_closes_connection(aio_ctx):
+    writer = StuckWriter()
+    conn = AioConnection(SimpleNamespace(mode=Mode.ACTIVE), aio_ctx, None, writer)
+    conn.send_timeout = 0.1
+
+    with pytest.raises(CommError) as exc_info:
+        conn.send_frame_segments([b"header", memoryview(bytearray(100))])
+
+    assert exc_info.value.code == CommError.TIMEOUT
+    assert conn.closing
+    assert writer.closed
@@ -0,0 +1,175 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import socket
+import threading
+from types import SimpleNamespace
+
+import msgpack
+import pytest
+
+from nvflare.fuel.f3.comm_config import CommConfigurator
+from nvflare.fuel.f3.comm_error import CommError
+from nvflare.fuel.f3.connection import Connection
+from nvflare.fuel.f3.drivers.connector_info import Mode
+from nvflare.fuel.f3.drivers.socket_conn import SocketConnection
+from nvflare.fuel.f3.endpoint import Endpoint
+from nvflare.fuel.f3.sfm.prefix import PREFIX_LEN, Prefix
+from nvflare.fuel.f3.sfm.sfm_conn import VECTORED_SEND_THRESHOLD, SfmConnection
+
+
+class FakeVectoredSocket:
+    def __init__(self, max_send=None):
+        self.max_send = max_send
+        self.data = bytearray()
+        self.sendmsg_calls = 0
+
+    def getpeername(self):
+        return ("127.0.0.1", 9001)
+
+    def getsockname(self):
+        return ("127.0.0.1", 9002)
+
+    def fileno(self):
+        return 99
+
+    def shutdown(self, *_args, **_kwargs):
+        return None
+
+    def close(self):
+        return None
+
+    def sendmsg(self, buffers):
+        self.sendmsg_calls += 1
+        budget = self.max_send
+        sent = 0
+        for buf in buffers:
+            chunk = bytes(buf)
+            if budget is not None:
+                chunk = chunk[: budget - sent]
+            self.data += chunk
+            sent += len(chunk)
+            if budget is not None and sent >= budget:
+                break
+        return sent
+
+
+class RecordingConn(Connection):
+    def __init__(self):
+        super().__init__(SimpleNamespace(mode=Mode.ACTIVE))
+        self.frames = []
+        self.segments = []
+
+    def get_conn_properties(self) -> dict:
+        return {}
+
+    def close(self):
+        pass
+
+    def send_frame(self, frame):
+        self.frames.append(bytes(frame))
+
+    def send_frame_segments(self, segments):
+        self.segments.append(segments)
+        super().send_frame_segments(segments)
+
+
+def _make_conn(monkeypatch, sock, secure=False):
+    monkeypatch.setattr(CommConfigurator, "get_streaming_send_timeout", lambda self, default: 2.0)
+    connector = SimpleNamespace(mode=Mode.ACTIVE, driver=SimpleNamespace(get_name=lambda: "tcp"))
+    return SocketConnection(sock=sock, connector=connector, secure=secure)
+
+
+class TestSocketConnectionSegments:
+    def test_partial_sendmsg_writes_all_segments_in_order(self, monkeypatch):
+        sock = FakeVectoredSocket(max_send=3)
+        conn = _make_conn(monkeypatch, sock)
+        monkeypatch.setattr(
+            "nvflare.fuel.f3.drivers.socket_conn.select.select",
+            lambda _r, _w, _x, _t: ([], [sock], []),
+        )
+
+        segments = [b"abcd", bytearray(b""), memoryview(b"efghij"), b"k"]
+        conn.send_frame_segments(segments)
+
+        assert bytes(sock.data) == b"abcdefghijk"
+        assert sock.sendmsg_calls == 4
+
+    def test_segment_send_timeout_closes_connection(self, monkeypatch):
+        sock = FakeVectoredSocket()
+        conn = _make_conn(monkeypatch, sock)
+        monkeypatch.setattr(
+            "nvflare.fuel.f3.drivers.socket_conn.select.select",
+            lambda _r, _w, _x, _t: ([], [], []),
+        )
+
+        with pytest.raises(CommError) as ex:
+            conn.send_frame_segments([b"abc", b"def"])
+
+        assert ex.value.code == CommError.TIMEOUT
+        assert conn.closing is True
+
+    @pytest.mark.parametrize("payload_size", [10, VECTORED_SEND_THRESHOLD + 1, 3 * VECTORED_SEND_THRESHOLD])
+    def test_sfm_frame_over_socketpair(self, monkeypatch, payload_size):
+        left, right = socket.socketpair()
+        try:
+            sender = _make_conn(monkeypatch, left)
+            receiver = _make_conn(monkeypatch, right)
+            sfm_conn = SfmConnection(conn=sender, local_endpoint=Endpoint("local"))
+
+            part1 = os.urandom(payload_size // 2)
+            part2 = memoryview(os.urandom(payload_size - len(part1)))
+            headers = {"k": "v"}
+
+            result = {}
+            reader = threading.Thread(target=lambda: result.update(frame=receiver.read_frame()), daemon=True)
+            reader.start()
+            sfm_conn.send_data(1, 2, headers, [part1, part2])
+            reader.join(timeout=5.0)
+
+            frame = result["frame"]
+            prefix = Prefix.from_bytes(frame)
+            assert prefix.length == len(frame)
+            assert msgpack.unpackb(frame[PREFIX_LEN : PREFIX_LEN + prefix.header_len]) == headers
+            assert bytes(frame[PREFIX_LEN + prefix.header_len :]) == part1 + bytes(part2)
+        finally:
+            left.close()
+            right.close()
+
+
+class TestSfmConnectionSegments:
+    def test_small_payload_is_sent_as_single_frame(self):
+        conn = RecordingConn()
+        sfm_conn = SfmConnection(conn=conn, local_endpoint=Endpoint("local"))
+
+        sfm_conn.send_data(1, 1, None, [b"ab", b"cd"])
+
+        assert not conn.segments
+        assert conn.frames[0][PREFIX_LEN:] == b"abcd"
+
+    def test_large_payload_segments_are_not_copied(self):
+        conn = RecordingConn()
+        sfm_conn = SfmConnection(conn=conn, local_endpoint=Endpoint("local"))
+        big = bytearray(VECTORED_SEND_THRESHOLD * 2)
+
+        sfm_conn.send_data(1, 1, {"a": 1}, [big, b"tail"])
+
+        segments = conn.segments[0]
+        assert len(segments) == 3
+        assert segments[1] is big
+        # Default send_frame_segments falls back to a flattened frame
+        frame = conn.frames[0]
+        assert Prefix.from_bytes(frame).length == len(frame)
+        assert frame.endswith(b"tail")
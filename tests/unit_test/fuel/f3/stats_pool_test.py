@@ -0,0 +1,178 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import random
+import threading
+
+import pytest
+
+from nvflare.fuel.f3.stats_pool import (
+    CounterPool,
+    CsvRecordHandler,
+    HistPool,
+    QuantileSketch,
+    StatsMode,
+    new_time_pool,
+    parse_hist_mode,
+)
+
+
+def _run_in_threads(fn, num_threads):
+    threads = [threading.Thread(target=fn, args=(i,)) for i in range(num_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+class TestQuantileSketch:
+    @pytest.mark.parametrize("q", [0.0, 0.5, 0.9, 0.99, 0.999, 1.0])
+    def test_relative_accuracy(self, q):
+        rng = random.Random(0)
+        values = sorted(rng.lognormvariate(-5, 2) for _ in range(20000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        expected = values[int(q * (len(values) - 1))]
+        assert sketch.get_quantile(q) == pytest.approx(expected, rel=0.01)
+
+    def test_merge_and_round_trip(self):
+        a = QuantileSketch()
+        b = QuantileSketch()
+        for i in range(1, 101):
+            (a if i % 2 else b).add(float(i))
+        a.add(0.0)
+        a.add(-5.0)
+        a.merge(b)
+
+        assert a.count == 102
+        assert a.get_quantile(0.0) == pytest.approx(-5.0, rel=0.01)
+        assert a.get_quantile(1.0) == pytest.approx(100.0, rel=0.01)
+
+        c = QuantileSketch.from_dict(json.loads(json.dumps(a.to_dict())))
+        assert c.count == a.count
+        assert c.get_quantile(0.5) == a.get_quantile(0.5)
+
+    def test_empty_and_non_finite(self):
+        sketch = QuantileSketch()
+        assert sketch.get_quantile(0.5) is None
+        sketch.add(float("nan"))
+        sketch.add(float("inf"))
+        assert sketch.count == 0
+
+    def test_merge_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+class TestHistPool:
+    def test_table_matches_recorded_values(self):
+        pool = HistPool("test", "", marks=(1.0, 2.0, 3.0), unit="s")
+        for v in (0.5, 1.0, 1.5, 2.5, 2.7, 10.0):
+            pool.record_value("a", v)
+        pool.record_value("b", 1.2)
+
+        headers, rows = pool.get_table(StatsMode.COUNT)
+        assert headers == ["category", "<1.0", "1.0-2.0", "2.0-3.0", ">=3.0", "overall"]
+        assert rows == [["a", "1", "2", "2", "1", "6"], ["b", "", "1", "", "", "1"]]
+
+        _, rows = pool.get_table(StatsMode.MAX)
+        assert rows[0][3] == "2.700e+00"
+        assert rows[0][-1] == "1.000e+01"
+
+    def test_concurrent_recording(self):
+        pool = new_time_pool("test")
+        num_threads, per_thread = 8, 2000
+
+        def _record(i):
+            for j in range(per_thread):
+                pool.record_value(f"cat{i % 2}", 0.001 * (j + 1))
+
+        _run_in_threads(_record, num_threads)
+
+        _, rows = pool.get_table(StatsMode.COUNT)
+        assert [r[-1] for r in rows] == [str(num_threads * per_thread // 2)] * 2
+        assert pool.get_quantile("cat0", 0.5) == pytest.approx(0.001 * per_thread / 2, rel=0.01)
+        # shards of the ended threads have been folded together
+        assert pool.cat_data.thread_shards == []
+
+    def test_shards_of_ended_threads_are_pruned_without_reads(self):
+        pool = new_time_pool("test")
+        for _ in range(20):
+            # short-lived threads that record once each, with no read in between
+            _run_in_threads(lambda i: pool.record_value("a", 0.5), 1)
+        assert len(pool.cat_data.thread_shards) == 1
+
+        _, rows = pool.get_table(StatsMode.COUNT)
+        assert rows[0][-1] == "20"
+
+    def test_quantile_table(self):
+        pool = new_time_pool("test")
+        for i in range(1000):
+            pool.record_value("a", (i + 1) / 1000)
+
+        headers, rows = pool.get_table(parse_hist_mode("quantile"))
+        assert headers == ["category", "count", "min", "p50", "p90", "p99", "p999", "max"]
+        assert rows[0][:3] == ["a", "1000", "1.000e-03"]
+        assert float(rows[0][4]) == pytest.approx(0.9, rel=0.01)
+
+    def test_dict_round_trip(self):
+        pool = new_time_pool("test", "desc")
+        for i in range(100):
+            pool.record_value("a", i / 100)
+
+        d = json.loads(json.dumps(pool.to_dict()))
+        restored = HistPool.from_dict(d)
+        assert restored.get_table(StatsMode.AVERAGE) == pool.get_table(StatsMode.AVERAGE)
+        assert restored.get_quantile("a", 0.99) == pool.get_quantile("a", 0.99)
+
+        # dicts without sketches are still accepted
+        d.pop("sketches")
+        assert HistPool.from_dict(d).get_table(StatsMode.COUNT) == pool.get_table(StatsMode.COUNT)
+
+    def test_record_writer(self, tmp_path):
+        file_name = str(tmp_path / "records.csv")
+        writer = CsvRecordHandler(file_name)
+        pool = new_time_pool("test", record_writer=writer)
+        pool.record_value("a", 0.5)
+        writer.close()
+
+        records = CsvRecordHandler.read_records(file_name)
+        assert [v for _, v in records["test"]["a"]] == [0.5]
+
+
+class TestCounterPool:
+    def test_concurrent_increment(self):
+        pool = CounterPool("test", "", counter_names=["sent"])
+
+        def _increment(i):
+            for _ in range(1000):
+                pool.increment("a", "sent")
+                pool.increment("b", f"err{i % 2}", 2)
+
+        _run_in_threads(_increment, 4)
+
+        headers, rows = pool.get_table()
+        assert headers == ["category", "sent", "err0", "err1"]
+        assert rows == [["a", "4000", "0", "0"], ["b", "0", "4000", "4000"]]
+
+        restored = CounterPool.from_dict(json.loads(json.dumps(pool.to_dict())))
+        assert restored.get_table() == (headers, rows)
+
+    def test_undefined_counter_name(self):
+        pool = CounterPool("test", "", counter_names=["sent"], dynamic_counter_name=False)
+        with pytest.raises(ValueError):
+            pool.increment("a", "unknown")
@@ -0,0 +1,120 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.cellnet.utils import make_reply
+from nvflare.fuel.f3.streaming.bytes_downloader import BytesConsumer, BytesDownloadable, add_bytes, download_bytes
+from nvflare.fuel.f3.streaming.download_service import DownloadService
+from nvflare.fuel.f3.streaming.obj_downloader import ObjectDownloader
+
+
+class _Cell:
+    """Serves download requests of the in-process DownloadService, failing the requests at the specified calls."""
+
+    def __init__(self, fqcn: str, fail_calls=()):
+        self.fqcn = fqcn
+        self.fail_calls = set(fail_calls)
+        self.states = []  # state of each download request
+
+    def get_fqcn(self):
+        return self.fqcn
+
+    def register_request_cb(self, channel, topic, cb):
+        pass
+
+    def send_request(self, channel, target, topic, request, timeout, secure=False, optional=False, abort_signal=None):
+        self.states.append(request.payload.get("state"))
+        if len(self.states) in self.fail_calls:
+            return make_reply(ReturnCode.COMM_ERROR)
+        request.set_header(MessageHeaderKey.ORIGIN, self.fqcn)
+        return DownloadService._handle_download(request)
+
+
+class TestBytesDownloadable:
+    def test_produce(self):
+        data = os.urandom(50)
+        obj = BytesDownloadable(data, chunk_size=20)
+
+        rc, chunk, state = obj.produce({}, "receiver1")
+        assert rc == "ok"
+        assert chunk == data[:20]
+        assert state == {"received_bytes": 20}
+
+        rc, chunk, state = obj.produce({"received_bytes": 40}, "receiver1")
+        assert rc == "ok"
+        assert chunk == data[40:]
+        assert state == {"received_bytes": 50}
+
+        rc, chunk, state = obj.produce({"received_bytes": 50}, "receiver1")
+        assert rc == "eof"
+        assert chunk is None
+
+    def test_produce_chunk(self):
+        data = os.urandom(50)
+        obj = BytesDownloadable(bytearray(data), chunk_size=20)
+        assert obj.produce_chunk(2, "receiver1")[1] == data[40:]
+        assert obj.produce_chunk(3, "receiver1")[0] == "eof"
+
+    @pytest.mark.parametrize("received_bytes", [-1, "invalid"])
+    def test_bad_state(self, received_bytes):
+        obj = BytesDownloadable(b"abc")
+        rc, chunk, state = obj.produce({"received_bytes": received_bytes}, "receiver1")
+        assert rc == "error"
+        assert chunk is None
+        assert state == {}
+
+    def test_bad_data(self):
+        with pytest.raises(TypeError):
+            BytesDownloadable("abc")
+
+
+class TestDownloadBytes:
+    def test_download(self):
+        cell = _Cell("site-1")
+        data = os.urandom(1000)
+        downloader = ObjectDownloader(cell=cell, timeout=10.0, num_receivers=1)
+        ref_id = add_bytes(downloader, data, chunk_size=300)
+
+        err, consumer = download_bytes("site-1", ref_id, 5.0, cell)
+        assert err is None
+        assert consumer.buffer == data
+        assert cell.states[0] is None
+        downloader.delete_transaction()
+
+    def test_resume_after_failure(self):
+        # the 3rd request fails: the 2nd attempt continues from the bytes received by the 1st attempt
+        cell = _Cell("site-1", fail_calls=[3])
+        data = os.urandom(1000)
+        downloader = ObjectDownloader(cell=cell, timeout=10.0, num_receivers=1)
+        ref_id = add_bytes(downloader, data, chunk_size=300)
+
+        err, consumer = download_bytes("site-1", ref_id, 5.0, cell)
+        assert err
+        assert consumer.buffer == data[:600]
+
+        err, consumer = download_bytes("site-1", ref_id, 5.0, cell, consumer=consumer)
+        assert err is None
+        assert consumer.buffer == data
+        assert cell.states[3] == {"received_bytes": 600}
+        downloader.delete_transaction()
+
+    def test_resume_with_consumer(self):
+        consumer = BytesConsumer()
+        assert consumer.resume_state == {"received_bytes": 0}
+        consumer.consume("ref", {}, b"abc")
+        assert consumer.resume_state == {"received_bytes": 3}
@@ -138,6 +138,42 @@ class TestFileDownloadable:
         assert data is None
         assert state == {}
 
+    def test_file_downloadable_mmap_shared_by_requesters(self, temp_file):
+        """Test that all requesters are served from one mapping, which is released when the tx is done."""
+        file_path, content = temp_file
+        obj = FileDownloadable(file_path, chunk_size=20)
+
+        _, data1, _ = obj.produce({}, "receiver1")
+        mapping = obj.mmap
+        _, data2, _ = obj.produce_chunk(1, "receiver2")
+
+        assert isinstance(data1, memoryview)
+        assert data1 == content[:20]
+        assert data2 == content[20:40]
+        assert obj.mmap is mapping
+
+        # chunks still referenced keep the mapping alive
+        obj.transaction_done("tx", "finished")
+        assert obj.mmap is None
+        assert data1 == content[:20]
+
+        del data1, data2
+        _, data, _ = obj.produce_chunk(2, "receiver3")
+        assert data == content[40:60]
+        assert obj.mmap is not mapping
+        obj.transaction_done("tx", "finished")
+
+    def test_file_downloadable_without_mmap(self, temp_file):
+        """Test that chunks are read from the file when mmap is disabled."""
+        file_path, content = temp_file
+        obj = FileDownloadable(file_path, chunk_size=20, use_mmap=False)
+
+        rc, data, _ = obj.produce_chunk(2, "receiver1")
+        assert rc == "ok"
+        assert isinstance(data, bytes)
+        assert data == content[40:]
+        assert obj.mmap is None
+
 
 class TestFileDownloaderIntegration:
     """Integration tests for file downloading."""
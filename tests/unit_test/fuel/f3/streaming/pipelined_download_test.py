@@ -0,0 +1,228 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from typing import Any, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from nvflare.apis.signal import Signal
+from nvflare.fuel.f3.cellnet.defs import MessageHeaderKey, ReturnCode
+from nvflare.fuel.f3.message import Message
+from nvflare.fuel.f3.streaming.cacheable import CacheableObject, ItemConsumer
+from nvflare.fuel.f3.streaming.download_service import (
+    Consumer,
+    Downloadable,
+    DownloadService,
+    DownloadStatus,
+    ProduceRC,
+    download_object,
+)
+from nvflare.fuel.f3.streaming.file_downloader import FileDownloadable, download_file
+
+
+class LoopbackCell:
+    """Routes download requests directly to the DownloadService handler."""
+
+    def __init__(self, requester="site-1"):
+        self.requester = requester
+        self.chunk_requests = []
+        self.lock = threading.Lock()
+
+    def register_request_cb(self, channel, topic, cb):
+        pass
+
+    def _handle(self, message: Message) -> Message:
+        message.set_header(MessageHeaderKey.ORIGIN, self.requester)
+        return DownloadService._handle_download(message)
+
+    def send_request(self, channel, target, topic, request, timeout, secure, optional, abort_signal):
+        with self.lock:
+            self.chunk_requests.append(request.payload.get("chunk"))
+        return self._handle(request)
+
+    def fire_and_forget(self, channel, topic, targets, message, secure, optional):
+        self._handle(message)
+
+
+class SequentialDownloadable(Downloadable):
+    def __init__(self, chunks: list):
+        super().__init__(chunks)
+        self.chunks = chunks
+        self.downloaded = []
+
+    def produce(self, state: dict, requester: str) -> Tuple[str, Any, dict]:
+        idx = state.get("idx", 0) if state else 0
+        if idx >= len(self.chunks):
+            return ProduceRC.EOF, None, {}
+        return ProduceRC.OK, self.chunks[idx], {"idx": idx + 1}
+
+    def downloaded_to_one(self, to_receiver: str, status: str):
+        self.downloaded.append((to_receiver, status))
+
+
+class ListCacheable(CacheableObject):
+    def __init__(self, items: list, max_chunk_size: int):
+        self.items = items
+        super().__init__(items, max_chunk_size)
+
+    def get_item_count(self) -> int:
+        return len(self.items)
+
+    def produce_item(self, index: int) -> bytes:
+        return self.items[index]
+
+
+class ListConsumer(ItemConsumer):
+    def consume_items(self, items: List[Any], result: Any) -> Any:
+        result = result or []
+        result.extend(items)
+        return result
+
+
+class BytesConsumer(Consumer):
+    def __init__(self):
+        super().__init__()
+        self.data = []
+        self.completed = False
+        self.error = None
+
+    def consume(self, ref_id: str, state: dict, data: Any) -> dict:
+        self.data.append(data)
+        return state
+
+    def download_completed(self, ref_id: str):
+        self.completed = True
+
+    def download_failed(self, ref_id: str, reason: str):
+        self.error = reason
+
+
+def _add_object(cell, obj, num_receivers=1):
+    tx_id = DownloadService.new_transaction(cell=cell, timeout=10.0, num_receivers=num_receivers)
+    return tx_id, DownloadService.add_object(tx_id, obj)
+
+
+class TestPipelinedDownload:
+    @pytest.fixture
+    def cell(self):
+        yield LoopbackCell()
+        DownloadService.shutdown()
+
+    @pytest.mark.parametrize("window_size", [2, 4, 16])
+    def test_file_download_in_order(self, cell, tmp_path, window_size):
+        content = os.urandom(10 * 1024 + 17)
+        src = tmp_path / "src.bin"
+        src.write_bytes(content)
+        calls = []
+        obj = FileDownloadable(str(src), chunk_size=1024, file_downloaded_cb=lambda r, s, f: calls.append((r, s)))
+        _, ref_id = _add_object(cell, obj)
+
+        err, path = download_file("server", ref_id, 5.0, cell, location=str(tmp_path), window_size=window_size)
+
+        assert err is None
+        with open(path, "rb") as f:
+            assert f.read() == content
+        # reported once by the requester, then once more for "downloaded to all"
+        assert calls == [("site-1", DownloadStatus.SUCCESS), ("", "")]
+        assert sorted(i for i in cell.chunk_requests if i is not None)[:11] == list(range(11))
+
+    def test_cacheable_download(self, cell):
+        items = [os.urandom(100 + i) for i in range(20)]
+        obj = ListCacheable(items, max_chunk_size=1000)
+        _, ref_id = _add_object(cell, obj, num_receivers=1)
+
+        consumer = ListConsumer()
+        download_object("server", ref_id, 5.0, cell, consumer, window_size=4)
+
+        assert consumer.error is None
+        assert consumer.result == items
+        # the requester reported completion, so the cache is cleared
+        assert obj.cache is None
+
+    def test_cacheable_chunk_is_cached_until_served_to_all(self, cell):
+        items = [b"a" * 10, b"b" * 10]
+        obj = ListCacheable(items, max_chunk_size=1000)
+        _add_object(cell, obj, num_receivers=2)
+
+        rc, data, state = obj.produce_chunk(1, "site-1")
+        assert rc == ProduceRC.OK
+        assert data == [items[1]]
+        assert state == {"start": 1, "count": 1}
+        assert obj.cache[1] == (items[1], 1)
+
+        obj.produce_chunk(1, "site-2")
+        assert obj.cache[1] == (None, 2)
+        assert obj.produce_chunk(2, "site-1")[0] == ProduceRC.EOF
+
+    def test_fallback_when_object_does_not_support_chunks(self, cell):
+        obj = SequentialDownloadable([b"a", b"b", b"c"])
+        _, ref_id = _add_object(cell, obj)
+
+        consumer = BytesConsumer()
+        download_object("server", ref_id, 5.0, cell, consumer, window_size=3)
+
+        assert consumer.completed
+        assert consumer.data == [b"a", b"b", b"c"]
+        assert obj.downloaded == [("site-1", DownloadStatus.SUCCESS)]
+
+    def test_fallback_when_owner_ignores_chunk_index(self):
+        # An older owner treats chunk requests as the first sequential request
+        def _reply(status, data=None, state=None):
+            msg = Message()
+            msg.set_header(MessageHeaderKey.RETURN_CODE, ReturnCode.OK)
+            msg.payload = {"status": status, "data": data, "state": state}
+            return msg
+
+        def _send_request(channel, target, topic, request, timeout, secure, optional, abort_signal):
+            state = request.payload.get("state")
+            if state:
+                return _reply(ProduceRC.EOF)
+            return _reply(ProduceRC.OK, b"x", {"idx": 1})
+
+        cell = MagicMock()
+        cell.send_request.side_effect = _send_request
+
+        consumer = BytesConsumer()
+        download_object("server", "ref", 5.0, cell, consumer, window_size=2)
+
+        assert consumer.completed
+        assert consumer.data == [b"x"]
+
+    def test_abort_is_reported_to_owner(self, cell, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(os.urandom(10 * 1024))
+        calls = []
+        obj = FileDownloadable(str(src), chunk_size=1024, file_downloaded_cb=lambda r, s, f: calls.append((r, s)))
+        _, ref_id = _add_object(cell, obj)
+
+        abort_signal = Signal()
+
+        class AbortingConsumer(BytesConsumer):
+            def consume(self, ref_id: str, state: dict, data: Any) -> dict:
+                abort_signal.trigger(True)
+                return super().consume(ref_id, state, data)
+
+        consumer = AbortingConsumer()
+        download_object("server", ref_id, 5.0, cell, consumer, abort_signal=abort_signal, window_size=2)
+
+        assert consumer.error == "download aborted"
+        # the owner finishes the transaction without waiting for it to time out
+        assert calls[0] == ("site-1", DownloadStatus.FAILED)
+
+    def test_bad_window_size(self, cell):
+        with pytest.raises(ValueError):
+            download_object("server", "ref", 5.0, cell, BytesConsumer(), window_size=0)
@@ -16,7 +16,6 @@ import datetime
 import json
 import os
 import shutil
-import tempfile
 
 import pytest
 from cryptography import x509
@@ -88,8 +87,8 @@ def get_test_certs():
     return root_cert, client_pri_key, client_cert, server_pri_key, server_cert
 
 
-def create_folder():
-    tmp_dir = tempfile.TemporaryDirectory().name
+def create_folder(work_dir):
+    tmp_dir = os.path.join(work_dir, "signed")
     for folder in folders:
         os.makedirs(os.path.join(tmp_dir, folder))
         for file in files:
@@ -104,48 +103,46 @@ def tamper_one_file(folder):
         f.write("fail case")
 
 
-def update_and_sign_one_folder(folder, pri_key, cert):
-    tmp_dir = tempfile.TemporaryDirectory().name
+def update_and_sign_one_folder(work_dir, folder, pri_key, cert):
+    tmp_dir = os.path.join(work_dir, "updated")
     new_folder = os.path.join(tmp_dir, "new_folder")
     shutil.move(folder, new_folder)
     with open(os.path.join(tmp_dir, "test_file"), "wt") as f:
         f.write("fail case")
-    with open("server.crt", "wb") as f:
+    server_crt = os.path.join(work_dir, "server.crt")
+    with open(server_crt, "wb") as f:
         f.write(serialize_cert(cert))
-    sign_folders(tmp_dir, pri_key, "server.crt", max_depth=1)
+    sign_folders(tmp_dir, pri_key, server_crt, max_depth=1)
     return tmp_dir
 
 
-def prepare_folders():
+def prepare_folders(work_dir):
     root_cert, client_pri_key, client_cert, server_pri_key, server_cert = get_test_certs()
-    folder = create_folder()
-    with open("client.crt", "wb") as f:
+    folder = create_folder(work_dir)
+    client_crt = os.path.join(work_dir, "client.crt")
+    with open(client_crt, "wb") as f:
         f.write(serialize_cert(client_cert))
-    with open("root.crt", "wb") as f:
+    with open(os.path.join(work_dir, "root.crt"), "wb") as f:
         f.write(serialize_cert(root_cert))
-    sign_folders(folder, client_pri_key, "client.crt")
+    sign_folders(folder, client_pri_key, client_crt)
     return folder, server_pri_key, server_cert
 
 
 @pytest.mark.xdist_group(name="lighter_utils_group")
 class TestSignFolder:
-    def test_verify_folder(self):
-        folder, server_pri_key, server_cert = prepare_folders()
-        assert verify_folder_signature(folder, "root.crt") is True
+    def test_verify_folder(self, tmp_path):
+        folder, server_pri_key, server_cert = prepare_folders(str(tmp_path))
+        root_crt = str(tmp_path / "root.crt")
+        assert verify_folder_signature(folder, root_crt) is True
         tamper_one_file(folder)
-        assert verify_folder_signature(folder, "root.crt") is False
-        os.unlink("client.crt")
-        os.unlink("root.crt")
-        shutil.rmtree(folder)
-
-    def test_verify_updated_folder(self):
-        folder, server_pri_key, server_cert = prepare_folders()
-        assert verify_folder_signature(folder, "root.crt") is True
-        folder = update_and_sign_one_folder(folder, server_pri_key, server_cert)
-        assert verify_folder_signature(folder, "root.crt") is True
-        os.unlink("client.crt")
-        os.unlink("root.crt")
-        shutil.rmtree(folder)
+        assert verify_folder_signature(folder, root_crt) is False
+
+    def test_verify_updated_folder(self, tmp_path):
+        folder, server_pri_key, server_cert = prepare_folders(str(tmp_path))
+        root_crt = str(tmp_path / "root.crt")
+        assert verify_folder_signature(folder, root_crt) is True
+        folder = update_and_sign_one_folder(str(tmp_path), folder, server_pri_key, server_cert)
+        assert verify_folder_signature(folder, root_crt) is True
 
     def _get_participant(self, name, participants):
         for p in participants:
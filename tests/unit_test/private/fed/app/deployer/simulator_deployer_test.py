@@ -36,13 +36,19 @@ from nvflare.security.security import EmptyAuthorizer
 
 @pytest.mark.xdist_group(name="simulator_deploy")
 class TestSimulatorDeploy(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _set_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+
     def setUp(self) -> None:
         self.deployer = SimulatorDeployer()
         AuthorizationService.initialize(EmptyAuthorizer())
-        AuditService.initialize(audit_file_name=WorkspaceConstants.AUDIT_LOG)
+        AuditService.initialize(audit_file_name=str(self.tmp_path / WorkspaceConstants.AUDIT_LOG))
 
     def tearDown(self) -> None:
         self.deployer.close()
+        AuditService.close()
+        AuditService.the_auditor = None
 
     def _create_parser(self):
         parser = argparse.ArgumentParser()
@@ -26,6 +26,7 @@ import pytest
 
 from nvflare.apis.fl_constant import FLContextKey, MachineStatus, WorkspaceConstants
 from nvflare.private.fed.app.simulator.simulator_runner import SimulatorClientRunner, SimulatorRunner
+from nvflare.private.fed.simulator.simulator_const import SimulatorConstants
 from nvflare.private.fed.utils.fed_utils import split_gpus
 
 
@@ -191,3 +192,35 @@ class TestSimulatorRunner:
         new_sys_path = runner._get_new_sys_path()
         assert old_sys_path == new_sys_path
         sys.path = old_sys_path
+
+    @pytest.mark.parametrize("warm_workers, expected_processes", [(False, 2), (True, 1)])
+    def test_warm_workers(self, warm_workers, expected_processes):
+        args = Namespace(workspace="/tmp", warm_workers=warm_workers)
+        args.set = []
+        clients = [Mock(client_name=f"site-{i}", token=f"token-{i}", simulate_running=False) for i in range(2)]
+        runner = SimulatorClientRunner(None, args, clients, {}, Namespace(workspace="/tmp"), {})
+
+        process = Mock()
+        process.poll.return_value = None
+        conn = Mock()
+        # the worker reports the task is done without stopping the run
+        conn.recv.return_value = False
+        lock = threading.Lock()
+        with patch.object(runner, "_start_worker", return_value=(process, conn)) as start_worker:
+            with patch.object(runner, "_cleanup_process") as cleanup_process:
+                for client in clients:
+                    stop_run, next_client, _ = runner.do_one_task(client, 1, None, lock)
+                    assert not stop_run
+                    assert next_client.client_name != client.client_name
+
+                assert start_worker.call_count == expected_processes
+                sent = [c.args[0] for c in conn.send.call_args_list]
+                assert [d[SimulatorConstants.CLIENT_NAME] for d in sent if isinstance(d, dict)] == ["site-0", "site-1"]
+                assert cleanup_process.call_count == (0 if warm_workers else 2)
+
+                runner._stop_warm_worker()
+                if warm_workers:
+                    conn.send.assert_called_with(None)
+                    cleanup_process.assert_called_once_with(process)
+                else:
+                    assert cleanup_process.call_count == 2
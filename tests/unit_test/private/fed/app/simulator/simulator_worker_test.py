@@ -0,0 +1,71 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import os
+import sys
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+from nvflare.private.fed.app.simulator.simulator_worker import ClientTaskWorker, _purge_modules
+
+
+def _write_module(folder: str, name: str, value: int):
+    with open(os.path.join(folder, f"{name}.py"), "w") as f:
+        f.write(f"VALUE = {value}\n")
+
+
+def test_purge_modules_of_custom_folder():
+    with TemporaryDirectory() as site1, TemporaryDirectory() as site2:
+        _write_module(site1, "purge_test_learner", 1)
+        _write_module(site2, "purge_test_learner", 2)
+        sys.path.append(site1)
+        try:
+            assert importlib.import_module("purge_test_learner").VALUE == 1
+        finally:
+            sys.path.remove(site1)
+
+        _purge_modules(site1)
+        assert "purge_test_learner" not in sys.modules
+        assert "os" in sys.modules
+
+        # the next client imports the module from its own custom folder
+        sys.path.append(site2)
+        try:
+            assert importlib.import_module("purge_test_learner").VALUE == 2
+        finally:
+            sys.path.remove(site2)
+            sys.modules.pop("purge_test_learner", None)
+
+
+def test_cell_cleanup_is_registered_once_per_process():
+    worker = ClientTaskWorker()
+    cells = []
+    with (
+        patch("nvflare.private.fed.app.simulator.simulator_worker.Cell", side_effect=lambda **kw: MagicMock()) as cls,
+        patch("nvflare.private.fed.app.simulator.simulator_worker.mpm") as mock_mpm,
+    ):
+        for name in ["site-1", "site-2", "site-3"]:
+            client = MagicMock(client_name=name)
+            worker._create_client_cell(client, "tcp://localhost:1234", None)
+            cells.append(client.cell)
+
+    assert cls.call_count == 3
+    mock_mpm.add_cleanup_cb.assert_called_once()
+
+    # the cleanup stops the cell of the current client
+    cleanup_cb = mock_mpm.add_cleanup_cb.call_args.args[0]
+    cleanup_cb()
+    cells[-1].stop.assert_called_once()
+    cells[0].stop.assert_not_called()
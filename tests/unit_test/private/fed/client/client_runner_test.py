@@ -0,0 +1,98 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest.mock import MagicMock
+
+from nvflare.apis.event_type import EventType
+from nvflare.apis.fl_constant import FLContextKey
+from nvflare.apis.fl_context import FLContext
+from nvflare.apis.shareable import Shareable
+from nvflare.private.fed.client.client_engine_executor_spec import TaskAssignment
+from nvflare.private.fed.client.client_runner import ClientRunner, ClientRunnerConfig, TaskRouter
+
+
+def _create_runner():
+    config = ClientRunnerConfig(task_router=TaskRouter(), task_data_filters={}, task_result_filters={})
+    runner = ClientRunner(client_config={}, config=config, job_id="job", engine=MagicMock())
+
+    task_ids = iter(["task-1", "task-2"])
+    submitting = []
+
+    def _get_task_assignment(fl_ctx, timeout):
+        submitting.append(fl_ctx.get_prop(FLContextKey.SUBMITTING_TASK_ID))
+        return TaskAssignment(name="train", task_id=next(task_ids), data=Shareable())
+
+    runner.engine.get_task_assignment.side_effect = _get_task_assignment
+    runner._process_task = MagicMock(side_effect=lambda task, fl_ctx: Shareable())
+    return runner, submitting
+
+
+class TestPipelinedTaskResult:
+    def test_result_is_sent_in_background(self):
+        runner, submitting = _create_runner()
+        release = threading.Event()
+        sent = []
+
+        def _send_task_result(result, task_id, fl_ctx):
+            release.wait(5.0)
+            sent.append(task_id)
+            return True
+
+        runner._send_task_result = _send_task_result
+
+        # returns while the result is still being sent
+        _, processed = runner.fetch_and_run_one_task(FLContext(), pipelined=True)
+        assert processed
+        assert sent == []
+
+        # the next task is fetched while the result of the previous task is being sent
+        sender = threading.Thread(target=runner.fetch_and_run_one_task, args=(FLContext(),), kwargs={"pipelined": True})
+        sender.start()
+        sender.join(0.5)
+        assert submitting == [None, "task-1"]
+        # the result of the second task must wait for the result of the first task
+        assert sender.is_alive()
+
+        release.set()
+        sender.join(5.0)
+        runner._wait_for_result_sender()
+        assert sent == ["task-1", "task-2"]
+
+    def test_result_events_fire_on_runner_thread(self):
+        runner, _ = _create_runner()
+        release = threading.Event()
+        runner._send_task_result = lambda result, task_id, fl_ctx: release.wait(5.0)
+        events = []
+        runner.fire_event = lambda event_type, fl_ctx: events.append((event_type, threading.current_thread()))
+
+        runner.fetch_and_run_one_task(FLContext(), pipelined=True)
+        assert [e for e, _ in events] == [EventType.BEFORE_SEND_TASK_RESULT]
+
+        # not fired while the result is still being sent
+        runner._wait_for_result_sender(block=False)
+        assert len(events) == 1
+
+        release.set()
+        runner._wait_for_result_sender()
+        assert [e for e, _ in events] == [EventType.BEFORE_SEND_TASK_RESULT, EventType.AFTER_SEND_TASK_RESULT]
+        assert all(t is threading.current_thread() for _, t in events)
+        assert runner._result_sender is None
+
+    def test_result_is_sent_before_returning_when_not_pipelined(self):
+        runner, _ = _create_runner()
+        runner._send_task_result = MagicMock(return_value=True)
+        runner.fetch_and_run_one_task(FLContext())
+        runner._send_task_result.assert_called_once()
+        assert runner._result_sender is None
@@ -0,0 +1,44 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nvflare.apis.fl_constant import FLContextKey
+from nvflare.apis.shareable import Shareable
+from nvflare.private.fed.client.communicator import Communicator
+
+
+def _task(task_id: str) -> Shareable:
+    task = Shareable()
+    task.set_header(FLContextKey.TASK_ID, task_id)
+    return task
+
+
+class TestPendingTask:
+    def test_pending_task_of_submitted_result_is_cleared(self):
+        communicator = Communicator(client_config={"client_name": "site-1"})
+        communicator.pending_task = _task("task-1")
+        communicator._clear_pending_task("task-1")
+        assert communicator.pending_task is None
+
+    def test_next_pending_task_is_kept(self):
+        # with pipelined results, the next task may be received before the previous result is submitted
+        communicator = Communicator(client_config={"client_name": "site-1"})
+        communicator.pending_task = _task("task-2")
+        communicator._clear_pending_task("task-1")
+        assert communicator.pending_task.get_header(FLContextKey.TASK_ID) == "task-2"
+
+    def test_pending_task_is_cleared_without_task_id(self):
+        communicator = Communicator(client_config={"client_name": "site-1"})
+        communicator.pending_task = _task("task-1")
+        communicator._clear_pending_task(None)
+        assert communicator.pending_task is None
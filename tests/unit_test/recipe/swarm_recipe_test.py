@@ -309,6 +309,31 @@ class TestSwarmLearningRecipeMemoryGC:
         )
         assert recipe.job is not None
 
+    def test_aggregation_mode_accepted(self, mock_file_system, simple_pt_model):
+        """aggregation_mode is passed to the server controller."""
+        from nvflare.app_common.ccwf.common import AggregationMode
+        from nvflare.app_common.ccwf.swarm_server_ctl import SwarmServerController
+        from nvflare.app_opt.pt.recipes.swarm import SwarmLearningRecipe
+
+        captured = {}
+        orig = SwarmServerController.__init__
+
+        def _capture(self, *a, **kw):
+            captured["aggregation_mode"] = kw.get("aggregation_mode")
+            orig(self, *a, **kw)
+
+        with patch.object(SwarmServerController, "__init__", _capture):
+            recipe = SwarmLearningRecipe(
+                name="test_swarm",
+                model=simple_pt_model,
+                num_rounds=5,
+                train_script="train.py",
+                min_clients=2,
+                aggregation_mode=AggregationMode.REDUCE_SCATTER,
+            )
+        assert recipe.job is not None
+        assert captured["aggregation_mode"] == AggregationMode.REDUCE_SCATTER
+
 
 class TestSwarmLearningRecipePipeType:
     """Tests for pipe_type and pipe_root_path parameters."""